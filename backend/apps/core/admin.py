@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import FailedEmail
+
+
+@admin.register(FailedEmail)
+class FailedEmailAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = ["subject", "to", "template", "attempts", "created_at"]
+    search_fields = ["subject", "to"]
+    readonly_fields = ["uuid", "created_at", "updated_at", "last_error"]
@@ -69,3 +69,33 @@ def run_daily_cron_batch(request: HttpRequest) -> tuple[int, DailyBatchResponse]
         ],
     )
     return http_status, payload
+
+
+class EventRemindersResponse(Schema):
+    status: str
+    timestamp: datetime
+    reminded: int
+
+
+@cron_router.post(
+    "/event-reminders/",
+    response={200: EventRemindersResponse},
+    auth=None,
+    operation_id="core_cron_event_reminders",
+)
+@require_oidc_auth
+def run_event_reminders(request: HttpRequest) -> EventRemindersResponse:
+    """
+    Envia os lembretes de eventos vencidos (RF12).
+
+    Os lembretes precisam de resolução de minutos, incompatível com o lote
+    diário: o GCP Cloud Scheduler chama este endpoint a cada minuto (ADR-005).
+    Em produção não há consumidor Huey, então a tarefa periódica
+    ``dispatch_event_reminders`` só roda em ambientes com worker.
+    """
+    from apps.scheduler.services.reminders import EventReminderService
+
+    reminded = EventReminderService.dispatch_due()
+    return EventRemindersResponse(
+        status="completed", timestamp=datetime.now(), reminded=reminded
+    )
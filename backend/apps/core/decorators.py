@@ -1,9 +1,12 @@
+import inspect
 import logging
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
 
 from apps.core.exceptions import AuthenticationFailedError, PermissionDeniedError
 from apps.core.services import get_oidc_verifier
@@ -54,3 +57,77 @@ def require_oidc_auth[R](view_func: Callable[..., R]) -> Callable[..., R]:
         return view_func(request, *args, **kwargs)
 
     return wrapper
+
+
+def conditional_get[R](
+    version: Callable[..., str],
+) -> Callable[[Callable[..., R]], Callable[..., R | HttpResponseBase]]:
+    """
+    GET condicional (ETag/304) para rotas do Django Ninja.
+
+    ``version(request, **kwargs)`` recebe os mesmos argumentos da view e
+    devolve um fingerprint barato dos dados da resposta (ver
+    ``tenant_data_version_selector``). Roda depois da autenticação: se o
+    ``If-None-Match`` do cliente corresponde, responde 304 sem executar a
+    view; caso contrário executa a view e envia o ETag.
+
+    Uso (abaixo do ``@router.get`` e acima do ``@paginate``)::
+
+        @router.get("/", response=list[WeddingOut])
+        @conditional_get(_weddings_version)
+        @paginate
+        def list_weddings(request): ...
+    """
+
+    def decorator(view_func: Callable[..., R]) -> Callable[..., R | HttpResponseBase]:
+        # O Ninja só injeta o HttpResponse temporário (cujos headers vão para
+        # a resposta final) em views que declaram um parâmetro desse tipo.
+        signature = inspect.signature(view_func, eval_str=True)
+        params = list(signature.parameters.values())
+        response_arg = next(
+            (p.name for p in params if p.annotation is HttpResponse), None
+        )
+        injected = response_arg is None
+        if response_arg is None:
+            response_arg = "response"
+            position = len(params)
+            if params and params[-1].kind is inspect.Parameter.VAR_KEYWORD:
+                position -= 1
+            params.insert(
+                position,
+                inspect.Parameter(
+                    response_arg,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=HttpResponse,
+                ),
+            )
+
+        @wraps(view_func)
+        def wrapper(request: HttpRequest, **kwargs: Any) -> R | HttpResponseBase:
+            response = kwargs.pop(response_arg)
+            etag = f'"{version(request, **kwargs)}"'
+
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return _with_etag(not_modified, etag)
+
+            if not injected:
+                kwargs[response_arg] = response
+            result = view_func(request, **kwargs)
+            target = result if isinstance(result, HttpResponseBase) else response
+            _with_etag(target, etag)
+            return result
+
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=params
+        )
+        return wrapper
+
+    return decorator
+
+
+def _with_etag(response: HttpResponseBase, etag: str) -> HttpResponseBase:
+    response["ETag"] = etag
+    # Revalidação a cada leitura: o 304 é barato e os dados mudam sem aviso.
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -64,3 +64,14 @@ class PermissionDeniedError(ApplicationError):
     status_code = 403
     default_detail = "Acesso negado."
     default_code = "unauthorized_sa"
+
+
+class ServiceUnavailableError(ApplicationError):
+    """
+    Status 503: Dependência de infraestrutura indisponível no momento
+    (ex: Redis Pub/Sub desativado ou servidor sem suporte a ASGI).
+    """
+
+    status_code = 503
+    default_detail = "Serviço temporariamente indisponível."
+    default_code = "service_unavailable"
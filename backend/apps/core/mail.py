@@ -0,0 +1,178 @@
+"""
+Fila de e-mails transacionais (``django.tasks``) com conexão SMTP reutilizada.
+
+Os serviços renderizam a mensagem no request (templates compilados uma única
+vez por processo) e a enfileiram após o commit; a tarefa envia em lotes pela
+mesma conexão SMTP, repete as falhas e grava no dead-letter (core.FailedEmail)
+os metadados das mensagens que esgotarem as tentativas (sem o corpo, que
+carrega links de uso único). Sem worker (backend imediato, produção), o envio
+roda no próprio processo, logo após o commit.
+"""
+
+import logging
+import smtplib
+import threading
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from functools import cache, partial
+from typing import Any
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.template.backends.django import Template
+from django.template.loader import get_template
+
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """Mensagem já renderizada, serializável para a fila."""
+
+    subject: str
+    to: list[str]
+    body: str
+    html: str = ""
+    from_email: str = field(default_factory=lambda: settings.DEFAULT_FROM_EMAIL)
+    # Template de origem, registrado no dead-letter no lugar do corpo.
+    template: str = ""
+
+    def to_payload(self) -> dict[str, Any]:
+        """Dicionário JSON-serializável usado como argumento da tarefa."""
+        return asdict(self)
+
+    def build(
+        self, connection: BaseEmailBackend | None = None
+    ) -> EmailMultiAlternatives:
+        """Monta o EmailMultiAlternatives (texto + HTML opcional)."""
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            connection=connection,
+        )
+        if self.html:
+            message.attach_alternative(self.html, "text/html")
+        return message
+
+
+@cache
+def _get_template(name: str) -> Template:
+    """Template compilado uma vez por processo (também com DEBUG=True)."""
+    return get_template(name)  # type: ignore[return-value]
+
+
+def render_email(
+    *,
+    subject: str,
+    to: Sequence[str],
+    text_template: str,
+    html_template: str,
+    context: dict[str, Any],
+) -> RenderedEmail:
+    """
+    Renderiza as versões texto e HTML de um e-mail transacional.
+
+    Args:
+        subject: Assunto da mensagem.
+        to: Destinatários.
+        text_template: Caminho do template em texto puro.
+        html_template: Caminho do template HTML.
+        context: Contexto de renderização.
+
+    Returns:
+        RenderedEmail pronto para ser enfileirado.
+    """
+    return RenderedEmail(
+        subject=subject,
+        to=list(to),
+        body=_get_template(text_template).render(context),
+        html=_get_template(html_template).render(context),
+        template=text_template,
+    )
+
+
+def queue_emails(messages: Sequence[RenderedEmail]) -> None:
+    """
+    Enfileira mensagens para envio, em lotes de EMAIL_QUEUE_BATCH_SIZE.
+
+    O enfileiramento acontece no commit da transação atual: um rollback não
+    dispara e-mails, e o envio síncrono (backend imediato) não segura a
+    transação aberta durante a conversa SMTP.
+
+    Args:
+        messages: Mensagens já renderizadas.
+    """
+    from apps.core.tasks import send_email_batch
+
+    payloads = [message.to_payload() for message in messages]
+    size = settings.EMAIL_QUEUE_BATCH_SIZE
+    for start in range(0, len(payloads), size):
+        transaction.on_commit(
+            partial(send_email_batch.enqueue, payloads[start : start + size])
+        )
+
+
+def queue_email(message: RenderedEmail) -> None:
+    """
+    Enfileira uma única mensagem para envio.
+
+    Args:
+        message: Mensagem já renderizada.
+    """
+    queue_emails([message])
+
+
+def _get_connection() -> BaseEmailBackend:
+    """Conexão SMTP aberta e mantida por thread do worker."""
+    connection: BaseEmailBackend | None = getattr(_local, "connection", None)
+    if connection is None:
+        connection = get_connection()
+        connection.open()
+        _local.connection = connection
+    return connection
+
+
+def _reset_connection() -> None:
+    connection: BaseEmailBackend | None = getattr(_local, "connection", None)
+    _local.connection = None
+    if connection is not None:
+        try:
+            connection.close()
+        except Exception:
+            logger.debug("Falha ao fechar conexão SMTP descartada.")
+
+
+def deliver(
+    messages: Sequence[RenderedEmail],
+) -> list[tuple[RenderedEmail, Exception]]:
+    """
+    Envia as mensagens pela conexão SMTP reutilizada da thread atual.
+
+    Uma desconexão do servidor (conexão ociosa derrubada pelo provedor) abre
+    uma nova conexão e tenta a mensagem mais uma vez.
+
+    Args:
+        messages: Mensagens a enviar.
+
+    Returns:
+        Pares (mensagem, erro) das mensagens que falharam.
+    """
+    failures: list[tuple[RenderedEmail, Exception]] = []
+    for message in messages:
+        try:
+            try:
+                message.build(_get_connection()).send()
+            except smtplib.SMTPServerDisconnected:
+                _reset_connection()
+                message.build(_get_connection()).send()
+        except Exception as exc:
+            _reset_connection()
+            failures.append((message, exc))
+    return failures
@@ -0,0 +1,420 @@
+"""
+Comando de seed em alto volume para testes de carga, benchmark e EXPLAIN.
+
+Diferente do seed_db (factories, um save com full_clean por linha), gera os
+registros em memória e grava com bulk_create em lotes. A geração é
+determinística: o mesmo --seed produz os mesmos UUIDs, nomes, valores e
+datas (relativas ao dia da execução). Tenants já existentes para o seed são
+ignorados, tornando o comando idempotente.
+
+Uso:
+    python manage.py seed_load --tenants 1 --weddings 1000 --installments 33
+    python manage.py seed_load --tenants 8 --weddings 500 --workers 4
+"""
+
+import multiprocessing
+import random
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from apps.finances.models import Budget, BudgetCategory, Expense, Installment
+from apps.logistics.models import Contract, Supplier
+from apps.notifications.models import Notification, NotificationType
+from apps.notifications.services import NotificationService
+from apps.scheduler.models import Event
+from apps.tenants.models import Company
+from apps.users.models import User
+from apps.weddings.models import Wedding
+
+
+# Casamentos gerados e gravados por transação (limita memória e locks).
+WEDDING_BLOCK = 200
+
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor",
+    "Isabela", "João", "Larissa", "Marcos", "Natália", "Otávio", "Paula",
+    "Rafael", "Sofia", "Tiago", "Vitória", "William",
+]  # fmt: skip
+CATEGORY_NAMES = ["Buffet", "Decoração", "Fotografia", "Música", "Espaço"]
+LOAD_PASSWORD = "loadtest123"  # pragma: allowlist secret # noqa: S105
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    """Parâmetros de volume compartilhados por todos os workers."""
+
+    seed: int
+    planners: int
+    suppliers: int
+    weddings: int
+    contracts: int
+    installments: int
+    events: int
+    notifications: int
+    chunk_size: int
+    password_hash: str
+    today: date
+
+
+class Command(BaseCommand):
+    help = "Gera volume de dados de produção com bulk_create para testes de carga"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tenants", type=int, default=1, help="Empresas")
+        parser.add_argument(
+            "--planners", type=int, default=2, help="Planners por empresa"
+        )
+        parser.add_argument(
+            "--suppliers", type=int, default=20, help="Fornecedores por empresa"
+        )
+        parser.add_argument(
+            "--weddings", type=int, default=100, help="Casamentos por empresa"
+        )
+        parser.add_argument(
+            "--contracts",
+            type=int,
+            default=5,
+            help="Contratos (e despesas vinculadas) por casamento",
+        )
+        parser.add_argument(
+            "--installments", type=int, default=10, help="Parcelas por despesa"
+        )
+        parser.add_argument(
+            "--events", type=int, default=10, help="Eventos por casamento"
+        )
+        parser.add_argument(
+            "--notifications",
+            type=int,
+            default=5,
+            help="Notificações por planner e casamento",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=2000, help="Linhas por INSERT"
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Semente da geração determinística"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processos paralelos (empresas são distribuídas entre eles)",
+        )
+
+    def handle(self, *args, **options):
+        if options["installments"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--installments e --chunk-size devem ser >= 1.")
+
+        config = LoadConfig(
+            seed=options["seed"],
+            planners=options["planners"],
+            suppliers=max(options["suppliers"], 1),
+            weddings=options["weddings"],
+            contracts=options["contracts"],
+            installments=options["installments"],
+            events=options["events"],
+            notifications=options["notifications"],
+            chunk_size=options["chunk_size"],
+            # Um único hash para todos os usuários: PBKDF2 por linha dominaria o tempo.
+            password_hash=make_password(LOAD_PASSWORD),
+            today=date.today(),
+        )
+        tenants = list(range(options["tenants"]))
+        workers = min(options["workers"], len(tenants)) or 1
+
+        if workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(
+                self.style.WARNING(
+                    "SQLite não suporta escrita concorrente; usando 1 worker."
+                )
+            )
+            workers = 1
+
+        self.stdout.write(
+            self.style.MIGRATE_LABEL(
+                f"Gerando {len(tenants)} empresa(s) x {config.weddings} casamentos "
+                f"(seed={config.seed}, workers={workers})..."
+            )
+        )
+
+        if workers > 1:
+            # Conexões abertas não podem ser herdadas pelos processos filhos.
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                results = pool.starmap(
+                    _seed_tenant_worker, [(index, config) for index in tenants]
+                )
+        else:
+            results = [_seed_tenant(index, config) for index in tenants]
+
+        totals: Counter[str] = Counter()
+        for result in results:
+            totals.update(result)
+
+        summary = ", ".join(f"{name}={total}" for name, total in sorted(totals.items()))
+        self.stdout.write(self.style.SUCCESS(f"Seed de carga concluído: {summary}"))
+
+
+def _seed_tenant_worker(index: int, config: LoadConfig) -> Counter[str]:
+    """Ponto de entrada dos processos filhos (abre conexões próprias)."""
+    try:
+        return _seed_tenant(index, config)
+    finally:
+        connections.close_all()
+
+
+def _seed_tenant(index: int, config: LoadConfig) -> Counter[str]:
+    """Gera uma empresa completa; ignora empresas já criadas para o seed."""
+    counts: Counter[str] = Counter()
+    slug = f"load-{config.seed}-{index}"
+    if Company.objects.filter(slug=slug).exists():
+        counts["skipped_tenants"] += 1
+        return counts
+
+    rng = random.Random(f"{config.seed}:{index}")  # noqa: S311
+
+    with transaction.atomic():
+        company = Company.objects.create(
+            uuid=_uuid(rng), name=f"Carga {config.seed}/{index}", slug=slug
+        )
+        planners = User.objects.bulk_create(
+            [
+                User(
+                    uuid=_uuid(rng),
+                    email=f"{slug}-{n}@load.test",
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=f"Carga {n}",
+                    company=company,
+                    password=config.password_hash,
+                    is_active=True,
+                    is_email_verified=True,
+                )
+                for n in range(config.planners)
+            ]
+        )
+        suppliers = Supplier.objects.bulk_create(
+            [
+                Supplier(
+                    uuid=_uuid(rng),
+                    company=company,
+                    name=f"Fornecedor {n + 1}",
+                    phone="(11) 99999-0000",
+                    email=f"fornecedor{n + 1}@{slug}.test",
+                )
+                for n in range(config.suppliers)
+            ]
+        )
+    counts.update(tenants=1, planners=len(planners), suppliers=len(suppliers))
+
+    for start in range(0, config.weddings, WEDDING_BLOCK):
+        size = min(WEDDING_BLOCK, config.weddings - start)
+        with transaction.atomic():
+            counts.update(
+                _seed_wedding_block(rng, config, company, planners, suppliers, size)
+            )
+
+    NotificationService.reconcile_unread_counters(company)
+    return counts
+
+
+def _seed_wedding_block(
+    rng: random.Random,
+    config: LoadConfig,
+    company: Company,
+    planners: list[User],
+    suppliers: list[Supplier],
+    size: int,
+) -> Counter[str]:
+    """Gera e grava um bloco de casamentos com todas as dependências."""
+    batch = config.chunk_size
+    today = config.today
+
+    weddings = []
+    for _ in range(size):
+        wedding_date = today + timedelta(days=rng.randint(-180, 540))
+        weddings.append(
+            Wedding(
+                uuid=_uuid(rng),
+                company=company,
+                bride_name=rng.choice(FIRST_NAMES),
+                groom_name=rng.choice(FIRST_NAMES),
+                date=wedding_date,
+                location=f"Espaço {rng.randint(1, 50)}",
+                expected_guests=rng.randint(50, 400),
+                status=(
+                    Wedding.StatusChoices.COMPLETED
+                    if wedding_date < today
+                    else Wedding.StatusChoices.IN_PROGRESS
+                ),
+            )
+        )
+    Wedding.objects.bulk_create(weddings, batch_size=batch)
+
+    budgets = Budget.objects.bulk_create(
+        [
+            Budget(
+                uuid=_uuid(rng),
+                company=company,
+                wedding=wedding,
+                total_estimated=Decimal(rng.randint(50, 300) * 1000),
+            )
+            for wedding in weddings
+        ],
+        batch_size=batch,
+    )
+    categories = BudgetCategory.objects.bulk_create(
+        [
+            BudgetCategory(
+                uuid=_uuid(rng),
+                company=company,
+                wedding=budget.wedding,
+                budget=budget,
+                name=name,
+                allocated_budget=Decimal("10000.00"),
+            )
+            for budget in budgets
+            for name in CATEGORY_NAMES
+        ],
+        batch_size=batch,
+    )
+
+    contracts = []
+    for wedding in weddings:
+        for n in range(config.contracts):
+            contracts.append(
+                Contract(
+                    uuid=_uuid(rng),
+                    company=company,
+                    wedding=wedding,
+                    supplier=rng.choice(suppliers),
+                    name=f"Contrato {n + 1}",
+                    total_amount=Decimal(rng.randint(1000, 50000)),
+                    status=rng.choice(Contract.StatusChoices.values),
+                    expiration_date=wedding.date + timedelta(days=30),
+                )
+            )
+    Contract.objects.bulk_create(contracts, batch_size=batch)
+
+    per_wedding = len(CATEGORY_NAMES)
+    expenses = [
+        Expense(
+            uuid=_uuid(rng),
+            company=company,
+            wedding=contract.wedding,
+            category=categories[
+                (i // config.contracts) * per_wedding + rng.randrange(per_wedding)
+            ],
+            contract=contract,
+            name=f"Despesa: {contract.name}",
+            estimated_amount=contract.total_amount,
+            actual_amount=contract.total_amount,
+        )
+        for i, contract in enumerate(contracts)
+    ]
+    Expense.objects.bulk_create(expenses, batch_size=batch)
+
+    installments = [
+        installment
+        for expense in expenses
+        for installment in _build_installments(rng, config, expense)
+    ]
+    Installment.objects.bulk_create(installments, batch_size=batch)
+
+    tz = timezone.get_current_timezone()
+    events = []
+    for wedding in weddings:
+        for n in range(config.events):
+            start = datetime.combine(
+                wedding.date - timedelta(days=rng.randint(0, 180)),
+                time(hour=rng.randint(8, 20)),
+                tzinfo=tz,
+            )
+            events.append(
+                Event(
+                    uuid=_uuid(rng),
+                    company=company,
+                    wedding=wedding,
+                    title=f"Evento {n + 1}",
+                    event_type=rng.choice(Event.TypeChoices.values),
+                    start_time=start,
+                    end_time=start + timedelta(hours=1),
+                )
+            )
+    Event.objects.bulk_create(events, batch_size=batch)
+
+    notifications = []
+    for wedding in weddings:
+        for planner in planners:
+            for _ in range(config.notifications):
+                notification_type = rng.choice(NotificationType.values)
+                notifications.append(
+                    Notification(
+                        uuid=_uuid(rng),
+                        company=company,
+                        user=planner,
+                        title=str(NotificationType(notification_type).label),
+                        message=f"Aviso de carga para {wedding.display_name}.",
+                        type=notification_type,
+                        wedding_id=wedding.uuid,
+                        wedding_name=wedding.display_name,
+                        is_read=rng.random() < 0.6,
+                    )
+                )
+    Notification.objects.bulk_create(notifications, batch_size=batch)
+
+    return Counter(
+        weddings=len(weddings),
+        contracts=len(contracts),
+        expenses=len(expenses),
+        installments=len(installments),
+        events=len(events),
+        notifications=len(notifications),
+    )
+
+
+def _build_installments(
+    rng: random.Random, config: LoadConfig, expense: Expense
+) -> list[Installment]:
+    """Parcelas mensais cuja soma fecha exatamente o valor da despesa."""
+    count = config.installments
+    share = (expense.actual_amount / count).quantize(Decimal("0.01"))
+    first_due = expense.wedding.date - timedelta(days=30 * count)
+    installments = []
+    for n in range(count):
+        # Tolerância Zero: a última parcela absorve a diferença do arredondamento.
+        last = n == count - 1
+        amount = expense.actual_amount - share * (count - 1) if last else share
+        due_date = first_due + timedelta(days=30 * n)
+        if due_date >= config.today:
+            status, paid_date = Installment.StatusChoices.PENDING, None
+        elif rng.random() < 0.8:
+            status, paid_date = Installment.StatusChoices.PAID, due_date
+        else:
+            status, paid_date = Installment.StatusChoices.OVERDUE, None
+        installments.append(
+            Installment(
+                uuid=_uuid(rng),
+                company=expense.company,
+                wedding=expense.wedding,
+                expense=expense,
+                installment_number=n + 1,
+                amount=amount,
+                due_date=due_date,
+                paid_date=paid_date,
+                status=status,
+            )
+        )
+    return installments
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    """UUID v4 derivado do gerador da empresa (determinístico por seed)."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
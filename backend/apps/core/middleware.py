@@ -1,9 +1,19 @@
+import logging
+import random
+import re
+import time
+import traceback
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from fnmatch import fnmatch
 from typing import Any, cast
 
 import sentry_sdk
-from django.http import HttpRequest, HttpResponse
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 
 from .logging import _thread_locals
 
@@ -38,3 +48,217 @@ class RequestIDMiddleware:
         response["X-Request-ID"] = request_id
 
         return response
+
+
+sql_logger = logging.getLogger("wedding_management.sql")
+
+# Listas IN de tamanhos diferentes são a mesma query para fins de duplicidade.
+_IN_LIST_RE = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+class QueryProfile:
+    """
+    Wrapper de execução (connection.execute_wrapper) que acumula, por
+    requisição, a quantidade de queries, o tempo de banco e o tempo por SQL.
+
+    No caminho quente só há um perf_counter e uma atualização de dicionário
+    por query; a normalização das SQLs fica para o fim da requisição. Com
+    ``capture_at`` > 0 (requisições amostradas pelo detector de N+1), a pilha
+    de chamadas é capturada uma única vez por SQL, quando ela atinge esse
+    número de execuções.
+    """
+
+    __slots__ = ("call_sites", "capture_at", "count", "duration", "statements")
+
+    def __init__(self, *, capture_at: int = 0) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: dict[str, list[float]] = {}
+        self.capture_at = capture_at
+        self.call_sites: dict[str, list[str]] = {}
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            stats = self.statements.get(sql)
+            if stats is None:
+                self.statements[sql] = [1, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if stats[0] == self.capture_at:
+                    self.call_sites[sql] = _app_call_site()
+
+    def fingerprints(self) -> dict[str, list[float]]:
+        """Agrupa as SQLs por impressão digital: ``{sql: [execuções, segundos]}``."""
+        grouped: dict[str, list[float]] = {}
+        for sql, (count, duration) in self.statements.items():
+            key = _IN_LIST_RE.sub("IN (...)", sql)
+            stats = grouped.setdefault(key, [0, 0.0])
+            stats[0] += count
+            stats[1] += duration
+        return grouped
+
+
+def _app_call_site(limit: int = 8) -> list[str]:
+    """Frames do código da aplicação (apps/) que levaram à query atual."""
+    apps_dir = str(settings.BASE_DIR / "apps")
+    frames = [
+        f"{frame.filename.removeprefix(str(settings.BASE_DIR) + '/')}:"
+        f"{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(apps_dir) and frame.filename != __file__
+    ]
+    return frames[-limit:]
+
+
+class QueryProfilingMiddleware:
+    """
+    Mede o uso de banco de cada requisição e o expõe para observabilidade.
+
+    - Header ``Server-Timing`` com o tempo de banco e o tempo total (DevTools);
+    - Log estruturado (``wedding_management.sql``) com queries, tempo de banco
+      e SQLs duplicadas, ao lado do request_id do RequestIDMiddleware;
+    - Requisições lentas são amostradas (``SQL_PROFILING_SLOW_SAMPLE_RATE``) e
+      registradas como WARNING com as SQLs mais caras;
+    - Detector de N+1 amostrado (``N_PLUS_ONE_SAMPLE_RATE``): SQLs idênticas a
+      menos dos parâmetros repetidas ``N_PLUS_ONE_THRESHOLD`` vezes na mesma
+      requisição são reportadas ao log e ao Sentry com a pilha de chamadas.
+      Rotas em ``N_PLUS_ONE_ALLOWLIST`` (padrões fnmatch) são ignoradas.
+
+    Desativado por ``SQL_PROFILING_ENABLED``, o Django remove o middleware da
+    cadeia (MiddlewareNotUsed) e o custo é zero.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]):
+        if not settings.SQL_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = settings.SQL_PROFILING_SLOW_REQUEST_MS
+        self.sample_rate = settings.SQL_PROFILING_SLOW_SAMPLE_RATE
+        self.top_queries = settings.SQL_PROFILING_TOP_QUERIES
+        self.n_plus_one_rate = settings.N_PLUS_ONE_SAMPLE_RATE
+        self.n_plus_one_threshold = settings.N_PLUS_ONE_THRESHOLD
+        self.n_plus_one_allowlist = tuple(settings.N_PLUS_ONE_ALLOWLIST)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        detect = (
+            random.random() < self.n_plus_one_rate  # noqa: S311
+            and not any(fnmatch(request.path, p) for p in self.n_plus_one_allowlist)
+        )
+        profile = QueryProfile(capture_at=self.n_plus_one_threshold if detect else 0)
+        start = time.perf_counter()
+        with connection.execute_wrapper(profile):
+            response = self.get_response(request)
+
+        if response.streaming:
+            streaming = cast(StreamingHttpResponse, response)
+            if streaming.is_async:
+                # As queries do stream assíncrono rodam em outras threads
+                # (sync_to_async), fora do alcance do execute_wrapper.
+                sql_logger.info(
+                    "Perfil SQL ignorado: resposta em streaming assíncrono",
+                    extra={"method": request.method, "path": request.path},
+                )
+                return response
+            # O corpo só é gerado (e consultado) enquanto o servidor o envia:
+            # o perfil acompanha o stream e é registrado quando ele fecha.
+            streaming.streaming_content = self._profile_stream(
+                request,
+                streaming,
+                cast(Iterator[bytes], streaming.streaming_content),
+                profile,
+                start,
+            )
+            return response
+
+        total_ms = self._record(request, response, profile, start)
+        response["Server-Timing"] = (
+            f'db;dur={profile.duration * 1000:.1f};desc="{profile.count} queries", '
+            f"total;dur={total_ms:.1f}"
+        )
+        return response
+
+    def _profile_stream(
+        self,
+        request: HttpRequest,
+        response: StreamingHttpResponse,
+        content: Iterator[bytes],
+        profile: QueryProfile,
+        start: float,
+    ) -> Iterator[bytes]:
+        try:
+            with connection.execute_wrapper(profile):
+                yield from content
+        finally:
+            self._record(request, response, profile, start)
+
+    def _record(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        profile: QueryProfile,
+        start: float,
+    ) -> float:
+        """Registra o perfil no log (e o N+1, se houver); devolve o tempo total."""
+        total_ms = (time.perf_counter() - start) * 1000
+        db_ms = profile.duration * 1000
+
+        fingerprints = profile.fingerprints()
+        duplicates = sum(int(count) - 1 for count, _ in fingerprints.values())
+        fields: dict[str, Any] = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 1),
+            "db_queries": profile.count,
+            "db_time_ms": round(db_ms, 1),
+            "db_duplicate_queries": duplicates,
+            "streaming": response.streaming,
+        }
+
+        if total_ms >= self.slow_ms and random.random() < self.sample_rate:  # noqa: S311
+            top = sorted(
+                fingerprints.items(), key=lambda item: item[1][1], reverse=True
+            )
+            fields["db_top_queries"] = [
+                {"sql": sql, "count": int(count), "time_ms": round(duration * 1000, 1)}
+                for sql, (count, duration) in top[: self.top_queries]
+            ]
+            sql_logger.warning("Requisição lenta", extra=fields)
+        else:
+            sql_logger.info("Perfil SQL da requisição", extra=fields)
+
+        if profile.call_sites:
+            self._report_n_plus_one(request, profile)
+        return total_ms
+
+    def _report_n_plus_one(self, request: HttpRequest, profile: QueryProfile) -> None:
+        """Registra cada SQL repetida da requisição amostrada (log + Sentry)."""
+        for sql, call_site in profile.call_sites.items():
+            fingerprint = _IN_LIST_RE.sub("IN (...)", sql)
+            details = {
+                "method": request.method,
+                "path": request.path,
+                "sql": fingerprint,
+                "count": int(profile.statements[sql][0]),
+                "call_site": call_site,
+            }
+            sql_logger.warning("Possível N+1 detectado", extra=details)
+            with sentry_sdk.new_scope() as scope:
+                # Agrupa no Sentry por SQL e local de origem, não por rota.
+                scope.fingerprint = ["n-plus-one", fingerprint, *call_site[-1:]]
+                scope.set_context("n_plus_one", details)
+                sentry_sdk.capture_message(f"N+1: {fingerprint[:120]}", level="warning")
@@ -0,0 +1,46 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Assume o dead-letter de e-mails, antes em notifications, sem recriar a tabela."""
+
+    initial = True
+
+    dependencies = [
+        ('notifications', '0010_failed_email_drop_body'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='FailedEmail',
+                    fields=[
+                        ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                        ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                        ('created_at', models.DateTimeField(auto_now_add=True)),
+                        ('updated_at', models.DateTimeField(auto_now=True)),
+                        ('subject', models.CharField(max_length=255, verbose_name='Assunto')),
+                        ('to', models.JSONField(default=list, verbose_name='Destinatários')),
+                        ('from_email', models.CharField(max_length=255, verbose_name='Remetente')),
+                        ('template', models.CharField(blank=True, max_length=255, verbose_name='Template')),
+                        ('attempts', models.PositiveIntegerField(default=0, verbose_name='Tentativas')),
+                        ('last_error', models.TextField(blank=True, verbose_name='Último erro')),
+                    ],
+                    options={
+                        'verbose_name': 'E-mail com Falha',
+                        'verbose_name_plural': 'E-mails com Falha',
+                        'db_table': 'notification_failed_emails',
+                        'ordering': ['-created_at'],
+                    },
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.AlterModelTable(
+            name='failedemail',
+            table='core_failed_emails',
+        ),
+    ]
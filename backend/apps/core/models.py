@@ -2,6 +2,7 @@ from typing import Any, Self, cast
 from uuid import UUID, uuid4
 
 from django.db import models
+from django.utils.translation import gettext_lazy as _
 
 
 class BaseModel(models.Model):
@@ -33,3 +34,30 @@ class BaseModel(models.Model):
     def get_by_uuid(cls, uuid_value: UUID | str) -> Self | None:
         """Busca rápida por identificador público."""
         return cast(Self | None, cls.objects.filter(uuid=uuid_value).first())  # type: ignore[attr-defined]
+
+
+class FailedEmail(BaseModel):
+    """
+    Dead-letter da fila de e-mails transacionais (``apps.core.mail``).
+
+    Registra as mensagens que esgotaram as tentativas de envio, para inspeção
+    pelo admin. O corpo não é guardado: os e-mails transacionais carregam
+    links de uso único (redefinição de senha, verificação de e-mail) que não
+    devem ficar em texto puro no banco; o usuário solicita um novo envio.
+    """
+
+    subject = models.CharField(_("Assunto"), max_length=255)
+    to = models.JSONField(_("Destinatários"), default=list)
+    from_email = models.CharField(_("Remetente"), max_length=255)
+    template = models.CharField(_("Template"), max_length=255, blank=True)
+    attempts = models.PositiveIntegerField(_("Tentativas"), default=0)
+    last_error = models.TextField(_("Último erro"), blank=True)
+
+    class Meta:
+        verbose_name = _("E-mail com Falha")
+        verbose_name_plural = _("E-mails com Falha")
+        db_table = "core_failed_emails"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.subject} -> {', '.join(self.to)}"
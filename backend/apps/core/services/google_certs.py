@@ -0,0 +1,182 @@
+"""
+Transporte HTTP com cache para os certificados públicos do Google.
+
+``id_token.verify_oauth2_token`` baixa os certificados de assinatura a cada
+chamada quando recebe um ``google_requests.Request()`` novo. Este transporte
+guarda a resposta pelo ``max-age`` do ``Cache-Control``, é compartilhado entre
+as threads do processo, renova em segundo plano antes do vencimento e reutiliza
+um pool de conexões HTTP.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+import requests
+from google.auth import exceptions
+from google.auth import transport as google_transport
+
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Resposta no formato de ``google.auth.transport.Response``."""
+
+    status: int
+    headers: Mapping[str, str]
+    data: bytes
+
+
+@dataclass
+class _CacheEntry:
+    response: CachedResponse
+    expires_at: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class CachedCertsRequest(google_transport.Request):
+    """
+    Transporte ``google.auth`` que mantém os GETs em cache até o ``max-age``.
+
+    - Dentro da janela ``refresh_margin`` antes do vencimento, a resposta em
+      cache continua sendo servida enquanto uma thread de fundo a renova;
+    - Vencido o cache, apenas uma thread baixa de novo (as demais aguardam);
+    - Falhas na renovação em fundo mantêm a resposta atual até o vencimento.
+
+    Args:
+        session: Sessão HTTP (pool de conexões). Uma nova é criada se omitida.
+        refresh_margin: Segundos antes do vencimento para renovar em fundo.
+        default_ttl: TTL usado quando a resposta não informa ``max-age``.
+        timeout: Timeout das requisições HTTP, em segundos.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        *,
+        refresh_margin: float = 300,
+        default_ttl: float = 3600,
+        timeout: float = 5,
+    ) -> None:
+        self.session = session or requests.Session()
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.timeout = timeout
+        self._entries: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+
+    def __call__(
+        self,
+        url: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Any = None,
+        timeout: Any = None,
+        **kwargs: Any,
+    ) -> CachedResponse:
+        if method != "GET":
+            return self._fetch(url, method=method, body=body, headers=headers)
+
+        entry = self._entry(url)
+        now = time.monotonic()
+        if now < entry.expires_at:
+            if now >= entry.expires_at - self.refresh_margin:
+                self._schedule_refresh(url)
+            return entry.response
+
+        with entry.lock:
+            # Outra thread pode ter renovado enquanto esperávamos o lock.
+            if time.monotonic() < entry.expires_at:
+                return entry.response
+            return self._store(url, entry)
+
+    def _entry(self, url: str) -> _CacheEntry:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                entry = _CacheEntry(
+                    response=CachedResponse(status=0, headers={}, data=b""),
+                    expires_at=0.0,
+                )
+                self._entries[url] = entry
+            return entry
+
+    def _store(self, url: str, entry: _CacheEntry) -> CachedResponse:
+        """Baixa a URL e, se a resposta for 200, a guarda até o ``max-age``."""
+        response = self._fetch(url)
+        if response.status == 200:
+            entry.response = response
+            entry.expires_at = time.monotonic() + self._ttl(response.headers)
+        return response
+
+    def _fetch(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        body: Any = None,
+        headers: Any = None,
+    ) -> CachedResponse:
+        try:
+            response = self.session.request(
+                method, url, data=body, headers=headers, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            raise exceptions.TransportError(e) from e  # type: ignore[no-untyped-call]
+        return CachedResponse(
+            status=response.status_code,
+            headers=response.headers,  # CaseInsensitiveDict
+            data=response.content,
+        )
+
+    def _ttl(self, headers: Mapping[str, str]) -> float:
+        """TTL pelo ``max-age`` do Cache-Control, descontando o header ``Age``."""
+        match = _MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+        if match is None:
+            return self.default_ttl
+        age = headers.get("Age", "0")
+        return max(int(match.group(1)) - (int(age) if age.isdigit() else 0), 0)
+
+    def _schedule_refresh(self, url: str) -> None:
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+        threading.Thread(
+            target=self._refresh, args=(url,), name="google-certs-refresh", daemon=True
+        ).start()
+
+    def _refresh(self, url: str) -> None:
+        entry = self._entry(url)
+        try:
+            with entry.lock:
+                self._store(url, entry)
+        except Exception:
+            logger.warning("Falha ao renovar certificados do Google em %s", url)
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+
+@cache
+def get_google_certs_request() -> CachedCertsRequest:
+    """
+    Retorna o transporte com cache compartilhado pelo processo.
+
+    Returns:
+        Instância única de CachedCertsRequest com pool de conexões HTTP.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    return CachedCertsRequest(session)
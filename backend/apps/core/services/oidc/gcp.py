@@ -2,9 +2,10 @@ import logging
 from typing import cast
 
 from django.conf import settings
-from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 
+from apps.core.services.google_certs import get_google_certs_request
+
 from .base import OIDCClaims
 
 
@@ -43,7 +44,7 @@ class GCPOIDCVerifier:
             OIDCClaims,
             id_token.verify_oauth2_token(  # type: ignore[no-untyped-call]
                 token,
-                google_requests.Request(),
+                get_google_certs_request(),
                 audience=self.audience,
             ),
         )
@@ -2,10 +2,11 @@ import logging
 from typing import cast
 
 from django.conf import settings
-from google.auth.transport import requests
 from google.oauth2 import id_token as google_id_token
 from ninja.errors import HttpError
 
+from apps.core.services.google_certs import get_google_certs_request
+
 from .base import GoogleIDTokenClaims, OAuthUserInfo
 
 
@@ -43,7 +44,7 @@ class GoogleOAuthProvider:
                 GoogleIDTokenClaims,
                 google_id_token.verify_oauth2_token(  # type: ignore[no-untyped-call]
                     token,
-                    requests.Request(),
+                    get_google_certs_request(),
                     client_id,
                 ),
             )
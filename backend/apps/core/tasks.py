@@ -0,0 +1,78 @@
+import logging
+from datetime import timedelta
+from typing import Any
+
+import sentry_sdk
+from django.conf import settings
+from django.tasks import task
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+@task()
+def send_email_batch(payloads: list[dict[str, Any]], attempt: int = 1) -> int:
+    """Envia um lote de e-mails, repetindo as falhas até EMAIL_QUEUE_MAX_ATTEMPTS.
+
+    Com um backend de tarefas que aceita agendamento (``supports_defer``), as
+    falhas voltam para a fila com backoff exponencial. No backend imediato
+    (produção, sem worker) elas são repetidas na hora, no mesmo processo.
+
+    Ao esgotar as tentativas, as mensagens que ainda falham são gravadas no
+    dead-letter (FailedEmail) e reportadas ao Sentry. Só os metadados são
+    gravados: o corpo traz links de redefinição de senha e de verificação
+    ainda válidos.
+
+    Args:
+        payloads: Mensagens serializadas por ``RenderedEmail.to_payload``.
+        attempt: Número da tentativa atual (1 na primeira execução).
+
+    Returns:
+        Quantidade de mensagens enviadas nesta execução.
+    """
+    from apps.core.mail import RenderedEmail, deliver
+    from apps.core.models import FailedEmail
+
+    messages = [RenderedEmail(**payload) for payload in payloads]
+    failures = deliver(messages)
+    while failures and attempt < settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+        if send_email_batch.get_backend().supports_defer:
+            delay = settings.EMAIL_QUEUE_RETRY_BASE_SECONDS * 2 ** (attempt - 1)
+            logger.warning(
+                "Falha ao enviar %d e-mail(s); nova tentativa %d em %ds.",
+                len(failures),
+                attempt + 1,
+                delay,
+            )
+            send_email_batch.using(
+                run_after=timezone.now() + timedelta(seconds=delay)
+            ).enqueue([message.to_payload() for message, _ in failures], attempt + 1)
+            return len(messages) - len(failures)
+        attempt += 1
+        failures = deliver([message for message, _ in failures])
+
+    if failures:
+        FailedEmail.objects.bulk_create(
+            [
+                FailedEmail(
+                    subject=message.subject,
+                    to=message.to,
+                    from_email=message.from_email,
+                    template=message.template,
+                    attempts=attempt,
+                    last_error=repr(error)[:1000],
+                )
+                for message, error in failures
+            ]
+        )
+        logger.error(
+            "%d e-mail(s) movido(s) para o dead-letter após %d tentativas.",
+            len(failures),
+            attempt,
+        )
+        sentry_sdk.capture_message(
+            f"{len(failures)} e-mail(s) no dead-letter", level="error"
+        )
+
+    return len(messages) - len(failures)
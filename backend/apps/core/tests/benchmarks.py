@@ -0,0 +1,346 @@
+"""
+Utilitários do benchmark de endpoints da API (contagem de queries e latência).
+
+Descobre todas as operações GET registradas em ``config/api.py`` a partir do
+schema OpenAPI, popula um tenant com N casamentos usando as factories
+existentes e mede cada endpoint pelo test client do Django. A comparação com
+um baseline JSON aponta regressões de queries, latência e memória.
+"""
+
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.finances.models import ExpenseImportJob
+from apps.finances.tests.factories import (
+    BudgetCategoryFactory,
+    BudgetFactory,
+    ExpenseFactory,
+    InstallmentFactory,
+)
+from apps.logistics.tests.factories import (
+    ContractFactory,
+    ItemFactory,
+    SupplierFactory,
+)
+from apps.notifications.tests.factories import NotificationFactory
+from apps.scheduler.models import CalendarFeed, ScheduleTemplate
+from apps.scheduler.tests.factories import EventFactory, TaskFactory
+from apps.users.models import User
+from apps.weddings.tests.factories import WeddingFactory
+
+
+# Operações que não fazem sentido no test client síncrono (SSE exige ASGI).
+EXCLUDED_OPERATIONS: frozenset[str] = frozenset({"notifications_stream"})
+
+# Folgas absolutas que evitam falsos positivos em números muito pequenos.
+LATENCY_FLOOR_MS = 2.0
+MEMORY_FLOOR_KIB = 64.0
+
+
+@dataclass(frozen=True)
+class BenchmarkEndpoint:
+    """Operação GET descoberta no schema OpenAPI."""
+
+    operation_id: str
+    path: str
+    path_params: tuple[str, ...]
+    query_params: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class EndpointMeasurement:
+    """Resultado medido de um endpoint para um tamanho de tenant."""
+
+    status: int
+    queries: int
+    p50_ms: float
+    p95_ms: float
+    peak_kib: float
+
+
+def discover_get_endpoints(api: Any) -> list[BenchmarkEndpoint]:
+    """
+    Lista as operações GET de todos os routers registrados na API.
+
+    Args:
+        api: Instância NinjaAPI (``config.api.api``).
+
+    Returns:
+        Endpoints ordenados por operation_id, sem os excluídos.
+    """
+    schema = api.get_openapi_schema()
+    endpoints: list[BenchmarkEndpoint] = []
+    for path, operations in schema["paths"].items():
+        operation = operations.get("get")
+        if not operation or operation["operationId"] in EXCLUDED_OPERATIONS:
+            continue
+        params = operation.get("parameters", [])
+        endpoints.append(
+            BenchmarkEndpoint(
+                operation_id=operation["operationId"],
+                path=path,
+                path_params=tuple(p["name"] for p in params if p["in"] == "path"),
+                query_params=tuple(
+                    p["name"]
+                    for p in params
+                    if p["in"] == "query" and p.get("required")
+                ),
+            )
+        )
+    return sorted(endpoints, key=lambda e: e.operation_id)
+
+
+def seed_tenant(user: User, weddings: int) -> dict[str, Any]:
+    """
+    Popula o tenant do usuário com ``weddings`` casamentos completos.
+
+    Cada casamento recebe orçamento, categoria, despesa com parcela,
+    fornecedor, contrato, item, evento, tarefa, feed de calendário, template
+    de cronograma, importação de despesas e uma notificação.
+
+    Args:
+        user: Usuário cujo tenant será populado.
+        weddings: Quantidade de casamentos a criar.
+
+    Returns:
+        Objetos do último casamento, usados para preencher parâmetros de rota.
+    """
+    company = user.company
+    seeded: dict[str, Any] = {}
+    for _ in range(weddings):
+        wedding: Any = WeddingFactory(company=company)
+        budget = BudgetFactory(wedding=wedding)
+        category = BudgetCategoryFactory(budget=budget, wedding=wedding)
+        expense = ExpenseFactory(wedding=wedding, category=category)
+        installment = InstallmentFactory(expense=expense, amount=expense.actual_amount)
+        supplier = SupplierFactory(company=company)
+        contract = ContractFactory(wedding=wedding, supplier=supplier)
+        item = ItemFactory(wedding=wedding, contract=contract)
+        event = EventFactory(wedding=wedding)
+        task = TaskFactory(wedding=wedding)
+        calendar_feed = CalendarFeed.objects.create(company=company, wedding=wedding)
+        schedule_template = ScheduleTemplate.objects.create(
+            company=company, key=f"template-{wedding.pk}", name="Template"
+        )
+        expense_import = ExpenseImportJob.objects.create(
+            company=company,
+            wedding=wedding,
+            filename="despesas.csv",
+            file_format=ExpenseImportJob.FormatChoices.CSV,
+        )
+        NotificationFactory(user=user, wedding_id=wedding.uuid)
+        seeded = {
+            "wedding": wedding,
+            "budget": budget,
+            "category": category,
+            "expense": expense,
+            "installment": installment,
+            "supplier": supplier,
+            "contract": contract,
+            "item": item,
+            "event": event,
+            "task": task,
+            "calendar_feed": calendar_feed,
+            "schedule_template": schedule_template,
+            "expense_import": expense_import,
+        }
+    return seeded
+
+
+# Objeto semeado que preenche o parâmetro de rota de cada operação de detalhe.
+PATH_OBJECTS: dict[str, str] = {
+    "weddings_read": "wedding",
+    "dashboard_wedding": "wedding",
+    "reports_wedding_export": "wedding",
+    "finances_budgets_for_wedding": "wedding",
+    "finances_budgets_read": "budget",
+    "finances_categories_read": "category",
+    "finances_expenses_read": "expense",
+    "finances_installments_read": "installment",
+    "finances_imports_read": "expense_import",
+    "logistics_suppliers_read": "supplier",
+    "logistics_contracts_read": "contract",
+    "logistics_items_read": "item",
+    "scheduler_events_read": "event",
+    "scheduler_feeds_ics": "calendar_feed",
+    "scheduler_templates_read": "schedule_template",
+}
+
+# Parâmetros de rota que não identificam um objeto (ex.: enums).
+PATH_LITERALS: dict[str, dict[str, str]] = {
+    "reports_bulk_export": {"resource": "weddings"},
+}
+
+
+def build_url(endpoint: BenchmarkEndpoint, seeded: dict[str, Any]) -> str:
+    """
+    Monta a URL concreta do endpoint usando os objetos semeados.
+
+    Args:
+        endpoint: Operação descoberta no schema.
+        seeded: Objetos retornados por ``seed_tenant``.
+
+    Returns:
+        URL com parâmetros de rota e de query obrigatórios preenchidos.
+
+    Raises:
+        KeyError: Se uma operação com parâmetros de rota não estiver em
+            PATH_OBJECTS ou PATH_LITERALS (novos endpoints precisam ser
+            mapeados).
+    """
+    url = endpoint.path
+    if endpoint.path_params:
+        literals = PATH_LITERALS.get(endpoint.operation_id, {})
+        for name in endpoint.path_params:
+            if name in literals:
+                value = literals[name]
+            else:
+                obj = seeded[PATH_OBJECTS[endpoint.operation_id]]
+                # O feed .ics é acessado pelo token público, não pelo UUID.
+                value = obj.token if name == "token" else obj.uuid
+            url = url.replace(f"{{{name}}}", str(value))
+    today = timezone.localdate()
+    query_values = {
+        "year": str(today.year),
+        # Janela do calendário de ocorrências: o ano corrente.
+        "start_date": today.replace(month=1, day=1).isoformat(),
+        "end_date": today.replace(month=12, day=31).isoformat(),
+    }
+    query = "&".join(f"{name}={query_values[name]}" for name in endpoint.query_params)
+    return f"{url}?{query}" if query else url
+
+
+def _get(client: Client, url: str) -> Any:
+    response = client.get(url)
+    if response.streaming:
+        # Respostas em streaming só executam as queries ao serem consumidas.
+        cast(StreamingHttpResponse, response).getvalue()
+    return response
+
+
+def measure_endpoint(client: Client, url: str, repeats: int) -> EndpointMeasurement:
+    """
+    Mede queries, latência (p50/p95) e pico de memória de um GET.
+
+    Args:
+        client: Test client autenticado.
+        url: URL a requisitar.
+        repeats: Quantidade de requisições cronometradas.
+
+    Returns:
+        EndpointMeasurement com os números coletados.
+    """
+    _get(client, url)  # aquecimento (imports, caches de schema)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = _get(client, url)
+    # Lido já: cada request_started limpa o log de queries da conexão.
+    queries = len(ctx.captured_queries)
+
+    tracemalloc.start()
+    _get(client, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _get(client, url)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if len(timings) > 1:
+        percentiles = statistics.quantiles(timings, n=20, method="inclusive")
+        p95 = percentiles[18]
+    else:
+        p95 = timings[0]
+
+    return EndpointMeasurement(
+        status=response.status_code,
+        queries=queries,
+        p50_ms=round(statistics.median(timings), 3),
+        p95_ms=round(p95, 3),
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def find_regressions(
+    current: dict[str, dict[str, dict[str, Any]]],
+    baseline: dict[str, dict[str, dict[str, Any]]],
+    *,
+    tolerance: float,
+) -> list[str]:
+    """
+    Compara resultados atuais com o baseline e lista as pioras.
+
+    Qualquer query a mais é regressão. Latência e memória só contam quando
+    passam da tolerância relativa e das folgas absolutas mínimas.
+
+    Args:
+        current: Resultados atuais no formato ``{tamanho: {operação: números}}``.
+        baseline: Resultados de referência no mesmo formato.
+        tolerance: Piora relativa aceita em latência/memória (0.2 = 20%).
+
+    Returns:
+        Mensagens descrevendo cada regressão encontrada.
+    """
+    regressions: list[str] = []
+    for size, operations in current.items():
+        for operation_id, numbers in operations.items():
+            reference = baseline.get(size, {}).get(operation_id)
+            if reference is None:
+                continue
+            label = f"{operation_id} [{size} casamentos]"
+            if numbers["queries"] > reference["queries"]:
+                regressions.append(
+                    f"{label}: queries {reference['queries']} -> {numbers['queries']}"
+                )
+            for metric, floor in (
+                ("p50_ms", LATENCY_FLOOR_MS),
+                ("p95_ms", LATENCY_FLOOR_MS),
+                ("peak_kib", MEMORY_FLOOR_KIB),
+            ):
+                before, after = reference[metric], numbers[metric]
+                if after > before * (1 + tolerance) and after - before > floor:
+                    regressions.append(f"{label}: {metric} {before} -> {after}")
+    return regressions
+
+
+def write_results(path: Path, results: dict[str, dict[str, dict[str, Any]]]) -> None:
+    """
+    Grava os resultados do benchmark em JSON.
+
+    Args:
+        path: Arquivo de saída.
+        results: Resultados no formato ``{tamanho: {operação: números}}``.
+    """
+    payload = {
+        "generated_at": timezone.now().isoformat(),
+        "database": connection.vendor,
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Lê um arquivo de resultados anterior para uso como baseline.
+
+    Args:
+        path: Arquivo JSON gerado por ``write_results``.
+
+    Returns:
+        Resultados no formato ``{tamanho: {operação: números}}``.
+    """
+    data: dict[str, dict[str, dict[str, Any]]] = json.loads(path.read_text())["results"]
+    return data
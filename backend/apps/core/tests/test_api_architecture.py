@@ -17,6 +17,9 @@ from django.test import Client
 from config.api import api
 
 
+PUBLIC_TOKEN_ROUTES = {"/scheduler/feeds/{token}.ics"}
+
+
 @pytest.mark.django_db
 class TestApiArchitecture:
     """
@@ -54,8 +57,9 @@ class TestApiArchitecture:
         Garante que requisições não autenticadas para rotas protegidas
         retornam HTTP 401.
 
-        Filtra as rotas públicas (/health e /auth/*) e dispara requisições HTTP
-        simuladas para todas as demais rotas para assegurar a blindagem de segurança.
+        Filtra as rotas públicas (/health, /auth/* e o feed .ics) e dispara
+        requisições HTTP simuladas para todas as demais rotas para assegurar a
+        blindagem de segurança.
         """
         unauthorized_failures: list[str] = []
         tested_count = 0
@@ -66,6 +70,9 @@ class TestApiArchitecture:
                 # Ignora rotas públicas de infraestrutura e autenticação
                 if full_route.startswith("/health") or full_route.startswith("/auth/"):
                     continue
+                # Feed .ics: autenticado pelo token na própria URL
+                if full_route in PUBLIC_TOKEN_ROUTES:
+                    continue
 
                 # Substitui parâmetros de rota por valor fictício
                 normalized_path = re.sub(
@@ -0,0 +1,139 @@
+"""
+Benchmark de contagem de queries, latência e memória de todos os endpoints GET.
+
+Executado apenas com ``--api-benchmark`` (ex:
+``pytest apps/core/tests/test_api_benchmarks.py --api-benchmark
+--api-benchmark-baseline benchmark-baseline.json``). Os testes da classe
+TestBenchmarkHarness rodam sempre e garantem que novos endpoints estejam
+mapeados no harness.
+"""
+
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from apps.core.tests.benchmarks import (
+    PATH_LITERALS,
+    PATH_OBJECTS,
+    BenchmarkEndpoint,
+    build_url,
+    discover_get_endpoints,
+    find_regressions,
+    load_baseline,
+    measure_endpoint,
+    seed_tenant,
+    write_results,
+)
+from config.api import api
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "tenant_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--api-benchmark-sizes")
+        metafunc.parametrize(
+            "tenant_size", [int(size) for size in sizes.split(",") if size.strip()]
+        )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(
+    request: pytest.FixtureRequest,
+) -> Iterator[dict[str, dict[str, dict[str, Any]]]]:
+    """Acumula os resultados de todos os tamanhos e grava o JSON ao final."""
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    yield results
+    if results:
+        write_results(Path(request.config.getoption("--api-benchmark-output")), results)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_api_endpoints_benchmark(
+    tenant_size: int,
+    user: Any,
+    auth_client: Any,
+    benchmark_results: dict[str, dict[str, dict[str, Any]]],
+    request: pytest.FixtureRequest,
+) -> None:
+    seeded = seed_tenant(user, tenant_size)
+    repeats = request.config.getoption("--api-benchmark-repeats")
+
+    measured: dict[str, dict[str, Any]] = {}
+    for endpoint in discover_get_endpoints(api):
+        measurement = measure_endpoint(
+            auth_client, build_url(endpoint, seeded), repeats
+        )
+        assert measurement.status < 500, f"{endpoint.operation_id} falhou"
+        measured[endpoint.operation_id] = asdict(measurement)
+    benchmark_results[str(tenant_size)] = measured
+
+    baseline_path = request.config.getoption("--api-benchmark-baseline")
+    if baseline_path:
+        regressions = find_regressions(
+            {str(tenant_size): measured},
+            load_baseline(Path(baseline_path)),
+            tolerance=request.config.getoption("--api-benchmark-tolerance"),
+        )
+        assert not regressions, "Regressões de desempenho:\n" + "\n".join(regressions)
+
+
+@pytest.mark.unit
+class TestBenchmarkHarness:
+    """Garante que o harness cobre todos os routers e detecta regressões."""
+
+    def test_every_detail_endpoint_is_mapped(self) -> None:
+        endpoints = discover_get_endpoints(api)
+        unmapped = [
+            e.operation_id
+            for e in endpoints
+            if e.operation_id not in PATH_OBJECTS
+            and set(e.path_params) - set(PATH_LITERALS.get(e.operation_id, {}))
+        ]
+        assert not unmapped, (
+            "Endpoints GET com parâmetros de rota sem objeto em PATH_OBJECTS "
+            "ou valor em PATH_LITERALS: " + ", ".join(unmapped)
+        )
+
+    def test_discovers_endpoints_from_all_routers(self) -> None:
+        paths = {e.path for e in discover_get_endpoints(api)}
+        for prefix in (
+            "/api/v1/weddings/",
+            "/api/v1/dashboard/",
+            "/api/v1/reports/",
+            "/api/v1/logistics/",
+            "/api/v1/finances/",
+            "/api/v1/scheduler/",
+            "/api/v1/notifications/",
+        ):
+            assert any(path.startswith(prefix) for path in paths), prefix
+
+    def test_build_url_fills_path_and_required_query(self) -> None:
+        class _Obj:
+            uuid = "abc"
+
+        detail = BenchmarkEndpoint("weddings_read", "/w/{uuid}/", ("uuid",), ())
+        by_month = BenchmarkEndpoint("weddings_by_month", "/w/", (), ("year",))
+
+        assert build_url(detail, {"wedding": _Obj()}) == "/w/abc/"
+        assert build_url(by_month, {}).startswith("/w/?year=")
+
+    def test_find_regressions(self) -> None:
+        baseline = {
+            "10": {"op": {"queries": 3, "p50_ms": 10, "p95_ms": 20, "peak_kib": 500}}
+        }
+        same = {
+            "10": {"op": {"queries": 3, "p50_ms": 11, "p95_ms": 21, "peak_kib": 510}}
+        }
+        worse = {
+            "10": {"op": {"queries": 4, "p50_ms": 30, "p95_ms": 21, "peak_kib": 510}}
+        }
+
+        assert find_regressions(same, baseline, tolerance=0.2) == []
+        assert find_regressions(worse, baseline, tolerance=0.2) == [
+            "op [10 casamentos]: queries 3 -> 4",
+            "op [10 casamentos]: p50_ms 10 -> 30",
+        ]
@@ -1,4 +1,4 @@
-"""Testes para os comandos de seed (seed_db e seed_e2e).
+"""Testes para os comandos de seed (seed_db, seed_e2e e seed_load).
 
 Verifica se os comandos populam o banco corretamente e de forma
 idempotente com dados de desenvolvimento e suíte E2E.
@@ -8,10 +8,13 @@ from datetime import date, timedelta
 
 import pytest
 from django.core.management import call_command
+from django.db.models import Sum
 
 from apps.finances.models import Budget, BudgetCategory, Expense, Installment
 from apps.logistics.models import Contract, Item, Supplier
+from apps.notifications.models import Notification, UserNotificationState
 from apps.scheduler.models import Event, Task
+from apps.tenants.models import Company
 from apps.users.models import User
 from apps.weddings.models import Wedding
 
@@ -217,3 +220,53 @@ class TestSeedE2ECommand:
         assert Installment.objects.filter(company=company).count() == 3
         assert Task.objects.filter(wedding__company=company).count() == 5
         assert Event.objects.filter(wedding__company=company).count() == 4
+
+
+@pytest.mark.django_db
+class TestSeedLoadCommand:
+    OPTIONS = {
+        "tenants": 2,
+        "planners": 2,
+        "suppliers": 3,
+        "weddings": 4,
+        "contracts": 2,
+        "installments": 3,
+        "events": 2,
+        "notifications": 1,
+        "chunk_size": 5,
+    }
+
+    def test_seed_load_creates_requested_volume(self) -> None:
+        call_command("seed_load", **self.OPTIONS)
+
+        assert Company.objects.filter(slug__startswith="load-42-").count() == 2
+        assert User.objects.filter(email__endswith="@load.test").count() == 4
+        assert Wedding.objects.count() == 8
+        assert Budget.objects.count() == 8
+        assert Contract.objects.count() == 16
+        assert Expense.objects.filter(contract__isnull=False).count() == 16
+        assert Installment.objects.count() == 48
+        assert Event.objects.count() == 16
+        assert Notification.objects.count() == 16
+
+    def test_seed_load_installments_match_expense_amounts(self) -> None:
+        call_command("seed_load", **self.OPTIONS)
+
+        for expense in Expense.objects.annotate(total=Sum("installments__amount")):
+            assert expense.total == expense.actual_amount
+
+    def test_seed_load_reconciles_unread_counters(self) -> None:
+        call_command("seed_load", **self.OPTIONS)
+
+        for state in UserNotificationState.objects.all():
+            unread = Notification.objects.filter(user=state.user, is_read=False)
+            assert state.unread_count == unread.count()
+
+    def test_seed_load_is_deterministic_and_idempotent(self) -> None:
+        call_command("seed_load", **self.OPTIONS)
+        first = set(Wedding.objects.values_list("uuid", flat=True))
+
+        call_command("seed_load", **self.OPTIONS)
+
+        assert set(Wedding.objects.values_list("uuid", flat=True)) == first
+        assert Wedding.objects.count() == 8
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from django.test import Client
 
@@ -81,3 +83,26 @@ class TestCronApi:
         assert len(failing_results) == 1
         assert failing_results[0]["status"] == "error"
         assert failing_results[0]["message"] == "Erro interno ao executar a tarefa."
+
+    def test_event_reminders_endpoint_dispatches_due_reminders(
+        self, client: Client
+    ) -> None:
+        """O endpoint por minuto dispara o envio dos lembretes vencidos."""
+        with patch(
+            "apps.scheduler.services.reminders.EventReminderService.dispatch_due",
+            return_value=3,
+        ) as dispatch:
+            response = client.post(
+                "/api/v1/internal/cron/event-reminders/",
+                HTTP_AUTHORIZATION="Bearer dev-cron-token",
+            )
+
+        assert response.status_code == 200
+        assert response.json()["reminded"] == 3
+        dispatch.assert_called_once_with()
+
+    def test_event_reminders_missing_token_returns_401(self, client: Client) -> None:
+        """O endpoint de lembretes também exige o token OIDC."""
+        response = client.post("/api/v1/internal/cron/event-reminders/")
+
+        assert response.status_code == 401
@@ -0,0 +1,198 @@
+"""Testes do transporte com cache dos certificados do Google.
+
+Usa um servidor HTTP local como stub do endpoint de certificados, sem rede.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from google.auth import exceptions
+from google.oauth2 import id_token
+
+from apps.core.services.google_certs import CachedCertsRequest
+
+
+class StubCertServer:
+    """Servidor local que conta os downloads e serve um JSON de certificados."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.certs: dict[str, str] = {"kid-1": "cert"}
+        self.cache_control = "public, max-age=3600"
+        self.status = 200
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub.hits += 1
+                time.sleep(0.01)  # alarga a janela de corrida entre threads
+                body = json.dumps(stub.certs).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Cache-Control", stub.cache_control)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/oauth2/v1/certs"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "StubCertServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def cert_server() -> Iterator[StubCertServer]:
+    with StubCertServer() as server:
+        yield server
+
+
+class TestCachedCertsRequest:
+    def test_serves_cached_response_within_max_age(
+        self, cert_server: StubCertServer
+    ) -> None:
+        request = CachedCertsRequest()
+
+        first = request(cert_server.url)
+        second = request(cert_server.url)
+
+        assert cert_server.hits == 1
+        assert first.status == 200
+        assert json.loads(second.data) == {"kid-1": "cert"}
+
+    def test_refetches_after_max_age_expires(self, cert_server: StubCertServer) -> None:
+        cert_server.cache_control = "public, max-age=0"
+        request = CachedCertsRequest(refresh_margin=0)
+
+        request(cert_server.url)
+        request(cert_server.url)
+
+        assert cert_server.hits == 2
+
+    def test_uses_default_ttl_without_max_age(
+        self, cert_server: StubCertServer
+    ) -> None:
+        cert_server.cache_control = "no-transform"
+        request = CachedCertsRequest(default_ttl=3600)
+
+        request(cert_server.url)
+        request(cert_server.url)
+
+        assert cert_server.hits == 1
+
+    def test_concurrent_cold_calls_download_once(
+        self, cert_server: StubCertServer
+    ) -> None:
+        request = CachedCertsRequest()
+        threads = [
+            threading.Thread(target=request, args=(cert_server.url,)) for _ in range(10)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cert_server.hits == 1
+
+    def test_refreshes_in_background_before_expiry(
+        self, cert_server: StubCertServer
+    ) -> None:
+        cert_server.cache_control = "public, max-age=60"
+        request = CachedCertsRequest(refresh_margin=120)
+        request(cert_server.url)
+        cert_server.certs = {"kid-2": "rotated"}
+
+        stale = request(cert_server.url)
+
+        assert json.loads(stale.data) == {"kid-1": "cert"}
+        deadline = time.monotonic() + 2
+        while cert_server.hits < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert json.loads(request(cert_server.url).data) == {"kid-2": "rotated"}
+
+    def test_error_responses_are_not_cached(self, cert_server: StubCertServer) -> None:
+        cert_server.status = 503
+        request = CachedCertsRequest()
+
+        assert request(cert_server.url).status == 503
+        cert_server.status = 200
+        assert request(cert_server.url).status == 200
+        assert cert_server.hits == 2
+
+    def test_connection_errors_raise_transport_error(self) -> None:
+        request = CachedCertsRequest(timeout=0.5)
+
+        with pytest.raises(exceptions.TransportError):
+            request("http://127.0.0.1:9/certs")
+
+
+class TestVerifyWithCachedCerts:
+    def test_verifies_id_token_against_stub_certs(
+        self, cert_server: StubCertServer
+    ) -> None:
+        """Fluxo completo do google-auth usando o transporte com cache."""
+        pytest.importorskip("cryptography")
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.x509.oid import NameOID
+        from google.auth import crypt, jwt
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "stub")])
+        now = datetime.now(UTC)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(1)
+            .not_valid_before(now - timedelta(days=1))
+            .not_valid_after(now + timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+        cert_server.certs = {
+            "kid-1": cert.public_bytes(serialization.Encoding.PEM).decode()
+        }
+        private_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        signer = crypt.RSASigner.from_string(private_pem, key_id="kid-1")
+        token = jwt.encode(
+            signer,
+            {
+                "iss": "https://accounts.google.com",
+                "aud": "client-id",
+                "email": "user@example.com",
+                "iat": int(now.timestamp()),
+                "exp": int(now.timestamp()) + 300,
+            },
+        )
+        request = CachedCertsRequest()
+
+        with patch("google.oauth2.id_token._GOOGLE_OAUTH2_CERTS_URL", cert_server.url):
+            for _ in range(3):
+                claims = id_token.verify_oauth2_token(token, request, "client-id")
+
+        assert claims["email"] == "user@example.com"
+        assert cert_server.hits == 1
@@ -0,0 +1,143 @@
+import smtplib
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core import mail
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.core import mail as core_mail
+from apps.core.mail import RenderedEmail, deliver, queue_email, queue_emails
+from apps.core.models import FailedEmail
+from apps.core.tasks import send_email_batch
+
+
+def _message(n: int = 1) -> RenderedEmail:
+    return RenderedEmail(
+        subject=f"Assunto {n}",
+        to=[f"user{n}@example.com"],
+        body="Texto",
+        html="<p>HTML</p>",
+        template="emails/test.txt",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_connection() -> Any:
+    core_mail._reset_connection()
+    yield
+    core_mail._reset_connection()
+
+
+@pytest.mark.django_db
+class TestEmailQueue:
+    def test_queue_email_sends_after_commit(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        with django_capture_on_commit_callbacks() as callbacks:
+            queue_email(_message())
+            assert mail.outbox == []
+        for callback in callbacks:
+            callback()
+
+        assert len(mail.outbox) == 1
+        sent = mail.outbox[0]
+        assert sent.to == ["user1@example.com"]
+        assert isinstance(sent, mail.EmailMultiAlternatives)
+        assert sent.alternatives[0][1] == "text/html"
+
+    @override_settings(EMAIL_QUEUE_BATCH_SIZE=2)
+    def test_queue_emails_splits_in_batches(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        with (
+            patch("apps.core.tasks.send_email_batch") as mock_batch,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            queue_emails([_message(n) for n in range(5)])
+
+        batches = mock_batch.enqueue.call_args_list
+        assert [len(call.args[0]) for call in batches] == [2, 2, 1]
+
+    def test_deliver_reuses_the_thread_connection(self) -> None:
+        with patch("apps.core.mail.get_connection", wraps=mail.get_connection) as spy:
+            deliver([_message(1), _message(2)])
+            deliver([_message(3)])
+
+        assert spy.call_count == 1
+        assert len(mail.outbox) == 3
+
+    def test_deliver_reconnects_after_server_disconnect(self) -> None:
+        connection = mail.get_connection()
+        with (
+            patch.object(RenderedEmail, "build", autospec=True) as mock_build,
+            patch("apps.core.mail.get_connection") as mock_connection,
+        ):
+            mock_connection.return_value = connection
+            first, second = MagicMock(), MagicMock()
+            first.send.side_effect = smtplib.SMTPServerDisconnected()
+            mock_build.side_effect = [first, second]
+
+            failures = deliver([_message()])
+
+        assert failures == []
+        assert mock_connection.call_count == 2
+        second.send.assert_called_once()
+
+    @override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=3, EMAIL_QUEUE_RETRY_BASE_SECONDS=10)
+    def test_failures_are_deferred_with_exponential_backoff(self) -> None:
+        failing = _message(2)
+        task = send_email_batch
+        with (
+            patch(
+                "apps.core.mail.deliver", return_value=[(failing, OSError("timeout"))]
+            ),
+            patch("apps.core.tasks.send_email_batch") as mock_task,
+        ):
+            mock_task.get_backend.return_value.supports_defer = True
+            sent = task.call(
+                [_message(1).to_payload(), failing.to_payload()], attempt=2
+            )
+
+        assert sent == 1
+        run_after = mock_task.using.call_args.kwargs["run_after"]
+        assert run_after - timezone.now() > timedelta(seconds=15)
+        mock_task.using.return_value.enqueue.assert_called_once_with(
+            [failing.to_payload()], 3
+        )
+        assert not FailedEmail.objects.exists()
+
+    @override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=3)
+    @patch("apps.core.tasks.sentry_sdk.capture_message")
+    def test_immediate_backend_retries_inline(self, mock_sentry: Any) -> None:
+        failing = _message()
+        with patch(
+            "apps.core.mail.deliver",
+            side_effect=[[(failing, OSError("timeout"))], []],
+        ) as mock_deliver:
+            sent = send_email_batch.call([failing.to_payload()])
+
+        assert sent == 1
+        assert mock_deliver.call_count == 2
+        assert not FailedEmail.objects.exists()
+        mock_sentry.assert_not_called()
+
+    @override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=3)
+    @patch("apps.core.tasks.sentry_sdk.capture_message")
+    def test_exhausted_messages_go_to_dead_letter(self, mock_sentry: Any) -> None:
+        failing = _message()
+        with patch(
+            "apps.core.mail.deliver", return_value=[(failing, OSError("timeout"))]
+        ) as mock_deliver:
+            send_email_batch.call([failing.to_payload()])
+
+        assert mock_deliver.call_count == 3
+        dead = FailedEmail.objects.get()
+        assert dead.to == ["user1@example.com"]
+        assert dead.attempts == 3
+        assert dead.template == "emails/test.txt"
+        assert "timeout" in dead.last_error
+        assert not hasattr(dead, "body")
+        mock_sentry.assert_called_once()
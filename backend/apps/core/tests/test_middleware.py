@@ -1,9 +1,19 @@
-from typing import Any
+import logging
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, cast
 from unittest.mock import patch
 
-from django.http import HttpRequest, HttpResponse
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, override_settings
 
-from apps.core.middleware import RequestIDMiddleware
+from apps.core.middleware import (
+    QueryProfile,
+    QueryProfilingMiddleware,
+    RequestIDMiddleware,
+)
+from apps.users.models import User
 
 
 class TestRequestIDMiddleware:
@@ -62,3 +72,178 @@ class TestRequestIDMiddleware:
         call_args = mock_set_context.call_args
         assert call_args[0][0] == "request"
         assert "request_id" in call_args[0][1]
+
+
+@pytest.mark.django_db
+class TestQueryProfilingMiddleware:
+    @staticmethod
+    def _view(queries: int) -> Any:
+        def get_response(request: HttpRequest) -> HttpResponse:
+            for _ in range(queries):
+                User.objects.filter(pk__in=[1, 2]).exists()
+            return HttpResponse("ok")
+
+        return get_response
+
+    def test_adds_server_timing_header(self) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=2))
+
+        response = middleware(RequestFactory().get("/api/v1/weddings/"))
+
+        assert response["Server-Timing"].startswith("db;dur=")
+        assert 'desc="2 queries"' in response["Server-Timing"]
+        assert "total;dur=" in response["Server-Timing"]
+
+    def test_logs_query_fields_and_duplicates(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=3))
+
+        with caplog.at_level(logging.INFO, logger="wedding_management.sql"):
+            middleware(RequestFactory().get("/api/v1/weddings/"))
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.INFO
+        assert record.__dict__["path"] == "/api/v1/weddings/"
+        assert record.__dict__["status"] == 200
+        assert record.__dict__["db_queries"] == 3
+        assert record.__dict__["db_duplicate_queries"] == 2
+        assert record.__dict__["db_time_ms"] >= 0
+
+    @override_settings(
+        SQL_PROFILING_SLOW_REQUEST_MS=0, SQL_PROFILING_SLOW_SAMPLE_RATE=1.0
+    )
+    def test_samples_slow_requests_with_top_queries(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=2))
+
+        with caplog.at_level(logging.INFO, logger="wedding_management.sql"):
+            middleware(RequestFactory().get("/api/v1/weddings/"))
+
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert len(record.__dict__["db_top_queries"]) == 1
+        assert record.__dict__["db_top_queries"][0]["count"] == 2
+
+    def test_streaming_response_is_profiled_until_consumed(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        def rows() -> Iterator[str]:
+            for pk in range(3):
+                yield str(User.objects.filter(pk=pk).exists())
+
+        middleware = QueryProfilingMiddleware(
+            lambda request: StreamingHttpResponse(rows())
+        )
+
+        with caplog.at_level(logging.INFO, logger="wedding_management.sql"):
+            response = middleware(RequestFactory().get("/api/v1/reports/exports/"))
+            assert not caplog.records
+            stream = cast(StreamingHttpResponse, response)
+            body = b"".join(cast(Iterator[bytes], stream.streaming_content))
+            response.close()
+
+        assert body == b"FalseFalseFalse"
+        assert "Server-Timing" not in response
+        record = caplog.records[-1]
+        assert record.__dict__["streaming"] is True
+        assert record.__dict__["db_queries"] == 3
+
+    def test_async_streaming_response_is_skipped(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        async def events() -> AsyncIterator[str]:
+            yield "data: ok\n\n"
+
+        middleware = QueryProfilingMiddleware(
+            lambda request: StreamingHttpResponse(events())
+        )
+
+        with caplog.at_level(logging.INFO, logger="wedding_management.sql"):
+            middleware(RequestFactory().get("/api/v1/notifications/stream/"))
+
+        assert caplog.records[-1].getMessage() == (
+            "Perfil SQL ignorado: resposta em streaming assíncrono"
+        )
+
+    @override_settings(SQL_PROFILING_ENABLED=False)
+    def test_disabled_middleware_is_removed_from_chain(self) -> None:
+        with pytest.raises(MiddlewareNotUsed):
+            QueryProfilingMiddleware(self._view(queries=0))
+
+
+class TestQueryProfile:
+    def test_fingerprints_group_in_lists_of_any_size(self) -> None:
+        profile = QueryProfile()
+        profile.statements = {
+            "SELECT 1 FROM t WHERE id IN (%s, %s)": [1, 0.01],
+            "SELECT 1 FROM t WHERE id IN (%s)": [2, 0.02],
+        }
+
+        fingerprints = profile.fingerprints()
+
+        assert list(fingerprints) == ["SELECT 1 FROM t WHERE id IN (...)"]
+        assert fingerprints["SELECT 1 FROM t WHERE id IN (...)"][0] == 3
+
+
+@pytest.mark.django_db
+class TestNPlusOneDetection:
+    @staticmethod
+    def _view(queries: int) -> Any:
+        def get_response(request: HttpRequest) -> HttpResponse:
+            for pk in range(queries):
+                User.objects.filter(pk=pk).exists()
+            return HttpResponse("ok")
+
+        return get_response
+
+    @override_settings(N_PLUS_ONE_SAMPLE_RATE=1.0, N_PLUS_ONE_THRESHOLD=3)
+    @patch("apps.core.middleware.sentry_sdk.capture_message")
+    def test_reports_repeated_query_with_call_site(
+        self, mock_capture: Any, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=4))
+
+        with caplog.at_level(logging.WARNING, logger="wedding_management.sql"):
+            middleware(RequestFactory().get("/api/v1/logistics/contracts/"))
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Possível N+1 detectado"
+        assert record.__dict__["count"] == 4
+        assert record.__dict__["path"] == "/api/v1/logistics/contracts/"
+        assert any(
+            "test_middleware.py" in frame for frame in record.__dict__["call_site"]
+        )
+        mock_capture.assert_called_once()
+
+    @override_settings(N_PLUS_ONE_SAMPLE_RATE=1.0, N_PLUS_ONE_THRESHOLD=5)
+    @patch("apps.core.middleware.sentry_sdk.capture_message")
+    def test_ignores_repetitions_below_threshold(self, mock_capture: Any) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=4))
+
+        middleware(RequestFactory().get("/api/v1/logistics/contracts/"))
+
+        mock_capture.assert_not_called()
+
+    @override_settings(
+        N_PLUS_ONE_SAMPLE_RATE=1.0,
+        N_PLUS_ONE_THRESHOLD=2,
+        N_PLUS_ONE_ALLOWLIST=["/api/v1/cron/*"],
+    )
+    @patch("apps.core.middleware.sentry_sdk.capture_message")
+    def test_skips_allowlisted_endpoints(self, mock_capture: Any) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=4))
+
+        middleware(RequestFactory().post("/api/v1/cron/run/"))
+
+        mock_capture.assert_not_called()
+
+    @override_settings(N_PLUS_ONE_SAMPLE_RATE=0.0, N_PLUS_ONE_THRESHOLD=2)
+    @patch("apps.core.middleware.sentry_sdk.capture_message")
+    def test_unsampled_requests_are_not_inspected(self, mock_capture: Any) -> None:
+        middleware = QueryProfilingMiddleware(self._view(queries=4))
+
+        middleware(RequestFactory().get("/api/v1/logistics/contracts/"))
+
+        mock_capture.assert_not_called()
@@ -111,6 +111,7 @@ class TestSecurityAudit:
             "apps/core/services/oidc/gcp.py",
             "apps/core/services/oidc/mock.py",
             "apps/core/services/oidc/factory.py",
+            "apps/core/services/google_certs.py",
             "apps/scheduler/services/templates.py",
         }
 
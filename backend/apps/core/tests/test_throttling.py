@@ -0,0 +1,144 @@
+"""
+Testes do rate limiting por janela deslizante (apps.core.throttling).
+
+O benchmark de concorrência (marcado ``benchmark``) roda apenas com
+``--api-benchmark``; com ``THROTTLE_REDIS_URL`` definido no ambiente ele mede
+também o store no Redis.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from django.test import RequestFactory
+
+from apps.core.throttling import (
+    LocalWindowStore,
+    RedisWindowStore,
+    SlidingWindowAnonThrottle,
+    WindowResult,
+    WindowStore,
+)
+
+
+class _Throttle(SlidingWindowAnonThrottle):
+    rate = "5/m"
+    scope = "test_scope"
+
+
+def _request(ip: str = "10.0.0.1") -> Any:
+    request = RequestFactory().post("/", REMOTE_ADDR=ip)
+    request.user = MagicMock(is_authenticated=False)
+    return request
+
+
+def _hammer(store: WindowStore, *, threads: int, hits: int, limit: int) -> int:
+    """Dispara ``threads * hits`` checagens concorrentes na mesma chave."""
+    barrier = threading.Barrier(threads)
+
+    def worker() -> int:
+        barrier.wait()
+        return sum(
+            store.hit("{k}:1", "{k}:0", limit, 0.0, 120_000).allowed
+            for _ in range(hits)
+        )
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(lambda _: worker(), range(threads)))
+
+
+class TestSlidingWindowAnonThrottle:
+    def test_blocks_after_limit_and_reports_wait(self) -> None:
+        throttle = _Throttle()
+        request = _request()
+
+        results = [throttle.allow_request(request) for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        wait = throttle.wait()
+        assert wait is not None and 0 < wait <= 120
+
+    def test_counters_are_per_client(self) -> None:
+        throttle = _Throttle()
+        for _ in range(5):
+            throttle.allow_request(_request("10.0.0.1"))
+
+        assert throttle.allow_request(_request("10.0.0.2"))
+
+    def test_previous_window_is_weighted(self) -> None:
+        throttle = _Throttle()
+        with patch.object(throttle, "timer", return_value=60.0 * 1000):
+            for _ in range(5):
+                assert throttle.allow_request(_request())
+        # 30s depois, na janela seguinte: metade da anterior ainda conta (2.5).
+        with patch.object(throttle, "timer", return_value=60.0 * 1001 + 30):
+            results = [throttle.allow_request(_request()) for _ in range(3)]
+
+        assert results == [True, True, False]
+
+    def test_retry_after_when_current_window_is_full(self) -> None:
+        wait = SlidingWindowAnonThrottle._retry_after(
+            WindowResult(False, current=5, previous=0), limit=5, duration=60, elapsed=20
+        )
+        # 40s até a virada + 12s para a janela cheia decair até caber 1 pedido.
+        assert wait == pytest.approx(52)
+
+
+class TestWindowStores:
+    def test_local_store_is_exact_under_concurrency(self) -> None:
+        allowed = _hammer(LocalWindowStore(), threads=16, hits=50, limit=100)
+
+        assert allowed == 100
+
+    def test_redis_store_uses_a_single_script_call(self) -> None:
+        client = MagicMock()
+        client.register_script.return_value.return_value = [1, 3, 2]
+        store = RedisWindowStore(client, LocalWindowStore())
+
+        result = store.hit("{k}:1", "{k}:0", 5, 0.5, 120_000)
+
+        assert result == WindowResult(True, 3, 2)
+        client.register_script.return_value.assert_called_once_with(
+            keys=["{k}:1", "{k}:0"], args=[5, 0.5, 120_000]
+        )
+
+    def test_redis_store_falls_back_to_local_counters(self) -> None:
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError()
+        fallback = LocalWindowStore()
+        store = RedisWindowStore(client, fallback)
+
+        results = [store.hit("{k}:1", "{k}:0", 2, 0.0, 120_000) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["local", "redis"])
+def test_throttle_store_benchmark(backend: str) -> None:
+    if backend == "local":
+        store: WindowStore = LocalWindowStore()
+    else:
+        url = os.environ.get("THROTTLE_REDIS_URL")
+        if not url:
+            pytest.skip("defina THROTTLE_REDIS_URL para medir o store no Redis")
+        client = redis.Redis.from_url(url)
+        client.delete("{k}:1", "{k}:0")
+        store = RedisWindowStore(client, LocalWindowStore())
+
+    threads, hits, limit = 32, 500, 1_000
+    started = time.perf_counter()
+    allowed = _hammer(store, threads=threads, hits=hits, limit=limit)
+    elapsed = time.perf_counter() - started
+
+    total = threads * hits
+    print(
+        f"\n{backend}: {total} checagens em {elapsed:.3f}s "
+        f"({total / elapsed:,.0f}/s, {elapsed / total * 1e6:.1f}µs/checagem)"
+    )
+    assert allowed == limit
@@ -0,0 +1,207 @@
+"""
+Rate limiting com contadores de janela deslizante compartilhados entre instâncias.
+
+O throttle padrão do ninja_extra guarda o histórico de timestamps no cache do
+Django, com leitura e escrita separadas (não atômicas) e, sem Redis, num
+LocMemCache por processo: cada worker/instância aplica o próprio limite.
+
+Aqui cada checagem é uma única chamada ``EVALSHA`` a um script Lua no
+Valkey/Redis (``THROTTLE_REDIS_URL``) que lê os contadores da janela atual e da
+anterior e incrementa a atual de forma atômica. A contagem estimada é a da
+janela deslizante ponderada::
+
+    anterior * (fração da janela anterior ainda coberta) + atual
+
+Sem Redis configurado, ou se ele estiver indisponível, os mesmos contadores
+são mantidos em memória no processo.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
+from typing import Protocol
+
+import redis
+from django.conf import settings
+from django.http import HttpRequest
+from ninja_extra.throttling import AnonRateThrottle
+
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = janela atual, KEYS[2] = janela anterior
+# ARGV[1] = limite, ARGV[2] = peso da janela anterior (0..1), ARGV[3] = TTL em ms
+_SLIDING_WINDOW_LUA = """
+local counts = redis.call("MGET", KEYS[1], KEYS[2])
+local current = tonumber(counts[1]) or 0
+local previous = tonumber(counts[2]) or 0
+if previous * tonumber(ARGV[2]) + current + 1 > tonumber(ARGV[1]) then
+    return {0, current, previous}
+end
+current = redis.call("INCR", KEYS[1])
+if current == 1 then
+    redis.call("PEXPIRE", KEYS[1], ARGV[3])
+end
+return {1, current, previous}
+"""
+
+
+@dataclass(frozen=True)
+class WindowResult:
+    """Resultado de uma checagem: se passou e os contadores das duas janelas."""
+
+    allowed: bool
+    current: int
+    previous: int
+
+
+class WindowStore(Protocol):
+    def hit(
+        self, current_key: str, previous_key: str, limit: int, weight: float, ttl: int
+    ) -> WindowResult: ...
+
+
+class LocalWindowStore:
+    """Contadores em memória do processo (fallback sem Redis)."""
+
+    # Acima deste número de chaves, as expiradas são descartadas na próxima checagem.
+    max_keys = 10_000
+
+    def __init__(self) -> None:
+        self._counts: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def hit(
+        self, current_key: str, previous_key: str, limit: int, weight: float, ttl: int
+    ) -> WindowResult:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._counts) > self.max_keys:
+                self._prune(now)
+            current = self._get(current_key, now)
+            previous = self._get(previous_key, now)
+            if previous * weight + current + 1 > limit:
+                return WindowResult(False, current, previous)
+            expires_at = self._counts.get(current_key, (0, now + ttl / 1000))[1]
+            self._counts[current_key] = (current + 1, expires_at)
+            return WindowResult(True, current + 1, previous)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def _get(self, key: str, now: float) -> int:
+        count, expires_at = self._counts.get(key, (0, 0.0))
+        return count if expires_at > now else 0
+
+    def _prune(self, now: float) -> None:
+        self._counts = {
+            key: value for key, value in self._counts.items() if value[1] > now
+        }
+
+
+class RedisWindowStore:
+    """
+    Contadores no Valkey/Redis, uma ida ao servidor por checagem.
+
+    Falhas de conexão caem no LocalWindowStore (limite por processo) em vez de
+    bloquear ou liberar todas as requisições.
+    """
+
+    def __init__(self, client: redis.Redis, fallback: LocalWindowStore) -> None:
+        self.client = client
+        self.fallback = fallback
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+
+    def hit(
+        self, current_key: str, previous_key: str, limit: int, weight: float, ttl: int
+    ) -> WindowResult:
+        try:
+            allowed, current, previous = self._script(
+                keys=[current_key, previous_key], args=[limit, weight, ttl]
+            )
+        except redis.RedisError:
+            logger.warning("Redis indisponível no throttling; usando contador local.")
+            return self.fallback.hit(current_key, previous_key, limit, weight, ttl)
+        return WindowResult(bool(allowed), int(current), int(previous))
+
+
+_local_store = LocalWindowStore()
+
+
+@cache
+def get_window_store() -> WindowStore:
+    """
+    Store de contadores do processo, conforme ``THROTTLE_REDIS_URL``.
+
+    Returns:
+        RedisWindowStore quando há Redis configurado; senão o store local.
+    """
+    if not settings.THROTTLE_REDIS_URL:
+        return _local_store
+    client = redis.Redis.from_url(
+        settings.THROTTLE_REDIS_URL,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+        health_check_interval=30,
+    )
+    return RedisWindowStore(client, _local_store)
+
+
+def reset_local_store() -> None:
+    """Zera os contadores em memória (usado entre testes)."""
+    _local_store.clear()
+
+
+class SlidingWindowAnonThrottle(AnonRateThrottle):
+    """
+    AnonRateThrottle com contadores de janela deslizante no store compartilhado.
+
+    Mantém a configuração por ``scope`` em ``NINJA_EXTRA["THROTTLE_RATES"]`` e a
+    identificação por IP do ninja_extra.
+    """
+
+    def allow_request(self, request: HttpRequest) -> bool:
+        limit, duration = self.num_requests, self.duration
+        if limit is None or duration is None:
+            return True
+        key = self.get_cache_key(request)
+        if key is None:
+            return True
+
+        now = self.timer()
+        window = math.floor(now / duration)
+        elapsed = now - window * duration
+        weight = (duration - elapsed) / duration
+
+        # Hash tag {key}: as duas janelas ficam no mesmo slot do Redis Cluster.
+        result = get_window_store().hit(
+            f"{{{key}}}:{window}",
+            f"{{{key}}}:{window - 1}",
+            limit,
+            weight,
+            duration * 2000,
+        )
+        self._wait = self._retry_after(result, limit, duration, elapsed)
+        return result.allowed
+
+    def wait(self) -> float | None:
+        return getattr(self, "_wait", None)
+
+    @staticmethod
+    def _retry_after(
+        result: WindowResult, limit: int, duration: int, elapsed: float
+    ) -> float | None:
+        """Segundos até a contagem estimada voltar a caber no limite."""
+        if result.allowed:
+            return None
+        # Libera quando previous * (duration - t) / duration + current + 1 <= limit.
+        if result.current + 1 > limit:
+            # Só após a virada, quando a janela atual passa a ser a anterior.
+            decay = max(1 - (limit - 1) / result.current, 0.0)
+            return (duration - elapsed) + duration * decay
+        target = duration * (1 - (limit - result.current - 1) / result.previous)
+        return max(target - elapsed, 0.0)
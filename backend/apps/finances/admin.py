@@ -1,7 +1,7 @@
 # backend/apps/finances/admin.py
 from django.contrib import admin
 
-from .models import Budget, BudgetCategory, Expense, Installment
+from .models import Budget, BudgetCategory, Expense, ExpenseImportJob, Installment
 
 
 class BudgetCategoryInline(admin.TabularInline):  # type: ignore[type-arg]
@@ -87,3 +87,27 @@ class InstallmentAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(ExpenseImportJob)
+class ExpenseImportJobAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = [
+        "filename",
+        "wedding",
+        "status",
+        "total_rows",
+        "imported_rows",
+        "error_count",
+        "created_at",
+    ]
+    list_filter = ["status", "file_format", "created_at"]
+    search_fields = ["filename", "wedding__groom_name", "wedding__bride_name"]
+    readonly_fields = [
+        "uuid",
+        "object_key",
+        "errors",
+        "started_at",
+        "finished_at",
+        "created_at",
+        "updated_at",
+    ]
@@ -1,12 +1,14 @@
 from .budgets import budgets_router
 from .categories import budget_categories_router
 from .expenses import expenses_router
+from .imports import expense_imports_router
 from .installments import installments_router
 
 
 __all__ = [
     "budget_categories_router",
     "budgets_router",
+    "expense_imports_router",
     "expenses_router",
     "installments_router",
 ]
@@ -4,9 +4,14 @@ from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.core.decorators import conditional_get
 from apps.finances.models.budget import Budget
 from apps.finances.schemas import BudgetOut, BudgetPatchIn
-from apps.finances.selectors import budget_get_selector, budget_list_selector
+from apps.finances.selectors import (
+    budget_data_version_selector,
+    budget_get_selector,
+    budget_list_selector,
+)
 from apps.finances.services.budget_service import BudgetService
 from apps.users.types import AuthRequest
 
@@ -14,7 +19,13 @@ from apps.users.types import AuthRequest
 budgets_router = Router(tags=["Finances"])
 
 
+def _data_version(request: AuthRequest, **_: object) -> str:
+    """Versão dos dados de orçamentos do tenant (ETag das leituras)."""
+    return budget_data_version_selector(company=request.user.company)
+
+
 @budgets_router.get("/", response=list[BudgetOut], operation_id="finances_budgets_list")
+@conditional_get(_data_version)
 @paginate
 def list_budgets(request: AuthRequest) -> QuerySet[Budget]:
     """
@@ -29,6 +40,7 @@ def list_budgets(request: AuthRequest) -> QuerySet[Budget]:
     response={200: BudgetOut, **READ_ERROR_RESPONSES},
     operation_id="finances_budgets_read",
 )
+@conditional_get(_data_version)
 def get_budget(request: AuthRequest, uuid: UUID4) -> Budget:
     """
     Retorna os totais e os saldos remanescentes autorizados de um projeto macro.
@@ -0,0 +1,85 @@
+from django.db.models import QuerySet
+from ninja.pagination import paginate
+from ninja_extra import Router
+from pydantic import UUID4
+
+from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.finances.models import ExpenseImportJob
+from apps.finances.schemas import (
+    ExpenseImportIn,
+    ExpenseImportOut,
+    ExpenseImportUploadOut,
+)
+from apps.finances.selectors import (
+    expense_import_get_selector,
+    expense_import_list_selector,
+)
+from apps.finances.services.expense_import_service import ExpenseImportService
+from apps.users.types import AuthRequest
+
+
+expense_imports_router = Router(tags=["Finances"])
+
+
+@expense_imports_router.get(
+    "/", response=list[ExpenseImportOut], operation_id="finances_imports_list"
+)
+@paginate
+def list_imports(
+    request: AuthRequest, wedding_id: UUID4 | None = None
+) -> QuerySet[ExpenseImportJob]:
+    """Lista as importações de despesas por planilha do tenant."""
+    user = request.user
+    return expense_import_list_selector(company=user.company, wedding_id=wedding_id)
+
+
+@expense_imports_router.get(
+    "/{uuid}/",
+    response={200: ExpenseImportOut, **READ_ERROR_RESPONSES},
+    operation_id="finances_imports_read",
+)
+def get_import(request: AuthRequest, uuid: UUID4) -> ExpenseImportJob:
+    """Retorna o progresso e o relatório de erros de uma importação."""
+    user = request.user
+    return expense_import_get_selector(company=user.company, uuid=uuid)
+
+
+@expense_imports_router.post(
+    "/",
+    response={201: ExpenseImportUploadOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_imports_create",
+)
+def create_import(
+    request: AuthRequest, payload: ExpenseImportIn
+) -> tuple[int, dict[str, object]]:
+    """
+    Registra uma importação e devolve a URL pré-assinada para enviar a planilha
+    (CSV ou XLSX) direto ao storage via PUT.
+    """
+    user = request.user
+    job, upload_url = ExpenseImportService.create(user.company, payload)
+    return 201, {"job": job, "upload_url": upload_url}
+
+
+@expense_imports_router.post(
+    "/{uuid}/validate/",
+    response={202: ExpenseImportOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_imports_validate",
+)
+def validate_import(request: AuthRequest, uuid: UUID4) -> tuple[int, ExpenseImportJob]:
+    """Enfileira a validação (dry-run) da planilha já enviada."""
+    user = request.user
+    instance = expense_import_get_selector(company=user.company, uuid=uuid)
+    return 202, ExpenseImportService.start(user.company, instance, dry_run=True)
+
+
+@expense_imports_router.post(
+    "/{uuid}/commit/",
+    response={202: ExpenseImportOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_imports_commit",
+)
+def commit_import(request: AuthRequest, uuid: UUID4) -> tuple[int, ExpenseImportJob]:
+    """Enfileira a gravação das despesas de uma planilha validada sem erros."""
+    user = request.user
+    instance = expense_import_get_selector(company=user.company, uuid=uuid)
+    return 202, ExpenseImportService.start(user.company, instance, dry_run=False)
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Any
 
 from django.db.models import QuerySet
 from ninja.pagination import paginate
@@ -9,19 +10,29 @@ from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
 from apps.finances.models.installment import Installment
 from apps.finances.schemas import (
     InstallmentAdjustIn,
+    InstallmentBulkAdjustIn,
+    InstallmentBulkIdsIn,
+    InstallmentBulkOut,
     InstallmentOut,
 )
 from apps.finances.selectors import (
     installment_get_selector,
     installment_list_selector,
 )
-from apps.finances.services.installment_service import InstallmentService
+from apps.finances.services.installment_service import (
+    InstallmentBulkResult,
+    InstallmentService,
+)
 from apps.users.types import AuthRequest
 
 
 installments_router = Router(tags=["Finances"])
 
 
+def _bulk_response(results: list[InstallmentBulkResult]) -> dict[str, Any]:
+    return {"affected_count": sum(r.ok for r in results), "results": results}
+
+
 @installments_router.get(
     "/", response=list[InstallmentOut], operation_id="finances_installments_list"
 )
@@ -49,6 +60,58 @@ def list_installments(
     )
 
 
+# Rotas de lote antes de "/{uuid}/..." para não colidirem com o parâmetro.
+@installments_router.post(
+    "/bulk/mark-as-paid/",
+    response={200: InstallmentBulkOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_installments_bulk_mark_as_paid",
+)
+def bulk_mark_as_paid_installments(
+    request: AuthRequest, payload: InstallmentBulkIdsIn
+) -> dict[str, Any]:
+    """
+    Marca várias parcelas como pagas numa única transação.
+    Itens recusados (já pagos, inexistentes, Tolerância Zero) vêm em `results`.
+    """
+    user = request.user
+    return _bulk_response(
+        InstallmentService.bulk_mark_as_paid(user.company, payload.installment_ids)
+    )
+
+
+@installments_router.post(
+    "/bulk/unmark-as-paid/",
+    response={200: InstallmentBulkOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_installments_bulk_unmark_as_paid",
+)
+def bulk_unmark_as_paid_installments(
+    request: AuthRequest, payload: InstallmentBulkIdsIn
+) -> dict[str, Any]:
+    """
+    Desmarca várias parcelas pagas numa única transação.
+    """
+    user = request.user
+    return _bulk_response(
+        InstallmentService.bulk_unmark_as_paid(user.company, payload.installment_ids)
+    )
+
+
+@installments_router.patch(
+    "/bulk/adjust/",
+    response={200: InstallmentBulkOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="finances_installments_bulk_adjust",
+)
+def bulk_adjust_installments(
+    request: AuthRequest, payload: InstallmentBulkAdjustIn
+) -> dict[str, Any]:
+    """
+    Ajusta data/valor de várias parcelas não pagas numa única transação.
+    Cronologia e Tolerância Zero são validadas uma vez por despesa.
+    """
+    user = request.user
+    return _bulk_response(InstallmentService.bulk_adjust(user.company, payload.items))
+
+
 @installments_router.get(
     "/{uuid}/",
     response={200: InstallmentOut, **READ_ERROR_RESPONSES},
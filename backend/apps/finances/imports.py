@@ -0,0 +1,136 @@
+"""
+Leitura em streaming das planilhas de importação de despesas (CSV/XLSX).
+
+Os geradores devolvem uma linha por vez (número da linha no arquivo + valores
+por coluna canônica), sem carregar a planilha inteira em memória. A validação
+e a gravação ficam no ``ExpenseImportService``.
+"""
+
+import csv
+import io
+from collections.abc import Iterator
+from datetime import date, datetime
+from itertools import chain
+from typing import IO, Any
+
+from apps.core.exceptions import BusinessRuleViolation
+
+
+# Colunas canônicas (nomes do ExpenseIn) e os cabeçalhos aceitos para cada uma.
+COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "category": ("category", "categoria"),
+    "name": ("name", "nome", "despesa"),
+    "description": ("description", "descricao", "descrição"),
+    "estimated_amount": ("estimated_amount", "valor_estimado", "valor estimado"),
+    "actual_amount": ("actual_amount", "valor", "valor_real", "valor real"),
+    "num_installments": ("num_installments", "parcelas"),
+    "first_due_date": (
+        "first_due_date",
+        "primeiro_vencimento",
+        "primeiro vencimento",
+        "vencimento",
+    ),
+    "contract": ("contract", "contrato"),
+}
+REQUIRED_COLUMNS = frozenset({"category", "name", "estimated_amount", "actual_amount"})
+
+_HEADER_LOOKUP = {
+    alias: column for column, aliases in COLUMN_ALIASES.items() for alias in aliases
+}
+
+ImportRow = tuple[int, dict[str, str]]
+
+
+def iter_import_rows(stream: IO[bytes], file_format: str) -> Iterator[ImportRow]:
+    """
+    Lê a planilha linha a linha.
+
+    Linhas totalmente vazias são ignoradas, assim como colunas desconhecidas
+    e células em branco.
+
+    Args:
+        stream: Arquivo binário aberto (storage local ou R2/S3).
+        file_format: ``"csv"`` ou ``"xlsx"``.
+
+    Returns:
+        Gerador de ``(número da linha, {coluna canônica: valor})``.
+
+    Raises:
+        BusinessRuleViolation: Se o formato não for suportado ou o cabeçalho
+            não tiver as colunas obrigatórias.
+    """
+    if file_format == "csv":
+        return _iter_csv(stream)
+    if file_format == "xlsx":
+        return _iter_xlsx(stream)
+    raise BusinessRuleViolation(
+        detail=f"Formato de arquivo não suportado: '{file_format}'.",
+        code="expense_import_invalid_format",
+    )
+
+
+def _iter_csv(stream: IO[bytes]) -> Iterator[ImportRow]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    first_line = text.readline()
+    # Planilhas exportadas em pt-BR costumam usar ";" como separador.
+    delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
+    reader = csv.reader(chain([first_line], text), delimiter=delimiter)
+    yield from _rows(enumerate(reader, start=1))
+
+
+def _iter_xlsx(stream: IO[bytes]) -> Iterator[ImportRow]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        values = (
+            [_cell_text(value) for value in row]
+            for row in sheet.iter_rows(values_only=True)
+        )
+        yield from _rows(enumerate(values, start=1))
+    finally:
+        workbook.close()
+
+
+def _rows(lines: Iterator[tuple[int, list[str]]]) -> Iterator[ImportRow]:
+    header: list[str | None] | None = None
+    for number, values in lines:
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = _parse_header(values)
+            continue
+        # Células vazias ficam de fora: o campo assume o padrão do schema.
+        yield (
+            number,
+            {
+                column: value.strip()
+                for column, value in zip(header, values, strict=False)
+                if column is not None and value.strip()
+            },
+        )
+
+
+def _parse_header(values: list[str]) -> list[str | None]:
+    header = [_HEADER_LOOKUP.get(value.strip().lower()) for value in values]
+    missing = REQUIRED_COLUMNS - set(header)
+    if missing:
+        raise BusinessRuleViolation(
+            detail=(
+                "Colunas obrigatórias ausentes no cabeçalho: "
+                f"{', '.join(sorted(missing))}."
+            ),
+            code="expense_import_missing_columns",
+        )
+    return header
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0003_expense_name_alter_expense_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budgetcategory',
+            name='template_key',
+            field=models.CharField(blank=True, editable=False, help_text='Chave do item do template de cronograma que gerou este registro', max_length=50, verbose_name='Item de template'),
+        ),
+    ]
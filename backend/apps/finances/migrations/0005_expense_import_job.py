@@ -0,0 +1,45 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:01
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0004_budget_category_template_key'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0003_wedding_events_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExpenseImportJob',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('filename', models.CharField(max_length=255, verbose_name='Arquivo')),
+                ('object_key', models.CharField(editable=False, max_length=512, verbose_name='Chave no storage')),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'Excel (XLSX)')], max_length=10, verbose_name='Formato')),
+                ('status', models.CharField(choices=[('AWAITING_UPLOAD', 'Aguardando envio'), ('QUEUED', 'Na fila'), ('VALIDATING', 'Validando'), ('VALIDATED', 'Validado'), ('IMPORTING', 'Importando'), ('COMPLETED', 'Concluído'), ('FAILED', 'Falhou')], default='AWAITING_UPLOAD', max_length=20, verbose_name='Status')),
+                ('dry_run', models.BooleanField(default=True, help_text='Modo da última execução: validação (dry-run) ou gravação', verbose_name='Somente validação')),
+                ('total_rows', models.PositiveIntegerField(default=0, verbose_name='Linhas lidas')),
+                ('imported_rows', models.PositiveIntegerField(default=0, verbose_name='Linhas importadas')),
+                ('error_count', models.PositiveIntegerField(default=0, verbose_name='Erros')),
+                ('errors', models.JSONField(blank=True, default=list, help_text='Erros por linha (limitado às primeiras ocorrências)', verbose_name='Relatório de erros')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Início')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Fim')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+                ('wedding', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='weddings.wedding')),
+            ],
+            options={
+                'verbose_name': 'Importação de Despesas',
+                'verbose_name_plural': 'Importações de Despesas',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['company', 'wedding'], name='finances_ex_company_1350b1_idx'), models.Index(fields=['company', 'status'], name='finances_ex_company_40e55d_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0005_expense_import_job'),
+        ('logistics', '0011_company_updated_at_index'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0004_company_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['company', 'updated_at'], name='finances_ex_company_ed6bc1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='installment',
+            index=models.Index(fields=['company', 'updated_at'], name='finances_in_company_5b2b99_idx'),
+        ),
+    ]
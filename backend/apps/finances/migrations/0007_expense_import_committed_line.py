@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0006_company_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expenseimportjob',
+            name='committed_line',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Linha final do último lote gravado; a retomada parte dela', verbose_name='Última linha gravada'),
+        ),
+    ]
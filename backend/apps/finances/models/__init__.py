@@ -1,7 +1,8 @@
 from .budget import Budget
 from .budget_category import BudgetCategory
 from .expense import Expense
+from .expense_import import ExpenseImportJob
 from .installment import Installment
 
 
-__all__ = ["Budget", "BudgetCategory", "Expense", "Installment"]
+__all__ = ["Budget", "BudgetCategory", "Expense", "ExpenseImportJob", "Installment"]
@@ -40,6 +40,13 @@ class BudgetCategory(TenantModel, WeddingOwnedMixin):
         validators=[MinValueValidator(Decimal("0.00"))],
         verbose_name="Verba Alocada",
     )
+    template_key = models.CharField(
+        max_length=50,
+        blank=True,
+        editable=False,
+        verbose_name="Item de template",
+        help_text="Chave do item do template de cronograma que gerou este registro",
+    )
 
     class Meta:
         app_label = "finances"
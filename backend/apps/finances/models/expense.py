@@ -9,7 +9,9 @@ Referências: RF04, RF05
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from apps.core.mixins import WeddingOwnedMixin
 from apps.finances.managers import ExpenseManager
@@ -24,6 +26,10 @@ class Expense(TenantModel, WeddingOwnedMixin):
 
     objects = ExpenseManager()  # type: ignore[misc]
 
+    # Soma das parcelas conhecida nesta transação (ver lock_installments_total).
+    _installments_total: Decimal | None = None
+    _installments_total_scope: object = None
+
     category = models.ForeignKey(
         "finances.BudgetCategory", on_delete=models.PROTECT, related_name="expenses"
     )
@@ -48,6 +54,7 @@ class Expense(TenantModel, WeddingOwnedMixin):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["company", "wedding"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["category"]),
         ]
 
@@ -67,13 +74,100 @@ class Expense(TenantModel, WeddingOwnedMixin):
         a soma das parcelas seria 0 e actual_amount > 0.
         """
         super().clean()
+        self.check_installments_total()
+
+    def lock_installments_total(self) -> Decimal:
+        """
+        Bloqueia a linha da despesa e guarda a soma atual das parcelas.
+
+        Também recarrega ``actual_amount``, já sob o lock.
+
+        Uma única query (``SELECT ... FOR UPDATE`` com subquery correlata da
+        soma): mutações concorrentes de parcelas da mesma despesa esperam o
+        commit, e o total em cache vale até o fim da transação desde que
+        toda alteração seguinte passe por ``check_installments_total(delta)``.
+        Depois do commit ou do rollback o cache deixa de valer (ver
+        ``_cached_installments_total``).
+
+        Returns:
+            Decimal: Soma das parcelas no momento do bloqueio.
+        """
+        from apps.finances.models.installment import Installment
+
+        total_subquery = (
+            Installment.objects.filter(expense=OuterRef("pk"))
+            .values("expense")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        )
+        actual_amount, total = (
+            type(self)
+            .objects.select_for_update()
+            .filter(pk=self.pk)
+            .annotate(
+                installments_total=Coalesce(Subquery(total_subquery), Decimal("0.00"))
+            )
+            .values_list("actual_amount", "installments_total")
+            .get()
+        )
+        self.actual_amount = actual_amount
+        self._set_installments_total(total)
+        return Decimal(total)
+
+    def _set_installments_total(self, total: Decimal) -> None:
+        # O callback marca a transação: ele só continua em run_on_commit
+        # enquanto ela (ou o savepoint onde foi registrado) estiver aberta.
+        def _expire() -> None:
+            self._installments_total = None
 
-        if self.pk and self.actual_amount:
-            total_installments = self.installments.aggregate(models.Sum("amount"))[
-                "amount__sum"
+        self._installments_total = total
+        self._installments_total_scope = _expire
+        transaction.on_commit(_expire)
+
+    def _cached_installments_total(self) -> Decimal | None:
+        """Total em cache, se ainda dentro da transação que o calculou."""
+        if self._installments_total is None:
+            return None
+        if not any(
+            entry[1] is self._installments_total_scope
+            for entry in connection.run_on_commit
+        ):
+            self._installments_total = None
+        return self._installments_total
+
+    def check_installments_total(self, delta: Decimal | None = None) -> None:
+        """
+        Valida apenas a Tolerância Zero, sem re-executar os outros validadores.
+
+        - ``delta`` com total em cache (``lock_installments_total``): o novo
+          total é o anterior + delta, sem query;
+        - ``delta`` zero sem cache: a soma não mudou, nada a validar;
+        - sem ``delta`` (ou sem cache): agrega as parcelas no banco.
+
+        Args:
+            delta: Variação da soma causada pela parcela alterada
+                (valor novo - valor antigo).
+
+        Raises:
+            ValidationError: Se a soma das parcelas não bater com actual_amount.
+        """
+        if not self.pk or not self.actual_amount:
+            return
+
+        cached = self._cached_installments_total()
+        if delta is not None and cached is not None:
+            total = cached + delta
+        elif delta is not None and not delta:
+            return
+        else:
+            total = self.installments.aggregate(total=Sum("amount"))[
+                "total"
             ] or Decimal("0.00")
-            if total_installments != self.actual_amount:
-                raise ValidationError(
-                    f"ERRO DE INTEGRIDADE: A soma das parcelas (R${total_installments})"
-                    f" não bate com o valor total (R${self.actual_amount})."
-                )
+        if cached is not None:
+            self._installments_total = total
+
+        if total != self.actual_amount:
+            raise ValidationError(
+                f"ERRO DE INTEGRIDADE: A soma das parcelas (R${total})"
+                f" não bate com o valor total (R${self.actual_amount})."
+            )
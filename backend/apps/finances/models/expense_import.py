@@ -0,0 +1,84 @@
+"""
+Modelo de importação de despesas em lote.
+Responsabilidade: Acompanhar o ciclo de vida de uma planilha (CSV/XLSX) enviada
+ao storage e processada em segundo plano (validação e gravação em lotes).
+"""
+
+from django.db import models
+
+from apps.core.mixins import WeddingOwnedMixin
+from apps.tenants.models import TenantModel
+
+
+class ExpenseImportJob(TenantModel, WeddingOwnedMixin):
+    """
+    Job de importação de despesas (e parcelas) a partir de uma planilha.
+
+    O arquivo é enviado direto ao R2/S3 por URL pré-assinada; a tarefa de
+    importação lê o objeto em streaming, valida (dry-run) e grava em lotes,
+    atualizando o progresso nesta linha.
+    """
+
+    class FormatChoices(models.TextChoices):
+        CSV = "csv", "CSV"
+        XLSX = "xlsx", "Excel (XLSX)"
+
+    class StatusChoices(models.TextChoices):
+        AWAITING_UPLOAD = "AWAITING_UPLOAD", "Aguardando envio"
+        QUEUED = "QUEUED", "Na fila"
+        VALIDATING = "VALIDATING", "Validando"
+        VALIDATED = "VALIDATED", "Validado"
+        IMPORTING = "IMPORTING", "Importando"
+        COMPLETED = "COMPLETED", "Concluído"
+        FAILED = "FAILED", "Falhou"
+
+    filename = models.CharField(max_length=255, verbose_name="Arquivo")
+    object_key = models.CharField(
+        max_length=512, editable=False, verbose_name="Chave no storage"
+    )
+    file_format = models.CharField(
+        max_length=10, choices=FormatChoices.choices, verbose_name="Formato"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.AWAITING_UPLOAD,
+        verbose_name="Status",
+    )
+    dry_run = models.BooleanField(
+        default=True,
+        verbose_name="Somente validação",
+        help_text="Modo da última execução: validação (dry-run) ou gravação",
+    )
+    total_rows = models.PositiveIntegerField(default=0, verbose_name="Linhas lidas")
+    imported_rows = models.PositiveIntegerField(
+        default=0, verbose_name="Linhas importadas"
+    )
+    committed_line = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Última linha gravada",
+        help_text="Linha final do último lote gravado; a retomada parte dela",
+    )
+    error_count = models.PositiveIntegerField(default=0, verbose_name="Erros")
+    errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Relatório de erros",
+        help_text="Erros por linha (limitado às primeiras ocorrências)",
+    )
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Início")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Fim")
+
+    class Meta:
+        app_label = "finances"
+        verbose_name = "Importação de Despesas"
+        verbose_name_plural = "Importações de Despesas"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["company", "wedding"]),
+            models.Index(fields=["company", "status"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.filename} ({self.status})"
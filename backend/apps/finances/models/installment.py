@@ -49,6 +49,7 @@ class Installment(TenantModel, WeddingOwnedMixin):
         ordering = ["due_date"]
         indexes = [
             models.Index(fields=["company", "wedding"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["status", "due_date"]),
         ]
 
@@ -1,9 +1,9 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from ninja import Schema
-from pydantic import UUID4, Field
+from pydantic import UUID4, Field, field_validator
 
 
 if TYPE_CHECKING:
@@ -253,3 +253,104 @@ class InstallmentOut(Schema):
     paid_date: date | None = None
     status: str
     notes: str | None = None
+
+
+# Limite de itens por requisição das operações em lote de parcelas.
+INSTALLMENT_BULK_MAX_ITEMS = 200
+
+
+class InstallmentBulkIdsIn(Schema):
+    installment_ids: list[UUID4] = Field(
+        ...,
+        min_length=1,
+        max_length=INSTALLMENT_BULK_MAX_ITEMS,
+        description="UUIDs das parcelas",
+    )
+
+
+class InstallmentBulkAdjustItemIn(InstallmentAdjustIn):
+    uuid: UUID4
+
+
+class InstallmentBulkAdjustIn(Schema):
+    items: list[InstallmentBulkAdjustItemIn] = Field(
+        ..., min_length=1, max_length=INSTALLMENT_BULK_MAX_ITEMS
+    )
+
+
+class InstallmentBulkItemOut(Schema):
+    uuid: UUID4
+    ok: bool
+    code: str | None = None
+    detail: str | None = None
+    installment: InstallmentOut | None = None
+
+
+class InstallmentBulkOut(Schema):
+    affected_count: int = Field(..., description="Quantidade de parcelas alteradas")
+    results: list[InstallmentBulkItemOut]
+
+
+# --- EXPENSE IMPORT SCHEMAS ---
+class ExpenseImportIn(Schema):
+    wedding: UUID4
+    filename: str = Field(..., min_length=1, max_length=255)
+
+
+class ExpenseImportRowIn(Schema):
+    """Linha da planilha de importação, já com as colunas canônicas."""
+
+    category: str = Field(..., min_length=1, max_length=255)
+    contract: UUID4 | None = None
+    name: str = Field(..., min_length=1, max_length=255)
+    description: str = ""
+    estimated_amount: Decimal = Field(..., ge=0, max_digits=10, decimal_places=2)
+    actual_amount: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2)
+    num_installments: int = Field(1, ge=1, le=120)
+    first_due_date: date | None = None
+
+    @field_validator("estimated_amount", "actual_amount", mode="before")
+    @classmethod
+    def parse_br_amount(cls, value: Any) -> Any:
+        """Aceita valores no formato brasileiro (ex.: ``1.234,56``)."""
+        if isinstance(value, str) and "," in value:
+            return value.replace("R$", "").strip().replace(".", "").replace(",", ".")
+        return value
+
+    @field_validator("first_due_date", mode="before")
+    @classmethod
+    def parse_br_date(cls, value: Any) -> Any:
+        """Aceita datas ``dd/mm/aaaa`` além do formato ISO."""
+        if isinstance(value, str) and "/" in value:
+            try:
+                return datetime.strptime(value, "%d/%m/%Y").date()
+            except ValueError:
+                return value
+        return value
+
+
+class ExpenseImportErrorOut(Schema):
+    row: int
+    field: str | None = None
+    detail: str
+
+
+class ExpenseImportOut(Schema):
+    uuid: UUID4
+    wedding: UUID4 = Field(alias="wedding.uuid")
+    filename: str
+    file_format: str
+    status: str
+    dry_run: bool
+    total_rows: int
+    imported_rows: int
+    error_count: int
+    errors: list[ExpenseImportErrorOut]
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    created_at: datetime
+
+
+class ExpenseImportUploadOut(Schema):
+    job: ExpenseImportOut
+    upload_url: str
@@ -8,10 +8,15 @@ from .budget_category_selectors import (
     budget_category_list_selector,
 )
 from .budget_selectors import (
+    budget_data_version_selector,
     budget_get_for_wedding_selector,
     budget_get_selector,
     budget_list_selector,
 )
+from .expense_import_selectors import (
+    expense_import_get_selector,
+    expense_import_list_selector,
+)
 from .expense_selectors import (
     expense_get_selector,
     expense_list_selector,
@@ -25,10 +30,13 @@ from .installment_selectors import (
 __all__ = [
     "budget_category_get_selector",
     "budget_category_list_selector",
+    "budget_data_version_selector",
     "budget_get_for_wedding_selector",
     "budget_get_selector",
     "budget_list_selector",
     "expense_get_selector",
+    "expense_import_get_selector",
+    "expense_import_list_selector",
     "expense_list_selector",
     "installment_get_selector",
     "installment_list_selector",
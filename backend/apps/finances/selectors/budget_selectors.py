@@ -11,7 +11,8 @@ from uuid import UUID
 from django.core.exceptions import ValidationError
 
 from apps.core.exceptions import ObjectNotFoundError
-from apps.finances.models import Budget
+from apps.finances.models import Budget, Expense
+from apps.tenants.selectors import tenant_data_version_selector
 
 
 if TYPE_CHECKING:
@@ -103,3 +104,18 @@ def budget_get_for_wedding_selector(
             detail="Orçamento não encontrado para o casamento informado.",
             code="budget_not_found_or_denied",
         ) from e
+
+
+def budget_data_version_selector(*, company: Company) -> str:
+    """
+    Versão (ETag) dos dados exibidos nas rotas de orçamentos.
+
+    O gasto total vem das despesas, então elas entram na versão.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        str: Fingerprint dos dados do tenant.
+    """
+    return tenant_data_version_selector(company=company, models=(Budget, Expense))
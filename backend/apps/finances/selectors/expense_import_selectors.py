@@ -0,0 +1,62 @@
+"""
+Selectors de leitura para as importações de despesas (ExpenseImportJob).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+
+from apps.core.exceptions import ObjectNotFoundError
+from apps.finances.models import ExpenseImportJob
+
+
+if TYPE_CHECKING:
+    from apps.tenants.models import Company
+
+
+def expense_import_list_selector(
+    *, company: Company, wedding_id: UUID | str | None = None
+) -> QuerySet[ExpenseImportJob]:
+    """
+    Lista as importações do tenant, mais recentes primeiro.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        wedding_id: UUID opcional do casamento para filtragem.
+
+    Returns:
+        QuerySet de ExpenseImportJob com o casamento carregado.
+    """
+    qs = ExpenseImportJob.objects.for_tenant(company).select_related("wedding")
+    if wedding_id:
+        qs = qs.filter(wedding__uuid=wedding_id)
+    return qs
+
+
+def expense_import_get_selector(
+    *, company: Company, uuid: UUID | str
+) -> ExpenseImportJob:
+    """
+    Recupera uma importação pelo UUID (progresso e relatório de erros).
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        uuid: Identificador único da importação.
+
+    Returns:
+        A instância de ExpenseImportJob.
+
+    Raises:
+        ObjectNotFoundError: Se a importação não pertencer ao tenant.
+    """
+    try:
+        return expense_import_list_selector(company=company).get(uuid=uuid)
+    except (ExpenseImportJob.DoesNotExist, ValueError, ValidationError) as e:
+        raise ObjectNotFoundError(
+            detail="Importação não encontrada ou acesso negado.",
+            code="expense_import_not_found_or_denied",
+        ) from e
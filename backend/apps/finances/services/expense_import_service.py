@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import partial
+from itertools import batched
+from typing import Any
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from pydantic import ValidationError as PydanticValidationError
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.core.services.storage import StorageService, get_storage_service
+from apps.core.shortcuts import get_object_or_404_for_tenant
+from apps.core.tenant import validate_tenant_ownership
+from apps.finances.imports import ImportRow, iter_import_rows
+from apps.finances.models import BudgetCategory, Expense, ExpenseImportJob
+from apps.finances.schemas import ExpenseImportIn, ExpenseImportRowIn
+from apps.finances.services.installment_service import (
+    InstallmentPlan,
+    InstallmentService,
+)
+from apps.logistics.models import Contract
+from apps.tenants.models import Company
+from apps.weddings.models import Wedding
+
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = {
+    "csv": (ExpenseImportJob.FormatChoices.CSV, "text/csv"),
+    "xlsx": (
+        ExpenseImportJob.FormatChoices.XLSX,
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+_Status = ExpenseImportJob.StatusChoices
+_RUNNING = [_Status.QUEUED, _Status.VALIDATING, _Status.IMPORTING]
+
+
+@dataclass
+class _ValidRow:
+    line: int
+    data: ExpenseImportRowIn
+    category: BudgetCategory
+    contract: Contract | None
+
+
+@dataclass
+class _ImportContext:
+    """Estado compartilhado entre os lotes de uma execução."""
+
+    job: ExpenseImportJob
+    categories: dict[str, BudgetCategory]
+    seen_contracts: set[uuid.UUID] = field(default_factory=set)
+    total_rows: int = 0
+    imported_rows: int = 0
+    error_count: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ExpenseImportService:
+    """Camada de serviço da importação de despesas por planilha.
+
+    O arquivo vai direto do navegador ao R2/S3 (URL pré-assinada); a leitura,
+    a validação (dry-run) e a gravação rodam na tarefa ``run_expense_import``
+    (``django.tasks``), em lotes de ``EXPENSE_IMPORT_BATCH_SIZE`` linhas, com o
+    progresso salvo no job.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def create(
+        company: Company,
+        payload: ExpenseImportIn,
+        storage_service: StorageService | None = None,
+    ) -> tuple[ExpenseImportJob, str]:
+        """Registra o job e gera a URL pré-assinada para envio da planilha.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            payload: Casamento de destino e nome do arquivo (``.csv``/``.xlsx``).
+            storage_service: Serviço de storage opcional para injeção.
+
+        Returns:
+            O job criado (aguardando envio) e a URL de upload (PUT).
+
+        Raises:
+            BusinessRuleViolation: Se a extensão não for suportada ou o storage
+                não estiver configurado.
+            ObjectNotFoundError: Se o casamento não pertencer ao tenant.
+        """
+        wedding = get_object_or_404_for_tenant(
+            Wedding,
+            company,
+            payload.wedding,
+            code="wedding_not_found_or_denied",
+        )
+        extension = payload.filename.rsplit(".", 1)[-1].lower()
+        if extension not in _FORMATS:
+            raise BusinessRuleViolation(
+                detail="Envie a planilha em formato CSV ou XLSX.",
+                code="expense_import_invalid_format",
+            )
+        file_format, content_type = _FORMATS[extension]
+
+        bucket = getattr(settings, "AWS_STORAGE_BUCKET_NAME", None) or getattr(
+            settings, "R2_BUCKET", None
+        )
+        if not bucket:
+            logger.error("Configuração de storage R2/S3 incompleta no servidor.")
+            raise BusinessRuleViolation(
+                detail="Configuração de storage R2/S3 incompleta no servidor.",
+                code="storage_configuration_incomplete",
+            )
+
+        job = ExpenseImportJob(
+            company=company,
+            wedding=wedding,
+            filename=payload.filename,
+            file_format=file_format,
+        )
+        job.object_key = f"imports/{wedding.uuid}/{job.uuid}/{payload.filename}"
+        job.save()
+
+        storage = storage_service or get_storage_service()
+        upload_url = storage.generate_presigned_put_url(
+            bucket=bucket,
+            object_key=job.object_key,
+            content_type=content_type,
+            expires_in=900,
+        )
+        logger.info(
+            f"Importação de despesas uuid={job.uuid} criada pela "
+            f"company_id={company.id}"
+        )
+        return job, upload_url
+
+    @staticmethod
+    @transaction.atomic
+    def start(
+        company: Company, instance: ExpenseImportJob, *, dry_run: bool
+    ) -> ExpenseImportJob:
+        """Enfileira a validação (dry-run) ou a gravação da planilha.
+
+        A gravação só é aceita depois de uma validação sem erros. Um job
+        parado em execução (sem progresso há ``EXPENSE_IMPORT_STALE_SECONDS``,
+        ex.: processo encerrado no meio) pode ser validado de novo. A troca de
+        status é um UPDATE condicional: de dois pedidos simultâneos, só um
+        enfileira a tarefa.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: O job de importação.
+            dry_run: True para só validar; False para gravar as despesas.
+
+        Returns:
+            O job atualizado (na fila).
+
+        Raises:
+            BusinessRuleViolation: Se o job estiver em execução, já concluído
+                ou, na gravação, sem validação aprovada.
+        """
+        from apps.finances.tasks import run_expense_import
+
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Importação não encontrada ou acesso negado.",
+            code="expense_import_not_found_or_denied",
+        )
+        now = timezone.now()
+        if dry_run:
+            allowed = Q(
+                status__in=[_Status.AWAITING_UPLOAD, _Status.VALIDATED, _Status.FAILED]
+            ) | Q(
+                status__in=_RUNNING,
+                updated_at__lt=now
+                - timedelta(seconds=settings.EXPENSE_IMPORT_STALE_SECONDS),
+            )
+        else:
+            allowed = Q(status=_Status.VALIDATED)
+        claimed = ExpenseImportJob.objects.filter(allowed, pk=instance.pk).update(
+            status=_Status.QUEUED, dry_run=dry_run, updated_at=now
+        )
+        if not claimed:
+            instance.refresh_from_db(fields=["status"])
+            raise BusinessRuleViolation(
+                detail=(
+                    "Valide a planilha sem erros antes de importar."
+                    if not dry_run
+                    else f"A importação está com status '{instance.status}'."
+                ),
+                code="expense_import_invalid_status",
+            )
+        instance.status = _Status.QUEUED
+        instance.dry_run = dry_run
+        instance.updated_at = now
+
+        transaction.on_commit(partial(run_expense_import.enqueue, instance.pk, dry_run))
+        return instance
+
+    @staticmethod
+    def process(company: Company, instance: ExpenseImportJob) -> ExpenseImportJob:
+        """Executa a validação ou gravação enfileirada por ``start``.
+
+        Lê o objeto do storage em streaming e trata um lote por vez: valida
+        cada linha (categoria pelo nome, contrato, BR-F02) e, fora do dry-run,
+        grava o lote numa transação própria com as parcelas e eventos PAYMENT
+        gerados em lote. Na gravação, o primeiro lote com erro interrompe o
+        job; os lotes anteriores permanecem gravados (``imported_rows``).
+
+        Cada lote gravado registra sua última linha (``committed_line``) na
+        mesma transação; uma nova validação ou gravação do job retoma depois
+        dela, sem duplicar as despesas já gravadas.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: O job de importação (status ``QUEUED``).
+
+        Returns:
+            O job com o resultado final.
+        """
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Importação não encontrada ou acesso negado.",
+            code="expense_import_not_found_or_denied",
+        )
+        dry_run = instance.dry_run
+        # Linhas até ``committed_line`` já foram gravadas (todas sem erro).
+        resume_after = instance.committed_line
+        _save_progress(
+            instance,
+            status=_Status.VALIDATING if dry_run else _Status.IMPORTING,
+            started_at=timezone.now(),
+            finished_at=None,
+            total_rows=instance.imported_rows,
+            error_count=0,
+            errors=[],
+        )
+        context = _ImportContext(
+            job=instance,
+            categories={
+                category.name.casefold(): category
+                for category in BudgetCategory.objects.filter(
+                    company=company, wedding_id=instance.wedding_id
+                )
+            },
+            total_rows=instance.imported_rows,
+            imported_rows=instance.imported_rows,
+        )
+
+        try:
+            with default_storage.open(instance.object_key, "rb") as stream:
+                rows = (
+                    row
+                    for row in iter_import_rows(stream, instance.file_format)
+                    if row[0] > resume_after
+                )
+                for chunk in batched(rows, settings.EXPENSE_IMPORT_BATCH_SIZE):
+                    errors_before = context.error_count
+                    valid = _validate_chunk(company, context, chunk)
+                    context.total_rows += len(chunk)
+                    if not dry_run:
+                        if context.error_count > errors_before:
+                            break
+                        context.imported_rows += _import_chunk(
+                            company, context, valid, last_line=chunk[-1][0]
+                        )
+                    _save_progress(
+                        instance,
+                        total_rows=context.total_rows,
+                        imported_rows=context.imported_rows,
+                        error_count=context.error_count,
+                        errors=context.errors,
+                    )
+        except BusinessRuleViolation as e:
+            _add_error(context, 0, e.detail)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(
+                f"Falha ao ler a planilha da importação {instance.uuid}: {e}"
+            )
+            _add_error(context, 0, "Não foi possível ler o arquivo enviado.")
+        except Exception:
+            # O lote em andamento foi desfeito; os anteriores seguem gravados
+            # e a retomada parte de ``committed_line``.
+            logger.exception(f"Erro inesperado na importação {instance.uuid}")
+            _add_error(context, 0, "Erro inesperado ao processar a planilha.")
+
+        if context.error_count:
+            status = _Status.FAILED
+        elif dry_run:
+            status = _Status.VALIDATED
+        else:
+            status = _Status.COMPLETED
+        _save_progress(
+            instance,
+            status=status,
+            finished_at=timezone.now(),
+            total_rows=context.total_rows,
+            imported_rows=context.imported_rows,
+            error_count=context.error_count,
+            errors=context.errors,
+        )
+        logger.info(
+            f"Importação uuid={instance.uuid} finalizada: status={status} "
+            f"linhas={context.total_rows} importadas={context.imported_rows} "
+            f"erros={context.error_count}"
+        )
+        return instance
+
+
+def _add_error(
+    context: _ImportContext, line: int, detail: str, field_name: str | None = None
+) -> None:
+    """Conta o erro e o guarda no relatório até o limite configurado."""
+    context.error_count += 1
+    if len(context.errors) < settings.EXPENSE_IMPORT_MAX_REPORTED_ERRORS:
+        context.errors.append({"row": line, "field": field_name, "detail": detail})
+
+
+def _save_progress(job: ExpenseImportJob, **fields: Any) -> None:
+    """Grava o progresso direto na linha do job (visível no polling)."""
+    fields["updated_at"] = timezone.now()
+    for name, value in fields.items():
+        setattr(job, name, value)
+    ExpenseImportJob.objects.filter(pk=job.pk).update(**fields)
+
+
+def _validate_chunk(
+    company: Company, context: _ImportContext, chunk: tuple[ImportRow, ...]
+) -> list[_ValidRow]:
+    """Valida um lote de linhas com uma única query de contratos."""
+    parsed: list[tuple[int, ExpenseImportRowIn]] = []
+    for line, raw in chunk:
+        try:
+            parsed.append((line, ExpenseImportRowIn.model_validate(raw)))
+        except PydanticValidationError as e:
+            for error in e.errors():
+                field_name = ".".join(str(part) for part in error["loc"]) or None
+                _add_error(context, line, error["msg"], field_name)
+
+    contract_ids = {row.contract for _, row in parsed if row.contract}
+    contracts = (
+        {
+            contract.uuid: contract
+            for contract in Contract.objects.for_tenant(company)
+            .filter(uuid__in=contract_ids, wedding_id=context.job.wedding_id)
+            .annotate(
+                has_expense=Exists(Expense.objects.filter(contract=OuterRef("pk")))
+            )
+        }
+        if contract_ids
+        else {}
+    )
+
+    valid: list[_ValidRow] = []
+    for line, row in parsed:
+        category = context.categories.get(row.category.casefold())
+        if category is None:
+            _add_error(
+                context,
+                line,
+                f"Categoria '{row.category}' não existe no orçamento do casamento.",
+                "category",
+            )
+            continue
+
+        contract = contracts.get(row.contract) if row.contract else None
+        if row.contract:
+            detail = _contract_error(context, row, contract)
+            if detail:
+                _add_error(context, line, detail, "contract")
+                continue
+            context.seen_contracts.add(row.contract)
+
+        valid.append(_ValidRow(line, row, category, contract))
+    return valid
+
+
+def _contract_error(
+    context: _ImportContext, row: ExpenseImportRowIn, contract: Contract | None
+) -> str | None:
+    """Regras do contrato vinculado: mesmo casamento, 1:1 e BR-F02."""
+    if contract is None:
+        return "Contrato não encontrado neste casamento."
+    if getattr(contract, "has_expense", False) or (
+        row.contract in context.seen_contracts
+    ):
+        return "Este contrato já possui uma despesa vinculada."
+    if row.actual_amount != contract.total_amount:
+        return (
+            f"BR-F02: O valor da despesa (R${row.actual_amount}) deve ser "
+            f"igual ao valor do contrato (R${contract.total_amount})."
+        )
+    return None
+
+
+@transaction.atomic
+def _import_chunk(
+    company: Company, context: _ImportContext, rows: list[_ValidRow], last_line: int
+) -> int:
+    """Grava um lote: despesas, parcelas e eventos PAYMENT em ``bulk_create``.
+
+    O ponto de retomada (``committed_line``) avança na mesma transação.
+    """
+    wedding = context.job.wedding
+    expenses = [
+        Expense(
+            company=company,
+            wedding=wedding,
+            category=row.category,
+            contract=row.contract,
+            name=row.data.name,
+            description=row.data.description,
+            estimated_amount=row.data.estimated_amount,
+            actual_amount=row.data.actual_amount,
+        )
+        for row in rows
+    ]
+    Expense.objects.bulk_create(expenses)
+
+    today = date.today()
+    InstallmentService.bulk_generate_installments(
+        company,
+        [
+            InstallmentPlan(
+                expense=expense,
+                num_installments=row.data.num_installments,
+                first_due_date=row.data.first_due_date or today,
+            )
+            for expense, row in zip(expenses, rows, strict=True)
+        ],
+    )
+    imported_rows = context.imported_rows + len(expenses)
+    _save_progress(context.job, committed_line=last_line, imported_rows=imported_rows)
+    return len(expenses)
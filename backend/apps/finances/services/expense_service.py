@@ -16,6 +16,7 @@ from apps.finances.models import BudgetCategory, Expense
 from apps.finances.schemas import ExpenseIn, ExpensePatchIn
 from apps.finances.services.installment_service import InstallmentService
 from apps.logistics.models import Contract
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 
 
@@ -375,7 +376,7 @@ class ExpenseService:
             f"por company_id={company.id}"
         )
 
-        instance.delete()
+        TombstoneService.delete(company, instance)
         logger.warning(
             f"Despesa uuid={instance.uuid} DESTRUÍDA por company_id={company.id}"
         )
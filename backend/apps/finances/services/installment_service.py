@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
 
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from django.utils import timezone
 
 from apps.core.exceptions import (
     BusinessRuleViolation,
@@ -13,13 +19,44 @@ from apps.core.exceptions import (
 from apps.core.shortcuts import resolve_tenant_resource
 from apps.core.tenant import validate_tenant_ownership
 from apps.finances.models import Expense, Installment
-from apps.finances.schemas import InstallmentAdjustIn, InstallmentIn, InstallmentPatchIn
+from apps.finances.schemas import (
+    InstallmentAdjustIn,
+    InstallmentBulkAdjustItemIn,
+    InstallmentIn,
+    InstallmentPatchIn,
+)
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class InstallmentBulkResult:
+    """Resultado de um item numa operação em lote de parcelas."""
+
+    uuid: UUID
+    ok: bool = False
+    installment: Installment | None = None
+    code: str | None = None
+    detail: str | None = None
+
+
+@dataclass(frozen=True)
+class InstallmentPlan:
+    """Parcelamento de uma despesa recém-criada (geração em lote)."""
+
+    expense: Expense
+    num_installments: int
+    first_due_date: date
+
+
+# Transição aplicada em memória a uma parcela; levanta BusinessRuleViolation
+# para recusar o item sem afetar os demais.
+_Transition = Callable[[Installment], None]
+
+
 class InstallmentService:
     """Camada de serviço para mutações e orquestração de Parcelas.
 
@@ -55,8 +92,6 @@ class InstallmentService:
                 número de parcelas for <= 0, ou se o valor total da despesa for
                 inválido.
         """
-        from datetime import timedelta
-
         # Bloqueio preventivo contra reentrada e duplicação de parcelas na despesa.
         if expense.installments.exists():
             raise BusinessRuleViolation(
@@ -80,36 +115,8 @@ class InstallmentService:
                 code="invalid_expense_amount",
             )
 
-        base_amount = round(expense.actual_amount / num_installments, 2)
-        installments: list[Installment] = []
-
-        current_due_date = first_due_date
-
-        for i in range(1, num_installments):
-            installments.append(
-                Installment(
-                    company=company,
-                    wedding=expense.wedding,
-                    expense=expense,
-                    installment_number=i,
-                    amount=base_amount,
-                    due_date=current_due_date,
-                    status=Installment.StatusChoices.PENDING,
-                )
-            )
-            current_due_date += timedelta(days=30)
-
-        last_amount = expense.actual_amount - (base_amount * (num_installments - 1))
-        installments.append(
-            Installment(
-                company=company,
-                wedding=expense.wedding,
-                expense=expense,
-                installment_number=num_installments,
-                amount=last_amount,
-                due_date=current_due_date,
-                status=Installment.StatusChoices.PENDING,
-            )
+        installments = _build_installments(
+            company, expense, num_installments, first_due_date
         )
 
         # Usar .save() em vez de bulk_create para garantir que full_clean()
@@ -122,6 +129,78 @@ class InstallmentService:
 
         return installments
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_generate_installments(
+        company: Company, plans: Sequence[InstallmentPlan]
+    ) -> list[Installment]:
+        """Gera as parcelas e os eventos PAYMENT de várias despesas novas em lote.
+
+        Caminho de alto volume (importação): as parcelas saem da mesma divisão
+        de ``auto_generate_installments``, mas são gravadas com um
+        ``bulk_create`` para as parcelas e outro para os eventos de pagamento
+        (BR-S01), sem o ``full_clean`` por linha. A Tolerância Zero é garantida
+        pela própria divisão (a última parcela absorve o arredondamento).
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            plans: Despesas recém-criadas (sem parcelas) e o parcelamento de
+                cada uma.
+
+        Returns:
+            list[Installment]: Parcelas criadas, na ordem dos planos.
+
+        Raises:
+            BusinessRuleViolation: Se algum plano tiver número de parcelas ou
+                valor da despesa inválidos.
+        """
+        from apps.scheduler.models import Event as SchedulerEvent
+        from apps.weddings.models import Wedding
+
+        installments: list[Installment] = []
+        events: list[SchedulerEvent] = []
+        for plan in plans:
+            validate_tenant_ownership(
+                company,
+                plan.expense,
+                detail="Despesa não encontrada ou acesso negado.",
+                code="expense_not_found_or_denied",
+            )
+            if plan.num_installments <= 0:
+                raise BusinessRuleViolation(
+                    detail="O número de parcelas deve ser maior que zero.",
+                    code="invalid_installment_number",
+                )
+            if not plan.expense.actual_amount or plan.expense.actual_amount <= 0:
+                raise BusinessRuleViolation(
+                    detail="A despesa precisa ter um valor maior que zero para "
+                    "parcelamento.",
+                    code="invalid_expense_amount",
+                )
+            planned = _build_installments(
+                company, plan.expense, plan.num_installments, plan.first_due_date
+            )
+            installments.extend(planned)
+            events.extend(
+                SchedulerEvent(
+                    company=company,
+                    wedding=plan.expense.wedding,
+                    event_type=SchedulerEvent.TypeChoices.PAYMENT,
+                    **_payment_event_fields(plan.expense, inst, len(planned)),
+                )
+                for inst in planned
+            )
+
+        # As parcelas recebem PK no bulk_create; os eventos apontam para elas.
+        Installment.objects.bulk_create(installments)
+        SchedulerEvent.objects.bulk_create(events)
+
+        # bulk_create não passa pelo Event.save: versiona os calendários aqui.
+        wedding_ids = {inst.wedding_id for inst in installments}
+        Wedding.objects.filter(pk__in=wedding_ids).bump_events_version()
+
+        return installments
+
     @staticmethod
     @transaction.atomic
     def redistribute(
@@ -158,7 +237,7 @@ class InstallmentService:
             )
 
         _delete_payment_events_for_expense(company, expense)
-        expense.installments.all().delete()
+        TombstoneService.delete(company, expense.installments.all())
         return InstallmentService.auto_generate_installments(
             company=company,
             expense=expense,
@@ -203,12 +282,13 @@ class InstallmentService:
             company=company, wedding=expense.wedding, expense=expense, **data
         )
 
-        # 3. Validação Estrita da Parcela
+        # 3. Validação Estrita da Parcela (com a despesa bloqueada)
+        expense.lock_installments_total()
         installment.save()
 
-        # 4. Checagem de Ricochete (Tolerância Zero)
+        # 4. Checagem de Ricochete (Tolerância Zero), incremental
         try:
-            expense.full_clean()
+            expense.check_installments_total(delta=installment.amount)
         except DjangoValidationError as e:
             logger.exception(
                 f"Criação de parcela violou Tolerância Zero da despesa "
@@ -279,6 +359,7 @@ class InstallmentService:
                 code="paid_installment_immutable",
             )
 
+        delta = _lock_for_amount_change(instance, data)
         for field, value in data.items():
             setattr(instance, field, value)
 
@@ -286,7 +367,7 @@ class InstallmentService:
 
         # Revalidação da Despesa Pai (Tolerância Zero)
         try:
-            instance.expense.full_clean()
+            instance.expense.check_installments_total(delta=delta)
         except DjangoValidationError as e:
             logger.exception(
                 f"Atualização de parcela quebrou Tolerância Zero na despesa "
@@ -336,8 +417,9 @@ class InstallmentService:
         instance.paid_date = date.today()
         instance.save()
 
+        # Mudança só de status: a soma não muda (delta zero, sem query).
         try:
-            instance.expense.full_clean()
+            instance.expense.check_installments_total(delta=Decimal("0.00"))
         except DjangoValidationError as e:
             logger.exception(
                 f"Marcação de parcela quebrou Tolerância Zero na despesa "
@@ -391,7 +473,7 @@ class InstallmentService:
         instance.save()
 
         try:
-            instance.expense.full_clean()
+            instance.expense.check_installments_total(delta=Decimal("0.00"))
         except DjangoValidationError as e:
             logger.exception(
                 f"Desmarcação de parcela quebrou Tolerância Zero na despesa "
@@ -481,13 +563,14 @@ class InstallmentService:
                     code="due_date_after_next_installment",
                 )
 
+        delta = _lock_for_amount_change(instance, data)
         for field, value in data.items():
             setattr(instance, field, value)
 
         instance.save()
 
         try:
-            instance.expense.full_clean()
+            instance.expense.check_installments_total(delta=delta)
         except DjangoValidationError as e:
             logger.exception(
                 f"Ajuste de parcela quebrou Tolerância Zero na despesa "
@@ -533,9 +616,11 @@ class InstallmentService:
         try:
             _delete_payment_event_for_single(company, instance)
 
-            instance.delete()
+            expense.lock_installments_total()
+            amount = _locked_amount(instance)
+            TombstoneService.delete(company, instance)
 
-            expense.full_clean()
+            expense.check_installments_total(delta=-amount)
 
             logger.warning(
                 f"Parcela uuid={instance.uuid} DESTRUÍDA por company_id={company.id}"
@@ -555,6 +640,114 @@ class InstallmentService:
                 code="installment_deletion_math_error",
             ) from e
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_mark_as_paid(
+        company: Company, installment_ids: Sequence[UUID]
+    ) -> list[InstallmentBulkResult]:
+        """Marca várias parcelas como pagas numa única transação.
+
+        Mesmas regras de ``mark_as_paid``, mas as despesas afetadas são
+        bloqueadas uma única vez e a Tolerância Zero de cada uma é validada
+        uma única vez, em memória, antes de gravar.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            installment_ids: UUIDs das parcelas a pagar.
+
+        Returns:
+            list[InstallmentBulkResult]: Um resultado por UUID, na ordem
+                recebida; itens recusados trazem ``code`` e ``detail``.
+        """
+        today = date.today()
+
+        def _pay(instance: Installment) -> None:
+            if instance.status == Installment.StatusChoices.PAID:
+                raise BusinessRuleViolation(
+                    detail="Esta parcela já foi marcada como paga.",
+                    code="installment_already_paid",
+                )
+            instance.status = Installment.StatusChoices.PAID
+            instance.paid_date = today
+
+        _reject_duplicate_ids(installment_ids)
+        return _apply_bulk(company, {uuid: _pay for uuid in installment_ids})
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_unmark_as_paid(
+        company: Company, installment_ids: Sequence[UUID]
+    ) -> list[InstallmentBulkResult]:
+        """Desmarca várias parcelas pagas numa única transação.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            installment_ids: UUIDs das parcelas a reverter.
+
+        Returns:
+            list[InstallmentBulkResult]: Um resultado por UUID, na ordem
+                recebida; itens recusados trazem ``code`` e ``detail``.
+        """
+        today = date.today()
+
+        def _unpay(instance: Installment) -> None:
+            if instance.status != Installment.StatusChoices.PAID:
+                raise BusinessRuleViolation(
+                    detail="Apenas parcelas marcadas como pagas podem ser desmarcadas.",
+                    code="installment_not_paid",
+                )
+            instance.paid_date = None
+            instance.status = (
+                Installment.StatusChoices.OVERDUE
+                if instance.due_date < today
+                else Installment.StatusChoices.PENDING
+            )
+
+        _reject_duplicate_ids(installment_ids)
+        return _apply_bulk(company, {uuid: _unpay for uuid in installment_ids})
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_adjust(
+        company: Company, items: Sequence[InstallmentBulkAdjustItemIn]
+    ) -> list[InstallmentBulkResult]:
+        """Ajusta valor e/ou vencimento de várias parcelas numa única transação.
+
+        A cronologia é conferida contra o estado final das parcelas vizinhas,
+        o que permite deslocar várias datas de uma mesma despesa de uma vez.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            items: Ajustes por parcela (UUID + valor e/ou vencimento).
+
+        Returns:
+            list[InstallmentBulkResult]: Um resultado por item, na ordem
+                recebida; itens recusados trazem ``code`` e ``detail``.
+        """
+
+        def _adjuster(item: InstallmentBulkAdjustItemIn) -> _Transition:
+            data = item.model_dump(exclude={"uuid"}, exclude_none=True)
+
+            def _adjust(instance: Installment) -> None:
+                if instance.status == Installment.StatusChoices.PAID:
+                    raise BusinessRuleViolation(
+                        detail="Não é possível ajustar uma parcela já marcada "
+                        "como paga. Reversão não suportada.",
+                        code="adjustment_on_paid_installment",
+                    )
+                if data.get("amount") is not None and data["amount"] < 0:
+                    raise BusinessRuleViolation(
+                        detail="O valor da parcela não pode ser negativo.",
+                        code="invalid_installment_amount",
+                    )
+                for field, value in data.items():
+                    setattr(instance, field, value)
+
+            return _adjust
+
+        _reject_duplicate_ids([item.uuid for item in items])
+        return _apply_bulk(company, {item.uuid: _adjuster(item) for item in items})
+
     @staticmethod
     @transaction.atomic
     def mark_overdue_installments(
@@ -629,6 +822,213 @@ class InstallmentService:
         return count
 
 
+def _reject_duplicate_ids(uuids: Sequence[UUID]) -> None:
+    """Recusa lotes com a mesma parcela repetida (um resultado por item).
+
+    Raises:
+        BusinessRuleViolation: Se algum UUID aparecer mais de uma vez.
+    """
+    if len(set(uuids)) != len(uuids):
+        raise BusinessRuleViolation(
+            detail="A mesma parcela foi informada mais de uma vez no lote.",
+            code="duplicate_installment_ids",
+        )
+
+
+def _apply_bulk(
+    company: Company, transitions: dict[UUID, _Transition]
+) -> list[InstallmentBulkResult]:
+    """Aplica transições em lote com bloqueio e validação únicos por despesa.
+
+    1. Resolve os UUIDs no tenant (uma query) e bloqueia as despesas afetadas
+       com ``select_for_update`` em ordem de PK (evita deadlock entre lotes);
+    2. Carrega todas as parcelas dessas despesas e aplica as transições em
+       memória, recusando individualmente os itens inválidos;
+    3. Valida cronologia e Tolerância Zero uma vez por despesa; se falhar,
+       todos os itens daquela despesa são revertidos e recusados;
+    4. Grava as parcelas alteradas num único ``bulk_update``.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        transitions: Transição por UUID de parcela, na ordem do pedido.
+
+    Returns:
+        list[InstallmentBulkResult]: Resultados na ordem de ``transitions``.
+    """
+    results = {uuid: InstallmentBulkResult(uuid=uuid) for uuid in transitions}
+    expenses, siblings = _lock_expenses_for_bulk(company, transitions)
+    by_uuid = {inst.uuid: inst for group in siblings.values() for inst in group}
+
+    fields = ("status", "paid_date", "amount", "due_date")
+    snapshots: dict[UUID, tuple[object, ...]] = {}
+    for uuid, transition in transitions.items():
+        instance = by_uuid.get(uuid)
+        if instance is None:
+            results[uuid].code = "installment_not_found_or_denied"
+            results[uuid].detail = "Parcela não encontrada ou acesso negado."
+            continue
+        snapshot = tuple(getattr(instance, field) for field in fields)
+        try:
+            transition(instance)
+        except BusinessRuleViolation as e:
+            results[uuid].code, results[uuid].detail = e.code, e.detail
+            continue
+        snapshots[uuid] = snapshot
+        results[uuid].ok, results[uuid].installment = True, instance
+
+    changed: list[Installment] = []
+    for expense_id, installments in siblings.items():
+        touched = [inst for inst in installments if inst.uuid in snapshots]
+        if not touched:
+            continue
+        error = _validate_expense_batch(
+            expenses[expense_id], installments, touched, snapshots
+        )
+        if error is None:
+            changed.extend(touched)
+            continue
+        for inst in touched:
+            for field, value in zip(fields, snapshots.pop(inst.uuid), strict=True):
+                setattr(inst, field, value)
+            results[inst.uuid] = InstallmentBulkResult(
+                uuid=inst.uuid, code=error.code, detail=error.detail
+            )
+
+    now = timezone.now()
+    for inst in changed:
+        inst.updated_at = now
+    Installment.objects.bulk_update(changed, [*fields, "updated_at"])
+
+    logger.info(
+        f"Lote de parcelas aplicado: {len(changed)}/{len(transitions)} "
+        f"alteradas por company_id={company.id}"
+    )
+    return list(results.values())
+
+
+def _lock_for_amount_change(instance: Installment, data: dict[str, object]) -> Decimal:
+    """Bloqueia a despesa pai se o valor da parcela for informado e retorna o delta.
+
+    O delta parte do valor relido sob o lock, não do carregado antes dele:
+    uma edição concorrente da mesma parcela já estará refletida no total.
+
+    Args:
+        instance: Parcela ainda com os valores antigos.
+        data: Campos que serão aplicados à parcela.
+
+    Returns:
+        Decimal: Variação da soma das parcelas (zero se o valor não muda).
+    """
+    new_amount = data.get("amount")
+    if not isinstance(new_amount, Decimal):
+        return Decimal("0.00")
+    instance.expense.lock_installments_total()
+    return new_amount - _locked_amount(instance)
+
+
+def _locked_amount(instance: Installment) -> Decimal:
+    """Relê (e bloqueia) o valor atual da parcela; chamar após travar a despesa."""
+    amount = (
+        Installment.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list("amount", flat=True)
+        .get()
+    )
+    instance.amount = amount
+    return amount
+
+
+def _lock_expenses_for_bulk(
+    company: Company, installment_ids: Iterable[UUID]
+) -> tuple[dict[int, Expense], dict[int, list[Installment]]]:
+    """Bloqueia as despesas das parcelas e carrega todas as parcelas delas.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        installment_ids: UUIDs das parcelas do lote.
+
+    Returns:
+        tuple: Despesas bloqueadas por PK e suas parcelas (ordenadas por
+            número), também por PK da despesa.
+    """
+    expense_ids = set(
+        Installment.objects.for_tenant(company)
+        .filter(uuid__in=list(installment_ids))
+        .values_list("expense_id", flat=True)
+    )
+    # Ordem de PK: dois lotes concorrentes bloqueiam na mesma sequência.
+    expenses = {
+        expense.pk: expense
+        for expense in Expense.objects.for_tenant(company)
+        .filter(pk__in=expense_ids)
+        .select_for_update()
+        .order_by("pk")
+    }
+    siblings: dict[int, list[Installment]] = {pk: [] for pk in expenses}
+    for installment in (
+        Installment.objects.filter(expense_id__in=expenses)
+        .select_related("wedding")
+        .order_by("expense_id", "installment_number")
+    ):
+        installment.expense = expenses[installment.expense_id]
+        siblings[installment.expense_id].append(installment)
+    return expenses, siblings
+
+
+def _validate_expense_batch(
+    expense: Expense,
+    installments: list[Installment],
+    touched: list[Installment],
+    snapshots: dict[UUID, tuple[object, ...]],
+) -> BusinessRuleViolation | None:
+    """Confere cronologia e Tolerância Zero de uma despesa já em memória.
+
+    Args:
+        expense: Despesa bloqueada.
+        installments: Todas as parcelas da despesa, ordenadas por número, com
+            as alterações do lote já aplicadas.
+        touched: Parcelas alteradas pelo lote.
+        snapshots: Valores originais (status, paid_date, amount, due_date).
+
+    Returns:
+        BusinessRuleViolation | None: O erro da despesa, ou None se válida.
+    """
+    touched_ids = {inst.uuid for inst in touched}
+    for index, inst in enumerate(installments):
+        if inst.uuid not in touched_ids or inst.due_date == snapshots[inst.uuid][3]:
+            continue
+        prev = installments[index - 1] if index > 0 else None
+        nxt = installments[index + 1] if index + 1 < len(installments) else None
+        if prev and inst.due_date < prev.due_date:
+            return BusinessRuleViolation(
+                detail=(
+                    "A data de vencimento não pode ser anterior à "
+                    f"parcela #{prev.installment_number} ({prev.due_date})."
+                ),
+                code="due_date_before_previous_installment",
+            )
+        if nxt and inst.due_date > nxt.due_date:
+            return BusinessRuleViolation(
+                detail=(
+                    "A data de vencimento não pode ser posterior à "
+                    f"parcela #{nxt.installment_number} ({nxt.due_date})."
+                ),
+                code="due_date_after_next_installment",
+            )
+
+    if expense.actual_amount:
+        total = sum((inst.amount for inst in installments), Decimal("0.00"))
+        if total != expense.actual_amount:
+            return BusinessRuleViolation(
+                detail=(
+                    f"A soma das parcelas (R${total}) não bate com o valor "
+                    f"total da despesa (R${expense.actual_amount}) (ADR-010)."
+                ),
+                code="expense_math_violation",
+            )
+    return None
+
+
 @transaction.atomic
 def _delete_payment_events_for_expense(company: Company, expense: Expense) -> None:
     """Remove todos os eventos PAYMENT do scheduler vinculados a esta despesa.
@@ -639,11 +1039,14 @@ def _delete_payment_events_for_expense(company: Company, expense: Expense) -> No
     """
     from apps.scheduler.models import Event as SchedulerEvent
 
-    SchedulerEvent.objects.for_tenant(company).filter(
-        wedding=expense.wedding,
-        event_type="pagamento",
-        source_installment__expense=expense,
-    ).delete()
+    TombstoneService.delete(
+        company,
+        SchedulerEvent.objects.for_tenant(company).filter(
+            wedding=expense.wedding,
+            event_type="pagamento",
+            source_installment__expense=expense,
+        ),
+    )
 
 
 @transaction.atomic
@@ -657,11 +1060,14 @@ def _delete_payment_event_for_single(company: Company, instance: Installment) ->
     """
     from apps.scheduler.models import Event as SchedulerEvent
 
-    SchedulerEvent.objects.for_tenant(company).filter(
-        wedding=instance.expense.wedding,
-        event_type="pagamento",
-        source_installment=instance,
-    ).delete()
+    TombstoneService.delete(
+        company,
+        SchedulerEvent.objects.for_tenant(company).filter(
+            wedding=instance.expense.wedding,
+            event_type="pagamento",
+            source_installment=instance,
+        ),
+    )
 
 
 @transaction.atomic
@@ -680,27 +1086,86 @@ def _create_payment_events(
         expense: A despesa pai associada.
         installments: Lista de parcelas que receberão eventos de pagamento.
     """
-    from datetime import datetime, time
-
-    from django.utils import timezone
-
     from apps.scheduler.services import EventService
 
     for inst in installments:
-        naive_start = datetime.combine(inst.due_date, time(hour=9, minute=0))
-        event_start = timezone.make_aware(naive_start)
         EventService.create(
             company,
             {
                 "wedding": expense.wedding,
-                "title": (
-                    f"Pagamento: {expense.name} - Parcela "
-                    f"{inst.installment_number}/{len(installments)}"
-                ),
                 "event_type": "pagamento",
-                "start_time": event_start,
-                "description": (f"Valor: R$ {inst.amount:.2f} — {expense.name}"),
-                "source_installment": inst,
+                **_payment_event_fields(expense, inst, len(installments)),
             },
             _caller_internal=True,
         )
+
+
+def _payment_event_fields(
+    expense: Expense, installment: Installment, total: int
+) -> dict[str, Any]:
+    """Título, horário e descrição do evento PAYMENT de uma parcela.
+
+    Args:
+        expense: A despesa pai da parcela.
+        installment: A parcela representada pelo evento.
+        total: Quantidade de parcelas da despesa.
+
+    Returns:
+        dict[str, Any]: Campos do evento (sem tenant, casamento e tipo).
+    """
+    naive_start = datetime.combine(installment.due_date, time(hour=9, minute=0))
+    return {
+        "title": (
+            f"Pagamento: {expense.name} - Parcela "
+            f"{installment.installment_number}/{total}"
+        ),
+        "start_time": timezone.make_aware(naive_start),
+        "description": f"Valor: R$ {installment.amount:.2f} — {expense.name}",
+        "source_installment": installment,
+    }
+
+
+def _build_installments(
+    company: Company,
+    expense: Expense,
+    num_installments: int,
+    first_due_date: date,
+) -> list[Installment]:
+    """Divide o valor da despesa em parcelas mensais (ainda não salvas).
+
+    A última parcela absorve a diferença do arredondamento, de modo que a soma
+    bata exatamente com ``actual_amount`` (Tolerância Zero).
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        expense: A despesa a parcelar.
+        num_installments: Número total de parcelas (> 0).
+        first_due_date: Vencimento da primeira parcela; as demais a cada 30 dias.
+
+    Returns:
+        list[Installment]: Parcelas em memória, na ordem de vencimento.
+    """
+    base_amount = round(expense.actual_amount / num_installments, 2)
+    installments: list[Installment] = []
+    current_due_date = first_due_date
+
+    for i in range(1, num_installments + 1):
+        amount = (
+            base_amount
+            if i < num_installments
+            else expense.actual_amount - base_amount * (num_installments - 1)
+        )
+        installments.append(
+            Installment(
+                company=company,
+                wedding=expense.wedding,
+                expense=expense,
+                installment_number=i,
+                amount=amount,
+                due_date=current_due_date,
+                status=Installment.StatusChoices.PENDING,
+            )
+        )
+        current_due_date += timedelta(days=30)
+
+    return installments
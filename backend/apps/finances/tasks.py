@@ -0,0 +1,29 @@
+from django.tasks import task
+
+
+@task()
+def run_expense_import(job_id: int, dry_run: bool) -> str | None:
+    """Processa uma importação de despesas enfileirada por ``start``.
+
+    O job é reivindicado com um UPDATE condicional (QUEUED → em execução):
+    um reenvio duplicado da tarefa, ou um modo que mudou desde o
+    enfileiramento, não encontra o job na fila e é ignorado.
+
+    Args:
+        job_id: PK do ``ExpenseImportJob``.
+        dry_run: Modo pedido ao enfileirar (validação ou gravação).
+
+    Returns:
+        Status final do job, ou None se nada foi processado.
+    """
+    from apps.finances.models import ExpenseImportJob
+    from apps.finances.services.expense_import_service import ExpenseImportService
+
+    status = ExpenseImportJob.StatusChoices
+    claimed = ExpenseImportJob.objects.filter(
+        pk=job_id, status=status.QUEUED, dry_run=dry_run
+    ).update(status=status.VALIDATING if dry_run else status.IMPORTING)
+    if not claimed:
+        return None
+    job = ExpenseImportJob.objects.select_related("company", "wedding").get(pk=job_id)
+    return ExpenseImportService.process(job.company, job).status
@@ -3,6 +3,7 @@ from typing import Any, cast
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from apps.finances.models import Budget, BudgetCategory, Expense, Installment
 from apps.finances.tests.factories import (
@@ -127,6 +128,53 @@ class TestExpenseToleranceZero:
 
         assert "não bate" in str(exc_info.value).lower()
 
+    def test_lock_installments_total_returns_sum(self, user: Any) -> None:
+        """O lock traz a soma atual das parcelas e o actual_amount do banco."""
+        _, category = _setup_expense(user)
+        expense = _make_expense(user, category, actual_amount=Decimal("1000.00"))
+        InstallmentFactory(
+            expense=expense, installment_number=1, amount=Decimal("600.00")
+        )
+        InstallmentFactory(
+            expense=expense, installment_number=2, amount=Decimal("400.00")
+        )
+
+        assert expense.lock_installments_total() == Decimal("1000.00")
+
+    def test_check_installments_total_uses_cached_total(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
+        """Com o total bloqueado em cache, a checagem por delta não consulta."""
+        _, category = _setup_expense(user)
+        expense = _make_expense(user, category, actual_amount=Decimal("1000.00"))
+        InstallmentFactory(
+            expense=expense, installment_number=1, amount=Decimal("1000.00")
+        )
+        expense.lock_installments_total()
+
+        with django_assert_num_queries(0):
+            expense.check_installments_total(delta=Decimal("0.00"))
+            with pytest.raises(ValidationError):
+                expense.check_installments_total(delta=Decimal("-100.00"))
+
+    def test_cached_total_expires_with_its_transaction(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
+        """Após o rollback, a checagem por delta volta a consultar o banco."""
+        _, category = _setup_expense(user)
+        expense = _make_expense(user, category, actual_amount=Decimal("1000.00"))
+        InstallmentFactory(
+            expense=expense, installment_number=1, amount=Decimal("1000.00")
+        )
+        with pytest.raises(RuntimeError), transaction.atomic():
+            expense.lock_installments_total()
+            raise RuntimeError
+
+        # Com o total antigo em cache, 1000 - 100 seria recusado; o banco
+        # (já com a alteração aplicada) ainda soma 1000.
+        with django_assert_num_queries(1):
+            expense.check_installments_total(delta=Decimal("-100.00"))
+
     def test_expense_creation_skips_tolerance_validation(self, user: Any) -> None:
         """Criação (primeiro save) não valida Tolerância Zero — gap intencional.
 
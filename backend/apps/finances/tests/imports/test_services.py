@@ -0,0 +1,422 @@
+import io
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Any, cast
+from unittest.mock import patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import IntegrityError
+from django.utils import timezone
+from openpyxl import Workbook
+
+from apps.core.exceptions import BusinessRuleViolation, ObjectNotFoundError
+from apps.finances.imports import ImportRow, iter_import_rows
+from apps.finances.models import BudgetCategory, Expense, ExpenseImportJob, Installment
+from apps.finances.schemas import ExpenseImportIn
+from apps.finances.services.expense_import_service import ExpenseImportService
+from apps.finances.tests.factories import (
+    BudgetCategoryFactory as _BudgetCategoryFactory,
+)
+from apps.logistics.models import Contract
+from apps.logistics.tests.factories import ContractFactory as _ContractFactory
+from apps.scheduler.models import Event
+from apps.users.models import User
+from apps.users.tests.factories import UserFactory as _UserFactory
+from apps.weddings.models import Wedding
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
+
+
+def BudgetCategoryFactory(*args: Any, **kwargs: Any) -> BudgetCategory:
+    return cast(BudgetCategory, _BudgetCategoryFactory(*args, **kwargs))
+
+
+def ContractFactory(*args: Any, **kwargs: Any) -> Contract:
+    return cast(Contract, _ContractFactory(*args, **kwargs))
+
+
+def UserFactory(*args: Any, **kwargs: Any) -> User:
+    return cast(User, _UserFactory(*args, **kwargs))
+
+
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
+HEADER = "categoria;nome;valor_estimado;valor;parcelas;primeiro_vencimento;contrato"
+
+
+class DummyStorageService:
+    def generate_presigned_put_url(
+        self, bucket: str, object_key: str, content_type: str, expires_in: int = 900
+    ) -> str:
+        return f"https://r2.com/{bucket}/{object_key}"
+
+    def upload_bytes(
+        self, bucket: str, object_key: str, data: bytes, content_type: str
+    ) -> str:
+        return object_key
+
+    def generate_presigned_get_url(
+        self, bucket: str, object_key: str, expires_in: int = 900
+    ) -> str:
+        return f"https://r2.com/{bucket}/{object_key}"
+
+
+@pytest.fixture(autouse=True)
+def import_storage(settings: Any) -> None:
+    settings.R2_BUCKET = "test-bucket"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
+
+
+@pytest.fixture
+def category(user: User) -> BudgetCategory:
+    wedding = WeddingFactory(company=user.company)
+    return BudgetCategoryFactory(
+        wedding=wedding, budget__wedding=wedding, name="Buffet"
+    )
+
+
+def _upload(
+    user: User, wedding: Wedding, content: bytes, filename: str = "despesas.csv"
+) -> ExpenseImportJob:
+    job, _ = ExpenseImportService.create(
+        user.company,
+        ExpenseImportIn(wedding=wedding.uuid, filename=filename),
+        storage_service=DummyStorageService(),
+    )
+    default_storage.save(job.object_key, ContentFile(content))
+    return job
+
+
+def _run(
+    user: User, job: ExpenseImportJob, capture: Any, *, dry_run: bool
+) -> ExpenseImportJob:
+    with capture(execute=True):
+        ExpenseImportService.start(user.company, job, dry_run=dry_run)
+    job.refresh_from_db()
+    return job
+
+
+class TestImportRowParsing:
+    """Leitura em streaming de CSV e XLSX."""
+
+    def test_csv_with_semicolon_and_aliases(self) -> None:
+        content = f"{HEADER}\nBuffet;Jantar;1.000,00;1.200,50;2;10/01/2030;\n\n"
+
+        rows = list(iter_import_rows(io.BytesIO(content.encode()), "csv"))
+
+        assert rows == [
+            (
+                2,
+                {
+                    "category": "Buffet",
+                    "name": "Jantar",
+                    "estimated_amount": "1.000,00",
+                    "actual_amount": "1.200,50",
+                    "num_installments": "2",
+                    "first_due_date": "10/01/2030",
+                },
+            )
+        ]
+
+    def test_xlsx_rows(self) -> None:
+        workbook = Workbook()
+        sheet = workbook.active
+        assert sheet is not None
+        sheet.append(["category", "name", "estimated_amount", "actual_amount"])
+        sheet.append(["Buffet", "Jantar", 1000, 1200.5])
+        sheet.append(["Buffet", "Bolo", 300, datetime(2030, 1, 10)])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+
+        rows = list(iter_import_rows(buffer, "xlsx"))
+
+        assert rows[0][1]["actual_amount"] == "1200.5"
+        assert rows[1][1]["actual_amount"] == "2030-01-10"
+
+    def test_missing_required_columns_raises(self) -> None:
+        content = b"categoria,nome\nBuffet,Jantar\n"
+
+        with pytest.raises(BusinessRuleViolation, match="estimated_amount"):
+            list(iter_import_rows(io.BytesIO(content), "csv"))
+
+
+@pytest.mark.django_db
+class TestExpenseImportService:
+    """Job de importação: upload, dry-run e gravação em lotes."""
+
+    def test_create_returns_presigned_url(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+
+        job, url = ExpenseImportService.create(
+            user.company,
+            ExpenseImportIn(wedding=wedding.uuid, filename="planilha.XLSX"),
+            storage_service=DummyStorageService(),
+        )
+
+        assert job.status == ExpenseImportJob.StatusChoices.AWAITING_UPLOAD
+        assert job.file_format == ExpenseImportJob.FormatChoices.XLSX
+        assert job.object_key.startswith(f"imports/{wedding.uuid}/")
+        assert url == f"https://r2.com/test-bucket/{job.object_key}"
+
+    def test_create_rejects_unsupported_extension(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+
+        with pytest.raises(BusinessRuleViolation, match="CSV ou XLSX"):
+            ExpenseImportService.create(
+                user.company,
+                ExpenseImportIn(wedding=wedding.uuid, filename="despesas.pdf"),
+                storage_service=DummyStorageService(),
+            )
+
+    def test_create_cross_tenant_wedding(self, user: User) -> None:
+        other = WeddingFactory()
+
+        with pytest.raises(ObjectNotFoundError):
+            ExpenseImportService.create(
+                user.company,
+                ExpenseImportIn(wedding=other.uuid, filename="despesas.csv"),
+                storage_service=DummyStorageService(),
+            )
+
+    def test_dry_run_validates_without_writing(
+        self,
+        user: User,
+        category: BudgetCategory,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        content = f"{HEADER}\nbuffet;Jantar;1000;1000;2;;\nBuffet;Bolo;300;300;1;;\n"
+        job = _upload(user, category.wedding, content.encode())
+
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        assert job.status == ExpenseImportJob.StatusChoices.VALIDATED
+        assert job.total_rows == 2
+        assert job.error_count == 0
+        assert not Expense.objects.exists()
+
+    def test_dry_run_reports_row_errors(
+        self,
+        user: User,
+        category: BudgetCategory,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        contract = ContractFactory(
+            wedding=category.wedding, total_amount=Decimal("500.00")
+        )
+        content = (
+            f"{HEADER}\n"
+            "Flores;Arranjos;100;100;1;;\n"
+            "Buffet;Jantar;abc;100;1;;\n"
+            f"Buffet;Banda;500;400;1;;{contract.uuid}\n"
+            "Buffet;Bolo;300;300;1;;\n"
+        )
+        job = _upload(user, category.wedding, content.encode())
+
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        assert job.status == ExpenseImportJob.StatusChoices.FAILED
+        assert job.total_rows == 4
+        assert [(e["row"], e["field"]) for e in job.errors] == [
+            (3, "estimated_amount"),
+            (2, "category"),
+            (4, "contract"),
+        ]
+        assert "BR-F02" in job.errors[2]["detail"]
+
+    def test_commit_requires_successful_validation(
+        self, user: User, category: BudgetCategory
+    ) -> None:
+        job = _upload(user, category.wedding, f"{HEADER}\n".encode())
+
+        with pytest.raises(BusinessRuleViolation, match="Valide a planilha"):
+            ExpenseImportService.start(user.company, job, dry_run=False)
+
+    def test_commit_imports_in_batches(
+        self,
+        user: User,
+        category: BudgetCategory,
+        settings: Any,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        settings.EXPENSE_IMPORT_BATCH_SIZE = 2
+        contract = ContractFactory(
+            wedding=category.wedding, total_amount=Decimal("900.00")
+        )
+        first_due = date.today() + timedelta(days=10)
+        lines = [f"Buffet;Item {i};100;100;1;{first_due:%d/%m/%Y};" for i in range(4)]
+        lines.append(f"Buffet;Banda;900;900;3;{first_due.isoformat()};{contract.uuid}")
+        content = "\n".join([HEADER, *lines])
+        job = _upload(user, category.wedding, content.encode())
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=False)
+
+        assert job.status == ExpenseImportJob.StatusChoices.COMPLETED
+        assert job.imported_rows == 5
+        assert job.finished_at is not None
+
+        band = Expense.objects.get(name="Banda")
+        assert band.contract == contract
+        installments = list(band.installments.order_by("installment_number"))
+        assert [i.amount for i in installments] == [
+            Decimal("300.00"),
+            Decimal("300.00"),
+            Decimal("300.00"),
+        ]
+        assert installments[2].due_date == first_due + timedelta(days=60)
+        assert Installment.objects.filter(wedding=category.wedding).count() == 7
+
+        payments = Event.objects.filter(
+            wedding=category.wedding, event_type=Event.TypeChoices.PAYMENT
+        )
+        assert payments.count() == 7
+        assert payments.filter(source_installment=installments[0]).get().title == (
+            "Pagamento: Banda - Parcela 1/3"
+        )
+        category.wedding.refresh_from_db()
+        assert category.wedding.events_version == 3
+
+    def test_retry_after_partial_commit_resumes_without_duplicates(
+        self,
+        user: User,
+        category: BudgetCategory,
+        settings: Any,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        settings.EXPENSE_IMPORT_BATCH_SIZE = 2
+        first_due = date.today() + timedelta(days=10)
+        lines = [f"Buffet;Item {i};100;100;1;{first_due:%d/%m/%Y};" for i in range(5)]
+        job = _upload(user, category.wedding, "\n".join([HEADER, *lines]).encode())
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        def _interrupted(*args: Any) -> Iterator[ImportRow]:
+            rows = iter_import_rows(*args)
+            yield from islice(rows, 3)
+            raise OSError("conexão com o storage perdida")
+
+        with patch(
+            "apps.finances.services.expense_import_service.iter_import_rows",
+            _interrupted,
+        ):
+            job = _run(user, job, django_capture_on_commit_callbacks, dry_run=False)
+
+        assert job.status == ExpenseImportJob.StatusChoices.FAILED
+        assert job.imported_rows == 2
+        assert job.committed_line == 3
+
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+        assert job.status == ExpenseImportJob.StatusChoices.VALIDATED
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=False)
+
+        assert job.status == ExpenseImportJob.StatusChoices.COMPLETED
+        assert job.imported_rows == 5
+        assert job.total_rows == 5
+        assert sorted(
+            Expense.objects.filter(wedding=category.wedding).values_list(
+                "name", flat=True
+            )
+        ) == [f"Item {i}" for i in range(5)]
+
+    def test_unexpected_error_fails_job_and_allows_retry(
+        self,
+        user: User,
+        category: BudgetCategory,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        content = f"{HEADER}\nBuffet;Jantar;100;100;1;;"
+        job = _upload(user, category.wedding, content.encode())
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        with patch(
+            "apps.finances.services.expense_import_service._import_chunk",
+            side_effect=IntegrityError("deadlock"),
+        ):
+            job = _run(user, job, django_capture_on_commit_callbacks, dry_run=False)
+
+        assert job.status == ExpenseImportJob.StatusChoices.FAILED
+        assert job.errors[0]["detail"] == "Erro inesperado ao processar a planilha."
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+        assert job.status == ExpenseImportJob.StatusChoices.VALIDATED
+
+    def test_stale_running_job_can_be_restarted(
+        self,
+        user: User,
+        category: BudgetCategory,
+        settings: Any,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        settings.EXPENSE_IMPORT_STALE_SECONDS = 60
+        job = _upload(user, category.wedding, f"{HEADER}\n".encode())
+        running = ExpenseImportJob.StatusChoices.IMPORTING
+        ExpenseImportJob.objects.filter(pk=job.pk).update(status=running)
+        job.refresh_from_db()
+
+        with pytest.raises(BusinessRuleViolation):
+            ExpenseImportService.start(user.company, job, dry_run=True)
+
+        ExpenseImportJob.objects.filter(pk=job.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=61)
+        )
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+        assert job.status == ExpenseImportJob.StatusChoices.VALIDATED
+
+    def test_concurrent_start_enqueues_once(
+        self,
+        user: User,
+        category: BudgetCategory,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        job = _upload(user, category.wedding, f"{HEADER}\n".encode())
+        same_job = ExpenseImportJob.objects.get(pk=job.pk)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            ExpenseImportService.start(user.company, job, dry_run=True)
+            with pytest.raises(BusinessRuleViolation) as exc_info:
+                ExpenseImportService.start(user.company, same_job, dry_run=True)
+
+        assert exc_info.value.code == "expense_import_invalid_status"
+        assert len(callbacks) == 1
+
+    def test_missing_file_fails_job(
+        self,
+        user: User,
+        category: BudgetCategory,
+        django_capture_on_commit_callbacks: Any,
+    ) -> None:
+        job, _ = ExpenseImportService.create(
+            user.company,
+            ExpenseImportIn(wedding=category.wedding.uuid, filename="despesas.csv"),
+            storage_service=DummyStorageService(),
+        )
+
+        job = _run(user, job, django_capture_on_commit_callbacks, dry_run=True)
+
+        assert job.status == ExpenseImportJob.StatusChoices.FAILED
+        assert job.errors == [
+            {
+                "row": 0,
+                "field": None,
+                "detail": "Não foi possível ler o arquivo enviado.",
+            }
+        ]
+
+    def test_start_cross_tenant(self, category: BudgetCategory) -> None:
+        other = UserFactory()
+        job = ExpenseImportJob.objects.create(
+            company=category.company,
+            wedding=category.wedding,
+            filename="despesas.csv",
+            file_format=ExpenseImportJob.FormatChoices.CSV,
+        )
+
+        with pytest.raises(ObjectNotFoundError):
+            ExpenseImportService.start(other.company, job, dry_run=True)
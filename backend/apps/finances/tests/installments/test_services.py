@@ -5,6 +5,8 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.core.exceptions import (
     BusinessRuleViolation,
@@ -12,7 +14,12 @@ from apps.core.exceptions import (
     ObjectNotFoundError,
 )
 from apps.finances.models import Budget, BudgetCategory, Expense, Installment
-from apps.finances.schemas import InstallmentAdjustIn, InstallmentIn, InstallmentPatchIn
+from apps.finances.schemas import (
+    InstallmentAdjustIn,
+    InstallmentBulkAdjustItemIn,
+    InstallmentIn,
+    InstallmentPatchIn,
+)
 from apps.finances.services.installment_service import InstallmentService
 from apps.finances.tests.factories import (
     BudgetCategoryFactory as _BudgetCategoryFactory,
@@ -330,6 +337,25 @@ class TestInstallmentServiceUpdate:
 
         assert "expense_math_violation" in str(exc_info.value.code)
 
+    def test_update_uses_amount_read_under_lock(self, user: User) -> None:
+        """O delta parte do valor relido sob o lock, não da instância em mãos."""
+        expense = _setup_expense(user, actual_amount=Decimal("1000.00"))
+        a = InstallmentFactory(
+            expense=expense, installment_number=1, amount=Decimal("600.00")
+        )
+        b = InstallmentFactory(
+            expense=expense, installment_number=2, amount=Decimal("400.00")
+        )
+        stale = Installment.objects.get(pk=a.pk)
+        # Edição concorrente já commitada: 500 + 500 continua fechando 1000.
+        Installment.objects.filter(pk__in=[a.pk, b.pk]).update(amount=Decimal("500"))
+
+        updated = InstallmentService.update(
+            user.company, stale, InstallmentPatchIn(amount=Decimal("500.00"))
+        )
+
+        assert updated.amount == Decimal("500.00")
+
     def test_update_installment_due_date(self, user: User) -> None:
         """Atualização de due_date é permitida para parcelas futuras."""
         expense = _setup_expense(user, actual_amount=Decimal("500.00"))
@@ -437,6 +463,22 @@ class TestInstallmentServiceDelete:
 
         assert "installment_deletion_math_error" in str(exc_info.value.code)
 
+    def test_delete_uses_amount_read_under_lock(self, user: User) -> None:
+        """Com o valor antigo (0) a exclusão passaria; o atual (100) quebra a soma."""
+        expense = _setup_expense(user, actual_amount=Decimal("1000.00"))
+        a, b, _ = (
+            InstallmentFactory(
+                expense=expense, installment_number=number, amount=Decimal(amount)
+            )
+            for number, amount in ((1, "0.00"), (2, "600.00"), (3, "400.00"))
+        )
+        stale = Installment.objects.get(pk=a.pk)
+        Installment.objects.filter(pk=a.pk).update(amount=Decimal("100.00"))
+        Installment.objects.filter(pk=b.pk).update(amount=Decimal("500.00"))
+
+        with pytest.raises(DomainIntegrityError):
+            InstallmentService.delete(user.company, stale)
+
     def test_delete_installment_when_sum_still_matches_passes(self, user: User) -> None:
         """Deleção permitida se soma das restantes ainda fecha."""
         expense = _setup_expense(user, actual_amount=Decimal("1000.00"))
@@ -557,7 +599,7 @@ class TestInstallmentServiceMarkAsPaid:
         )
 
         with patch(
-            "apps.finances.models.Expense.full_clean",
+            "apps.finances.models.Expense.check_installments_total",
             side_effect=DjangoValidationError("Math error"),
         ):
             with pytest.raises(BusinessRuleViolation) as exc:
@@ -592,7 +634,7 @@ class TestInstallmentServiceMarkAsPaid:
     ) -> None:
         """Marcação de parcela como paga que quebra Tolerância Zero levanta erro.
         Para forçar isso, simulamos um erro de validação (DjangoValidationError)
-        durante o `full_clean()` da despesa na hora do mark_as_paid."""
+        durante a checagem de soma da despesa na hora do mark_as_paid."""
         from django.core.exceptions import ValidationError as DjangoValidationError
 
         expense = _setup_expense(user, actual_amount=Decimal("500.00"))
@@ -602,7 +644,7 @@ class TestInstallmentServiceMarkAsPaid:
         )
 
         mocker.patch(
-            "apps.finances.models.Expense.full_clean",
+            "apps.finances.models.Expense.check_installments_total",
             side_effect=DjangoValidationError("Mock error"),
         )
 
@@ -616,7 +658,7 @@ class TestInstallmentServiceMarkAsPaid:
     ) -> None:
         """Desmarcação de parcela que quebra Tolerância Zero levanta erro.
         Simulamos um erro de validação (DjangoValidationError) durante
-        o `full_clean()` da despesa na hora do unmark_as_paid."""
+        a checagem de soma da despesa na hora do unmark_as_paid."""
         from django.core.exceptions import ValidationError as DjangoValidationError
 
         expense = _setup_expense(user, actual_amount=Decimal("500.00"))
@@ -628,7 +670,7 @@ class TestInstallmentServiceMarkAsPaid:
         )
 
         mocker.patch(
-            "apps.finances.models.Expense.full_clean",
+            "apps.finances.models.Expense.check_installments_total",
             side_effect=DjangoValidationError("Mock error"),
         )
 
@@ -996,3 +1038,201 @@ class TestInstallmentServiceAdjust:
                 other_installment,
                 InstallmentAdjustIn(amount=Decimal("300.00")),
             )
+
+
+@pytest.mark.django_db
+class TestInstallmentServiceToleranceCheck:
+    """Checagem incremental da Tolerância Zero nas transições de parcela."""
+
+    @staticmethod
+    def _sum_queries(ctx: CaptureQueriesContext) -> list[str]:
+        return [q["sql"] for q in ctx.captured_queries if "SUM(" in q["sql"].upper()]
+
+    def test_mark_as_paid_skips_installment_sum(self, user: User) -> None:
+        """Mudança só de status não recalcula a soma das parcelas."""
+        expense = _setup_expense(user, actual_amount=Decimal("500.00"))
+        installment = InstallmentFactory(expense=expense, amount=Decimal("500.00"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            InstallmentService.mark_as_paid(user.company, installment)
+
+        assert self._sum_queries(ctx) == []
+
+    def test_adjust_sums_once_with_locked_total(self, user: User) -> None:
+        """Mudança de valor soma uma única vez, junto com o lock da despesa."""
+        expense = _setup_expense(user, actual_amount=Decimal("900.00"))
+        InstallmentFactory(
+            expense=expense,
+            installment_number=1,
+            amount=Decimal("500.00"),
+            due_date=date.today() + timedelta(days=30),
+        )
+        inst2 = InstallmentFactory(
+            expense=expense,
+            installment_number=2,
+            amount=Decimal("400.00"),
+            due_date=date.today() + timedelta(days=60),
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            with pytest.raises(BusinessRuleViolation) as exc:
+                InstallmentService.adjust(
+                    user.company, inst2, InstallmentAdjustIn(amount=Decimal("300.00"))
+                )
+
+        assert exc.value.code == "expense_math_violation"
+        assert len(self._sum_queries(ctx)) == 1
+
+
+@pytest.mark.django_db
+class TestInstallmentServiceBulk:
+    """Testes das transições em lote (bulk_mark_as_paid/unmark/adjust)."""
+
+    def _two_expenses(self, user: User) -> tuple[list[Installment], list[Installment]]:
+        first = _setup_expense(user, actual_amount=Decimal("600.00"))
+        second = _setup_expense(user, actual_amount=Decimal("200.00"))
+        base = date.today() + timedelta(days=30)
+        a = [
+            InstallmentFactory(
+                expense=first,
+                installment_number=n,
+                amount=Decimal("200.00"),
+                due_date=base + timedelta(days=30 * n),
+            )
+            for n in range(1, 4)
+        ]
+        b = [
+            InstallmentFactory(
+                expense=second,
+                installment_number=1,
+                amount=Decimal("200.00"),
+                due_date=base,
+            )
+        ]
+        return a, b
+
+    def test_bulk_mark_as_paid_success(
+        self, user: User, django_assert_max_num_queries: Any
+    ) -> None:
+        """Todas as parcelas de duas despesas pagas com número fixo de queries."""
+        a, b = self._two_expenses(user)
+        ids = [inst.uuid for inst in a + b]
+
+        with django_assert_max_num_queries(6):
+            results = InstallmentService.bulk_mark_as_paid(user.company, ids)
+
+        assert [r.uuid for r in results] == ids
+        assert all(r.ok for r in results)
+        assert (
+            Installment.objects.filter(
+                uuid__in=ids, status=Installment.StatusChoices.PAID
+            ).count()
+            == 4
+        )
+
+    def test_bulk_mark_as_paid_reports_items_individually(self, user: User) -> None:
+        """Itens já pagos ou de outro tenant são recusados sem afetar os demais."""
+        a, _ = self._two_expenses(user)
+        InstallmentService.mark_as_paid(user.company, a[0])
+        other_expense = _setup_expense(UserFactory(), actual_amount=Decimal("50.00"))
+        foreign = InstallmentFactory(expense=other_expense, amount=Decimal("50.00"))
+
+        results = InstallmentService.bulk_mark_as_paid(
+            user.company, [a[0].uuid, a[1].uuid, foreign.uuid, uuid4()]
+        )
+
+        assert [r.code for r in results] == [
+            "installment_already_paid",
+            None,
+            "installment_not_found_or_denied",
+            "installment_not_found_or_denied",
+        ]
+        foreign.refresh_from_db()
+        assert foreign.status == Installment.StatusChoices.PENDING
+
+    def test_bulk_unmark_as_paid(self, user: User) -> None:
+        a, _ = self._two_expenses(user)
+        InstallmentService.bulk_mark_as_paid(user.company, [a[0].uuid, a[1].uuid])
+
+        results = InstallmentService.bulk_unmark_as_paid(
+            user.company, [a[0].uuid, a[2].uuid]
+        )
+
+        assert [r.ok for r in results] == [True, False]
+        assert results[1].code == "installment_not_paid"
+        a[0].refresh_from_db()
+        assert a[0].status == Installment.StatusChoices.PENDING
+        assert a[0].paid_date is None
+
+    def test_bulk_adjust_validates_sum_once_per_expense(self, user: User) -> None:
+        """Rebalancear valores só é válido considerando o lote inteiro."""
+        a, b = self._two_expenses(user)
+        items = [
+            InstallmentBulkAdjustItemIn(uuid=a[0].uuid, amount=Decimal("100.00")),
+            InstallmentBulkAdjustItemIn(uuid=a[1].uuid, amount=Decimal("300.00")),
+            InstallmentBulkAdjustItemIn(uuid=b[0].uuid, amount=Decimal("150.00")),
+        ]
+
+        results = InstallmentService.bulk_adjust(user.company, items)
+
+        assert [r.ok for r in results] == [True, True, False]
+        assert results[2].code == "expense_math_violation"
+        a[0].refresh_from_db()
+        b[0].refresh_from_db()
+        assert a[0].amount == Decimal("100.00")
+        assert b[0].amount == Decimal("200.00")
+
+    def test_bulk_adjust_checks_chronology_against_final_state(
+        self, user: User
+    ) -> None:
+        """Deslocar parcelas vizinhas juntas é aceito; inverter a ordem não."""
+        a, _ = self._two_expenses(user)
+        shift = timedelta(days=90)
+        ok = InstallmentService.bulk_adjust(
+            user.company,
+            [
+                InstallmentBulkAdjustItemIn(
+                    uuid=inst.uuid, due_date=inst.due_date + shift
+                )
+                for inst in reversed(a)
+            ],
+        )
+        assert all(r.ok for r in ok)
+
+        a[1].refresh_from_db()
+        rejected = InstallmentService.bulk_adjust(
+            user.company,
+            [
+                InstallmentBulkAdjustItemIn(
+                    uuid=a[0].uuid, due_date=a[1].due_date + timedelta(days=1)
+                )
+            ],
+        )
+        assert rejected[0].code == "due_date_after_next_installment"
+
+    def test_bulk_adjust_blocked_by_paid(self, user: User) -> None:
+        a, _ = self._two_expenses(user)
+        InstallmentService.mark_as_paid(user.company, a[0])
+
+        results = InstallmentService.bulk_adjust(
+            user.company,
+            [InstallmentBulkAdjustItemIn(uuid=a[0].uuid, amount=Decimal("1.00"))],
+        )
+
+        assert results[0].code == "adjustment_on_paid_installment"
+
+    def test_bulk_rejects_duplicate_ids(self, user: User) -> None:
+        a, _ = self._two_expenses(user)
+
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            InstallmentService.bulk_mark_as_paid(user.company, [a[0].uuid, a[0].uuid])
+        assert exc_info.value.code == "duplicate_installment_ids"
+
+        with pytest.raises(BusinessRuleViolation):
+            InstallmentService.bulk_adjust(
+                user.company,
+                [
+                    InstallmentBulkAdjustItemIn(uuid=a[0].uuid, amount=Decimal("1")),
+                    InstallmentBulkAdjustItemIn(uuid=a[0].uuid, amount=Decimal("2")),
+                ],
+            )
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any, cast
 from uuid import uuid4
@@ -8,6 +8,12 @@ import pytest
 from apps.finances.schemas import ExpenseIn
 from apps.finances.services.budget_service import BudgetService
 from apps.finances.services.expense_service import ExpenseService
+from apps.finances.tests.factories import (
+    BudgetCategoryFactory,
+    BudgetFactory,
+    ExpenseFactory,
+    InstallmentFactory,
+)
 from apps.logistics.models import Contract, Supplier
 from apps.logistics.tests.factories import ContractFactory as _ContractFactory
 from apps.logistics.tests.factories import SupplierFactory as _SupplierFactory
@@ -15,6 +21,7 @@ from apps.users.models import User
 from apps.users.tests.factories import UserFactory as _UserFactory
 from apps.weddings.schemas import WeddingIn
 from apps.weddings.services import WeddingService
+from apps.weddings.tests.factories import WeddingFactory
 
 
 def ContractFactory(*args: Any, **kwargs: Any) -> Contract:
@@ -387,3 +394,157 @@ class TestFinancesAPIErrorHandling:
     def test_get_expense_not_found(self, auth_client: Any) -> None:
         response = auth_client.get(f"/api/v1/finances/expenses/{uuid4()}/")
         assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestInstallmentBulkAPI:
+    @pytest.fixture
+    def installments(self, user: Any) -> list[Any]:
+        wedding = WeddingFactory(user_context=user)
+        budget = BudgetFactory(wedding=wedding)
+        category = BudgetCategoryFactory(budget=budget, wedding=wedding)
+        expense = ExpenseFactory(
+            wedding=wedding,
+            category=category,
+            contract=None,
+            actual_amount=Decimal("300.00"),
+        )
+        return [
+            InstallmentFactory(
+                expense=expense,
+                installment_number=n,
+                amount=Decimal("150.00"),
+                due_date=date.today() + timedelta(days=30 * n),
+            )
+            for n in (1, 2)
+        ]
+
+    def test_bulk_mark_as_paid(self, auth_client: Any, installments: Any) -> None:
+        missing = uuid4()
+        response = auth_client.post(
+            "/api/v1/finances/installments/bulk/mark-as-paid/",
+            {"installment_ids": [str(i.uuid) for i in installments] + [str(missing)]},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["affected_count"] == 2
+        assert [r["ok"] for r in data["results"]] == [True, True, False]
+        assert data["results"][0]["installment"]["status"] == "PAID"
+        assert data["results"][2]["code"] == "installment_not_found_or_denied"
+
+    def test_bulk_adjust(self, auth_client: Any, installments: Any) -> None:
+        response = auth_client.patch(
+            "/api/v1/finances/installments/bulk/adjust/",
+            {
+                "items": [
+                    {"uuid": str(installments[0].uuid), "amount": "100.00"},
+                    {"uuid": str(installments[1].uuid), "amount": "200.00"},
+                ]
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert [r["installment"]["amount"] for r in response.json()["results"]] == [
+            "100.00",
+            "200.00",
+        ]
+
+    def test_bulk_rejects_duplicate_ids(self, auth_client: Any) -> None:
+        duplicated = str(uuid4())
+        response = auth_client.post(
+            "/api/v1/finances/installments/bulk/mark-as-paid/",
+            {"installment_ids": [duplicated, duplicated]},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 422
+        assert response.json()["code"] == "duplicate_installment_ids"
+
+    def test_bulk_rejects_empty_payload(self, auth_client: Any) -> None:
+        response = auth_client.post(
+            "/api/v1/finances/installments/bulk/unmark-as-paid/",
+            {"installment_ids": []},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 422
+
+
+@pytest.mark.django_db
+class TestExpenseImportAPI:
+    @pytest.fixture(autouse=True)
+    def storage(self, settings: Any, monkeypatch: Any) -> None:
+        from apps.finances.tests.imports.test_services import DummyStorageService
+
+        settings.R2_BUCKET = "test-bucket"
+        settings.STORAGES = {
+            **settings.STORAGES,
+            "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        }
+        monkeypatch.setattr(
+            "apps.finances.services.expense_import_service.get_storage_service",
+            DummyStorageService,
+        )
+
+    def test_import_flow(
+        self, auth_client: Any, user: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+
+        wedding: Any = WeddingFactory(user_context=user)
+        BudgetCategoryFactory(wedding=wedding, budget__wedding=wedding, name="Buffet")
+
+        response = auth_client.post(
+            "/api/v1/finances/imports/",
+            {"wedding": str(wedding.uuid), "filename": "despesas.csv"},
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["upload_url"].startswith("https://r2.com/test-bucket/imports/")
+        job_uuid = data["job"]["uuid"]
+        assert data["job"]["status"] == "AWAITING_UPLOAD"
+
+        key = data["upload_url"].removeprefix("https://r2.com/test-bucket/")
+        default_storage.save(
+            key,
+            ContentFile(
+                b"category,name,estimated_amount,actual_amount\nBuffet,Jantar,100,100\n"
+            ),
+        )
+        for action in ("validate", "commit"):
+            with django_capture_on_commit_callbacks(execute=True):
+                response = auth_client.post(
+                    f"/api/v1/finances/imports/{job_uuid}/{action}/"
+                )
+            assert response.status_code == 202
+            assert response.json()["status"] == "QUEUED"
+
+        response = auth_client.get(f"/api/v1/finances/imports/{job_uuid}/")
+        assert response.status_code == 200
+        assert response.json()["status"] == "COMPLETED"
+        assert response.json()["imported_rows"] == 1
+
+    def test_commit_before_validation_returns_422(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        wedding: Any = WeddingFactory(user_context=user)
+        response = auth_client.post(
+            "/api/v1/finances/imports/",
+            {"wedding": str(wedding.uuid), "filename": "despesas.csv"},
+            content_type="application/json",
+        )
+        job_uuid = response.json()["job"]["uuid"]
+
+        response = auth_client.post(f"/api/v1/finances/imports/{job_uuid}/commit/")
+
+        assert response.status_code == 422
+        assert response.json()["code"] == "expense_import_invalid_status"
+
+    def test_import_of_other_tenant_returns_404(self, auth_client: Any) -> None:
+        response = auth_client.get(f"/api/v1/finances/imports/{uuid4()}/")
+        assert response.status_code == 404
@@ -4,6 +4,7 @@ from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.core.decorators import conditional_get
 from apps.logistics.models.contract import Contract
 from apps.logistics.schemas import (
     ContractFullCreateIn,
@@ -15,7 +16,11 @@ from apps.logistics.schemas import (
     ContractUploadUrlIn,
     ContractUploadUrlOut,
 )
-from apps.logistics.selectors import contract_get_selector, contract_list_selector
+from apps.logistics.selectors import (
+    contract_data_version_selector,
+    contract_get_selector,
+    contract_list_selector,
+)
 from apps.logistics.services.contract_service import ContractService
 from apps.users.types import AuthRequest
 
@@ -23,9 +28,15 @@ from apps.users.types import AuthRequest
 contracts_router = Router(tags=["Logistics"])
 
 
+def _data_version(request: AuthRequest, **_: object) -> str:
+    """Versão dos dados de contratos do tenant (ETag das leituras)."""
+    return contract_data_version_selector(company=request.user.company)
+
+
 @contracts_router.get(
     "/", response=list[ContractOut], operation_id="logistics_contracts_list"
 )
+@conditional_get(_data_version)
 @paginate
 def list_contracts(
     request: AuthRequest,
@@ -53,6 +64,7 @@ def list_contracts(
     response={200: ContractOut, **READ_ERROR_RESPONSES},
     operation_id="logistics_contracts_read",
 )
+@conditional_get(_data_version)
 def retrieve_contract(request: AuthRequest, uuid: UUID4) -> Contract:
     """
     Exibe as cláusulas e informações completas de um contrato.
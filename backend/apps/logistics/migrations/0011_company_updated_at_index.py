@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logistics', '0010_alter_contract_pdf_file'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0004_company_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['company', 'updated_at'], name='logistics_c_company_fcb34a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['company', 'updated_at'], name='logistics_s_company_738341_idx'),
+        ),
+    ]
@@ -107,6 +107,7 @@ class Contract(TenantModel, WeddingOwnedMixin):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["company", "wedding"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["status"]),
         ]
 
@@ -97,6 +97,7 @@ class Supplier(TenantModel):
         ordering = ["name"]
         indexes = [
             models.Index(fields=["company", "name"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["is_active"]),
             models.Index(fields=["city", "state"]),
         ]
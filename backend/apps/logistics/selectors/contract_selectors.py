@@ -11,8 +11,9 @@ from django.core.exceptions import ValidationError
 
 from apps.core.exceptions import ObjectNotFoundError
 from apps.logistics.managers import ContractQuerySet
-from apps.logistics.models import Contract
+from apps.logistics.models import Contract, Supplier
 from apps.tenants.models import Company
+from apps.tenants.selectors import tenant_data_version_selector
 
 
 if TYPE_CHECKING:
@@ -91,3 +92,22 @@ def contract_pending_count_selector(
     if wedding_id:
         qs = qs.for_wedding(wedding_id)
     return qs.count()
+
+
+def contract_data_version_selector(*, company: Company) -> str:
+    """
+    Versão (ETag) dos dados exibidos nas rotas de contratos.
+
+    O payload traz dados do fornecedor e o vínculo com a despesa.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        str: Fingerprint dos dados do tenant.
+    """
+    from apps.finances.models import Expense
+
+    return tenant_data_version_selector(
+        company=company, models=(Contract, Supplier, Expense)
+    )
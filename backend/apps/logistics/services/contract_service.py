@@ -34,6 +34,7 @@ from apps.logistics.schemas import (
 )
 from apps.logistics.selectors.contract_selectors import contract_get_selector
 from apps.logistics.services.item_service import ItemService
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 from apps.weddings.models import Wedding
 
@@ -502,7 +503,7 @@ class ContractService:
             instance.pdf_file.delete(save=False)
 
         try:
-            instance.delete()
+            TombstoneService.delete(company, instance)
             logger.warning(
                 f"Contrato uuid={instance.uuid} DESTRUÍDO por company_id={company.id}"
             )
@@ -5,6 +5,7 @@ from django.db import transaction
 from apps.core.tenant import validate_tenant_ownership
 from apps.logistics.models import Supplier
 from apps.logistics.schemas import SupplierIn, SupplierPatchIn
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 
 
@@ -113,7 +114,7 @@ class SupplierService:
             f"company_id={company.id}"
         )
 
-        instance.delete()
+        TombstoneService.delete(company, instance)
         logger.warning(
             f"Fornecedor uuid={instance.uuid} DESTRUÍDO pela company_id={company.id}"
         )
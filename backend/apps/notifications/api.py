@@ -1,22 +1,39 @@
+import json
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
 from ninja.pagination import paginate
 from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES
+from apps.core.exceptions import ServiceUnavailableError
+from apps.core.schemas import ErrorResponse
+from apps.notifications.realtime import (
+    is_realtime_enabled,
+    subscribe_inbox,
+    wait_for_inbox_change,
+)
 from apps.notifications.schemas import (
     BulkNotificationIdsIn,
     BulkOperationOut,
+    InboxStateOut,
     MarkAllReadOut,
     NotificationOut,
     UnreadCountOut,
 )
 from apps.notifications.selectors import (
+    notification_inbox_state_selector,
     notification_list_selector,
     notification_unread_count_selector,
 )
 from apps.notifications.services import NotificationService
+from apps.users.authentication import AsyncTenantJWTAuth
 from apps.users.types import AuthRequest
 
 
@@ -54,6 +71,84 @@ def get_unread_count(request: AuthRequest) -> UnreadCountOut:
     return UnreadCountOut(count=count)
 
 
+@notifications_router.get(
+    "/poll/",
+    response={200: InboxStateOut, 304: None},
+    operation_id="notifications_poll",
+)
+def poll_inbox(request: AuthRequest, timeout: int | None = None) -> HttpResponse:
+    """GET condicional da caixa de notificações (fallback WSGI do SSE).
+
+    Sem If-None-Match (ou com versão desatualizada) responde imediatamente.
+    Com a versão atual responde 304; só segura a requisição até a próxima
+    mudança quando ``NOTIFICATIONS_LONG_POLL_TIMEOUT_SECONDS`` é positivo e o
+    Pub/Sub está ativo, pois cada espera ocupa uma thread do gunicorn.
+    """
+    user = request.user
+    max_timeout = settings.NOTIFICATIONS_LONG_POLL_TIMEOUT_SECONDS
+    wait = max_timeout if timeout is None else max(0, min(timeout, max_timeout))
+
+    state = notification_inbox_state_selector(company=user.company, user=user)
+    if (
+        wait > 0
+        and is_realtime_enabled()
+        and _inbox_etag(state.version) in _parse_if_none_match(request)
+    ):
+        state = wait_for_inbox_change(
+            user.company, user, known_version=state.version, timeout=wait
+        )
+
+    etag = _inbox_etag(state.version)
+    if etag in _parse_if_none_match(request):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(
+            InboxStateOut(
+                unread_count=state.unread_count, version=state.version
+            ).model_dump_json(),
+            content_type="application/json",
+        )
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+@notifications_router.get(
+    "/stream/",
+    auth=AsyncTenantJWTAuth(),
+    response={200: None, 503: ErrorResponse},
+    operation_id="notifications_stream",
+)
+async def stream_notifications(request: AuthRequest) -> StreamingHttpResponse:
+    """Stream SSE com novas notificações e mudanças do contador de não lidas.
+
+    Requer o servidor ASGI (config/asgi.py) e Redis Pub/Sub configurado; caso
+    contrário responde 503 e o cliente deve usar o long-polling em /poll/.
+    """
+    if not isinstance(request, ASGIRequest):
+        raise ServiceUnavailableError(
+            detail="Stream disponível apenas via ASGI. Use /notifications/poll/.",
+            code="realtime_requires_asgi",
+        )
+    if not is_realtime_enabled():
+        raise ServiceUnavailableError(
+            detail="Notificações em tempo real desativadas. Use /notifications/poll/.",
+            code="realtime_unavailable",
+        )
+
+    user = request.user
+    state = await sync_to_async(
+        lambda: notification_inbox_state_selector(company=user.company, user=user)
+    )()
+    response = StreamingHttpResponse(
+        _sse_events(user.id, state.unread_count, state.version),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @notifications_router.post(
     "/read-all/",
     response={200: MarkAllReadOut, **MUTATION_ERROR_RESPONSES},
@@ -137,3 +232,39 @@ def delete_notification(
         company=user.company, user=user, notification_id=notification_id
     )
     return 204, None
+
+
+def _inbox_etag(version: int) -> str:
+    return f'"inbox-{version}"'
+
+
+def _parse_if_none_match(request: AuthRequest) -> set[str]:
+    header = request.headers.get("If-None-Match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _sse_message(event: str, data: dict[str, Any], event_id: int) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _sse_events(
+    user_id: int, unread_count: int, version: int
+) -> AsyncIterator[str]:
+    """Gera as mensagens SSE até o limite de duração da conexão.
+
+    A conexão é encerrada após NOTIFICATIONS_STREAM_MAX_SECONDS para que
+    proxies e o Cloud Run não a derrubem; o EventSource reconecta sozinho.
+    """
+    yield _sse_message(
+        "inbox.state", {"unread_count": unread_count, "version": version}, version
+    )
+    deadline = time.monotonic() + settings.NOTIFICATIONS_STREAM_MAX_SECONDS
+    async for payload in subscribe_inbox(
+        user_id, heartbeat=settings.NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS
+    ):
+        if payload is None:
+            yield ": keep-alive\n\n"
+        else:
+            yield _sse_message(payload["event"], payload, payload["version"])
+        if time.monotonic() >= deadline:
+            return
@@ -0,0 +1,28 @@
+import logging
+
+from apps.core.cron import cron_registry
+from apps.notifications.services import NotificationService
+
+
+logger = logging.getLogger(__name__)
+
+
+@cron_registry.register(
+    "apply_notification_retention",
+    description="Arquiva notificações lidas antigas e exclui as expiradas por tipo.",
+)
+def run_apply_notification_retention() -> str:
+    """Aplica a política de retenção de notificações em lotes."""
+    archived = NotificationService.archive_read_notifications()
+    purged = NotificationService.purge_expired_notifications()
+    return f"{archived} notificação(ões) arquivada(s), {purged} excluída(s)."
+
+
+@cron_registry.register(
+    "reconcile_notification_counters",
+    description="Corrige desvios nos contadores de notificações não lidas.",
+)
+def run_reconcile_notification_counters() -> str:
+    """Recalcula os contadores de não lidas divergentes da tabela real."""
+    fixed = NotificationService.reconcile_unread_counters()
+    return f"{fixed} contador(es) de notificações reconciliado(s)."
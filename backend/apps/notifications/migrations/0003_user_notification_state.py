@@ -0,0 +1,35 @@
+# Generated by Django 6.0.8 on 2026-10-19 02:30
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_target_id_notification_target_type_and_more'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserNotificationState',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('unread_count', models.PositiveIntegerField(default=0, verbose_name='Não lidas')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_states', to='tenants.company', verbose_name='Empresa')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='notification_state', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Estado de Notificações do Usuário',
+                'verbose_name_plural': 'Estados de Notificações dos Usuários',
+                'db_table': 'notification_user_states',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.8 on 2026-10-19 02:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_user_notification_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usernotificationstate',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, help_text='Incrementada a cada mutação na caixa (usada como ETag).', verbose_name='Versão'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.8 on 2026-10-19 02:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat
+
+
+def backfill_wedding_name(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    Wedding = apps.get_model("weddings", "Wedding")
+    # Um único UPDATE com subquery correlacionada, executado só na migração.
+    name = Wedding.objects.filter(uuid=OuterRef("wedding_id")).values(
+        name=Concat(Value("Casamento de "), "bride_name", Value(" e "), "groom_name")
+    )[:1]
+    Notification.objects.filter(wedding_id__isnull=False).update(
+        wedding_name=Coalesce(Subquery(name), Value(""))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_user_notification_state_version'),
+        ('weddings', '0002_wedding_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='wedding_name',
+            field=models.CharField(blank=True, default='', help_text='Cópia do nome do casamento gravada na criação e propagada ao renomear.', max_length=255, verbose_name='Nome do Casamento'),
+        ),
+        migrations.RunPython(backfill_wedding_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 6.0.8 on 2026-10-19 02:42
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_notification_wedding_name'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('title', models.CharField(max_length=255, verbose_name='Título')),
+                ('message', models.TextField(verbose_name='Mensagem')),
+                ('type', models.CharField(choices=[('OVERDUE_INSTALLMENT', 'Parcela Vencida'), ('UPCOMING_INSTALLMENT', 'Parcela a Vencer'), ('EXPIRING_CONTRACT', 'Contrato Prestes a Vencer'), ('TASK_DEADLINE', 'Prazo de Tarefa'), ('CHECKLIST_ITEM_OVERDUE', 'Item de Checklist Vencido'), ('GENERAL', 'Geral')], default='GENERAL', max_length=50, verbose_name='Tipo')),
+                ('target_type', models.CharField(blank=True, choices=[('installment', 'Parcela'), ('expense', 'Despesa'), ('task', 'Tarefa'), ('contract', 'Contrato'), ('wedding', 'Casamento'), ('general', 'Geral')], default='', max_length=50, verbose_name='Tipo de Alvo')),
+                ('target_id', models.UUIDField(blank=True, null=True, verbose_name='ID do Alvo')),
+                ('wedding_id', models.UUIDField(blank=True, null=True, verbose_name='ID do Casamento')),
+                ('wedding_name', models.CharField(blank=True, default='', max_length=255, verbose_name='Nome do Casamento')),
+                ('link', models.CharField(blank=True, default='', max_length=500, verbose_name='Link')),
+                ('read_at', models.DateTimeField(blank=True, null=True, verbose_name='Lida em')),
+                ('notified_at', models.DateTimeField(verbose_name='Notificada em')),
+            ],
+            options={
+                'verbose_name': 'Notificação Arquivada',
+                'verbose_name_plural': 'Notificações Arquivadas',
+                'db_table': 'notifications_archive',
+                'ordering': ['-notified_at'],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_company_ca158b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['company', 'user', '-created_at'], name='notificatio_company_1abcbc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['company', 'user', 'is_read', '-created_at'], name='notificatio_company_03e49e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['type', 'created_at'], name='notificatio_type_cb6908_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', True)), fields=['read_at'], name='notifications_read_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to='tenants.company', verbose_name='Empresa'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL, verbose_name='Usuário'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationarchive',
+            index=models.Index(fields=['company', 'user', '-notified_at'], name='notificatio_company_4dd61f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationarchive',
+            index=models.Index(fields=['type', 'notified_at'], name='notificatio_type_3d32ee_idx'),
+        ),
+    ]
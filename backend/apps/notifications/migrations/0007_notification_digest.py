@@ -0,0 +1,45 @@
+# Generated by Django 6.0.8 on 2026-10-19 02:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_notification_retention'),
+        ('tenants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='digest_key',
+            field=models.CharField(blank=True, default='', help_text='Tipo, casamento e dia; vazia para notificações não agrupadas.', max_length=120, verbose_name='Chave de Agrupamento'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='items',
+            field=models.JSONField(blank=True, default=list, help_text='Ocorrências mais recentes reunidas neste resumo.', verbose_name='Itens Agrupados'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='occurrences',
+            field=models.PositiveIntegerField(default=1, verbose_name='Ocorrências'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='items',
+            field=models.JSONField(blank=True, default=list, verbose_name='Itens Agrupados'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='occurrences',
+            field=models.PositiveIntegerField(default=1, verbose_name='Ocorrências'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('digest_key', ''), _negated=True), fields=('user', 'digest_key'), name='notifications_unique_digest'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.8 on 2026-10-19 03:03
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_digest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FailedEmail',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('subject', models.CharField(max_length=255, verbose_name='Assunto')),
+                ('to', models.JSONField(default=list, verbose_name='Destinatários')),
+                ('from_email', models.CharField(max_length=255, verbose_name='Remetente')),
+                ('body', models.TextField(verbose_name='Texto')),
+                ('html', models.TextField(blank=True, verbose_name='HTML')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Tentativas')),
+                ('last_error', models.TextField(blank=True, verbose_name='Último erro')),
+            ],
+            options={
+                'verbose_name': 'E-mail com Falha',
+                'verbose_name_plural': 'E-mails com Falha',
+                'db_table': 'notification_failed_emails',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_failed_email'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='target_type',
+            field=models.CharField(blank=True, choices=[('installment', 'Parcela'), ('expense', 'Despesa'), ('task', 'Tarefa'), ('contract', 'Contrato'), ('wedding', 'Casamento'), ('event', 'Evento'), ('general', 'Geral')], default='', max_length=50, verbose_name='Tipo de Alvo'),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('OVERDUE_INSTALLMENT', 'Parcela Vencida'), ('UPCOMING_INSTALLMENT', 'Parcela a Vencer'), ('EXPIRING_CONTRACT', 'Contrato Prestes a Vencer'), ('TASK_DEADLINE', 'Prazo de Tarefa'), ('CHECKLIST_ITEM_OVERDUE', 'Item de Checklist Vencido'), ('EVENT_REMINDER', 'Lembrete de Evento'), ('GENERAL', 'Geral')], default='GENERAL', max_length=50, verbose_name='Tipo'),
+        ),
+        migrations.AlterField(
+            model_name='notificationarchive',
+            name='target_type',
+            field=models.CharField(blank=True, choices=[('installment', 'Parcela'), ('expense', 'Despesa'), ('task', 'Tarefa'), ('contract', 'Contrato'), ('wedding', 'Casamento'), ('event', 'Evento'), ('general', 'Geral')], default='', max_length=50, verbose_name='Tipo de Alvo'),
+        ),
+        migrations.AlterField(
+            model_name='notificationarchive',
+            name='type',
+            field=models.CharField(choices=[('OVERDUE_INSTALLMENT', 'Parcela Vencida'), ('UPCOMING_INSTALLMENT', 'Parcela a Vencer'), ('EXPIRING_CONTRACT', 'Contrato Prestes a Vencer'), ('TASK_DEADLINE', 'Prazo de Tarefa'), ('CHECKLIST_ITEM_OVERDUE', 'Item de Checklist Vencido'), ('EVENT_REMINDER', 'Lembrete de Evento'), ('GENERAL', 'Geral')], default='GENERAL', max_length=50, verbose_name='Tipo'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0009_notification_event_reminder'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='failedemail',
+            name='body',
+        ),
+        migrations.RemoveField(
+            model_name='failedemail',
+            name='html',
+        ),
+        migrations.AddField(
+            model_name='failedemail',
+            name='template',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Template'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """FailedEmail passou para apps.core; a tabela é mantida por lá."""
+
+    dependencies = [
+        ('core', '0001_failed_email'),
+        ('notifications', '0010_failed_email_drop_body'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[migrations.DeleteModel(name='FailedEmail')],
+            database_operations=[],
+        ),
+    ]
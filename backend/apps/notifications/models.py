@@ -12,6 +12,7 @@ class NotificationType(models.TextChoices):
     EXPIRING_CONTRACT = "EXPIRING_CONTRACT", _("Contrato Prestes a Vencer")
     TASK_DEADLINE = "TASK_DEADLINE", _("Prazo de Tarefa")
     CHECKLIST_ITEM_OVERDUE = "CHECKLIST_ITEM_OVERDUE", _("Item de Checklist Vencido")
+    EVENT_REMINDER = "EVENT_REMINDER", _("Lembrete de Evento")
     GENERAL = "GENERAL", _("Geral")
 
 
@@ -21,6 +22,7 @@ class NotificationTargetType(models.TextChoices):
     TASK = "task", _("Tarefa")
     CONTRACT = "contract", _("Contrato")
     WEDDING = "wedding", _("Casamento")
+    EVENT = "event", _("Evento")
     GENERAL = "general", _("Geral")
 
 
@@ -58,9 +60,32 @@ class Notification(BaseModel):
     wedding_id = models.UUIDField(
         _("ID do Casamento"), null=True, blank=True, db_index=True
     )
+    wedding_name = models.CharField(
+        _("Nome do Casamento"),
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_(
+            "Cópia do nome do casamento gravada na criação e propagada ao renomear."
+        ),
+    )
     is_read = models.BooleanField(_("Lida"), default=False, db_index=True)
     link = models.CharField(_("Link"), max_length=500, blank=True, default="")
     read_at = models.DateTimeField(_("Lida em"), null=True, blank=True)
+    digest_key = models.CharField(
+        _("Chave de Agrupamento"),
+        max_length=120,
+        blank=True,
+        default="",
+        help_text=_("Tipo, casamento e dia; vazia para notificações não agrupadas."),
+    )
+    occurrences = models.PositiveIntegerField(_("Ocorrências"), default=1)
+    items = models.JSONField(
+        _("Itens Agrupados"),
+        default=list,
+        blank=True,
+        help_text=_("Ocorrências mais recentes reunidas neste resumo."),
+    )
 
     objects = NotificationQuerySet.as_manager()
 
@@ -70,8 +95,124 @@ class Notification(BaseModel):
         ordering = ["-created_at"]
         db_table = "notifications"
         indexes = [
-            models.Index(fields=["company", "user", "is_read"]),
+            # Listagem "mais recentes primeiro" por usuário (com e sem filtro
+            # de não lidas) percorre o índice já ordenado, sem sort.
+            models.Index(fields=["company", "user", "-created_at"]),
+            models.Index(fields=["company", "user", "is_read", "-created_at"]),
+            # Varreduras da política de retenção.
+            models.Index(fields=["type", "created_at"]),
+            models.Index(
+                fields=["read_at"],
+                condition=models.Q(is_read=True),
+                name="notifications_read_at_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "digest_key"],
+                condition=~models.Q(digest_key=""),
+                name="notifications_unique_digest",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"[{self.type}] {self.title} (user_id={self.user_id})"
+
+
+class NotificationArchive(BaseModel):
+    """
+    Notificação lida retirada da tabela principal pela política de retenção.
+
+    Mantém o histórico fora de ``notifications`` para que a listagem da caixa
+    trabalhe sobre um volume estável. Preserva o ``uuid`` original e é
+    excluída ao fim do TTL do tipo (``NOTIFICATIONS_RETENTION_DAYS``).
+    """
+
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="archived_notifications",
+        verbose_name=_("Empresa"),
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="archived_notifications",
+        verbose_name=_("Usuário"),
+    )
+    title = models.CharField(_("Título"), max_length=255)
+    message = models.TextField(_("Mensagem"))
+    type = models.CharField(
+        _("Tipo"),
+        max_length=50,
+        choices=NotificationType.choices,
+        default=NotificationType.GENERAL,
+    )
+    target_type = models.CharField(
+        _("Tipo de Alvo"),
+        max_length=50,
+        choices=NotificationTargetType.choices,
+        blank=True,
+        default="",
+    )
+    target_id = models.UUIDField(_("ID do Alvo"), null=True, blank=True)
+    wedding_id = models.UUIDField(_("ID do Casamento"), null=True, blank=True)
+    wedding_name = models.CharField(
+        _("Nome do Casamento"), max_length=255, blank=True, default=""
+    )
+    link = models.CharField(_("Link"), max_length=500, blank=True, default="")
+    read_at = models.DateTimeField(_("Lida em"), null=True, blank=True)
+    occurrences = models.PositiveIntegerField(_("Ocorrências"), default=1)
+    items = models.JSONField(_("Itens Agrupados"), default=list, blank=True)
+    notified_at = models.DateTimeField(_("Notificada em"))
+
+    class Meta:
+        verbose_name = _("Notificação Arquivada")
+        verbose_name_plural = _("Notificações Arquivadas")
+        ordering = ["-notified_at"]
+        db_table = "notifications_archive"
+        indexes = [
+            models.Index(fields=["company", "user", "-notified_at"]),
+            models.Index(fields=["type", "notified_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.type}] {self.title} (user_id={self.user_id}, arquivada)"
+
+
+class UserNotificationState(BaseModel):
+    """
+    Estado agregado da caixa de notificações de um usuário.
+
+    Mantém o contador de não lidas desnormalizado para que o endpoint de
+    contagem seja uma leitura por chave única, sem COUNT(*) sobre a tabela
+    de notificações. Atualizado atomicamente pelo NotificationService e
+    reconciliado diariamente pelo cron ``reconcile_notification_counters``.
+    """
+
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="notification_states",
+        verbose_name=_("Empresa"),
+    )
+    user = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="notification_state",
+        verbose_name=_("Usuário"),
+    )
+    unread_count = models.PositiveIntegerField(_("Não lidas"), default=0)
+    version = models.PositiveBigIntegerField(
+        _("Versão"),
+        default=0,
+        help_text=_("Incrementada a cada mutação na caixa (usada como ETag)."),
+    )
+
+    class Meta:
+        verbose_name = _("Estado de Notificações do Usuário")
+        verbose_name_plural = _("Estados de Notificações dos Usuários")
+        db_table = "notification_user_states"
+
+    def __str__(self) -> str:
+        return f"user_id={self.user_id} unread={self.unread_count}"
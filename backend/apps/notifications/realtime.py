@@ -0,0 +1,162 @@
+"""
+Distribuição de eventos de notificações em tempo real via Redis Pub/Sub.
+
+O NotificationService publica um evento no canal do usuário após o commit de
+cada mutação da caixa. O endpoint SSE (ASGI) assina esse canal de forma
+assíncrona e o long-polling (WSGI) bloqueia nele até a próxima mudança, de
+modo que abas abertas não precisam mais consultar o banco em intervalos fixos.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from redis import asyncio as aioredis
+
+
+if TYPE_CHECKING:
+    from apps.notifications.models import Notification
+    from apps.notifications.selectors import InboxState
+    from apps.tenants.models import Company
+    from apps.users.models import User
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_realtime_enabled() -> bool:
+    """Indica se há um servidor Pub/Sub configurado para eventos em tempo real."""
+    return bool(settings.NOTIFICATIONS_PUBSUB_URL)
+
+
+def inbox_channel(user_id: int) -> str:
+    """Nome do canal Pub/Sub exclusivo da caixa de um usuário."""
+    return f"notifications:user:{user_id}"
+
+
+@cache
+def _get_client() -> redis.Redis:
+    """Cliente síncrono compartilhado (pool de conexões por processo)."""
+    return redis.Redis.from_url(
+        settings.NOTIFICATIONS_PUBSUB_URL,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
+
+
+def publish_inbox_event(
+    user_id: int, event: str, *, notification: Notification | None = None
+) -> None:
+    """Agenda a publicação de um evento da caixa para depois do commit.
+
+    Publicar somente após o commit evita que clientes recebam eventos de
+    transações revertidas ou leiam um estado ainda não visível.
+
+    Args:
+        user_id: ID do usuário dono da caixa.
+        event: Nome do evento (ex: ``notification.created``).
+        notification: Notificação criada, serializada no payload quando houver.
+    """
+    if not is_realtime_enabled():
+        return
+    transaction.on_commit(lambda: _publish(user_id, event, notification))
+
+
+def _publish(user_id: int, event: str, notification: Notification | None) -> None:
+    """Monta o payload com o estado atual da caixa e publica no canal."""
+    from apps.notifications.models import UserNotificationState
+    from apps.notifications.schemas import NotificationOut
+
+    state = (
+        UserNotificationState.objects.filter(user_id=user_id)
+        .values("unread_count", "version")
+        .first()
+    ) or {"unread_count": 0, "version": 0}
+
+    payload: dict[str, Any] = {"event": event, **state}
+    if notification is not None:
+        payload["notification"] = NotificationOut.from_orm(notification).model_dump(
+            mode="json"
+        )
+
+    try:
+        _get_client().publish(inbox_channel(user_id), json.dumps(payload))
+    except redis.RedisError:
+        # A notificação já está persistida; clientes se recuperam no próximo poll.
+        logger.warning("Falha ao publicar evento '%s' para user_id=%s", event, user_id)
+
+
+async def subscribe_inbox(
+    user_id: int, *, heartbeat: float
+) -> AsyncIterator[dict[str, Any] | None]:
+    """Assina o canal da caixa e produz os eventos recebidos.
+
+    Produz ``None`` a cada ``heartbeat`` segundos sem mensagens, permitindo
+    que o chamador envie keep-alives e verifique limites de duração.
+
+    Args:
+        user_id: ID do usuário dono da caixa.
+        heartbeat: Intervalo máximo de espera por mensagem, em segundos.
+
+    Yields:
+        O payload decodificado do evento ou None em caso de timeout.
+    """
+    client = aioredis.Redis.from_url(settings.NOTIFICATIONS_PUBSUB_URL)
+    pubsub = client.pubsub()
+    channel = inbox_channel(user_id)
+    await pubsub.subscribe(channel)
+    try:
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=heartbeat
+            )
+            yield json.loads(message["data"]) if message else None
+    finally:
+        await pubsub.unsubscribe(channel)
+        await pubsub.aclose()  # type: ignore[no-untyped-call]
+        await client.aclose()
+
+
+def wait_for_inbox_change(
+    company: Company, user: User, *, known_version: int, timeout: float
+) -> InboxState:
+    """Bloqueia até a versão da caixa mudar ou o timeout expirar (long-polling).
+
+    Exige Pub/Sub ativo (``is_realtime_enabled``). A assinatura é feita antes
+    de reler a versão para não perder eventos publicados entre as duas
+    operações; a espera não consulta o banco.
+
+    Args:
+        company: Empresa (tenant) para isolamento de dados.
+        user: Usuário dono da caixa.
+        known_version: Versão já conhecida pelo cliente (If-None-Match).
+        timeout: Tempo máximo de espera, em segundos.
+
+    Returns:
+        InboxState: Estado atual da caixa ao fim da espera.
+    """
+    from apps.notifications.selectors import notification_inbox_state_selector
+
+    deadline = time.monotonic() + timeout
+    pubsub = _get_client().pubsub(ignore_subscribe_messages=True)  # type: ignore[no-untyped-call]
+    try:
+        pubsub.subscribe(inbox_channel(user.id))
+        state = notification_inbox_state_selector(company=company, user=user)
+        if state.version != known_version:
+            return state
+        while (remaining := deadline - time.monotonic()) > 0:
+            if pubsub.get_message(timeout=remaining) is not None:
+                break
+    except redis.RedisError:
+        logger.warning("Pub/Sub indisponível no long-polling de user_id=%s", user.id)
+    finally:
+        pubsub.close()
+    return notification_inbox_state_selector(company=company, user=user)
@@ -1,9 +1,22 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from ninja import Schema
 from pydantic import UUID4, Field
 
 
+if TYPE_CHECKING:
+    from apps.notifications.models import Notification
+
+
+class NotificationDigestItemOut(Schema):
+    title: str
+    message: str
+    link: str = ""
+    target_type: str = ""
+    target_id: UUID4 | None = None
+
+
 class NotificationOut(Schema):
     uuid: UUID4
     title: str
@@ -17,6 +30,14 @@ class NotificationOut(Schema):
     link: str
     read_at: datetime | None = None
     created_at: datetime
+    occurrences: int = Field(1, description="Ocorrências agrupadas neste resumo")
+    items: list[NotificationDigestItemOut] = Field(
+        default_factory=list, description="Ocorrências mais recentes do resumo"
+    )
+
+    @staticmethod
+    def resolve_wedding_name(obj: "Notification") -> str | None:
+        return obj.wedding_name or None
 
 
 class UnreadCountOut(Schema):
@@ -37,3 +58,10 @@ class BulkNotificationIdsIn(Schema):
 
 class BulkOperationOut(Schema):
     affected_count: int = Field(..., description="Quantidade de registros afetados")
+
+
+class InboxStateOut(Schema):
+    unread_count: int = Field(..., description="Quantidade de notificações não lidas")
+    version: int = Field(
+        ..., description="Versão da caixa, incrementada a cada mudança (ETag)"
+    )
@@ -4,11 +4,11 @@ Seletores de leitura para o domínio de Notificações.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from uuid import UUID
 
 from apps.core.exceptions import ObjectNotFoundError
-from apps.notifications.models import Notification
+from apps.notifications.models import Notification, UserNotificationState
 
 
 if TYPE_CHECKING:
@@ -17,6 +17,13 @@ if TYPE_CHECKING:
     from apps.users.models import User
 
 
+class InboxState(NamedTuple):
+    """Snapshot leve da caixa de notificações de um usuário."""
+
+    unread_count: int
+    version: int
+
+
 def notification_list_selector(
     *,
     company: Company,
@@ -31,13 +38,10 @@ def notification_list_selector(
         unread_only: Se True, filtra apenas notificações não lidas.
 
     Returns:
-        NotificationQuerySet: QuerySet encadeável anotado com wedding_name.
+        NotificationQuerySet: QuerySet encadeável ordenado pelas mais recentes.
     """
     qs: NotificationQuerySet = (
-        Notification.objects.for_tenant(company)
-        .for_user(user)
-        .with_wedding_name()
-        .recent()
+        Notification.objects.for_tenant(company).for_user(user).recent()
     )
     if unread_only:
         qs = qs.unread()
@@ -47,6 +51,10 @@ def notification_list_selector(
 def notification_unread_count_selector(*, company: Company, user: User) -> int:
     """Retorna a contagem de notificações não lidas de um usuário no tenant.
 
+    Lê o contador desnormalizado em UserNotificationState (busca por chave
+    única). Usuários que ainda não possuem estado caem no COUNT sobre o
+    índice (company, user, is_read).
+
     Args:
         company: Empresa (tenant) para isolamento de dados.
         user: Usuário destinatário das notificações.
@@ -54,9 +62,40 @@ def notification_unread_count_selector(*, company: Company, user: User) -> int:
     Returns:
         int: Quantidade de notificações não lidas (is_read=False).
     """
+    cached = (
+        UserNotificationState.objects.filter(company=company, user=user)
+        .values_list("unread_count", flat=True)
+        .first()
+    )
+    if cached is not None:
+        return int(cached)
     return int(Notification.objects.for_tenant(company).for_user(user).unread().count())
 
 
+def notification_inbox_state_selector(*, company: Company, user: User) -> InboxState:
+    """Retorna o contador de não lidas e a versão atual da caixa do usuário.
+
+    A versão é incrementada a cada mutação e serve de ETag para o
+    long-polling condicional. Usuários sem estado persistido têm versão 0.
+
+    Args:
+        company: Empresa (tenant) para isolamento de dados.
+        user: Usuário destinatário das notificações.
+
+    Returns:
+        InboxState: Tupla (unread_count, version) da caixa do usuário.
+    """
+    row = (
+        UserNotificationState.objects.filter(company=company, user=user)
+        .values_list("unread_count", "version")
+        .first()
+    )
+    if row is not None:
+        return InboxState(unread_count=int(row[0]), version=int(row[1]))
+    unread = Notification.objects.for_tenant(company).for_user(user).unread().count()
+    return InboxState(unread_count=int(unread), version=0)
+
+
 def notification_get_selector(
     *,
     company: Company,
@@ -71,7 +110,7 @@ def notification_get_selector(
         uuid: Identificador único da notificação.
 
     Returns:
-        Notification: Instância da notificação anotada com wedding_name.
+        Notification: Instância da notificação encontrada.
 
     Raises:
         ObjectNotFoundError: Se a notificação não for encontrada.
@@ -79,7 +118,6 @@ def notification_get_selector(
     notification = (
         Notification.objects.for_tenant(company)
         .for_user(user)
-        .with_wedding_name()
         .filter(uuid=uuid)
         .first()
     )
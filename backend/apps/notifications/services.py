@@ -5,32 +5,49 @@ Serviço para gerenciamento de Notificações In-App.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
 from uuid import UUID
 
-from django.db import transaction
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet
+from django.db.models.functions import Greatest
 from django.utils import timezone
 
 from apps.core.exceptions import BusinessRuleViolation, ObjectNotFoundError
-from apps.notifications.models import Notification, NotificationType
+from apps.notifications.models import (
+    Notification,
+    NotificationArchive,
+    NotificationType,
+    UserNotificationState,
+)
+from apps.notifications.realtime import publish_inbox_event
 from apps.notifications.tasks import dispatch_async_notification_task
 from apps.tenants.models import Company
 from apps.users.models import User
+from apps.weddings.models import Wedding
 
 
 logger = logging.getLogger(__name__)
 
 
-if TYPE_CHECKING:
+@dataclass(frozen=True)
+class NotificationDraft:
+    """Dados de uma notificação a criar em lote (``bulk_notify``)."""
 
-    class AnnotatedNotification(Notification):
-        """Notificação com o nome do casamento calculado pela consulta."""
-
-        wedding_name: str | None
-
-else:
-    AnnotatedNotification = Notification
+    user: User
+    title: str
+    message: str
+    notification_type: str = NotificationType.GENERAL
+    link: str = ""
+    target_type: str = ""
+    target_id: UUID | None = None
+    wedding_id: UUID | None = None
 
 
 class NotificationService:
@@ -85,6 +102,31 @@ class NotificationService:
         if user.company_id != company.id:
             raise BusinessRuleViolation("Usuário não pertence à empresa informada.")
 
+        # Tipos agrupáveis viram um único resumo por (usuário, tipo, casamento, dia).
+        digest_key = _digest_key(notification_type, wedding_id)
+        item = {
+            "title": title,
+            "message": message,
+            "link": link,
+            "target_type": target_type,
+            "target_id": str(target_id) if target_id else None,
+        }
+        if digest_key:
+            digest = _merge_into_digest(company, user, digest_key, item)
+            if digest is not None:
+                return digest
+
+        # Nome gravado na criação: a listagem não precisa consultar Wedding.
+        wedding_name = ""
+        if wedding_id is not None:
+            wedding = (
+                Wedding.objects.for_tenant(company)
+                .filter(uuid=wedding_id)
+                .only("bride_name", "groom_name")
+                .first()
+            )
+            wedding_name = wedding.display_name if wedding else ""
+
         notification = Notification(
             company=company,
             user=user,
@@ -95,9 +137,25 @@ class NotificationService:
             target_type=target_type,
             target_id=target_id,
             wedding_id=wedding_id,
+            wedding_name=wedding_name,
+            digest_key=digest_key,
+            items=[item] if digest_key else [],
             is_read=False,
         )
-        notification.save()
+        try:
+            with transaction.atomic():
+                notification.save()
+        except (IntegrityError, DjangoValidationError):
+            if not digest_key:
+                raise
+            # Outro processo criou o resumo do dia entre a busca e o insert.
+            digest = _merge_into_digest(company, user, digest_key, item)
+            if digest is None:
+                raise
+            return digest
+        _sync_inbox_state(
+            company, user, 1, event="notification.created", notification=notification
+        )
         logger.info(
             "Notificação criada com sucesso: uuid=%s para user_id=%s",
             notification.uuid,
@@ -147,6 +205,96 @@ class NotificationService:
             wedding_id=wedding_id,
         )
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_notify(
+        company: Company, drafts: Sequence[NotificationDraft]
+    ) -> list[Notification]:
+        """Cria várias notificações do tenant com um único INSERT.
+
+        Os contadores de não lidas são atualizados uma vez por usuário. Tipos
+        agrupáveis em resumo (NOTIFICATIONS_DIGEST_TYPES) seguem pelo fluxo
+        individual de ``create_notification``.
+
+        Args:
+            company: O tenant dono das notificações.
+            drafts: Notificações a criar.
+
+        Returns:
+            list[Notification]: As notificações criadas (ou resumos atualizados).
+
+        Raises:
+            BusinessRuleViolation: Se algum destinatário não pertencer à empresa.
+        """
+        if any(draft.user.company_id != company.id for draft in drafts):
+            raise BusinessRuleViolation("Usuário não pertence à empresa informada.")
+
+        digested = [
+            NotificationService.create_notification(
+                company=company,
+                user=draft.user,
+                title=draft.title,
+                message=draft.message,
+                notification_type=draft.notification_type,
+                link=draft.link,
+                target_type=draft.target_type,
+                target_id=draft.target_id,
+                wedding_id=draft.wedding_id,
+            )
+            for draft in drafts
+            if _digest_key(draft.notification_type, draft.wedding_id)
+        ]
+        plain = [
+            draft
+            for draft in drafts
+            if not _digest_key(draft.notification_type, draft.wedding_id)
+        ]
+        if not plain:
+            return digested
+
+        wedding_ids = {draft.wedding_id for draft in plain if draft.wedding_id}
+        wedding_names = {
+            wedding.uuid: wedding.display_name
+            for wedding in Wedding.objects.for_tenant(company)
+            .filter(uuid__in=wedding_ids)
+            .only("uuid", "bride_name", "groom_name")
+        }
+        created = Notification.objects.bulk_create(
+            [
+                Notification(
+                    company=company,
+                    user=draft.user,
+                    title=draft.title,
+                    message=draft.message,
+                    type=draft.notification_type,
+                    link=draft.link,
+                    target_type=draft.target_type,
+                    target_id=draft.target_id,
+                    wedding_id=draft.wedding_id,
+                    wedding_name=(
+                        wedding_names.get(draft.wedding_id, "")
+                        if draft.wedding_id
+                        else ""
+                    ),
+                    is_read=False,
+                )
+                for draft in plain
+            ]
+        )
+
+        users = {draft.user.id: draft.user for draft in plain}
+        per_user = Counter(draft.user.id for draft in plain)
+        for user_id, total in per_user.items():
+            _sync_inbox_state(
+                company, users[user_id], total, event="notification.created"
+            )
+        logger.info(
+            "%d notificação(ões) criada(s) em lote para company_id=%s",
+            len(created),
+            company.id,
+        )
+        return digested + created
+
     @staticmethod
     def create_async_notification(
         company: Company | UUID | str | int,
@@ -201,7 +349,7 @@ class NotificationService:
         company: Company,
         user: User,
         notification_id: UUID | str,
-    ) -> AnnotatedNotification:
+    ) -> Notification:
         """Marca notificação como lida se ela pertencer ao usuário e empresa.
 
         Args:
@@ -219,7 +367,6 @@ class NotificationService:
         notification = (
             Notification.objects.for_tenant(company)
             .for_user(user)
-            .with_wedding_name()
             .filter(uuid=notification_id)
             .first()
         )
@@ -230,13 +377,14 @@ class NotificationService:
             notification.is_read = True
             notification.read_at = timezone.now()
             notification.save()
+            _sync_inbox_state(company, user, -1, event="notification.read")
             logger.info(
                 "Notificação marcada como lida: uuid=%s para user_id=%s",
                 notification.uuid,
                 user.id,
             )
 
-        return cast(AnnotatedNotification, notification)
+        return notification
 
     @staticmethod
     @transaction.atomic
@@ -253,6 +401,8 @@ class NotificationService:
         now = timezone.now()
         qs = Notification.objects.for_tenant(company).for_user(user).unread()
         count = int(qs.update(is_read=True, read_at=now, updated_at=now))
+        if count:
+            _sync_inbox_state(company, user, -count, event="notification.read")
         logger.info(
             "Todas as notificações marcadas como lidas: count=%d para user_id=%s",
             count,
@@ -287,7 +437,9 @@ class NotificationService:
         if not notification:
             raise ObjectNotFoundError(detail="Notificação não encontrada.")
 
+        unread_delta = 0 if notification.is_read else -1
         notification.delete()
+        _sync_inbox_state(company, user, unread_delta, event="notification.deleted")
         logger.info(
             "Notificação excluída com sucesso: uuid=%s para user_id=%s",
             notification_id,
@@ -319,6 +471,8 @@ class NotificationService:
             .filter(uuid__in=notification_ids)
         )
         count = int(qs.update(is_read=True, read_at=now, updated_at=now))
+        if count:
+            _sync_inbox_state(company, user, -count, event="notification.read")
         logger.info(
             "Notificações em lote marcadas como lidas: count=%d para user_id=%s",
             count,
@@ -348,7 +502,15 @@ class NotificationService:
             .for_user(user)
             .filter(uuid__in=notification_ids)
         )
-        count, _ = qs.delete()
+        # Exclui as não lidas primeiro para saber o delta exato do contador
+        # sem um COUNT adicional.
+        unread_deleted, _ = qs.unread().delete()
+        read_deleted, _ = qs.delete()
+        count = unread_deleted + read_deleted
+        if count:
+            _sync_inbox_state(
+                company, user, -unread_deleted, event="notification.deleted"
+            )
         logger.info(
             "Notificações em lote excluídas: count=%d para user_id=%s",
             count,
@@ -369,10 +531,378 @@ class NotificationService:
             int: Quantidade total de notificações excluídas.
         """
         qs = Notification.objects.for_tenant(company).for_user(user)
-        count, _ = qs.delete()
+        unread_deleted, _ = qs.unread().delete()
+        read_deleted, _ = qs.delete()
+        count = unread_deleted + read_deleted
+        if count:
+            _sync_inbox_state(
+                company, user, -unread_deleted, event="notification.deleted"
+            )
         logger.info(
             "Todas as notificações foram limpas: count=%d para user_id=%s",
             count,
             user.id,
         )
         return int(count)
+
+    @staticmethod
+    @transaction.atomic
+    def sync_wedding_name(company: Company, wedding: Wedding) -> int:
+        """Propaga o nome atual do casamento para as notificações vinculadas.
+
+        Chamado pelo WeddingService quando os nomes dos noivos mudam, mantendo
+        a cópia desnormalizada em ``wedding_name`` consistente na caixa e no
+        arquivo (NotificationArchive).
+
+        Args:
+            company: O tenant atual para isolamento multitenancy.
+            wedding: Casamento renomeado.
+
+        Returns:
+            int: Quantidade de notificações (ativas e arquivadas) atualizadas.
+        """
+        name = wedding.display_name
+        now = timezone.now()
+        count = 0
+        for model in (Notification, NotificationArchive):
+            count += (
+                model.objects.filter(company=company, wedding_id=wedding.uuid)
+                .exclude(wedding_name=name)
+                .update(wedding_name=name, updated_at=now)
+            )
+        if count:
+            logger.info(
+                "Nome do casamento propagado: wedding_uuid=%s em %d notificações",
+                wedding.uuid,
+                count,
+            )
+        return int(count)
+
+    @staticmethod
+    def archive_read_notifications(
+        company: Company | None = None,
+        *,
+        now: datetime | None = None,
+        batch_size: int | None = None,
+    ) -> int:
+        """Move notificações lidas antigas para a tabela de arquivo.
+
+        Seleciona as lidas há mais de ``NOTIFICATIONS_ARCHIVE_READ_AFTER_DAYS``
+        pelo índice parcial de ``read_at`` e as transfere em lotes, cada lote
+        em sua própria transação, para não manter locks longos na tabela.
+
+        Args:
+            company: Tenant opcional para restringir a operação.
+            now: Instante de referência (padrão: agora).
+            batch_size: Tamanho do lote (padrão: NOTIFICATIONS_RETENTION_BATCH_SIZE).
+
+        Returns:
+            int: Quantidade de notificações arquivadas.
+        """
+        now = now or timezone.now()
+        batch_size = batch_size or settings.NOTIFICATIONS_RETENTION_BATCH_SIZE
+        cutoff = now - timedelta(days=settings.NOTIFICATIONS_ARCHIVE_READ_AFTER_DAYS)
+        queryset = Notification.objects.read().filter(read_at__lt=cutoff)
+        if company is not None:
+            queryset = queryset.for_tenant(company)
+
+        archived = 0
+        while batch := list(queryset.order_by("read_at")[:batch_size]):
+            with transaction.atomic():
+                NotificationArchive.objects.bulk_create(
+                    [
+                        NotificationArchive(
+                            uuid=n.uuid,
+                            company_id=n.company_id,
+                            user_id=n.user_id,
+                            title=n.title,
+                            message=n.message,
+                            type=n.type,
+                            target_type=n.target_type,
+                            target_id=n.target_id,
+                            wedding_id=n.wedding_id,
+                            wedding_name=n.wedding_name,
+                            link=n.link,
+                            read_at=n.read_at,
+                            occurrences=n.occurrences,
+                            items=n.items,
+                            notified_at=n.created_at,
+                        )
+                        for n in batch
+                    ],
+                    ignore_conflicts=True,
+                )
+                Notification.objects.filter(id__in=[n.id for n in batch]).delete()
+            archived += len(batch)
+
+        if archived:
+            logger.info("Notificações lidas arquivadas: count=%d", archived)
+        return archived
+
+    @staticmethod
+    def purge_expired_notifications(
+        company: Company | None = None,
+        *,
+        now: datetime | None = None,
+        batch_size: int | None = None,
+    ) -> int:
+        """Exclui notificações e itens arquivados que passaram do TTL do tipo.
+
+        O TTL de cada NotificationType vem de ``NOTIFICATIONS_RETENTION_DAYS``
+        (chave ``default`` para tipos não listados). As exclusões são feitas em
+        lotes e os contadores de não lidas dos usuários afetados são ajustados
+        no mesmo lote.
+
+        Args:
+            company: Tenant opcional para restringir a operação.
+            now: Instante de referência (padrão: agora).
+            batch_size: Tamanho do lote (padrão: NOTIFICATIONS_RETENTION_BATCH_SIZE).
+
+        Returns:
+            int: Quantidade total de registros excluídos.
+        """
+        now = now or timezone.now()
+        batch_size = batch_size or settings.NOTIFICATIONS_RETENTION_BATCH_SIZE
+        retention: dict[str, int] = settings.NOTIFICATIONS_RETENTION_DAYS
+        notifications = Notification.objects.all()
+        archived = NotificationArchive.objects.all()
+        if company is not None:
+            notifications = notifications.for_tenant(company)
+            archived = archived.filter(company=company)
+
+        purged = 0
+        for notification_type in NotificationType.values:
+            days = retention.get(notification_type, retention["default"])
+            cutoff = now - timedelta(days=days)
+            purged += _purge_in_batches(
+                notifications.filter(type=notification_type, created_at__lt=cutoff),
+                batch_size,
+            )
+            purged += _purge_in_batches(
+                archived.filter(type=notification_type, notified_at__lt=cutoff),
+                batch_size,
+            )
+
+        if purged:
+            logger.info("Notificações expiradas excluídas: count=%d", purged)
+        return purged
+
+    @staticmethod
+    def reconcile_unread_counters(company: Company | None = None) -> int:
+        """Corrige o desvio entre os contadores de não lidas e a tabela real.
+
+        Recalcula a contagem de não lidas por usuário com uma única agregação
+        por tenant e ajusta apenas os estados divergentes, criando os que
+        ainda não existem. Cada tenant roda numa transação própria, que libera
+        as travas dos estados ao terminar. Executado diariamente pelo
+        CronRegistry.
+
+        Args:
+            company: Tenant opcional para restringir a reconciliação.
+
+        Returns:
+            int: Quantidade de estados criados ou corrigidos.
+        """
+        companies = [company] if company is not None else Company.objects.only("id")
+        fixed = sum(_reconcile_company_counters(tenant) for tenant in companies)
+        if fixed:
+            logger.warning(
+                "Contadores de notificações reconciliados: %d estado(s) corrigido(s)",
+                fixed,
+            )
+        return fixed
+
+
+@transaction.atomic
+def _reconcile_company_counters(company: Company) -> int:
+    """Reconcilia os contadores de um tenant com os estados travados.
+
+    Os estados são travados antes da agregação: uma notificação criada ou
+    lida em paralelo fica esperando a trava para aplicar o seu delta sobre o
+    valor reconciliado, em vez de ser sobrescrita por ele.
+    """
+    states = list(
+        UserNotificationState.objects.filter(company=company)
+        .select_for_update()
+        .only("id", "user_id", "unread_count")
+        .order_by("pk")
+    )
+    actual: dict[int, int] = {
+        row["user_id"]: row["total"]
+        for row in Notification.objects.unread()
+        .for_tenant(company)
+        .values("user_id")
+        .annotate(total=Count("id"))
+    }
+
+    now = timezone.now()
+    to_update: list[UserNotificationState] = []
+    for state in states:
+        expected = actual.pop(state.user_id, 0)
+        if state.unread_count != expected:
+            state.unread_count = expected
+            # Incrementa a versão para que clientes em long-polling recarreguem.
+            state.version = F("version") + 1
+            state.updated_at = now
+            to_update.append(state)
+
+    UserNotificationState.objects.bulk_update(
+        to_update, ["unread_count", "version", "updated_at"], batch_size=500
+    )
+    # Estados ausentes são raros (usuários que nunca receberam notificação);
+    # get_or_create informa quais foram de fato criados aqui.
+    created = sum(
+        UserNotificationState.objects.get_or_create(
+            user_id=user_id,
+            defaults={"company": company, "unread_count": total, "version": 1},
+        )[1]
+        for user_id, total in actual.items()
+    )
+    return len(to_update) + created
+
+
+@transaction.atomic
+def _sync_inbox_state(
+    company: Company,
+    user: User,
+    unread_delta: int,
+    *,
+    event: str,
+    notification: Notification | None = None,
+) -> None:
+    """Aplica a mutação ao estado da caixa do usuário e agenda o evento realtime.
+
+    Deve ser chamado dentro da mesma transação que alterou as notificações.
+    O contador recebe um delta atômico e a versão é sempre incrementada. Se o
+    estado ainda não existir, ele é inicializado a partir da tabela de
+    notificações, que já reflete a mutação corrente.
+
+    Args:
+        company: O tenant dono das notificações.
+        user: O usuário cuja caixa foi alterada.
+        unread_delta: Variação da quantidade de não lidas (negativa para leituras).
+        event: Nome do evento publicado no canal Pub/Sub do usuário.
+        notification: Notificação criada, anexada ao evento quando houver.
+    """
+    updated = UserNotificationState.objects.filter(user=user).update(
+        unread_count=Greatest(F("unread_count") + unread_delta, 0),
+        version=F("version") + 1,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        unread = (
+            Notification.objects.for_tenant(company).for_user(user).unread().count()
+        )
+        UserNotificationState.objects.get_or_create(
+            user=user,
+            defaults={"company": company, "unread_count": unread, "version": 1},
+        )
+
+    publish_inbox_event(user.id, event, notification=notification)
+
+
+def _purge_in_batches(queryset: QuerySet[Any], batch_size: int) -> int:
+    """Exclui os registros do queryset em lotes de chaves primárias.
+
+    Para a tabela principal, as não lidas excluídas são descontadas do
+    contador de cada usuário na mesma transação do lote; eventuais corridas
+    com leituras concorrentes são corrigidas pelo cron de reconciliação.
+
+    Args:
+        queryset: Registros a excluir (Notification ou NotificationArchive).
+        batch_size: Quantidade máxima de registros por lote.
+
+    Returns:
+        int: Quantidade de registros excluídos.
+    """
+    model = queryset.model
+    track_unread = model is Notification
+    fields = ("id", "user_id", "is_read") if track_unread else ("id", "user_id")
+
+    purged = 0
+    while rows := list(queryset.values_list(*fields)[:batch_size]):
+        with transaction.atomic():
+            model.objects.filter(id__in=[row[0] for row in rows]).delete()
+            if track_unread:
+                unread = Counter(row[1] for row in rows if not row[2])
+                for user_id, total in unread.items():
+                    UserNotificationState.objects.filter(user_id=user_id).update(
+                        unread_count=Greatest(F("unread_count") - total, 0),
+                        version=F("version") + 1,
+                        updated_at=timezone.now(),
+                    )
+        purged += len(rows)
+    return purged
+
+
+def _digest_key(notification_type: str, wedding_id: UUID | str | None) -> str:
+    """Monta a chave de agrupamento do dia para tipos configurados como resumo.
+
+    Args:
+        notification_type: Tipo da notificação (NotificationType).
+        wedding_id: UUID do casamento associado, se houver.
+
+    Returns:
+        str: Chave ``tipo:casamento:dia`` ou vazia quando o tipo não agrupa.
+    """
+    if notification_type not in settings.NOTIFICATIONS_DIGEST_TYPES:
+        return ""
+    wedding_part = str(UUID(str(wedding_id))) if wedding_id else "-"
+    return f"{notification_type}:{wedding_part}:{timezone.localdate().isoformat()}"
+
+
+def _merge_into_digest(
+    company: Company, user: User, digest_key: str, item: dict[str, Any]
+) -> Notification | None:
+    """Acrescenta uma ocorrência ao resumo existente do dia, se houver.
+
+    O resumo é bloqueado (SELECT FOR UPDATE) para que ocorrências
+    concorrentes não se percam. Um resumo já lido volta a ficar não lido.
+
+    Args:
+        company: O tenant dono das notificações.
+        user: O usuário destinatário.
+        digest_key: Chave de agrupamento calculada por ``_digest_key``.
+        item: Dados da nova ocorrência.
+
+    Returns:
+        Notification | None: O resumo atualizado ou None se ainda não existir.
+    """
+    digest = (
+        Notification.objects.for_tenant(company)
+        .select_for_update()
+        .filter(user=user, digest_key=digest_key)
+        .first()
+    )
+    if digest is None:
+        return None
+
+    was_read = digest.is_read
+    digest.occurrences += 1
+    digest.items = [*digest.items, item][-settings.NOTIFICATIONS_DIGEST_MAX_ITEMS :]
+    digest.title = f"{digest.get_type_display()} ({digest.occurrences})"
+    digest.message = item["message"]
+    digest.target_id = None
+    digest.is_read = False
+    digest.read_at = None
+    digest.save(
+        skip_clean=True,
+        update_fields=[
+            "occurrences",
+            "items",
+            "title",
+            "message",
+            "target_id",
+            "is_read",
+            "read_at",
+            "updated_at",
+        ],
+    )
+    _sync_inbox_state(
+        company,
+        user,
+        1 if was_read else 0,
+        event="notification.updated",
+        notification=digest,
+    )
+    return digest
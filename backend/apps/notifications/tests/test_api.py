@@ -1,9 +1,15 @@
+from collections.abc import AsyncIterator
 from typing import Any, cast
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from ninja_jwt.tokens import RefreshToken
 
 from apps.notifications.models import Notification
+from apps.notifications.services import NotificationService
 from apps.notifications.tests.factories import (
     NotificationFactory as _NotificationFactory,
 )
@@ -152,3 +158,84 @@ class TestNotificationsAPI:
         response = auth_client.delete("/api/v1/notifications/clear-all/")
         assert response.status_code == 200
         assert response.json()["affected_count"] == 2
+
+    def test_poll_returns_state_with_etag(self, auth_client: Any, user: Any) -> None:
+        NotificationFactory(user=user, is_read=False)
+
+        response = auth_client.get("/api/v1/notifications/poll/?timeout=0")
+        assert response.status_code == 200
+        assert response.json() == {"unread_count": 1, "version": 0}
+        assert response["ETag"] == '"inbox-0"'
+
+    def test_poll_returns_304_when_version_unchanged(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        response = auth_client.get(
+            "/api/v1/notifications/poll/?timeout=0",
+            HTTP_IF_NONE_MATCH='"inbox-0"',
+        )
+        assert response.status_code == 304
+        assert response["ETag"] == '"inbox-0"'
+
+    def test_poll_returns_new_state_after_mutation(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        first = auth_client.get("/api/v1/notifications/poll/?timeout=0")
+        NotificationService.create_notification(
+            company=user.company, user=user, title="Nova", message="Mensagem"
+        )
+
+        response = auth_client.get(
+            "/api/v1/notifications/poll/?timeout=0",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        assert response.status_code == 200
+        assert response.json() == {"unread_count": 1, "version": 1}
+        assert response["ETag"] == '"inbox-1"'
+
+    def test_poll_answers_immediately_by_default(self, auth_client: Any) -> None:
+        with patch("apps.notifications.api.wait_for_inbox_change") as wait:
+            response = auth_client.get(
+                "/api/v1/notifications/poll/", HTTP_IF_NONE_MATCH='"inbox-0"'
+            )
+
+        assert response.status_code == 304
+        wait.assert_not_called()
+
+    def test_stream_requires_asgi(self, auth_client: Any) -> None:
+        response = auth_client.get("/api/v1/notifications/stream/")
+        assert response.status_code == 503
+        assert response.json()["code"] == "realtime_requires_asgi"
+
+    def test_stream_emits_initial_state_and_published_events(
+        self, user: Any, settings: Any
+    ) -> None:
+        settings.NOTIFICATIONS_PUBSUB_URL = "redis://pubsub.invalid:6379/2"
+        NotificationFactory(user=user, is_read=False)
+
+        async def fake_subscribe(
+            user_id: int, *, heartbeat: float
+        ) -> AsyncIterator[dict[str, Any] | None]:
+            yield None
+            yield {"event": "notification.read", "unread_count": 0, "version": 3}
+
+        token = RefreshToken.for_user(user).access_token  # type: ignore[misc]
+        client = AsyncClient()
+
+        async def consume() -> str:
+            response: Any = await client.get(
+                "/api/v1/notifications/stream/",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            assert response.status_code == 200, response.content
+            assert response["Content-Type"] == "text/event-stream"
+            return "".join(
+                [chunk.decode() async for chunk in response.streaming_content]
+            )
+
+        with patch("apps.notifications.api.subscribe_inbox", fake_subscribe):
+            body = async_to_sync(consume)()
+
+        assert 'event: inbox.state\ndata: {"unread_count": 1, "version": 0}' in body
+        assert ": keep-alive" in body
+        assert "event: notification.read" in body
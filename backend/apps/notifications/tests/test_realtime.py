@@ -0,0 +1,90 @@
+"""
+Testes da publicação de eventos de notificações em tempo real (Redis Pub/Sub).
+"""
+
+import json
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.notifications.realtime import inbox_channel, wait_for_inbox_change
+from apps.notifications.services import NotificationService
+
+
+@pytest.mark.django_db
+class TestRealtimePublishing:
+    """Eventos publicados pelo NotificationService após o commit."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_pubsub(self, settings: Any) -> None:
+        settings.NOTIFICATIONS_PUBSUB_URL = "redis://pubsub.invalid:6379/2"
+
+    def test_create_publishes_after_commit(
+        self, user: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        client = MagicMock()
+        with patch("apps.notifications.realtime._get_client", return_value=client):
+            with django_capture_on_commit_callbacks(execute=False) as callbacks:
+                notification = NotificationService.create_notification(
+                    company=user.company, user=user, title="Nova", message="Msg"
+                )
+            client.publish.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+
+        channel, raw = client.publish.call_args.args
+        payload = json.loads(raw)
+        assert channel == inbox_channel(user.id)
+        assert payload["event"] == "notification.created"
+        assert payload["unread_count"] == 1
+        assert payload["version"] == 1
+        assert payload["notification"]["uuid"] == str(notification.uuid)
+
+    def test_mark_all_as_read_publishes_counter_change(
+        self, user: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        client = MagicMock()
+        with patch("apps.notifications.realtime._get_client", return_value=client):
+            NotificationService.create_notification(
+                company=user.company, user=user, title="Nova", message="Msg"
+            )
+            with django_capture_on_commit_callbacks(execute=True):
+                NotificationService.mark_all_as_read(user.company, user)
+
+        payload = json.loads(client.publish.call_args.args[1])
+        assert payload["event"] == "notification.read"
+        assert payload["unread_count"] == 0
+        assert "notification" not in payload
+
+    def test_long_poll_wakes_up_on_published_event(self, user: Any) -> None:
+        pubsub = MagicMock()
+        pubsub.get_message.return_value = {"data": b"{}"}
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+
+        with patch("apps.notifications.realtime._get_client", return_value=client):
+            state = wait_for_inbox_change(
+                user.company, user, known_version=0, timeout=5
+            )
+
+        pubsub.subscribe.assert_called_once_with(inbox_channel(user.id))
+        pubsub.close.assert_called_once()
+        assert state.version == 0
+
+
+@pytest.mark.django_db
+class TestRealtimeDisabled:
+    """Sem Pub/Sub configurado nada é publicado."""
+
+    def test_no_publish_without_pubsub_url(
+        self, user: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        with patch("apps.notifications.realtime._get_client") as get_client:
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                NotificationService.create_notification(
+                    company=user.company, user=user, title="Nova", message="Msg"
+                )
+        assert callbacks == []
+        get_client.assert_not_called()
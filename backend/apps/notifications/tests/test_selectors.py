@@ -15,6 +15,7 @@ from apps.notifications.selectors import (
     notification_list_selector,
     notification_unread_count_selector,
 )
+from apps.notifications.services import NotificationService
 from apps.notifications.tests.factories import (
     NotificationFactory as _NotificationFactory,
 )
@@ -83,21 +84,6 @@ class TestNotificationQuerySet:
         assert items[0].id == n2.id
         assert items[1].id == n1.id
 
-    def test_with_wedding_name_annotation(self, user: Any) -> None:
-        wedding = WeddingFactory(company=user.company)
-        NotificationFactory(user=user, wedding_id=wedding.uuid)
-
-        qs = (
-            Notification.objects.for_tenant(user.company)
-            .for_user(user)
-            .with_wedding_name()
-        )
-        first = qs.first()
-        assert first is not None
-        assert getattr(first, "wedding_name", None) == (
-            f"Casamento de {wedding.bride_name} e {wedding.groom_name}"
-        )
-
     def test_chaining_methods(self, user: Any) -> None:
         wedding = WeddingFactory(company=user.company)
         NotificationFactory(user=user, wedding_id=wedding.uuid, is_read=False)
@@ -107,15 +93,12 @@ class TestNotificationQuerySet:
             Notification.objects.for_tenant(user.company)
             .for_user(user)
             .unread()
-            .with_wedding_name()
             .recent()
         )
         assert qs.count() == 1
         item = qs.first()
         assert item is not None
-        assert getattr(item, "wedding_name", None) == (
-            f"Casamento de {wedding.bride_name} e {wedding.groom_name}"
-        )
+        assert item.wedding_id == wedding.uuid
 
 
 @pytest.mark.django_db
@@ -153,14 +136,18 @@ class TestNotificationListSelector:
         first_user = qs.first()
         assert first_user is not None and first_user.user == user
 
-    def test_list_notifications_wedding_name_annotation(self, user: Any) -> None:
+    def test_list_notifications_includes_stored_wedding_name(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
         wedding = WeddingFactory(company=user.company)
-        NotificationFactory(user=user, wedding_id=wedding.uuid)
+        NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
+        )
 
-        qs = notification_list_selector(company=user.company, user=user)
-        first = qs.first()
+        with django_assert_num_queries(1):
+            first = notification_list_selector(company=user.company, user=user).first()
         assert first is not None
-        assert getattr(first, "wedding_name", None) == (
+        assert first.wedding_name == (
             f"Casamento de {wedding.bride_name} e {wedding.groom_name}"
         )
 
@@ -191,11 +178,13 @@ class TestNotificationGetSelector:
 
     def test_get_notification_success(self, user: Any) -> None:
         wedding = WeddingFactory(company=user.company)
-        n = NotificationFactory(user=user, wedding_id=wedding.uuid)
+        n = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
+        )
 
         result = notification_get_selector(company=user.company, user=user, uuid=n.uuid)
         assert result.id == n.id
-        assert getattr(result, "wedding_name", None) == (
+        assert result.wedding_name == (
             f"Casamento de {wedding.bride_name} e {wedding.groom_name}"
         )
 
@@ -1,18 +1,26 @@
+from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from django.db import connection
 from django.tasks import Task
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from apps.core.exceptions import BusinessRuleViolation, ObjectNotFoundError
-from apps.notifications.models import Notification, NotificationType
+from apps.notifications.models import (
+    Notification,
+    NotificationArchive,
+    NotificationType,
+    UserNotificationState,
+)
 from apps.notifications.selectors import (
     notification_list_selector,
     notification_unread_count_selector,
 )
-from apps.notifications.services import NotificationService
+from apps.notifications.services import NotificationDraft, NotificationService
 from apps.notifications.tests.factories import (
     NotificationFactory as _NotificationFactory,
 )
@@ -228,10 +236,10 @@ class TestNotificationServiceMarkAsRead:
         assert updated.is_read is True
         assert updated.read_at == read_at_before
 
-    def test_mark_as_read_populates_wedding_name(self, user: Any) -> None:
+    def test_mark_as_read_returns_stored_wedding_name(self, user: Any) -> None:
         wedding = WeddingFactory(company=user.company)
-        notification = NotificationFactory(
-            user=user, wedding_id=wedding.uuid, is_read=False
+        notification = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
         )
 
         updated = NotificationService.mark_as_read(
@@ -247,7 +255,7 @@ class TestNotificationServiceMarkAsRead:
         updated = NotificationService.mark_as_read(
             user.company, user, notification.uuid
         )
-        assert updated.wedding_name is None
+        assert updated.wedding_name == ""
 
 
 @pytest.mark.django_db
@@ -329,3 +337,351 @@ class TestNotificationServiceBulkOperations:
             ).count()
             == 1
         )
+
+
+@pytest.mark.django_db
+class TestNotificationServiceBulkNotify:
+    """Testes da criação de notificações em lote (bulk_notify)."""
+
+    def test_bulk_notify_inserts_once_and_updates_counters(self, user: Any) -> None:
+        other = UserFactory(company=user.company)
+        wedding = WeddingFactory(company=user.company)
+        drafts = [
+            NotificationDraft(
+                user=recipient,
+                title=f"Lembrete {n}",
+                message="Mensagem",
+                notification_type=NotificationType.EVENT_REMINDER,
+                wedding_id=wedding.uuid,
+            )
+            for n in range(3)
+            for recipient in (user, other)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            created = NotificationService.bulk_notify(user.company, drafts)
+
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "notifications"')
+        ]
+        assert len(inserts) == 1
+        assert len(created) == 6
+        assert {n.wedding_name for n in created} == {wedding.display_name}
+        assert UserNotificationState.objects.get(user=user).unread_count == 3
+        assert UserNotificationState.objects.get(user=other).unread_count == 3
+
+    def test_bulk_notify_merges_digest_types(self, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+        drafts = [
+            NotificationDraft(
+                user=user,
+                title="Parcela Vencida",
+                message=f"Parcela {n} venceu.",
+                notification_type=NotificationType.OVERDUE_INSTALLMENT,
+                wedding_id=wedding.uuid,
+            )
+            for n in range(3)
+        ]
+
+        NotificationService.bulk_notify(user.company, drafts)
+
+        assert Notification.objects.get().occurrences == 3
+
+    def test_bulk_notify_rejects_foreign_user(self, user: Any) -> None:
+        draft = NotificationDraft(user=UserFactory(), title="T", message="M")
+
+        with pytest.raises(BusinessRuleViolation):
+            NotificationService.bulk_notify(user.company, [draft])
+
+        assert not Notification.objects.exists()
+
+
+@pytest.mark.django_db
+class TestNotificationServiceUnreadCounter:
+    """Testes do contador desnormalizado de não lidas (UserNotificationState)."""
+
+    def _create(self, user: Any) -> Notification:
+        return NotificationService.create_notification(
+            company=user.company, user=user, title="Título", message="Mensagem"
+        )
+
+    def _state_count(self, user: Any) -> int:
+        return UserNotificationState.objects.get(user=user).unread_count
+
+    def test_create_initializes_counter_from_existing_rows(self, user: Any) -> None:
+        NotificationFactory(user=user, is_read=False)
+        self._create(user)
+        assert self._state_count(user) == 2
+
+    def test_create_increments_existing_counter(self, user: Any) -> None:
+        self._create(user)
+        self._create(user)
+        assert self._state_count(user) == 2
+
+    def test_mutations_keep_counter_in_sync(self, user: Any) -> None:
+        n1 = self._create(user)
+        n2 = self._create(user)
+        n3 = self._create(user)
+        n4 = self._create(user)
+        self._create(user)
+
+        NotificationService.mark_as_read(user.company, user, n1.uuid)
+        assert self._state_count(user) == 4
+
+        NotificationService.mark_as_read(user.company, user, n1.uuid)
+        assert self._state_count(user) == 4
+
+        NotificationService.bulk_mark_as_read(user.company, user, [n1.uuid, n2.uuid])
+        assert self._state_count(user) == 3
+
+        NotificationService.bulk_delete(user.company, user, [n2.uuid, n3.uuid])
+        assert self._state_count(user) == 2
+
+        NotificationService.delete_notification(user.company, user, n4.uuid)
+        assert self._state_count(user) == 1
+
+        NotificationService.mark_all_as_read(user.company, user)
+        assert self._state_count(user) == 0
+
+        self._create(user)
+        NotificationService.clear_all(user.company, user)
+        assert self._state_count(user) == 0
+
+    def test_selector_reads_counter_without_counting_rows(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
+        self._create(user)
+        UserNotificationState.objects.filter(user=user).update(unread_count=7)
+
+        with django_assert_num_queries(1):
+            count = notification_unread_count_selector(company=user.company, user=user)
+        assert count == 7
+
+    def test_reconcile_fixes_drift_and_creates_missing_states(self, user: Any) -> None:
+        self._create(user)
+        UserNotificationState.objects.filter(user=user).update(unread_count=42)
+        other_user = UserFactory()
+        NotificationFactory(user=other_user, is_read=False)
+
+        fixed = NotificationService.reconcile_unread_counters()
+
+        assert fixed == 2
+        assert self._state_count(user) == 1
+        assert self._state_count(other_user) == 1
+
+    def test_reconcile_is_noop_when_counters_match(self, user: Any) -> None:
+        self._create(user)
+        assert NotificationService.reconcile_unread_counters(user.company) == 0
+
+    def test_reconcile_queries_do_not_grow_with_states(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
+        for _ in range(3):
+            self._create(UserFactory(company=user.company))
+        UserNotificationState.objects.filter(company=user.company).update(
+            unread_count=9
+        )
+
+        # Savepoint + trava dos estados + agregação + bulk_update + release.
+        with django_assert_num_queries(5):
+            fixed = NotificationService.reconcile_unread_counters(user.company)
+
+        assert fixed == 3
+
+    def test_reconcile_counts_only_states_it_created(self, user: Any) -> None:
+        self._create(user)
+        UserNotificationState.objects.filter(user=user).delete()
+
+        assert NotificationService.reconcile_unread_counters(user.company) == 1
+        assert NotificationService.reconcile_unread_counters(user.company) == 0
+        assert self._state_count(user) == 1
+
+
+@pytest.mark.django_db
+class TestNotificationServiceWeddingName:
+    """Testes para o nome do casamento desnormalizado nas notificações."""
+
+    def test_create_stores_wedding_name(self, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+        notification = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
+        )
+        notification.refresh_from_db()
+        assert notification.wedding_name == wedding.display_name
+
+    def test_create_ignores_wedding_from_other_tenant(self, user: Any) -> None:
+        foreign_wedding = WeddingFactory()
+        notification = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=foreign_wedding.uuid
+        )
+        assert notification.wedding_name == ""
+
+    def test_sync_wedding_name_updates_linked_notifications(self, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+        linked = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
+        )
+        unrelated = NotificationFactory(user=user)
+        archived = NotificationArchive.objects.create(
+            company=user.company,
+            user=user,
+            title="Antiga",
+            message="Mensagem",
+            wedding_id=wedding.uuid,
+            wedding_name=linked.wedding_name,
+            notified_at=timezone.now(),
+        )
+
+        wedding.bride_name = "Ana"
+        wedding.groom_name = "Bruno"
+        assert NotificationService.sync_wedding_name(user.company, wedding) == 2
+        assert NotificationService.sync_wedding_name(user.company, wedding) == 0
+
+        linked.refresh_from_db()
+        unrelated.refresh_from_db()
+        archived.refresh_from_db()
+        assert linked.wedding_name == "Casamento de Ana e Bruno"
+        assert archived.wedding_name == "Casamento de Ana e Bruno"
+        assert unrelated.wedding_name == ""
+
+
+@pytest.mark.django_db
+class TestNotificationServiceRetention:
+    """Testes para a política de retenção (arquivo e expiração por tipo)."""
+
+    def _age(self, notification: Notification, days: int) -> None:
+        past = timezone.now() - timedelta(days=days)
+        Notification.objects.filter(pk=notification.pk).update(
+            created_at=past, read_at=past if notification.is_read else None
+        )
+
+    def test_archive_moves_old_read_notifications(self, user: Any) -> None:
+        old_read = NotificationFactory(user=user, is_read=True)
+        recent_read = NotificationFactory(user=user, is_read=True)
+        old_unread = NotificationFactory(user=user, is_read=False)
+        self._age(old_read, 40)
+        recent_read.read_at = timezone.now()
+        recent_read.save()
+        self._age(old_unread, 40)
+
+        archived = NotificationService.archive_read_notifications(batch_size=1)
+
+        assert archived == 1
+        remaining = set(Notification.objects.values_list("uuid", flat=True))
+        assert remaining == {recent_read.uuid, old_unread.uuid}
+        archive = NotificationArchive.objects.get()
+        assert archive.uuid == old_read.uuid
+        assert archive.title == old_read.title
+
+    def test_purge_uses_ttl_per_type(self, user: Any, settings: Any) -> None:
+        settings.NOTIFICATIONS_RETENTION_DAYS = {"default": 180, "GENERAL": 10}
+        expired = NotificationFactory(user=user, type=NotificationType.GENERAL)
+        kept = NotificationFactory(user=user, type=NotificationType.OVERDUE_INSTALLMENT)
+        self._age(expired, 20)
+        self._age(kept, 20)
+
+        purged = NotificationService.purge_expired_notifications(batch_size=1)
+
+        assert purged == 1
+        assert list(Notification.objects.values_list("pk", flat=True)) == [kept.pk]
+
+    def test_purge_releases_unread_counter(self, user: Any, settings: Any) -> None:
+        settings.NOTIFICATIONS_RETENTION_DAYS = {"default": 10}
+        notification = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem"
+        )
+        NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem"
+        )
+        self._age(notification, 20)
+
+        NotificationService.purge_expired_notifications()
+
+        state = UserNotificationState.objects.get(user=user)
+        assert state.unread_count == 1
+
+    def test_purge_removes_expired_archive_rows(self, user: Any, settings: Any) -> None:
+        settings.NOTIFICATIONS_RETENTION_DAYS = {"default": 60}
+        notification = NotificationFactory(user=user, is_read=True)
+        self._age(notification, 40)
+        NotificationService.archive_read_notifications()
+        assert NotificationArchive.objects.count() == 1
+
+        NotificationService.purge_expired_notifications(
+            now=timezone.now() + timedelta(days=30)
+        )
+
+        assert NotificationArchive.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestNotificationServiceDigest:
+    """Testes para o agrupamento de notificações em resumos diários."""
+
+    def _overdue(self, user: Any, wedding: Wedding, number: int) -> Notification:
+        return NotificationService.create_notification(
+            user.company,
+            user,
+            "Parcela Vencida",
+            f"Parcela {number} venceu.",
+            notification_type=NotificationType.OVERDUE_INSTALLMENT,
+            target_type="installment",
+            target_id=uuid4(),
+            wedding_id=wedding.uuid,
+        )
+
+    def test_same_type_wedding_and_day_are_merged(self, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+
+        first = self._overdue(user, wedding, 1)
+        for number in range(2, 41):
+            self._overdue(user, wedding, number)
+
+        digest = Notification.objects.get()
+        assert digest.pk == first.pk
+        assert digest.occurrences == 40
+        assert len(digest.items) == 40
+        assert digest.items[-1]["message"] == "Parcela 40 venceu."
+        assert digest.title == "Parcela Vencida (40)"
+        assert digest.target_id is None
+        assert notification_unread_count_selector(company=user.company, user=user) == 1
+
+    def test_different_weddings_are_not_merged(self, user: Any) -> None:
+        self._overdue(user, WeddingFactory(company=user.company), 1)
+        self._overdue(user, WeddingFactory(company=user.company), 2)
+        assert Notification.objects.count() == 2
+
+    def test_non_digest_types_are_not_merged(self, user: Any) -> None:
+        for _ in range(2):
+            NotificationService.create_notification(
+                user.company, user, "Aviso", "Mensagem"
+            )
+        assert Notification.objects.count() == 2
+
+    def test_new_occurrence_reopens_read_digest(self, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+        digest = self._overdue(user, wedding, 1)
+        NotificationService.mark_as_read(user.company, user, digest.uuid)
+
+        self._overdue(user, wedding, 2)
+
+        digest.refresh_from_db()
+        assert digest.is_read is False
+        assert digest.read_at is None
+        assert notification_unread_count_selector(company=user.company, user=user) == 1
+
+    def test_items_are_capped(self, user: Any, settings: Any) -> None:
+        settings.NOTIFICATIONS_DIGEST_MAX_ITEMS = 3
+        wedding = WeddingFactory(company=user.company)
+        for number in range(1, 6):
+            self._overdue(user, wedding, number)
+
+        digest = Notification.objects.get()
+        assert digest.occurrences == 5
+        assert [i["message"] for i in digest.items] == [
+            "Parcela 3 venceu.",
+            "Parcela 4 venceu.",
+            "Parcela 5 venceu.",
+        ]
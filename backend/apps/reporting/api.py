@@ -2,19 +2,27 @@
 Roteadores e endpoints para o módulo de reporting (dashboard e relatórios).
 """
 
+import datetime
 from typing import Literal
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
 from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import READ_ERROR_RESPONSES
+from apps.core.decorators import conditional_get
+from apps.reporting.exports import render_csv, render_ndjson
 from apps.reporting.schemas import (
     DashboardSummaryOut,
+    ExportResourceEnum,
     WeddingDashboardOut,
 )
 from apps.reporting.selectors import (
+    EXPORT_SPECS,
+    dashboard_data_version_selector,
     dashboard_summary_selector,
+    export_rows_selector,
     wedding_overview_selector,
 )
 from apps.reporting.services import ReportGenerationService
@@ -25,12 +33,18 @@ dashboard_router = Router(tags=["Dashboard"])
 reports_router = Router(tags=["Reports"])
 
 
+def _data_version(request: AuthRequest, **_: object) -> str:
+    """Versão dos dados do dashboard do tenant (ETag das leituras)."""
+    return dashboard_data_version_selector(company=request.user.company)
+
+
 # ── Rotas de Dashboard ──
 @dashboard_router.get(
     "/summary/",
     response={200: DashboardSummaryOut, **READ_ERROR_RESPONSES},
     operation_id="dashboard_summary",
 )
+@conditional_get(_data_version)
 def dashboard_summary(request: AuthRequest) -> dict[str, object]:
     """
     Retorna os KPIs agregados de desempenho para a empresa autenticada.
@@ -47,6 +61,7 @@ def dashboard_summary(request: AuthRequest) -> dict[str, object]:
     response={200: WeddingDashboardOut, **READ_ERROR_RESPONSES},
     operation_id="dashboard_wedding",
 )
+@conditional_get(_data_version)
 def wedding_dashboard(request: AuthRequest, uuid: UUID4) -> dict[str, object]:
     """
     Retorna a visão detalhada de indicadores e métricas de um casamento.
@@ -87,3 +102,44 @@ def export_wedding_report(
     response = HttpResponse(file_bytes, content_type=content_type)
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
+
+
+_EXPORT_FORMATS = {
+    "ndjson": (render_ndjson, "application/x-ndjson; charset=utf-8"),
+    "csv": (render_csv, "text/csv; charset=utf-8"),
+}
+
+
+@reports_router.get(
+    "/exports/{resource}/",
+    response=None,
+    operation_id="reports_bulk_export",
+)
+def export_tenant_data(
+    request: AuthRequest,
+    resource: ExportResourceEnum,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    updated_since: datetime.datetime | None = None,
+) -> StreamingHttpResponse:
+    """
+    Exporta em streaming todos os registros de um recurso do tenant.
+
+    Com ``updated_since``, exporta só o que mudou desde então (sincronização
+    incremental). O header ``X-Export-Started-At`` traz o instante do início
+    da exportação, a ser usado como ``updated_since`` na próxima execução.
+    """
+    started_at = timezone.now()
+    render, content_type = _EXPORT_FORMATS[format]
+    rows = export_rows_selector(
+        company=request.user.company,
+        resource=resource,
+        updated_since=updated_since,
+    )
+    response = StreamingHttpResponse(
+        render(EXPORT_SPECS[resource].header, rows), content_type=content_type
+    )
+    filename = f"{resource}-{started_at:%Y%m%dT%H%M%SZ}.{format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["X-Export-Started-At"] = started_at.isoformat()
+    response["Cache-Control"] = "private, no-store"
+    return response
@@ -0,0 +1,92 @@
+"""
+Serialização em streaming da exportação em massa (NDJSON e CSV).
+
+Os renderizadores consomem o iterador do selector e devolvem pedaços de
+texto prontos para o ``StreamingHttpResponse``, agrupando as linhas para não
+gerar um pedaço por registro.
+"""
+
+import csv
+import datetime
+import json
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import batched
+from typing import Any
+from uuid import UUID
+
+
+# Linhas por pedaço enviado ao cliente.
+_ROWS_PER_CHUNK = 200
+
+# Prefixos que planilhas interpretam como fórmula (CSV injection).
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+
+def render_ndjson(header: list[str], rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+    """
+    Gera um objeto JSON por linha (``application/x-ndjson``).
+
+    Args:
+        header: Nomes das colunas, na ordem das tuplas.
+        rows: Linhas do selector.
+
+    Returns:
+        Gerador de pedaços de texto terminados em ``\\n``.
+    """
+    for chunk in batched(rows, _ROWS_PER_CHUNK):
+        yield "".join(
+            json.dumps(
+                dict(zip(header, row, strict=True)),
+                default=_json_default,
+                ensure_ascii=False,
+            )
+            + "\n"
+            for row in chunk
+        )
+
+
+def render_csv(header: list[str], rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+    """
+    Gera o CSV com cabeçalho (datas em ISO 8601, nulos como vazio).
+
+    Args:
+        header: Nomes das colunas, na ordem das tuplas.
+        rows: Linhas do selector.
+
+    Returns:
+        Gerador de pedaços de texto CSV.
+    """
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    yield writer.writerow(header)
+    for chunk in batched(rows, _ROWS_PER_CHUNK):
+        yield "".join(
+            writer.writerow([_csv_value(value) for value in row]) for row in chunk
+        )
+
+
+class _LineBuffer:
+    """Pseudo-arquivo: ``csv.writer`` devolve a linha em vez de acumulá-la."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    raise TypeError(f"Tipo não serializável na exportação: {type(value)!r}")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        # O apóstrofo faz a planilha tratar a célula como texto.
+        return f"'{value}"
+    return value
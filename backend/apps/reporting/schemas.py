@@ -5,6 +5,7 @@ Schemas Pydantic / Django Ninja para o módulo de relatórios e dashboard.
 from __future__ import annotations
 
 import datetime
+from enum import StrEnum
 
 from ninja import Schema
 from pydantic import UUID4
@@ -75,3 +76,16 @@ class WeddingDashboardOut(Schema):
     upcoming_installments: list[WeddingDashboardInstallmentOut]
     urgent_tasks: list[WeddingDashboardTaskOut]
     categories_summary: list[WeddingDashboardCategoryOut]
+
+
+# ── Exportação em massa ──
+class ExportResourceEnum(StrEnum):
+    """Recursos disponíveis na exportação em massa (NDJSON/CSV)."""
+
+    WEDDINGS = "weddings"
+    CONTRACTS = "contracts"
+    EXPENSES = "expenses"
+    INSTALLMENTS = "installments"
+    EVENTS = "events"
+    TASKS = "tasks"
+    SUPPLIERS = "suppliers"
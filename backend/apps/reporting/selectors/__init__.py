@@ -1,7 +1,13 @@
 from .dashboard_selectors import (
+    dashboard_data_version_selector,
     dashboard_summary_selector,
     wedding_overview_selector,
 )
+from .export_selectors import (
+    EXPORT_SPECS,
+    ExportSpec,
+    export_rows_selector,
+)
 from .report_selectors import (
     WeddingReportDataDTO,
     wedding_report_data_selector,
@@ -14,11 +20,15 @@ from .summaries import (
 
 
 __all__ = [
+    "EXPORT_SPECS",
     "ContractSummarySelector",
+    "ExportSpec",
     "FinancialSummarySelector",
     "TaskSummarySelector",
     "WeddingReportDataDTO",
+    "dashboard_data_version_selector",
     "dashboard_summary_selector",
+    "export_rows_selector",
     "wedding_overview_selector",
     "wedding_report_data_selector",
 ]
@@ -9,12 +9,17 @@ from datetime import date
 from typing import Any
 from uuid import UUID
 
+from apps.finances.models import Budget, BudgetCategory, Expense, Installment
+from apps.logistics.models import Contract
 from apps.reporting.selectors.summaries import (
     ContractSummarySelector,
     FinancialSummarySelector,
     TaskSummarySelector,
 )
+from apps.scheduler.models import Task
 from apps.tenants.models import Company
+from apps.tenants.selectors import tenant_data_version_selector
+from apps.weddings.models import Wedding
 from apps.weddings.selectors import (
     critical_weddings_selector,
     wedding_get_selector,
@@ -156,3 +161,23 @@ def wedding_overview_selector(
         "urgent_tasks": urgent_tasks,
         "categories_summary": categories_summary,
     }
+
+
+def dashboard_data_version_selector(*, company: Company) -> str:
+    """
+    Versão (ETag) dos dados dos dashboards do tenant.
+
+    Os indicadores dependem da data atual (prazos, atrasos, contagem
+    regressiva), então ela também compõe a versão.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        str: Fingerprint dos dados do tenant.
+    """
+    return tenant_data_version_selector(
+        company=company,
+        models=(Wedding, Budget, BudgetCategory, Expense, Installment, Contract, Task),
+        extra=date.today().isoformat(),
+    )
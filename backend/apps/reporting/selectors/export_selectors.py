@@ -0,0 +1,179 @@
+"""
+Selectors da exportação em massa dos dados do tenant (NDJSON/CSV).
+
+Cada recurso exporta uma projeção plana (``values_list``), sem instanciar
+models, lida com ``.iterator(chunk_size=...)``: no PostgreSQL isso abre um
+cursor nomeado no servidor, então a memória fica constante qualquer que seja
+o tamanho do tenant.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Model
+
+from apps.finances.models import Expense, Installment
+from apps.logistics.models import Contract, Supplier
+from apps.reporting.schemas import ExportResourceEnum
+from apps.scheduler.models import Event, Task
+from apps.tenants.models import Company
+from apps.weddings.models import Wedding
+
+
+_TIMESTAMPS = (("created_at", "created_at"), ("updated_at", "updated_at"))
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """Model exportado e suas colunas (nome na saída, lookup do ORM)."""
+
+    model: type[Model]
+    columns: tuple[tuple[str, str], ...]
+
+    @property
+    def header(self) -> list[str]:
+        return [name for name, _ in self.columns]
+
+
+EXPORT_SPECS: dict[ExportResourceEnum, ExportSpec] = {
+    ExportResourceEnum.WEDDINGS: ExportSpec(
+        Wedding,
+        (
+            ("uuid", "uuid"),
+            ("groom_name", "groom_name"),
+            ("bride_name", "bride_name"),
+            ("date", "date"),
+            ("location", "location"),
+            ("expected_guests", "expected_guests"),
+            ("status", "status"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.SUPPLIERS: ExportSpec(
+        Supplier,
+        (
+            ("uuid", "uuid"),
+            ("name", "name"),
+            ("cnpj", "cnpj"),
+            ("phone", "phone"),
+            ("email", "email"),
+            ("website", "website"),
+            ("address", "address"),
+            ("city", "city"),
+            ("state", "state"),
+            ("notes", "notes"),
+            ("is_active", "is_active"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.CONTRACTS: ExportSpec(
+        Contract,
+        (
+            ("uuid", "uuid"),
+            ("wedding", "wedding__uuid"),
+            ("supplier", "supplier__uuid"),
+            ("parent", "parent__uuid"),
+            ("name", "name"),
+            ("description", "description"),
+            ("total_amount", "total_amount"),
+            ("status", "status"),
+            ("expiration_date", "expiration_date"),
+            ("signed_date", "signed_date"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.EXPENSES: ExportSpec(
+        Expense,
+        (
+            ("uuid", "uuid"),
+            ("wedding", "wedding__uuid"),
+            ("category", "category__uuid"),
+            ("category_name", "category__name"),
+            ("contract", "contract__uuid"),
+            ("name", "name"),
+            ("description", "description"),
+            ("estimated_amount", "estimated_amount"),
+            ("actual_amount", "actual_amount"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.INSTALLMENTS: ExportSpec(
+        Installment,
+        (
+            ("uuid", "uuid"),
+            ("wedding", "wedding__uuid"),
+            ("expense", "expense__uuid"),
+            ("installment_number", "installment_number"),
+            ("amount", "amount"),
+            ("due_date", "due_date"),
+            ("paid_date", "paid_date"),
+            ("status", "status"),
+            ("notes", "notes"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.EVENTS: ExportSpec(
+        Event,
+        (
+            ("uuid", "uuid"),
+            ("wedding", "wedding__uuid"),
+            ("title", "title"),
+            ("event_type", "event_type"),
+            ("start_time", "start_time"),
+            ("end_time", "end_time"),
+            ("location", "location"),
+            ("description", "description"),
+            ("recurrence_rule", "recurrence_rule"),
+            *_TIMESTAMPS,
+        ),
+    ),
+    ExportResourceEnum.TASKS: ExportSpec(
+        Task,
+        (
+            ("uuid", "uuid"),
+            ("wedding", "wedding__uuid"),
+            ("title", "title"),
+            ("description", "description"),
+            ("due_date", "due_date"),
+            ("is_completed", "is_completed"),
+            *_TIMESTAMPS,
+        ),
+    ),
+}
+
+
+def export_rows_selector(
+    *,
+    company: Company,
+    resource: ExportResourceEnum,
+    updated_since: datetime.datetime | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Itera as linhas de um recurso do tenant para exportação.
+
+    A ordem é ``(updated_at, id)``: no modo incremental (``updated_since``),
+    o cliente usa o instante da exportação anterior como novo corte.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        resource: Recurso a exportar.
+        updated_since: Se informado, só linhas alteradas a partir dele.
+
+    Returns:
+        Iterador de tuplas na ordem de ``EXPORT_SPECS[resource].columns``.
+    """
+    spec = EXPORT_SPECS[resource]
+    qs = spec.model._default_manager.filter(company=company)
+    if updated_since is not None:
+        qs = qs.filter(updated_at__gte=updated_since)
+    lookups = [lookup for _, lookup in spec.columns]
+    return (
+        qs.order_by("updated_at", "id")
+        .values_list(*lookups)
+        .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    )
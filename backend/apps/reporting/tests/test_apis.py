@@ -57,3 +57,19 @@ class TestReportingDashboardAPI:
 
         response = auth_client.get(f"/api/v1/dashboard/wedding/{other_wedding.uuid}/")
         assert response.status_code == 404
+
+    def test_dashboard_summary_conditional_get(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        WeddingFactory(company=user.company)
+        etag = auth_client.get("/api/v1/dashboard/summary/")["ETag"]
+
+        cached = auth_client.get("/api/v1/dashboard/summary/", HTTP_IF_NONE_MATCH=etag)
+        WeddingFactory(company=user.company)
+        refreshed = auth_client.get(
+            "/api/v1/dashboard/summary/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert cached.status_code == 304
+        assert refreshed.status_code == 200
+        assert refreshed["ETag"] != etag
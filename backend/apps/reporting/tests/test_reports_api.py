@@ -2,10 +2,15 @@
 Testes de integração para as rotas do reports_router (/api/v1/reports/).
 """
 
+import csv
+import io
+import json
+from datetime import timedelta
 from typing import Any, cast
 from uuid import uuid4
 
 import pytest
+from django.utils import timezone
 
 from apps.tenants.models import Company
 from apps.tenants.tests.factories import CompanyFactory as _CompanyFactory
@@ -78,3 +83,85 @@ class TestReportsAPI:
         """Bloqueia requisição não autenticada com HTTP 401."""
         response = client.get(f"/api/v1/reports/weddings/{uuid4()}/?format=pdf")
         assert response.status_code == 401
+
+
+def _stream(response: Any) -> str:
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestBulkExportAPI:
+    """Exportação em massa em streaming (NDJSON/CSV) por recurso."""
+
+    def test_ndjson_exports_only_tenant_rows(self, auth_client: Any, user: Any) -> None:
+        """Cada linha é um objeto JSON; registros de outro tenant ficam de fora."""
+        own = WeddingFactory(company=user.company, groom_name="João")
+        WeddingFactory(company=CompanyFactory())
+
+        response = auth_client.get("/api/v1/reports/exports/weddings/")
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        assert response["X-Export-Started-At"]
+        rows = [json.loads(line) for line in _stream(response).splitlines()]
+        assert [row["uuid"] for row in rows] == [str(own.uuid)]
+        assert rows[0]["groom_name"] == "João"
+        assert rows[0]["date"] == own.date.isoformat()
+
+    def test_csv_export_has_header(self, auth_client: Any, user: Any) -> None:
+        """O CSV começa pelo cabeçalho e traz uma linha por registro."""
+        wedding = WeddingFactory(company=user.company)
+
+        response = auth_client.get("/api/v1/reports/exports/weddings/?format=csv")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"].endswith('.csv"')
+        rows = list(csv.DictReader(io.StringIO(_stream(response))))
+        assert len(rows) == 1
+        assert rows[0]["uuid"] == str(wedding.uuid)
+        assert rows[0]["date"] == wedding.date.isoformat()
+
+    def test_csv_neutralizes_formula_cells(self, auth_client: Any, user: Any) -> None:
+        """Texto iniciado por ``=``/``+``/``-``/``@`` sai com apóstrofo no CSV."""
+        WeddingFactory(company=user.company, groom_name='=HYPERLINK("x")')
+
+        csv_response = auth_client.get("/api/v1/reports/exports/weddings/?format=csv")
+        ndjson_response = auth_client.get("/api/v1/reports/exports/weddings/")
+
+        rows = list(csv.DictReader(io.StringIO(_stream(csv_response))))
+        assert rows[0]["groom_name"] == '\'=HYPERLINK("x")'
+        ndjson_row = json.loads(_stream(ndjson_response))
+        assert ndjson_row["groom_name"] == '=HYPERLINK("x")'
+
+    def test_updated_since_returns_only_changed_rows(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        """O modo incremental filtra por ``updated_at``."""
+        old = WeddingFactory(company=user.company)
+        recent = WeddingFactory(company=user.company)
+        cutoff = timezone.now()
+        Wedding.objects.filter(pk=old.pk).update(updated_at=cutoff - timedelta(days=1))
+        Wedding.objects.filter(pk=recent.pk).update(
+            updated_at=cutoff + timedelta(seconds=1)
+        )
+
+        response = auth_client.get(
+            "/api/v1/reports/exports/weddings/",
+            {"updated_since": cutoff.isoformat()},
+        )
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in _stream(response).splitlines()]
+        assert [row["uuid"] for row in rows] == [str(recent.uuid)]
+
+    def test_unknown_resource_returns_422(self, auth_client: Any) -> None:
+        """Recurso fora do enum é rejeitado na validação."""
+        response = auth_client.get("/api/v1/reports/exports/guests/")
+        assert response.status_code == 422
+
+    def test_export_unauthenticated_returns_401(self, client: Any) -> None:
+        """Bloqueia requisição não autenticada com HTTP 401."""
+        response = client.get("/api/v1/reports/exports/weddings/")
+        assert response.status_code == 401
@@ -1,6 +1,12 @@
 from django.contrib import admin
 
-from .models import Event
+from .models import (
+    CalendarFeed,
+    Event,
+    EventException,
+    ScheduleTemplate,
+    ScheduleTemplateVersion,
+)
 
 
 # Configuração do modelo Event no painel administrativo do Django
@@ -19,3 +25,37 @@ class EventAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 
     # Exibe hierarquia de datas no topo da página
     date_hierarchy = "start_time"
+
+
+@admin.register(EventException)
+class EventExceptionAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    """Exceções (cancelamentos/remarcações) de ocorrências recorrentes."""
+
+    list_display = ("id", "event", "original_start", "is_cancelled", "start_time")
+    list_filter = ("is_cancelled", "company")
+
+
+@admin.register(CalendarFeed)
+class CalendarFeedAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    """Assinaturas iCalendar; o token não é exibido na listagem."""
+
+    list_display = ("id", "name", "wedding", "company", "created_at")
+    list_filter = ("company",)
+
+
+class ScheduleTemplateVersionInline(admin.TabularInline):  # type: ignore[type-arg]
+    model = ScheduleTemplateVersion
+    extra = 0
+    fields = ("number", "created_at")
+    readonly_fields = ("number", "created_at")
+    can_delete = False
+
+
+@admin.register(ScheduleTemplate)
+class ScheduleTemplateAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    """Templates de cronograma do tenant; versões publicadas são somente leitura."""
+
+    list_display = ("id", "key", "name", "company")
+    search_fields = ("key", "name")
+    list_filter = ("company",)
+    inlines = [ScheduleTemplateVersionInline]
@@ -1,8 +1,12 @@
 from .events import events_router
+from .feeds import feeds_router
 from .tasks import tasks_router
+from .templates import templates_router
 
 
 __all__ = [
     "events_router",
+    "feeds_router",
     "tasks_router",
+    "templates_router",
 ]
@@ -1,12 +1,27 @@
+from collections.abc import Iterator
+from datetime import date, datetime
+
 from django.db.models import QuerySet
 from ninja.pagination import paginate
 from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
-from apps.scheduler.models import Event
-from apps.scheduler.schemas import EventIn, EventOut, EventPatchIn
-from apps.scheduler.selectors import event_get_selector, event_list_selector
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.schemas import (
+    EventExceptionIn,
+    EventExceptionOut,
+    EventIn,
+    EventOccurrenceOut,
+    EventOut,
+    EventPatchIn,
+)
+from apps.scheduler.selectors import (
+    EventOccurrence,
+    event_get_selector,
+    event_list_selector,
+    event_occurrences_selector,
+)
 from apps.scheduler.services import EventService
 from apps.users.types import AuthRequest
 
@@ -33,6 +48,33 @@ def list_events(
     )
 
 
+@events_router.get(
+    "/occurrences/",
+    response={200: list[EventOccurrenceOut], **READ_ERROR_RESPONSES},
+    operation_id="scheduler_events_occurrences",
+)
+def list_occurrences(
+    request: AuthRequest,
+    start_date: date,
+    end_date: date,
+    wedding_id: UUID4 | None = None,
+) -> Iterator[EventOccurrence]:
+    """
+    Lista as ocorrências do calendário dentro de uma janela de datas.
+
+    Eventos recorrentes (semanal/quinzenal/mensal) são expandidos em cada
+    ocorrência da janela, já com cancelamentos e remarcações aplicados, e
+    intercalados com os eventos avulsos em ordem de início.
+    """
+    user = request.user
+    return event_occurrences_selector(
+        company=user.company,
+        start_date=start_date,
+        end_date=end_date,
+        wedding_id=wedding_id,
+    )
+
+
 @events_router.get(
     "/{uuid}/",
     response={200: EventOut, **READ_ERROR_RESPONSES},
@@ -97,3 +139,39 @@ def delete_event(request: AuthRequest, uuid: UUID4) -> tuple[int, None]:
     instance = event_get_selector(company=user.company, uuid=uuid)
     EventService.delete(user.company, instance)
     return 204, None
+
+
+@events_router.put(
+    "/{uuid}/occurrences/",
+    response={200: EventExceptionOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_events_occurrence_set",
+)
+def set_occurrence(
+    request: AuthRequest, uuid: UUID4, payload: EventExceptionIn
+) -> EventException:
+    """
+    Cancela ou altera uma única ocorrência de um evento recorrente.
+
+    A ocorrência é identificada pelo seu início original (``original_start``);
+    título, local e horários informados valem apenas para ela.
+    """
+    user = request.user
+    instance = event_get_selector(company=user.company, uuid=uuid)
+    return EventService.set_occurrence_exception(user.company, instance, payload)
+
+
+@events_router.delete(
+    "/{uuid}/occurrences/",
+    response={204: None, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_events_occurrence_clear",
+)
+def clear_occurrence(
+    request: AuthRequest, uuid: UUID4, original_start: datetime
+) -> tuple[int, None]:
+    """
+    Restaura uma ocorrência cancelada ou alterada ao padrão da série.
+    """
+    user = request.user
+    instance = event_get_selector(company=user.company, uuid=uuid)
+    EventService.clear_occurrence_exception(user.company, instance, original_start)
+    return 204, None
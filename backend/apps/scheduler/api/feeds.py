@@ -0,0 +1,114 @@
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from ninja_extra import Router
+from pydantic import UUID4
+
+from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.scheduler.ical import render_calendar
+from apps.scheduler.models import CalendarFeed
+from apps.scheduler.schemas import CalendarFeedIn, CalendarFeedOut
+from apps.scheduler.selectors import (
+    CalendarFeedVersion,
+    calendar_feed_by_token_selector,
+    calendar_feed_events_selector,
+    calendar_feed_get_selector,
+    calendar_feed_list_selector,
+    calendar_feed_version_selector,
+)
+from apps.scheduler.services import CalendarFeedService
+from apps.users.types import AuthRequest
+
+
+feeds_router = Router(tags=["Scheduler"])
+
+
+@feeds_router.get(
+    "/", response=list[CalendarFeedOut], operation_id="scheduler_feeds_list"
+)
+def list_feeds(request: AuthRequest) -> QuerySet[CalendarFeed]:
+    """
+    Lista as assinaturas de calendário (.ics) ativas do Planner.
+    """
+    user = request.user
+    return calendar_feed_list_selector(company=user.company)
+
+
+@feeds_router.post(
+    "/",
+    response={201: CalendarFeedOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_feeds_create",
+)
+def create_feed(
+    request: AuthRequest, payload: CalendarFeedIn
+) -> tuple[int, CalendarFeed]:
+    """
+    Cria uma URL de assinatura iCalendar para Google Calendar, Outlook etc.
+
+    Sem ``wedding``, o feed reúne os eventos de todos os casamentos. A URL
+    retornada contém o token de acesso e deve ser tratada como segredo.
+    """
+    user = request.user
+    return 201, CalendarFeedService.create(user.company, payload)
+
+
+@feeds_router.delete(
+    "/{uuid}/",
+    response={204: None, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_feeds_delete",
+)
+def delete_feed(request: AuthRequest, uuid: UUID4) -> tuple[int, None]:
+    """
+    Revoga uma assinatura: a URL do feed deixa de funcionar.
+    """
+    user = request.user
+    instance = calendar_feed_get_selector(company=user.company, uuid=uuid)
+    CalendarFeedService.delete(user.company, instance)
+    return 204, None
+
+
+@feeds_router.get(
+    "/{token}.ics",
+    auth=None,
+    response={200: None, 304: None, **READ_ERROR_RESPONSES},
+    operation_id="scheduler_feeds_ics",
+    url_name="scheduler_feeds_ics",
+)
+def download_feed(request: HttpRequest, token: str) -> HttpResponse:
+    """
+    Conteúdo iCalendar do feed (acesso público pelo token).
+
+    Responde 304 quando o ``If-None-Match``/``If-Modified-Since`` do cliente
+    ainda corresponde à versão atual dos eventos, sem consultá-los. Caso
+    contrário, o calendário é transmitido em streaming.
+    """
+    feed = calendar_feed_by_token_selector(token=token)
+    version = calendar_feed_version_selector(feed=feed)
+
+    not_modified = get_conditional_response(
+        request,
+        etag=version.etag,
+        last_modified=int(version.last_modified.timestamp()),
+    )
+    if not_modified is not None:
+        return _with_validators(not_modified, version)
+
+    events, exceptions = calendar_feed_events_selector(feed=feed)
+    name = feed.name or (str(feed.wedding) if feed.wedding else str(feed.company))
+    response = StreamingHttpResponse(
+        render_calendar(name, events.iterator(chunk_size=500), exceptions),
+        content_type="text/calendar; charset=utf-8",
+    )
+    response["Content-Disposition"] = 'inline; filename="calendario.ics"'
+    return _with_validators(response, version)
+
+
+def _with_validators(
+    response: HttpResponse | StreamingHttpResponse, version: CalendarFeedVersion
+) -> HttpResponse:
+    response["ETag"] = version.etag
+    response["Last-Modified"] = http_date(version.last_modified.timestamp())
+    # Revalidação a cada leitura: o 304 é barato e o conteúdo muda sem aviso.
+    response["Cache-Control"] = "private, no-cache"
+    return response  # type: ignore[return-value]
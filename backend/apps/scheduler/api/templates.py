@@ -0,0 +1,114 @@
+from django.db.models import QuerySet
+from ninja_extra import Router
+from pydantic import UUID4
+
+from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.scheduler.models import ScheduleTemplate, ScheduleTemplateVersion
+from apps.scheduler.schemas import (
+    ScheduleTemplateIn,
+    ScheduleTemplateOut,
+    ScheduleTemplateVersionIn,
+    ScheduleTemplateVersionOut,
+    TemplateSyncOut,
+)
+from apps.scheduler.selectors import (
+    schedule_template_get_selector,
+    schedule_template_list_selector,
+)
+from apps.scheduler.services import ScheduleTemplateService
+from apps.users.types import AuthRequest
+
+
+templates_router = Router(tags=["Scheduler"])
+
+
+@templates_router.get(
+    "/", response=list[ScheduleTemplateOut], operation_id="scheduler_templates_list"
+)
+def list_templates(request: AuthRequest) -> QuerySet[ScheduleTemplate]:
+    """
+    Lista os templates de cronograma próprios do Planner, com a versão atual.
+    """
+    user = request.user
+    return schedule_template_list_selector(company=user.company)
+
+
+@templates_router.get(
+    "/{uuid}/",
+    response={200: ScheduleTemplateOut, **READ_ERROR_RESPONSES},
+    operation_id="scheduler_templates_read",
+)
+def get_template(request: AuthRequest, uuid: UUID4) -> ScheduleTemplate:
+    """
+    Retorna um template de cronograma com o conteúdo da versão atual.
+    """
+    user = request.user
+    return schedule_template_get_selector(company=user.company, uuid=uuid)
+
+
+@templates_router.post(
+    "/",
+    response={201: ScheduleTemplateOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_templates_create",
+)
+def create_template(
+    request: AuthRequest, payload: ScheduleTemplateIn
+) -> tuple[int, ScheduleTemplate]:
+    """
+    Cria um template de cronograma com eventos, tarefas e categorias.
+
+    O ``key`` é o valor informado em ``template`` ao criar um casamento; usar o
+    mesmo ``key`` de um template embutido o substitui para o Planner.
+    """
+    user = request.user
+    return 201, ScheduleTemplateService.create(user.company, payload)
+
+
+@templates_router.post(
+    "/{uuid}/versions/",
+    response={201: ScheduleTemplateVersionOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_templates_publish",
+)
+def publish_version(
+    request: AuthRequest, uuid: UUID4, payload: ScheduleTemplateVersionIn
+) -> tuple[int, ScheduleTemplateVersion]:
+    """
+    Publica uma nova versão do template.
+
+    Novos casamentos passam a usá-la; os existentes só mudam ao sincronizar.
+    """
+    user = request.user
+    instance = schedule_template_get_selector(company=user.company, uuid=uuid)
+    return 201, ScheduleTemplateService.publish_version(user.company, instance, payload)
+
+
+@templates_router.post(
+    "/{uuid}/sync/",
+    response={200: TemplateSyncOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_templates_sync",
+)
+def sync_template(request: AuthRequest, uuid: UUID4) -> dict[str, int]:
+    """
+    Aplica a versão atual aos casamentos criados com versões anteriores.
+
+    Só a diferença entre as versões é aplicada: itens inalterados (inclusive
+    os editados no casamento) são preservados.
+    """
+    user = request.user
+    instance = schedule_template_get_selector(company=user.company, uuid=uuid)
+    return {"weddings": ScheduleTemplateService.sync_weddings(user.company, instance)}
+
+
+@templates_router.delete(
+    "/{uuid}/",
+    response={204: None, **MUTATION_ERROR_RESPONSES},
+    operation_id="scheduler_templates_delete",
+)
+def delete_template(request: AuthRequest, uuid: UUID4) -> tuple[int, None]:
+    """
+    Exclui o template; os cronogramas já criados permanecem nos casamentos.
+    """
+    user = request.user
+    instance = schedule_template_get_selector(company=user.company, uuid=uuid)
+    ScheduleTemplateService.delete(user.company, instance)
+    return 204, None
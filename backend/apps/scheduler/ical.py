@@ -0,0 +1,220 @@
+"""
+Serialização dos eventos do calendário em iCalendar (RFC 5545).
+
+Séries recorrentes viram um único VEVENT com RRULE; ocorrências canceladas
+entram como EXDATE e as alteradas como VEVENTs com RECURRENCE-ID. O conteúdo
+é gerado em pedaços (um por evento) para ser transmitido em streaming, e é
+determinístico para a mesma versão dos eventos (DTSTAMP vem de
+``updated_at``), o que permite um ETag forte.
+
+Os horários usam o fuso local (``TIME_ZONE``) via TZID, coerente com a
+expansão das recorrências no backend.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+
+from django.utils import timezone
+
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.recurrence import BIWEEKLY, MONTHLY, WEEKLY
+
+
+PRODID = "-//Wedding Management//Scheduler//PT-BR"
+
+# Incrementar ao mudar o formato gerado: invalida os ETags já emitidos.
+FEED_FORMAT_VERSION = 1
+
+_UID_DOMAIN = "wedding-management"
+_MAX_LINE_OCTETS = 75
+
+_RRULES = {
+    WEEKLY: "FREQ=WEEKLY",
+    BIWEEKLY: "FREQ=WEEKLY;INTERVAL=2",
+    MONTHLY: "FREQ=MONTHLY",
+}
+
+
+def render_calendar(
+    name: str,
+    events: Iterable[Event],
+    exceptions: Mapping[int, list[EventException]],
+) -> Iterator[str]:
+    """
+    Gera o documento VCALENDAR em pedaços de texto.
+
+    Args:
+        name: Nome exibido pelo cliente de calendário (X-WR-CALNAME).
+        events: Eventos, de preferência já ordenados por início.
+        exceptions: Exceções de ocorrência agrupadas por ``event_id``.
+
+    Returns:
+        Gerador de pedaços com linhas terminadas em CRLF.
+    """
+    tz = timezone.get_current_timezone()
+    tzid = str(tz)
+    yield _lines(
+        [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_escape(name)}",
+            f"X-WR-TIMEZONE:{tzid}",
+            *_vtimezone(tzid),
+        ]
+    )
+    for event in events:
+        yield _lines(_vevent(event, exceptions.get(event.pk, []), tzid))
+    yield _lines(["END:VCALENDAR"])
+
+
+def _vtimezone(tzid: str) -> list[str]:
+    """
+    VTIMEZONE com o deslocamento atual do fuso.
+
+    Suficiente para fusos sem horário de verão (America/Sao_Paulo desde 2019);
+    os clientes resolvem o TZID pelo banco de fusos próprio quando o conhecem.
+    """
+    offset = timezone.localtime().utcoffset()
+    minutes = int(offset.total_seconds() // 60) if offset else 0
+    sign = "+" if minutes >= 0 else "-"
+    hours, mins = divmod(abs(minutes), 60)
+    utc_offset = f"{sign}{hours:02d}{mins:02d}"
+    return [
+        "BEGIN:VTIMEZONE",
+        f"TZID:{tzid}",
+        "BEGIN:STANDARD",
+        "DTSTART:19700101T000000",
+        f"TZOFFSETFROM:{utc_offset}",
+        f"TZOFFSETTO:{utc_offset}",
+        f"TZNAME:{timezone.localtime().strftime('%Z')}",
+        "END:STANDARD",
+        "END:VTIMEZONE",
+    ]
+
+
+def _vevent(event: Event, exceptions: list[EventException], tzid: str) -> list[str]:
+    uid = f"{event.uuid}@{_UID_DOMAIN}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{_utc(event.updated_at)}",
+        f"DTSTART;TZID={tzid}:{_local(event.start_time)}",
+    ]
+    if event.end_time:
+        lines.append(f"DTEND;TZID={tzid}:{_local(event.end_time)}")
+    lines.append(f"SUMMARY:{_escape(event.title)}")
+    if event.location:
+        lines.append(f"LOCATION:{_escape(event.location)}")
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+    lines.append(f"CATEGORIES:{_escape(event.get_event_type_display())}")
+
+    rrule = _rrule(event)
+    overrides: list[EventException] = []
+    if rrule:
+        lines.append(f"RRULE:{rrule}")
+        cancelled = [e.original_start for e in exceptions if e.is_cancelled]
+        if cancelled:
+            dates = ",".join(_local(start) for start in sorted(cancelled))
+            lines.append(f"EXDATE;TZID={tzid}:{dates}")
+        overrides = [e for e in exceptions if not e.is_cancelled]
+
+    lines.extend(_valarm(event))
+    lines.append("END:VEVENT")
+
+    for exception in overrides:
+        lines.extend(_override_vevent(event, exception, uid, tzid))
+    return lines
+
+
+def _override_vevent(
+    event: Event, exception: EventException, uid: str, tzid: str
+) -> list[str]:
+    start = exception.start_time or exception.original_start
+    end = exception.end_time
+    if end is None and event.end_time is not None:
+        end = start + (event.end_time - event.start_time)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{_utc(exception.updated_at)}",
+        f"RECURRENCE-ID;TZID={tzid}:{_local(exception.original_start)}",
+        f"DTSTART;TZID={tzid}:{_local(start)}",
+    ]
+    if end is not None:
+        lines.append(f"DTEND;TZID={tzid}:{_local(end)}")
+    lines.append(f"SUMMARY:{_escape(exception.title or event.title)}")
+    location = exception.location or event.location
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    lines.extend(_valarm(event))
+    lines.append("END:VEVENT")
+    return lines
+
+
+def _rrule(event: Event) -> str:
+    rule = _RRULES.get(event.recurrence_rule, "")
+    if event.recurrence_rule == MONTHLY:
+        day = timezone.localtime(event.start_time).day
+        if day > 28:
+            # Dia 29-31: cai no último dia dos meses mais curtos, como na
+            # expansão do backend (ex.: 31/01 -> 28/02 -> 31/03).
+            days = ",".join(str(d) for d in range(28, day + 1))
+            rule = f"{rule};BYMONTHDAY={days};BYSETPOS=-1"
+    return rule
+
+
+def _valarm(event: Event) -> list[str]:
+    if not event.reminder_enabled:
+        return []
+    return [
+        "BEGIN:VALARM",
+        "ACTION:DISPLAY",
+        f"DESCRIPTION:{_escape(event.title)}",
+        f"TRIGGER:-PT{event.reminder_minutes_before}M",
+        "END:VALARM",
+    ]
+
+
+def _local(value: datetime) -> str:
+    return timezone.localtime(value).strftime("%Y%m%dT%H%M%S")
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _lines(lines: list[str]) -> str:
+    return "".join(f"{_fold(line)}\r\n" for line in lines)
+
+
+def _fold(line: str) -> str:
+    """Dobra linhas acima de 75 octetos sem partir caracteres UTF-8."""
+    if len(line.encode()) <= _MAX_LINE_OCTETS:
+        return line
+    parts: list[str] = []
+    current, size = "", 0
+    for char in line:
+        width = len(char.encode())
+        # Continuações começam com um espaço, que também conta no limite.
+        limit = _MAX_LINE_OCTETS if not parts else _MAX_LINE_OCTETS - 1
+        if size + width > limit:
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts)
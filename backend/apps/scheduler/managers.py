@@ -93,6 +93,21 @@ class TaskQuerySet(TenantQuerySet["Task"]):
 class EventQuerySet(TenantQuerySet["Event"]):
     """QuerySet customizado para Event com métodos encadeáveis."""
 
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Exclui os eventos e incrementa a versão de eventos dos casamentos.
+
+        Returns:
+            O retorno padrão de ``QuerySet.delete``.
+        """
+        from apps.weddings.models import Wedding
+
+        wedding_ids = set(self.values_list("wedding_id", flat=True))
+        result = super().delete()
+        if wedding_ids:
+            Wedding.objects.filter(pk__in=wedding_ids).bump_events_version()
+        return result
+
     def for_wedding(
         self, wedding_id_or_instance: Wedding | UUID | str | int
     ) -> EventQuerySet:
@@ -0,0 +1,69 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:24
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0003_expense_name_alter_expense_description'),
+        ('scheduler', '0003_event_source_installment'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0002_wedding_template'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventException',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('original_start', models.DateTimeField(verbose_name='Início original')),
+                ('is_cancelled', models.BooleanField(default=False, verbose_name='Cancelada?')),
+                ('title', models.CharField(blank=True, max_length=255, verbose_name='Título')),
+                ('location', models.CharField(blank=True, max_length=255, verbose_name='Local')),
+                ('start_time', models.DateTimeField(blank=True, null=True, verbose_name='Novo início')),
+                ('end_time', models.DateTimeField(blank=True, null=True, verbose_name='Novo fim')),
+            ],
+            options={
+                'verbose_name': 'Exceção de Evento',
+                'verbose_name_plural': 'Exceções de Eventos',
+                'ordering': ['original_start'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['company', 'recurrence_rule', 'start_time'], name='scheduler_e_company_6080cd_idx'),
+        ),
+        migrations.AddField(
+            model_name='eventexception',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa'),
+        ),
+        migrations.AddField(
+            model_name='eventexception',
+            name='event',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exceptions', to='scheduler.event', verbose_name='Evento recorrente'),
+        ),
+        migrations.AddField(
+            model_name='eventexception',
+            name='wedding',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='weddings.wedding'),
+        ),
+        migrations.AddIndex(
+            model_name='eventexception',
+            index=models.Index(fields=['event', 'original_start'], name='scheduler_e_event_i_ad0337_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventexception',
+            index=models.Index(fields=['event', 'start_time'], name='scheduler_e_event_i_c78855_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventexception',
+            constraint=models.UniqueConstraint(fields=('event', 'original_start'), name='unique_event_exception_per_occurrence'),
+        ),
+    ]
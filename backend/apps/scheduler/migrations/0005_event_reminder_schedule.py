@@ -0,0 +1,58 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:30
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+from apps.scheduler.recurrence import next_occurrence_start
+
+
+def backfill_reminder_at(apps, schema_editor):
+    Event = apps.get_model("scheduler", "Event")
+    now = timezone.now()
+    # Só eventos com lembrete ativo e que ainda podem ocorrer.
+    pending = Event.objects.filter(reminder_enabled=True).exclude(
+        recurrence_rule="none", start_time__lte=now
+    )
+    batch = []
+    for event in pending.only(
+        "id", "start_time", "recurrence_rule", "reminder_minutes_before"
+    ).iterator(chunk_size=1000):
+        start = next_occurrence_start(event.start_time, event.recurrence_rule, now)
+        if start is None:
+            continue
+        event.reminder_at = start - timedelta(minutes=event.reminder_minutes_before)
+        batch.append(event)
+        if len(batch) == 1000:
+            Event.objects.bulk_update(batch, ["reminder_at"])
+            batch = []
+    Event.objects.bulk_update(batch, ["reminder_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0003_expense_name_alter_expense_description'),
+        ('scheduler', '0004_event_recurrence_exceptions'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0002_wedding_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='reminder_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Calculado no save; nulo quando não há lembrete pendente', null=True, verbose_name='Próximo lembrete'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='reminder_sent_for',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Início da ocorrência cujo lembrete já foi enviado', null=True, verbose_name='Último lembrete enviado'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('reminder_at__isnull', False)), fields=['reminder_at'], name='scheduler_event_reminder_due'),
+        ),
+        migrations.RunPython(backfill_reminder_at, migrations.RunPython.noop),
+    ]
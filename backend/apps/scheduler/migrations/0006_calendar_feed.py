@@ -0,0 +1,37 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:34
+
+import apps.scheduler.models.feed
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0005_event_reminder_schedule'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0003_wedding_events_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarFeed',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('token', models.CharField(default=apps.scheduler.models.feed.generate_feed_token, editable=False, max_length=64, unique=True, verbose_name='Token')),
+                ('name', models.CharField(blank=True, max_length=255, verbose_name='Nome')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+                ('wedding', models.ForeignKey(blank=True, help_text='Vazio: todos os casamentos do tenant', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='calendar_feeds', to='weddings.wedding', verbose_name='Casamento')),
+            ],
+            options={
+                'verbose_name': 'Feed de Calendário',
+                'verbose_name_plural': 'Feeds de Calendário',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['company', 'wedding'], name='scheduler_c_company_1e4118_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,127 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:48
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+from django.utils.text import slugify
+
+from apps.scheduler.services.templates import TEMPLATES
+
+
+def backfill_template_applications(apps, schema_editor):
+    """Registra o template embutido já aplicado aos casamentos existentes."""
+    Wedding = apps.get_model("weddings", "Wedding")
+    Event = apps.get_model("scheduler", "Event")
+    TemplateApplication = apps.get_model("scheduler", "TemplateApplication")
+
+    weddings = Wedding.objects.filter(template__in=list(TEMPLATES)).only(
+        "id", "company_id", "template"
+    )
+    applications = []
+    for wedding in weddings.iterator(chunk_size=1000):
+        titles = {entry["title"] for entry in TEMPLATES[wedding.template]}
+        for event in Event.objects.filter(wedding_id=wedding.id, title__in=titles):
+            event.template_key = slugify(event.title)
+            event.save(update_fields=["template_key"])
+        applications.append(
+            TemplateApplication(
+                company_id=wedding.company_id,
+                wedding_id=wedding.id,
+                template_key=wedding.template,
+            )
+        )
+    TemplateApplication.objects.bulk_create(applications, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0006_calendar_feed'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0003_wedding_events_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='template_key',
+            field=models.CharField(blank=True, editable=False, help_text='Chave do item do template de cronograma que gerou este registro', max_length=50, verbose_name='Item de template'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='template_key',
+            field=models.CharField(blank=True, editable=False, help_text='Chave do item do template de cronograma que gerou este registro', max_length=50, verbose_name='Item de template'),
+        ),
+        migrations.CreateModel(
+            name='ScheduleTemplate',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('key', models.SlugField(help_text='Valor informado em Wedding.template', verbose_name='Identificador')),
+                ('name', models.CharField(max_length=255, verbose_name='Nome')),
+                ('description', models.TextField(blank=True, verbose_name='Descrição')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Template de Cronograma',
+                'verbose_name_plural': 'Templates de Cronograma',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ScheduleTemplateVersion',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('number', models.PositiveIntegerField(verbose_name='Versão')),
+                ('events', models.JSONField(blank=True, default=list, help_text='[{key, title, event_type, offset_days}]', verbose_name='Eventos')),
+                ('tasks', models.JSONField(blank=True, default=list, help_text='[{key, title, description, offset_days}]', verbose_name='Tarefas')),
+                ('budget_categories', models.JSONField(blank=True, default=list, help_text='[{key, name, description}]', verbose_name='Categorias de orçamento')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+                ('template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='scheduler.scheduletemplate', verbose_name='Template')),
+            ],
+            options={
+                'verbose_name': 'Versão de Template de Cronograma',
+                'verbose_name_plural': 'Versões de Templates de Cronograma',
+                'ordering': ['template', '-number'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TemplateApplication',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('template_key', models.SlugField(verbose_name='Template')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+                ('version', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='scheduler.scheduletemplateversion', verbose_name='Versão aplicada')),
+                ('wedding', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='weddings.wedding')),
+            ],
+            options={
+                'verbose_name': 'Aplicação de Template',
+                'verbose_name_plural': 'Aplicações de Templates',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='scheduletemplate',
+            constraint=models.UniqueConstraint(fields=('company', 'key'), name='unique_schedule_template_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='scheduletemplateversion',
+            constraint=models.UniqueConstraint(fields=('template', 'number'), name='unique_schedule_template_version_number'),
+        ),
+        migrations.AddIndex(
+            model_name='templateapplication',
+            index=models.Index(fields=['company', 'template_key'], name='scheduler_t_company_ba205b_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='templateapplication',
+            constraint=models.UniqueConstraint(fields=('wedding',), name='unique_template_application_per_wedding'),
+        ),
+        migrations.RunPython(backfill_template_applications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0006_company_updated_at_index'),
+        ('scheduler', '0007_schedule_templates'),
+        ('tenants', '0001_initial'),
+        ('weddings', '0004_company_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['company', 'updated_at'], name='scheduler_e_company_15bcff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['company', 'updated_at'], name='scheduler_t_company_22df98_idx'),
+        ),
+    ]
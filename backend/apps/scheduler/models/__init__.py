@@ -1,5 +1,15 @@
-from .event import Event
+from .event import Event, EventException
+from .feed import CalendarFeed
 from .task import Task
+from .template import ScheduleTemplate, ScheduleTemplateVersion, TemplateApplication
 
 
-__all__ = ["Event", "Task"]
+__all__ = [
+    "CalendarFeed",
+    "Event",
+    "EventException",
+    "ScheduleTemplate",
+    "ScheduleTemplateVersion",
+    "Task",
+    "TemplateApplication",
+]
@@ -1,7 +1,12 @@
+from datetime import datetime, timedelta
+from typing import Any
+
 from django.db import models
+from django.utils import timezone
 
 from apps.core.mixins import WeddingOwnedMixin
 from apps.scheduler.managers import EventQuerySet
+from apps.scheduler.recurrence import next_occurrence_start
 from apps.tenants.models import TenantModel
 
 
@@ -58,6 +63,20 @@ class Event(TenantModel, WeddingOwnedMixin):
         verbose_name="Lembrete (minutos antes)",
         help_text="Quantos minutos antes do evento enviar lembrete",
     )
+    reminder_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Próximo lembrete",
+        help_text="Calculado no save; nulo quando não há lembrete pendente",
+    )
+    reminder_sent_for = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Último lembrete enviado",
+        help_text="Início da ocorrência cujo lembrete já foi enviado",
+    )
 
     source_installment = models.ForeignKey(
         "finances.Installment",
@@ -67,6 +86,16 @@ class Event(TenantModel, WeddingOwnedMixin):
         verbose_name="Parcela de origem",
         help_text="Parcela financeira que gerou este evento (apenas PAYMENT)",
     )
+    template_key = models.CharField(
+        max_length=50,
+        blank=True,
+        editable=False,
+        verbose_name="Item de template",
+        help_text="Chave do item do template de cronograma que gerou este registro",
+    )
+
+    # Início e recorrência lidos do banco (ver ``schedule_reminder``).
+    _loaded_series: tuple[datetime | None, str] | None = None
 
     class Meta:
         verbose_name = "Evento"
@@ -74,10 +103,136 @@ class Event(TenantModel, WeddingOwnedMixin):
         ordering = ["start_time"]
         indexes = [
             models.Index(fields=["company", "start_time"]),
+            # Feed de alterações e exportação incremental.
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["wedding", "start_time"]),
             models.Index(fields=["event_type"]),
             models.Index(fields=["start_time"]),
+            # Séries recorrentes iniciadas até o fim da janela (expansão).
+            models.Index(fields=["company", "recurrence_rule", "start_time"]),
+            # Fila de lembretes: só as linhas com lembrete pendente.
+            models.Index(
+                fields=["reminder_at"],
+                name="scheduler_event_reminder_due",
+                condition=models.Q(reminder_at__isnull=False),
+            ),
         ]
 
     def __str__(self) -> str:
         return self.title
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Any, values: Any) -> "Event":
+        instance = super().from_db(db, field_names, values)
+        if not {"start_time", "recurrence_rule"} & instance.get_deferred_fields():
+            instance._loaded_series = instance._series()
+        return instance
+
+    def _series(self) -> tuple[datetime | None, str]:
+        return self.start_time, self.recurrence_rule
+
+    def schedule_reminder(self) -> None:
+        """
+        Recalcula ``reminder_at`` a partir do estado atual do evento.
+
+        Se o início ou a recorrência mudaram desde a leitura do banco, o
+        lembrete já enviado pertence à agenda antiga e é esquecido: um evento
+        antecipado (ou uma série nova) volta a ter lembrete.
+        """
+        if self._loaded_series not in (None, self._series()):
+            self.reminder_sent_for = None
+        self.reminder_at = self.next_reminder_at()
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Recalcula ``reminder_at`` e versiona o calendário do casamento."""
+        self.schedule_reminder()
+        super().save(*args, **kwargs)
+        self._loaded_series = self._series()
+        touch_wedding_events(self.wedding_id)
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        touch_wedding_events(self.wedding_id)
+        return result
+
+    def next_reminder_at(self, after: datetime | None = None) -> datetime | None:
+        """
+        Horário do lembrete da próxima ocorrência ainda não lembrada.
+
+        Considera apenas ocorrências que começam depois de ``after`` e depois
+        da última já lembrada (``reminder_sent_for``). Se o horário do lembrete
+        já passou mas a ocorrência não começou, o lembrete fica vencido e sai
+        no próximo ciclo do despachante.
+
+        Args:
+            after: Instante de referência (padrão: agora).
+
+        Returns:
+            O horário do lembrete ou None se não houver lembrete pendente.
+        """
+        if not self.reminder_enabled or self.start_time is None:
+            return None
+        after = after or timezone.now()
+        if self.reminder_sent_for is not None:
+            after = max(after, self.reminder_sent_for)
+        start = next_occurrence_start(self.start_time, self.recurrence_rule, after)
+        if start is None:
+            return None
+        return start - timedelta(minutes=self.reminder_minutes_before)
+
+
+class EventException(TenantModel, WeddingOwnedMixin):
+    """
+    Exceção de uma ocorrência de evento recorrente.
+
+    Identifica a ocorrência pelo início original (``original_start``) e a
+    cancela ou sobrescreve título, local e horários apenas naquela data.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="exceptions",
+        verbose_name="Evento recorrente",
+    )
+    original_start = models.DateTimeField(verbose_name="Início original")
+    is_cancelled = models.BooleanField(default=False, verbose_name="Cancelada?")
+
+    title = models.CharField(max_length=255, blank=True, verbose_name="Título")
+    location = models.CharField(max_length=255, blank=True, verbose_name="Local")
+    start_time = models.DateTimeField(null=True, blank=True, verbose_name="Novo início")
+    end_time = models.DateTimeField(null=True, blank=True, verbose_name="Novo fim")
+
+    class Meta:
+        verbose_name = "Exceção de Evento"
+        verbose_name_plural = "Exceções de Eventos"
+        ordering = ["original_start"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "original_start"],
+                name="unique_event_exception_per_occurrence",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["event", "original_start"]),
+            models.Index(fields=["event", "start_time"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_id} @ {self.original_start:%Y-%m-%d %H:%M}"
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        super().save(*args, **kwargs)
+        touch_wedding_events(self.wedding_id)
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        touch_wedding_events(self.wedding_id)
+        return result
+
+
+def touch_wedding_events(wedding_id: int) -> None:
+    """Incrementa a versão dos eventos do casamento (ETag do feed iCalendar)."""
+    from apps.weddings.models import Wedding
+
+    Wedding.objects.filter(pk=wedding_id).bump_events_version()
@@ -0,0 +1,57 @@
+import secrets
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from apps.tenants.models import TenantModel
+
+
+def generate_feed_token() -> str:
+    """Token opaco e não adivinhável usado na URL pública do feed."""
+    return secrets.token_urlsafe(32)
+
+
+class CalendarFeed(TenantModel):
+    """
+    Assinatura iCalendar (.ics) do calendário do tenant ou de um casamento.
+
+    Clientes como Google Calendar e Outlook não enviam o JWT: o acesso é pelo
+    token na URL. Excluir o feed revoga a assinatura.
+    """
+
+    token = models.CharField(
+        max_length=64,
+        unique=True,
+        default=generate_feed_token,
+        editable=False,
+        verbose_name="Token",
+    )
+    wedding = models.ForeignKey(
+        "weddings.Wedding",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="calendar_feeds",
+        verbose_name="Casamento",
+        help_text="Vazio: todos os casamentos do tenant",
+    )
+    name = models.CharField(max_length=255, blank=True, verbose_name="Nome")
+
+    class Meta:
+        verbose_name = "Feed de Calendário"
+        verbose_name_plural = "Feeds de Calendário"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["company", "wedding"]),
+        ]
+
+    def __str__(self) -> str:
+        return self.name or f"Feed {self.uuid}"
+
+    def clean(self) -> None:
+        """Garante que o casamento do feed pertence ao mesmo tenant."""
+        super().clean()
+        if self.wedding is not None and self.wedding.company_id != self.company_id:
+            raise ValidationError(
+                {"wedding": "Este casamento pertence a outra organização."}
+            )
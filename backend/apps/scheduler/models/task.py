@@ -14,6 +14,13 @@ class Task(TenantModel, WeddingOwnedMixin):
     description = models.TextField(blank=True, verbose_name="Descrição detalhada")
     due_date = models.DateField(null=True, blank=True, verbose_name="Prazo Estimado")
     is_completed = models.BooleanField(default=False, verbose_name="Concluída?")
+    template_key = models.CharField(
+        max_length=50,
+        blank=True,
+        editable=False,
+        verbose_name="Item de template",
+        help_text="Chave do item do template de cronograma que gerou este registro",
+    )
 
     class Meta:
         verbose_name = "Tarefa"
@@ -21,6 +28,7 @@ class Task(TenantModel, WeddingOwnedMixin):
         ordering = ["is_completed", "due_date", "created_at"]
         indexes = [
             models.Index(fields=["company", "is_completed"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["wedding", "is_completed"]),
             models.Index(fields=["due_date"]),
         ]
@@ -0,0 +1,128 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from apps.core.mixins import WeddingOwnedMixin
+from apps.tenants.models import TenantModel
+
+
+class ScheduleTemplate(TenantModel):
+    """
+    Template de cronograma definido pelo tenant (UC08).
+
+    O conteúdo fica nas versões (ScheduleTemplateVersion), imutáveis: editar
+    o template publica uma nova versão. Um ``key`` igual ao de um template
+    embutido o substitui para o tenant.
+    """
+
+    key = models.SlugField(
+        max_length=50,
+        verbose_name="Identificador",
+        help_text="Valor informado em Wedding.template",
+    )
+    name = models.CharField(max_length=255, verbose_name="Nome")
+    description = models.TextField(blank=True, verbose_name="Descrição")
+
+    class Meta:
+        verbose_name = "Template de Cronograma"
+        verbose_name_plural = "Templates de Cronograma"
+        ordering = ["name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "key"], name="unique_schedule_template_key"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class ScheduleTemplateVersion(TenantModel):
+    """
+    Versão publicada (imutável) do conteúdo de um template de cronograma.
+
+    Cada item tem um ``key`` estável dentro do template: é por ele que a
+    reaplicação de uma versão nova compara e atualiza os objetos do casamento.
+    """
+
+    template = models.ForeignKey(
+        ScheduleTemplate,
+        on_delete=models.CASCADE,
+        related_name="versions",
+        verbose_name="Template",
+    )
+    number = models.PositiveIntegerField(verbose_name="Versão")
+    events = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Eventos",
+        help_text="[{key, title, event_type, offset_days}]",
+    )
+    tasks = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Tarefas",
+        help_text="[{key, title, description, offset_days}]",
+    )
+    budget_categories = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Categorias de orçamento",
+        help_text="[{key, name, description}]",
+    )
+
+    class Meta:
+        verbose_name = "Versão de Template de Cronograma"
+        verbose_name_plural = "Versões de Templates de Cronograma"
+        ordering = ["template", "-number"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["template", "number"],
+                name="unique_schedule_template_version_number",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.template_id} v{self.number}"
+
+    def clean(self) -> None:
+        """Garante que a versão pertence ao mesmo tenant do template."""
+        super().clean()
+        if self.template.company_id != self.company_id:
+            raise ValidationError(
+                {"template": "Este template pertence a outra organização."}
+            )
+
+
+class TemplateApplication(TenantModel, WeddingOwnedMixin):
+    """
+    Template (e versão) aplicado a um casamento.
+
+    Guarda o ponto de partida da reaplicação incremental: a diferença entre a
+    versão aplicada e a nova define o que inserir, atualizar ou remover.
+    ``version`` vazio indica um template embutido (``template_key``).
+    """
+
+    template_key = models.SlugField(max_length=50, verbose_name="Template")
+    version = models.ForeignKey(
+        ScheduleTemplateVersion,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="applications",
+        verbose_name="Versão aplicada",
+    )
+
+    class Meta:
+        verbose_name = "Aplicação de Template"
+        verbose_name_plural = "Aplicações de Templates"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wedding"], name="unique_template_application_per_wedding"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["company", "template_key"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.template_key} -> {self.wedding_id}"
@@ -0,0 +1,103 @@
+"""
+Regras de recorrência de eventos do calendário, sem acesso ao banco.
+
+A recorrência segue o horário local (``TIME_ZONE``): uma reunião semanal às
+10h continua às 10h após mudanças de fuso/horário de verão. O primeiro índice
+da série dentro de uma janela é calculado aritmeticamente, sem percorrer as
+ocorrências anteriores.
+
+Os valores das regras espelham ``Event.RecurrenceChoices`` (este módulo é
+importado pelo próprio model e pelas migrations).
+"""
+
+import calendar
+import itertools
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+
+NONE = "none"
+WEEKLY = "semanal"
+BIWEEKLY = "quinzenal"
+MONTHLY = "mensal"
+
+RECURRING_RULES = [WEEKLY, BIWEEKLY, MONTHLY]
+
+_STEP_DAYS = {WEEKLY: 7, BIWEEKLY: 14}
+
+# Uma janela maior que o maior passo (mensal) sempre contém a próxima ocorrência.
+_NEXT_OCCURRENCE_HORIZON = timedelta(days=62)
+
+
+def next_occurrence_start(
+    first_start: datetime, rule: str, after: datetime
+) -> datetime | None:
+    """
+    Início da primeira ocorrência estritamente posterior a ``after``.
+
+    Args:
+        first_start: Início da primeira ocorrência da série.
+        rule: Regra de recorrência (valor de ``Event.RecurrenceChoices``).
+        after: Instante de referência.
+
+    Returns:
+        O início da próxima ocorrência, ou None se o evento não recorrente
+        já começou.
+    """
+    if rule not in RECURRING_RULES:
+        return first_start if first_start > after else None
+    window_start = after + timedelta(microseconds=1)
+    starts = occurrence_starts(
+        first_start, rule, window_start, window_start + _NEXT_OCCURRENCE_HORIZON
+    )
+    return next(starts, None)
+
+
+def occurrence_starts(
+    first_start: datetime, rule: str, window_start: datetime, window_end: datetime
+) -> Iterator[datetime]:
+    """
+    Gera os inícios de uma série recorrente dentro de [window_start, window_end].
+
+    Args:
+        first_start: Início da primeira ocorrência da série.
+        rule: Regra de recorrência (valor de ``Event.RecurrenceChoices``).
+        window_start: Início da janela (inclusive).
+        window_end: Fim da janela (inclusive).
+
+    Returns:
+        Gerador dos inícios, em ordem crescente.
+    """
+    tz = timezone.get_current_timezone()
+    base = timezone.localtime(first_start, tz).replace(tzinfo=None)
+    lower = timezone.localtime(max(first_start, window_start), tz).replace(tzinfo=None)
+    upper = timezone.localtime(window_end, tz).replace(tzinfo=None)
+
+    if rule == MONTHLY:
+        months = (lower.year - base.year) * 12 + lower.month - base.month
+        index = max(months - 1, 0)
+        candidates: Iterator[datetime] = (
+            _add_months(base, n) for n in itertools.count(index)
+        )
+    elif rule in _STEP_DAYS:
+        step = timedelta(days=_STEP_DAYS[rule])
+        index = max((lower - base) // step, 0)
+        candidates = (base + step * n for n in itertools.count(index))
+    else:
+        return
+
+    for naive in candidates:
+        if naive > upper:
+            return
+        if naive >= lower:
+            yield timezone.make_aware(naive, tz)
+
+
+def _add_months(base: datetime, months: int) -> datetime:
+    """Soma meses mantendo o dia, limitado ao último dia do mês (31 -> 30/28)."""
+    month_index = base.month - 1 + months
+    year, month = base.year + month_index // 12, month_index % 12 + 1
+    day = min(base.day, calendar.monthrange(year, month)[1])
+    return base.replace(year=year, month=month, day=day)
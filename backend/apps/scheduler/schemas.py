@@ -1,8 +1,17 @@
 from datetime import date, datetime
+from typing import Any
+from uuid import UUID
 
+from django.urls import reverse
 from ninja import Schema
 from pydantic import UUID4, Field, model_validator
 
+from apps.scheduler.models import (
+    CalendarFeed,
+    ScheduleTemplate,
+    ScheduleTemplateVersion,
+)
+
 
 class EventIn(Schema):
     wedding: UUID4
@@ -74,6 +83,144 @@ class EventOut(Schema):
     reminder_minutes_before: int
 
 
+class EventOccurrenceOut(Schema):
+    event: UUID4 = Field(alias="event.uuid")
+    wedding: UUID4 = Field(alias="event.wedding.uuid")
+    title: str
+    location: str | None = None
+    event_type: str = Field(alias="event.event_type")
+    recurrence_rule: str = Field(alias="event.recurrence_rule")
+    start_time: datetime
+    end_time: datetime | None = None
+    original_start: datetime
+    is_exception: bool
+
+
+class EventExceptionIn(Schema):
+    original_start: datetime
+    is_cancelled: bool = False
+    title: str = Field(default="", max_length=255)
+    location: str = Field(default="", max_length=255)
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+
+    @model_validator(mode="after")
+    def validate_exception(self) -> "EventExceptionIn":
+        if self.start_time and self.end_time and self.end_time < self.start_time:
+            raise ValueError(
+                "A hora de término não pode ser anterior à hora de início."
+            )
+        return self
+
+
+class EventExceptionOut(Schema):
+    uuid: UUID4
+    event: UUID4 = Field(alias="event.uuid")
+    original_start: datetime
+    is_cancelled: bool
+    title: str
+    location: str
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+
+
+class CalendarFeedIn(Schema):
+    wedding: UUID4 | None = None
+    name: str = Field(default="", max_length=255)
+
+
+class CalendarFeedOut(Schema):
+    uuid: UUID4
+    wedding: UUID4 | None = None
+    name: str
+    url: str
+    created_at: datetime
+
+    @staticmethod
+    def resolve_wedding(obj: CalendarFeed) -> UUID | None:
+        return obj.wedding.uuid if obj.wedding is not None else None
+
+    @staticmethod
+    def resolve_url(obj: CalendarFeed, context: dict[str, Any]) -> str:
+        path = reverse("api-1.0.0:scheduler_feeds_ics", kwargs={"token": obj.token})
+        return str(context["request"].build_absolute_uri(path))
+
+
+class TemplateEventIn(Schema):
+    key: str = Field(..., max_length=50, pattern=r"^[-a-z0-9_]+$")
+    title: str = Field(..., min_length=1, max_length=255)
+    event_type: str = Field(..., max_length=50)
+    offset_days: int = Field(..., ge=0, description="Dias antes do casamento")
+
+
+class TemplateTaskIn(Schema):
+    key: str = Field(..., max_length=50, pattern=r"^[-a-z0-9_]+$")
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str = ""
+    offset_days: int | None = Field(
+        default=None, ge=0, description="Prazo em dias antes do casamento"
+    )
+
+
+class TemplateBudgetCategoryIn(Schema):
+    key: str = Field(..., max_length=50, pattern=r"^[-a-z0-9_]+$")
+    name: str = Field(..., min_length=1, max_length=100)
+    description: str = ""
+
+
+class ScheduleTemplateVersionIn(Schema):
+    events: list[TemplateEventIn] = Field(default_factory=list)
+    tasks: list[TemplateTaskIn] = Field(default_factory=list)
+    budget_categories: list[TemplateBudgetCategoryIn] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_unique_keys(self) -> "ScheduleTemplateVersionIn":
+        for items in (self.events, self.tasks, self.budget_categories):
+            keys = [item.key for item in items]
+            if len(keys) != len(set(keys)):
+                raise ValueError("As chaves dos itens do template devem ser únicas.")
+        names = [category.name for category in self.budget_categories]
+        if len(names) != len(set(names)):
+            raise ValueError("Os nomes das categorias do template devem ser únicos.")
+        return self
+
+
+class ScheduleTemplateIn(Schema):
+    key: str = Field(..., max_length=50, pattern=r"^[-a-z0-9_]+$")
+    name: str = Field(..., min_length=1, max_length=255)
+    description: str = ""
+    version: ScheduleTemplateVersionIn
+
+
+class ScheduleTemplateVersionOut(Schema):
+    number: int
+    events: list[TemplateEventIn]
+    tasks: list[TemplateTaskIn]
+    budget_categories: list[TemplateBudgetCategoryIn]
+    created_at: datetime
+
+
+class ScheduleTemplateOut(Schema):
+    uuid: UUID4
+    key: str
+    name: str
+    description: str
+    latest_version: ScheduleTemplateVersionOut | None = None
+
+    @staticmethod
+    def resolve_latest_version(
+        obj: ScheduleTemplate,
+    ) -> ScheduleTemplateVersion | None:
+        versions = getattr(obj, "latest_versions", None)
+        if versions is not None:
+            return versions[0] if versions else None
+        return obj.versions.order_by("-number").first()
+
+
+class TemplateSyncOut(Schema):
+    weddings: int = Field(..., description="Casamentos atualizados para a versão")
+
+
 class TaskIn(Schema):
     wedding: UUID4
     title: str = Field(..., max_length=255)
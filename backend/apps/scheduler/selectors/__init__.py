@@ -1,14 +1,40 @@
 from .event_selectors import event_get_selector, event_list_selector
+from .feed_selectors import (
+    CalendarFeedVersion,
+    calendar_feed_by_token_selector,
+    calendar_feed_events_selector,
+    calendar_feed_get_selector,
+    calendar_feed_list_selector,
+    calendar_feed_version_selector,
+)
+from .occurrence_selectors import (
+    EventOccurrence,
+    event_occurrences_selector,
+)
 from .task_selectors import (
     task_get_selector,
     task_list_selector,
     task_urgent_list_selector,
 )
+from .template_selectors import (
+    schedule_template_get_selector,
+    schedule_template_list_selector,
+)
 
 
 __all__ = [
+    "CalendarFeedVersion",
+    "EventOccurrence",
+    "calendar_feed_by_token_selector",
+    "calendar_feed_events_selector",
+    "calendar_feed_get_selector",
+    "calendar_feed_list_selector",
+    "calendar_feed_version_selector",
     "event_get_selector",
     "event_list_selector",
+    "event_occurrences_selector",
+    "schedule_template_get_selector",
+    "schedule_template_list_selector",
     "task_get_selector",
     "task_list_selector",
     "task_urgent_list_selector",
@@ -0,0 +1,157 @@
+"""
+Selectors dos feeds iCalendar (assinaturas .ics) do calendário.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.db.models import Count, Max, QuerySet, Sum
+
+from apps.core.exceptions import ObjectNotFoundError
+from apps.core.shortcuts import get_object_or_404_for_tenant
+from apps.scheduler.ical import FEED_FORMAT_VERSION
+from apps.scheduler.managers import EventQuerySet
+from apps.scheduler.models import CalendarFeed, Event, EventException
+from apps.weddings.models import Wedding
+
+
+if TYPE_CHECKING:
+    from apps.tenants.models import Company
+
+
+@dataclass(frozen=True)
+class CalendarFeedVersion:
+    """Validadores HTTP do conteúdo atual de um feed."""
+
+    etag: str
+    last_modified: datetime
+
+
+def calendar_feed_list_selector(*, company: Company) -> QuerySet[CalendarFeed]:
+    """
+    Lista os feeds de calendário do tenant.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        QuerySet de CalendarFeed, dos mais recentes para os mais antigos.
+    """
+    return CalendarFeed.objects.for_tenant(company).select_related("wedding")
+
+
+def calendar_feed_get_selector(*, company: Company, uuid: UUID | str) -> CalendarFeed:
+    """
+    Recupera um feed pelo UUID, garantindo o isolamento multitenant.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        uuid: O identificador único do feed.
+
+    Returns:
+        A instância do CalendarFeed encontrado.
+
+    Raises:
+        ObjectNotFoundError: Se o feed não existir ou pertencer a outro tenant.
+    """
+    return get_object_or_404_for_tenant(
+        CalendarFeed,
+        company,
+        uuid,
+        select_related=["wedding"],
+        code="calendar_feed_not_found_or_denied",
+    )
+
+
+def calendar_feed_by_token_selector(*, token: str) -> CalendarFeed:
+    """
+    Recupera um feed pelo token público da URL de assinatura.
+
+    Único acesso sem JWT: o token identifica o tenant (e o casamento).
+
+    Args:
+        token: Token opaco do feed.
+
+    Returns:
+        A instância do CalendarFeed, com company e wedding carregados.
+
+    Raises:
+        ObjectNotFoundError: Se não houver feed com o token (ou foi revogado).
+    """
+    feed = (
+        CalendarFeed.objects.select_related("company", "wedding")
+        .filter(token=token)
+        .first()
+    )
+    if feed is None:
+        raise ObjectNotFoundError(
+            detail="Feed de calendário não encontrado.",
+            code="calendar_feed_not_found",
+        )
+    return feed
+
+
+def calendar_feed_version_selector(*, feed: CalendarFeed) -> CalendarFeedVersion:
+    """
+    Calcula ETag e Last-Modified do feed sem carregar os eventos.
+
+    Usa o contador ``Wedding.events_version``, incrementado a cada alteração
+    nos eventos ou exceções do casamento. No feed do tenant, o agregado dos
+    casamentos (soma das versões, quantidade e última alteração) muda sempre
+    que algum calendário muda, inclusive quando um casamento é excluído.
+
+    Args:
+        feed: O feed consultado.
+
+    Returns:
+        CalendarFeedVersion com o ETag forte e a data da última alteração.
+    """
+    weddings = Wedding.objects.for_tenant(feed.company)
+    if feed.wedding_id:
+        weddings = weddings.filter(pk=feed.wedding_id)
+    state = weddings.aggregate(
+        version=Sum("events_version"),
+        count=Count("pk"),
+        changed_at=Max("events_changed_at"),
+    )
+
+    last_modified = state["changed_at"] or feed.created_at
+    fingerprint = (
+        f"{FEED_FORMAT_VERSION}:{feed.token}:{state['version'] or 0}:"
+        f"{state['count']}:{last_modified.isoformat()}"
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:32]
+    return CalendarFeedVersion(etag=f'"{digest}"', last_modified=last_modified)
+
+
+def calendar_feed_events_selector(
+    *, feed: CalendarFeed
+) -> tuple[EventQuerySet, dict[int, list[EventException]]]:
+    """
+    Eventos do feed (inclusive os de pagamento) e suas exceções de ocorrência.
+
+    Os eventos vêm como QuerySet ordenado, para iteração em lotes; as exceções,
+    bem menos numerosas, são carregadas de uma vez e agrupadas por evento.
+
+    Args:
+        feed: O feed consultado.
+
+    Returns:
+        Tupla (eventos, exceções agrupadas por ``event_id``).
+    """
+    events = Event.objects.for_tenant(feed.company)
+    exceptions = EventException.objects.for_tenant(feed.company)
+    if feed.wedding_id:
+        events = events.filter(wedding_id=feed.wedding_id)
+        exceptions = exceptions.filter(wedding_id=feed.wedding_id)
+
+    grouped: dict[int, list[EventException]] = defaultdict(list)
+    for exception in exceptions.order_by("original_start"):
+        grouped[exception.event_id].append(exception)
+    return events.chronological(), grouped
@@ -0,0 +1,198 @@
+"""
+Expansão de eventos recorrentes em ocorrências para consultas de calendário.
+
+As séries (``Event.recurrence_rule`` != ``none``) não são materializadas: para
+uma janela ``start_date``/``end_date`` cada série gera, sob demanda, apenas as
+ocorrências dentro da janela. O primeiro índice da série na janela é calculado
+aritmeticamente, então o custo cresce com o tamanho da janela e não com a
+idade da série. Os geradores são intercalados por ``start_time`` com os
+eventos avulsos e com as exceções remarcadas (``EventException``).
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.recurrence import RECURRING_RULES, occurrence_starts
+
+
+if TYPE_CHECKING:
+    from apps.tenants.models import Company
+
+
+# Janela máxima aceita numa consulta de ocorrências (em dias).
+MAX_OCCURRENCE_WINDOW_DAYS = 366
+
+
+@dataclass(frozen=True)
+class EventOccurrence:
+    """Ocorrência de um evento no calendário (avulso, da série ou exceção)."""
+
+    event: Event
+    start_time: datetime
+    end_time: datetime | None
+    title: str
+    location: str
+    original_start: datetime
+    is_exception: bool = False
+
+
+def event_occurrences_selector(
+    *,
+    company: Company,
+    start_date: date,
+    end_date: date,
+    wedding_id: UUID | str | None = None,
+) -> Iterator[EventOccurrence]:
+    """
+    Lista as ocorrências de eventos na janela, em ordem de ``start_time``.
+
+    Eventos avulsos vêm do banco já ordenados; séries recorrentes iniciadas até
+    o fim da janela são expandidas preguiçosamente, com as exceções por
+    ocorrência (canceladas ou remarcadas) aplicadas.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        start_date: Primeiro dia da janela (inclusive).
+        end_date: Último dia da janela (inclusive).
+        wedding_id: Identificador opcional do casamento para filtragem.
+
+    Returns:
+        Gerador de EventOccurrence ordenado por início.
+
+    Raises:
+        BusinessRuleViolation: Se a janela for invertida ou maior que
+            MAX_OCCURRENCE_WINDOW_DAYS.
+    """
+    if end_date < start_date:
+        raise BusinessRuleViolation(
+            detail="A data final não pode ser anterior à data inicial.",
+            code="occurrence_window_invalid",
+        )
+    if (end_date - start_date).days >= MAX_OCCURRENCE_WINDOW_DAYS:
+        raise BusinessRuleViolation(
+            detail=(
+                f"A janela de consulta é limitada a {MAX_OCCURRENCE_WINDOW_DAYS} dias."
+            ),
+            code="occurrence_window_too_large",
+        )
+
+    window_start = timezone.make_aware(datetime.combine(start_date, time.min))
+    window_end = timezone.make_aware(datetime.combine(end_date, time.max))
+
+    qs = Event.objects.for_tenant(company).select_related("wedding", "company")
+    if wedding_id:
+        qs = qs.for_wedding(wedding_id)
+
+    single = (
+        qs.filter(recurrence_rule=Event.RecurrenceChoices.NONE)
+        .in_period(window_start, window_end)
+        .chronological()
+    )
+    series = list(
+        qs.filter(
+            recurrence_rule__in=RECURRING_RULES, start_time__lte=window_end
+        ).chronological()
+    )
+
+    streams: list[Iterable[EventOccurrence]] = [
+        _single_occurrences(single.iterator(chunk_size=500))
+    ]
+    if series:
+        skipped, moved = _load_exceptions(series, window_start, window_end)
+        streams.extend(
+            _expand_series(event, window_start, window_end, skipped) for event in series
+        )
+        streams.append(moved)
+
+    return heapq.merge(*streams, key=lambda occurrence: occurrence.start_time)
+
+
+def _single_occurrences(events: Iterable[Event]) -> Iterator[EventOccurrence]:
+    for event in events:
+        yield EventOccurrence(
+            event=event,
+            start_time=event.start_time,
+            end_time=event.end_time,
+            title=event.title,
+            location=event.location,
+            original_start=event.start_time,
+        )
+
+
+def _load_exceptions(
+    series: list[Event], window_start: datetime, window_end: datetime
+) -> tuple[set[tuple[int, datetime]], list[EventOccurrence]]:
+    """
+    Busca as exceções relevantes para a janela numa única query.
+
+    Returns:
+        As chaves (event_id, original_start) a omitir da expansão e as
+        ocorrências remarcadas que caem na janela, já ordenadas.
+    """
+    by_id = {event.pk: event for event in series}
+    exceptions = EventException.objects.filter(event_id__in=by_id).filter(
+        Q(original_start__range=(window_start, window_end))
+        | Q(start_time__range=(window_start, window_end))
+    )
+
+    skipped: set[tuple[int, datetime]] = set()
+    moved: list[EventOccurrence] = []
+    for exception in exceptions:
+        skipped.add((exception.event_id, exception.original_start))
+        if exception.is_cancelled:
+            continue
+
+        event = by_id[exception.event_id]
+        start = exception.start_time or exception.original_start
+        if not window_start <= start <= window_end:
+            continue
+        end = exception.end_time
+        if end is None and event.end_time is not None:
+            end = start + (event.end_time - event.start_time)
+        moved.append(
+            EventOccurrence(
+                event=event,
+                start_time=start,
+                end_time=end,
+                title=exception.title or event.title,
+                location=exception.location or event.location,
+                original_start=exception.original_start,
+                is_exception=True,
+            )
+        )
+    moved.sort(key=lambda occurrence: occurrence.start_time)
+    return skipped, moved
+
+
+def _expand_series(
+    event: Event,
+    window_start: datetime,
+    window_end: datetime,
+    skipped: set[tuple[int, datetime]],
+) -> Iterator[EventOccurrence]:
+    """Gera as ocorrências da série dentro da janela, pulando as exceções."""
+    duration = event.end_time - event.start_time if event.end_time else None
+    for start in occurrence_starts(
+        event.start_time, event.recurrence_rule, window_start, window_end
+    ):
+        if (event.pk, start) in skipped:
+            continue
+        yield EventOccurrence(
+            event=event,
+            start_time=start,
+            end_time=start + duration if duration is not None else None,
+            title=event.title,
+            location=event.location,
+            original_start=start,
+        )
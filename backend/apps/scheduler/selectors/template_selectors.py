@@ -0,0 +1,69 @@
+"""
+Selectors dos templates de cronograma definidos pelo tenant.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.db.models import Prefetch, QuerySet
+
+from apps.core.shortcuts import get_object_or_404_for_tenant
+from apps.scheduler.models import ScheduleTemplate, ScheduleTemplateVersion
+
+
+if TYPE_CHECKING:
+    from apps.tenants.models import Company
+
+
+def _with_latest_versions(
+    qs: QuerySet[ScheduleTemplate],
+) -> QuerySet[ScheduleTemplate]:
+    # As versões ficam em ``latest_versions``, da mais recente para a mais antiga.
+    return qs.prefetch_related(
+        Prefetch(
+            "versions",
+            queryset=ScheduleTemplateVersion.objects.order_by("-number"),
+            to_attr="latest_versions",
+        )
+    )
+
+
+def schedule_template_list_selector(*, company: Company) -> QuerySet[ScheduleTemplate]:
+    """
+    Lista os templates de cronograma do tenant com suas versões.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        QuerySet de ScheduleTemplate ordenado por nome.
+    """
+    return _with_latest_versions(ScheduleTemplate.objects.for_tenant(company))
+
+
+def schedule_template_get_selector(
+    *, company: Company, uuid: UUID | str
+) -> ScheduleTemplate:
+    """
+    Recupera um template de cronograma pelo UUID, garantindo o isolamento
+    multitenant.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        uuid: O identificador único do template.
+
+    Returns:
+        A instância do ScheduleTemplate encontrado.
+
+    Raises:
+        ObjectNotFoundError: Se o template não existir ou pertencer a outro
+            tenant.
+    """
+    return get_object_or_404_for_tenant(
+        ScheduleTemplate,
+        company,
+        uuid,
+        code="schedule_template_not_found_or_denied",
+    )
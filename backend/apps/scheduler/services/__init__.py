@@ -1,5 +1,12 @@
 from .events import EventService
+from .feeds import CalendarFeedService
+from .schedule_templates import ScheduleTemplateService
 from .tasks import TaskService
 
 
-__all__ = ["EventService", "TaskService"]
+__all__ = [
+    "CalendarFeedService",
+    "EventService",
+    "ScheduleTemplateService",
+    "TaskService",
+]
@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Any
 
 from django.db import transaction
@@ -9,8 +10,11 @@ from apps.core.exceptions import (
 )
 from apps.core.shortcuts import resolve_tenant_resource
 from apps.core.tenant import validate_tenant_ownership
-from apps.scheduler.models import Event
-from apps.scheduler.schemas import EventIn, EventPatchIn
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.models.event import touch_wedding_events
+from apps.scheduler.recurrence import occurrence_starts
+from apps.scheduler.schemas import EventExceptionIn, EventIn, EventPatchIn
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 from apps.weddings.models import Wedding
 
@@ -156,11 +160,20 @@ class EventService:
         data.pop("wedding", None)
         data.pop("company", None)
 
+        series_changed = any(
+            field in data and data[field] != getattr(instance, field)
+            for field in ("start_time", "recurrence_rule")
+        )
+
         for field, value in data.items():
             setattr(instance, field, value)
 
         instance.save()
 
+        # Exceções apontam para inícios da série antiga: deixam de valer.
+        if series_changed:
+            instance.exceptions.all().delete()
+
         logger.info(f"Evento uuid={instance.uuid} atualizado com sucesso.")
         return instance
 
@@ -199,7 +212,103 @@ class EventService:
                 code="payment_event_readonly",
             )
 
-        instance.delete()
+        TombstoneService.delete(company, instance)
         logger.warning(
             f"Evento uuid={instance.uuid} DESTRUÍDO por company_id={company.id}"
         )
+
+    @staticmethod
+    @transaction.atomic
+    def set_occurrence_exception(
+        company: Company, instance: Event, payload: EventExceptionIn
+    ) -> EventException:
+        """
+        Cancela ou altera uma única ocorrência de um evento recorrente.
+
+        Regrava a exceção se a ocorrência já tiver uma.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: O evento recorrente (série).
+            payload: Início original da ocorrência e os campos sobrescritos.
+
+        Returns:
+            A exceção criada ou atualizada.
+
+        Raises:
+            ObjectNotFoundError: Se o evento pertencer a outro tenant.
+            BusinessRuleViolation: Se o evento não for recorrente ou se
+                ``original_start`` não for uma ocorrência da série.
+        """
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Evento não encontrado ou acesso negado.",
+            code="event_not_found_or_denied",
+        )
+        data = payload.model_dump()
+        original_start: datetime = data.pop("original_start")
+        _ensure_occurrence(instance, original_start)
+
+        exception = EventException.objects.filter(
+            event=instance, original_start=original_start
+        ).first() or EventException(
+            company=company,
+            wedding_id=instance.wedding_id,
+            event=instance,
+            original_start=original_start,
+        )
+        for field, value in data.items():
+            setattr(exception, field, value)
+        exception.save()
+
+        logger.info(
+            f"Exceção de ocorrência gravada: evento uuid={instance.uuid} "
+            f"original_start={original_start.isoformat()}"
+        )
+        return exception
+
+    @staticmethod
+    @transaction.atomic
+    def clear_occurrence_exception(
+        company: Company, instance: Event, original_start: datetime
+    ) -> None:
+        """
+        Restaura uma ocorrência da série, removendo a sua exceção (se houver).
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: O evento recorrente (série).
+            original_start: Início original da ocorrência.
+
+        Raises:
+            ObjectNotFoundError: Se o evento pertencer a outro tenant.
+        """
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Evento não encontrado ou acesso negado.",
+            code="event_not_found_or_denied",
+        )
+        deleted, _ = EventException.objects.filter(
+            event=instance, original_start=original_start
+        ).delete()
+        if deleted:
+            touch_wedding_events(instance.wedding_id)
+
+
+def _ensure_occurrence(instance: Event, original_start: datetime) -> None:
+    """Garante que ``original_start`` é o início de uma ocorrência da série."""
+    if instance.recurrence_rule == Event.RecurrenceChoices.NONE:
+        raise BusinessRuleViolation(
+            detail="Apenas eventos recorrentes possuem ocorrências.",
+            code="event_not_recurring",
+        )
+    starts = occurrence_starts(
+        instance.start_time, instance.recurrence_rule, original_start, original_start
+    )
+    if next(starts, None) != original_start:
+        raise BusinessRuleViolation(
+            detail="A data informada não corresponde a uma ocorrência do evento.",
+            code="event_occurrence_not_found",
+        )
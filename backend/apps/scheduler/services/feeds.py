@@ -0,0 +1,80 @@
+import logging
+
+from django.db import transaction
+
+from apps.core.shortcuts import resolve_tenant_resource
+from apps.core.tenant import validate_tenant_ownership
+from apps.scheduler.models import CalendarFeed
+from apps.scheduler.schemas import CalendarFeedIn
+from apps.tenants.models import Company
+from apps.weddings.models import Wedding
+
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarFeedService:
+    """
+    Camada de serviço para as assinaturas iCalendar (.ics) do calendário.
+    O token do feed dá acesso de leitura sem JWT; excluir o feed o revoga.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def create(company: Company, payload: CalendarFeedIn) -> CalendarFeed:
+        """
+        Cria um feed do calendário do tenant ou de um único casamento.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            payload: Casamento opcional (vazio: todos) e nome do feed.
+
+        Returns:
+            O feed criado, já com o token de acesso gerado.
+
+        Raises:
+            ObjectNotFoundError: Se o casamento informado não for encontrado ou
+                pertencer a outro tenant.
+        """
+        wedding = None
+        if payload.wedding is not None:
+            wedding = resolve_tenant_resource(
+                Wedding,
+                company,
+                payload.wedding,
+                code="wedding_not_found_or_denied",
+                detail="Acesso negado ao casamento.",
+            )
+
+        feed = CalendarFeed(company=company, wedding=wedding, name=payload.name)
+        feed.save()
+
+        logger.info(
+            f"Feed de calendário criado: uuid={feed.uuid} company_id={company.id}"
+        )
+        return feed
+
+    @staticmethod
+    @transaction.atomic
+    def delete(company: Company, instance: CalendarFeed) -> None:
+        """
+        Exclui um feed, revogando o acesso pela URL de assinatura.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: O feed a ser excluído.
+
+        Raises:
+            ObjectNotFoundError: Se o feed pertencer a outro tenant.
+        """
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Feed de calendário não encontrado ou acesso negado.",
+            code="calendar_feed_not_found_or_denied",
+        )
+        instance.delete()
+        logger.warning(
+            f"Feed de calendário uuid={instance.uuid} revogado por "
+            f"company_id={company.id}"
+        )
@@ -0,0 +1,138 @@
+"""
+Despacho dos lembretes de eventos do calendário.
+
+Cada Event guarda o horário do próximo lembrete em ``reminder_at`` (recalculado
+a cada save). A tarefa periódica varre o índice parcial de lembretes pendentes
+em lotes: as linhas vencidas são bloqueadas (``SKIP LOCKED``, sem disputa entre
+workers), as notificações são criadas em lote e o lembrete avança para a
+próxima ocorrência na mesma transação. Assim um lembrete é enviado uma única
+vez, mesmo com vários workers ou após um restart no meio do lote.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.notifications.models import NotificationTargetType, NotificationType
+from apps.notifications.services import NotificationDraft, NotificationService
+from apps.scheduler.models import Event, EventException
+from apps.tenants.models import Company
+from apps.users.models import User
+
+
+logger = logging.getLogger(__name__)
+
+
+class EventReminderService:
+    """Envio dos lembretes automáticos de eventos (RF12)."""
+
+    @staticmethod
+    def dispatch_due(
+        company: Company | None = None, now: datetime | None = None
+    ) -> int:
+        """
+        Envia os lembretes vencidos até ``now``, em lotes.
+
+        Ocorrências que já começaram ou foram canceladas (EventException) não
+        geram lembrete; em todos os casos o evento avança para a próxima
+        ocorrência da série (ou deixa de ter lembrete pendente).
+
+        Args:
+            company: Tenant opcional para restrição de escopo.
+            now: Instante de referência (padrão: agora).
+
+        Returns:
+            int: Quantidade de ocorrências lembradas.
+        """
+        now = now or timezone.now()
+        batch_size = settings.EVENT_REMINDER_BATCH_SIZE
+
+        qs = Event.objects.filter(reminder_at__lte=now).order_by("reminder_at")
+        if company is not None:
+            qs = qs.filter(company=company)
+        qs = qs.select_related("company", "wedding").select_for_update(
+            skip_locked=True, of=("self",)
+        )
+
+        reminded = 0
+        while True:
+            with transaction.atomic():
+                batch = list(qs[:batch_size])
+                if not batch:
+                    break
+                reminded += _dispatch_batch(batch, now)
+
+        if reminded:
+            logger.info(f"{reminded} lembrete(s) de evento enviado(s).")
+        return reminded
+
+
+def _dispatch_batch(events: list[Event], now: datetime) -> int:
+    """
+    Notifica as ocorrências do lote e avança o ``reminder_at`` de cada evento.
+
+    Deve rodar na transação que bloqueou os eventos.
+
+    Returns:
+        int: Quantidade de ocorrências lembradas.
+    """
+    starts = {
+        event.pk: event.reminder_at + timedelta(minutes=event.reminder_minutes_before)
+        for event in events
+        if event.reminder_at is not None
+    }
+    cancelled = set(
+        EventException.objects.filter(
+            event_id__in=starts,
+            original_start__in=set(starts.values()),
+            is_cancelled=True,
+        ).values_list("event_id", "original_start")
+    )
+    due = [
+        event
+        for event in events
+        if starts[event.pk] > now and (event.pk, starts[event.pk]) not in cancelled
+    ]
+
+    recipients: dict[int, list[User]] = defaultdict(list)
+    for user in User.objects.filter(
+        company_id__in={event.company_id for event in due}, is_active=True
+    ):
+        recipients[user.company_id].append(user)
+
+    drafts: dict[int, list[NotificationDraft]] = defaultdict(list)
+    for event in due:
+        for user in recipients[event.company_id]:
+            drafts[event.company_id].append(
+                _reminder_draft(event, starts[event.pk], user)
+            )
+    companies = {event.company_id: event.company for event in due}
+    for company_id, company_drafts in drafts.items():
+        NotificationService.bulk_notify(companies[company_id], company_drafts)
+
+    for event in events:
+        event.reminder_sent_for = starts[event.pk]
+        event.reminder_at = event.next_reminder_at(after=now)
+    Event.objects.bulk_update(events, ["reminder_sent_for", "reminder_at"])
+    return len(due)
+
+
+def _reminder_draft(event: Event, start: datetime, user: User) -> NotificationDraft:
+    local_start = timezone.localtime(start)
+    return NotificationDraft(
+        user=user,
+        title=f"Lembrete: {event.title}",
+        message=(
+            f"'{event.title}' começa em {local_start.strftime('%d/%m/%Y às %H:%M')}"
+            + (f" ({event.location})." if event.location else ".")
+        ),
+        notification_type=NotificationType.EVENT_REMINDER,
+        link=f"/weddings/{event.wedding.uuid}?tab=planning&subtab=timeline",
+        target_type=NotificationTargetType.EVENT,
+        target_id=event.uuid,
+        wedding_id=event.wedding.uuid,
+    )
@@ -0,0 +1,520 @@
+"""
+Aplicação e versionamento dos templates de cronograma (UC08).
+
+Aplicar um template cria, em lote, os eventos, tarefas e categorias de
+orçamento do casamento, marcando cada objeto com o ``template_key`` do item de
+origem. Reaplicar uma versão mais nova compara as duas versões item a item
+(pelo ``key``) e só insere, atualiza ou remove o que mudou: objetos de itens
+inalterados, inclusive os editados pelo Planner, ficam intactos.
+"""
+
+import logging
+from collections.abc import Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+from django.utils import timezone
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.core.tenant import validate_tenant_ownership
+from apps.scheduler.models import (
+    Event,
+    ScheduleTemplate,
+    ScheduleTemplateVersion,
+    Task,
+    TemplateApplication,
+)
+from apps.scheduler.models.event import touch_wedding_events
+from apps.scheduler.schemas import ScheduleTemplateIn, ScheduleTemplateVersionIn
+from apps.scheduler.services.templates import (
+    TEMPLATE_EVENT_TYPES,
+    TEMPLATES,
+    CompiledTemplate,
+    TemplateBudgetCategory,
+    TemplateEvent,
+    TemplateTask,
+    compile_template_version,
+    get_template,
+    resolve_template,
+)
+from apps.sync.services import TombstoneService
+from apps.tenants.models import Company
+from apps.weddings.models import Wedding
+
+
+logger = logging.getLogger(__name__)
+
+# Horário de início dos eventos criados a partir de templates de cronograma.
+TEMPLATE_EVENT_TIME = time(hour=9)
+
+# Validação em memória: company/wedding já resolvidos e uuid recém-gerado.
+_CLEAN_EXCLUDE = ["company", "wedding"]
+
+
+class ScheduleTemplateService:
+    """
+    Camada de serviço dos templates de cronograma do tenant.
+    Publica versões imutáveis e aplica/reaplica templates aos casamentos.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def create(company: Company, payload: ScheduleTemplateIn) -> ScheduleTemplate:
+        """
+        Cria um template do tenant já com a versão 1 publicada.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            payload: Identificador, nome e conteúdo da primeira versão.
+
+        Returns:
+            O template criado.
+
+        Raises:
+            BusinessRuleViolation: Se o ``key`` já estiver em uso no tenant ou
+                o conteúdo for inválido.
+        """
+        if (
+            ScheduleTemplate.objects.for_tenant(company)
+            .filter(key=payload.key)
+            .exists()
+        ):
+            raise BusinessRuleViolation(
+                detail=f"Já existe um template com o identificador '{payload.key}'.",
+                code="schedule_template_key_taken",
+            )
+
+        template = ScheduleTemplate(
+            company=company,
+            key=payload.key,
+            name=payload.name,
+            description=payload.description,
+        )
+        template.save()
+        _publish(company, template, payload.version, number=1)
+
+        logger.info(
+            f"Template de cronograma criado: uuid={template.uuid} "
+            f"key={template.key} company_id={company.id}"
+        )
+        return template
+
+    @staticmethod
+    @transaction.atomic
+    def publish_version(
+        company: Company,
+        template: ScheduleTemplate,
+        payload: ScheduleTemplateVersionIn,
+    ) -> ScheduleTemplateVersion:
+        """
+        Publica uma nova versão do template (as anteriores não mudam).
+
+        Casamentos criados a partir daqui recebem a nova versão; os existentes
+        só mudam ao sincronizar (``sync_weddings``).
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            template: O template a versionar.
+            payload: Conteúdo completo da nova versão.
+
+        Returns:
+            A versão publicada.
+
+        Raises:
+            ObjectNotFoundError: Se o template pertencer a outro tenant.
+            BusinessRuleViolation: Se o conteúdo for inválido.
+        """
+        validate_tenant_ownership(
+            company,
+            template,
+            detail="Template de cronograma não encontrado ou acesso negado.",
+            code="schedule_template_not_found_or_denied",
+        )
+        # Serializa publicações concorrentes do mesmo template (número da versão).
+        ScheduleTemplate.objects.select_for_update().filter(pk=template.pk).first()
+        last = template.versions.aggregate(last=Max("number"))["last"] or 0
+        return _publish(company, template, payload, number=last + 1)
+
+    @staticmethod
+    @transaction.atomic
+    def delete(company: Company, template: ScheduleTemplate) -> None:
+        """
+        Exclui o template e suas versões.
+
+        Os casamentos já criados mantêm eventos, tarefas e categorias; apenas
+        deixam de poder ser sincronizados com o template.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            template: O template a excluir.
+
+        Raises:
+            ObjectNotFoundError: Se o template pertencer a outro tenant.
+        """
+        validate_tenant_ownership(
+            company,
+            template,
+            detail="Template de cronograma não encontrado ou acesso negado.",
+            code="schedule_template_not_found_or_denied",
+        )
+        key = template.key
+        template.delete()
+        logger.warning(
+            f"Template de cronograma key={key} DESTRUÍDO por company_id={company.id}"
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def apply(
+        company: Company, wedding: Wedding, template_name: str
+    ) -> TemplateApplication:
+        """
+        Aplica ao casamento a versão atual do template (do tenant ou embutido).
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            wedding: O casamento (já carregado) que recebe o cronograma.
+            template_name: O ``key`` do template.
+
+        Returns:
+            O registro da aplicação (template e versão aplicados).
+
+        Raises:
+            BusinessRuleViolation: Se o template não existir.
+            ObjectNotFoundError: Se o casamento pertencer a outro tenant.
+        """
+        validate_tenant_ownership(
+            company,
+            wedding,
+            detail="Acesso negado ao casamento.",
+            code="wedding_not_found_or_denied",
+        )
+        target = resolve_template(company, template_name)
+        _sync_wedding(company, wedding, None, target)
+
+        application = TemplateApplication(
+            company=company,
+            wedding=wedding,
+            template_key=template_name,
+            version_id=target.version_id,
+        )
+        application.save()
+
+        logger.info(
+            f"Template '{template_name}' aplicado ao casamento uuid={wedding.uuid}"
+        )
+        return application
+
+    @staticmethod
+    @transaction.atomic
+    def sync_weddings(company: Company, template: ScheduleTemplate) -> int:
+        """
+        Leva à versão mais recente os casamentos com versões anteriores.
+
+        Inclui casamentos criados com o template embutido de mesmo ``key``.
+        Cada casamento recebe apenas a diferença entre a versão aplicada e a
+        nova.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            template: O template cuja última versão será aplicada.
+
+        Returns:
+            int: Quantidade de casamentos atualizados.
+
+        Raises:
+            ObjectNotFoundError: Se o template pertencer a outro tenant.
+        """
+        validate_tenant_ownership(
+            company,
+            template,
+            detail="Template de cronograma não encontrado ou acesso negado.",
+            code="schedule_template_not_found_or_denied",
+        )
+        latest = template.versions.order_by("-number").first()
+        if latest is None:
+            return 0
+        target = compile_template_version(company, latest)
+
+        applications = (
+            TemplateApplication.objects.for_tenant(company)
+            .filter(template_key=template.key)
+            .exclude(version=latest)
+            .select_related("wedding", "version__template")
+            .select_for_update(of=("self",))
+        )
+        synced = 0
+        for application in applications:
+            if application.version is not None:
+                previous = compile_template_version(company, application.version)
+            elif template.key in TEMPLATES:
+                previous = get_template(template.key)
+            else:
+                previous = None
+            _sync_wedding(company, application.wedding, previous, target)
+            application.version = latest
+            application.save(skip_clean=True)
+            synced += 1
+
+        logger.info(
+            f"Template key={template.key} v{latest.number} sincronizado em "
+            f"{synced} casamento(s) da company_id={company.id}"
+        )
+        return synced
+
+
+def _publish(
+    company: Company,
+    template: ScheduleTemplate,
+    payload: ScheduleTemplateVersionIn,
+    *,
+    number: int,
+) -> ScheduleTemplateVersion:
+    """Valida os tipos de evento do conteúdo e grava a nova versão."""
+    invalid = {e.event_type for e in payload.events} - TEMPLATE_EVENT_TYPES
+    if invalid:
+        raise BusinessRuleViolation(
+            detail=(
+                f"Tipos de evento inválidos no template: {', '.join(sorted(invalid))}."
+            ),
+            code="schedule_template_event_type_invalid",
+        )
+
+    data = payload.model_dump()
+    version = ScheduleTemplateVersion(
+        company=company,
+        template=template,
+        number=number,
+        events=data["events"],
+        tasks=data["tasks"],
+        budget_categories=data["budget_categories"],
+    )
+    version.save()
+    return version
+
+
+def _diff[ItemT: (TemplateEvent, TemplateTask, TemplateBudgetCategory)](
+    previous: Sequence[ItemT], target: Sequence[ItemT]
+) -> tuple[list[ItemT], list[ItemT], set[str]]:
+    """
+    Compara duas listas de itens pelo ``key``.
+
+    Returns:
+        Itens novos, itens alterados (na versão nova) e chaves removidas.
+    """
+    old = {item.key: item for item in previous}
+    new = {item.key: item for item in target}
+    added = [item for key, item in new.items() if key not in old]
+    changed = [item for key, item in new.items() if key in old and old[key] != item]
+    return added, changed, old.keys() - new.keys()
+
+
+def _sync_wedding(
+    company: Company,
+    wedding: Wedding,
+    previous: CompiledTemplate | None,
+    target: CompiledTemplate,
+) -> None:
+    """Aplica ao casamento a diferença entre ``previous`` e ``target``."""
+    _sync_events(company, wedding, previous.events if previous else (), target.events)
+    _sync_tasks(company, wedding, previous.tasks if previous else (), target.tasks)
+    _sync_budget_categories(
+        company,
+        wedding,
+        previous.budget_categories if previous else (),
+        target.budget_categories,
+    )
+
+
+def _event_start(wedding_date: date, item: TemplateEvent) -> datetime:
+    return timezone.make_aware(
+        datetime.combine(wedding_date, TEMPLATE_EVENT_TIME) - item.offset
+    )
+
+
+@transaction.atomic
+def _sync_events(
+    company: Company,
+    wedding: Wedding,
+    previous: Sequence[TemplateEvent],
+    target: Sequence[TemplateEvent],
+) -> None:
+    added, changed, removed = _diff(previous, target)
+
+    created = []
+    for item in added:
+        event = Event(
+            company=company,
+            wedding=wedding,
+            template_key=item.key,
+            title=item.title,
+            event_type=item.event_type,
+            start_time=_event_start(wedding.date, item),
+        )
+        event.full_clean(
+            exclude=_CLEAN_EXCLUDE, validate_unique=False, validate_constraints=False
+        )
+        # bulk_create não passa pelo Event.save: agenda o lembrete aqui.
+        event.reminder_at = event.next_reminder_at()
+        created.append(event)
+    Event.objects.bulk_create(created)
+
+    items = {item.key: item for item in changed}
+    updated = list(Event.objects.filter(wedding=wedding, template_key__in=items))
+    now = timezone.now()
+    for event in updated:
+        item = items[event.template_key]
+        event.title = item.title
+        event.event_type = item.event_type
+        event.start_time = _event_start(wedding.date, item)
+        event.schedule_reminder()
+        event.updated_at = now
+    Event.objects.bulk_update(
+        updated,
+        [
+            "title",
+            "event_type",
+            "start_time",
+            "reminder_at",
+            "reminder_sent_for",
+            "updated_at",
+        ],
+    )
+
+    if removed:
+        # EventQuerySet.delete já versiona o calendário do casamento.
+        TombstoneService.delete(
+            company, Event.objects.filter(wedding=wedding, template_key__in=removed)
+        )
+    if created or updated:
+        touch_wedding_events(wedding.pk)
+
+
+def _task_due_date(wedding_date: date, item: TemplateTask) -> date | None:
+    return wedding_date - item.offset if item.offset is not None else None
+
+
+@transaction.atomic
+def _sync_tasks(
+    company: Company,
+    wedding: Wedding,
+    previous: Sequence[TemplateTask],
+    target: Sequence[TemplateTask],
+) -> None:
+    added, changed, removed = _diff(previous, target)
+
+    created = []
+    for item in added:
+        task = Task(
+            company=company,
+            wedding=wedding,
+            template_key=item.key,
+            title=item.title,
+            description=item.description,
+            due_date=_task_due_date(wedding.date, item),
+        )
+        task.full_clean(
+            exclude=_CLEAN_EXCLUDE, validate_unique=False, validate_constraints=False
+        )
+        created.append(task)
+    Task.objects.bulk_create(created)
+
+    items = {item.key: item for item in changed}
+    updated = list(Task.objects.filter(wedding=wedding, template_key__in=items))
+    now = timezone.now()
+    for task in updated:
+        item = items[task.template_key]
+        task.title = item.title
+        task.description = item.description
+        task.due_date = _task_due_date(wedding.date, item)
+        task.updated_at = now
+    Task.objects.bulk_update(
+        updated, ["title", "description", "due_date", "updated_at"]
+    )
+
+    if removed:
+        TombstoneService.delete(
+            company, Task.objects.filter(wedding=wedding, template_key__in=removed)
+        )
+
+
+@transaction.atomic
+def _sync_budget_categories(
+    company: Company,
+    wedding: Wedding,
+    previous: Sequence[TemplateBudgetCategory],
+    target: Sequence[TemplateBudgetCategory],
+) -> None:
+    """
+    Sincroniza as categorias de orçamento do template.
+
+    Categorias já existentes com o mesmo nome são adotadas em vez de
+    duplicadas; categorias removidas do template que já têm despesas são
+    mantidas (apenas desvinculadas do template).
+    """
+    from apps.finances.models import BudgetCategory, Expense
+    from apps.finances.services import BudgetService
+
+    added, changed, removed = _diff(previous, target)
+    if not (added or changed or removed):
+        return
+
+    budget = BudgetService.get_or_create_for_wedding(company, wedding.uuid)
+    categories = BudgetCategory.objects.for_tenant(company).filter(budget=budget)
+    by_name = {category.name: category for category in categories}
+    by_key = {c.template_key: c for c in by_name.values() if c.template_key}
+    now = timezone.now()
+
+    created, updated = [], []
+    for item in added:
+        category = by_name.get(item.name)
+        if category is not None:
+            category.template_key = item.key
+            category.description = item.description
+            category.updated_at = now
+            updated.append(category)
+            continue
+        category = BudgetCategory(
+            company=company,
+            wedding=wedding,
+            budget=budget,
+            template_key=item.key,
+            name=item.name,
+            description=item.description,
+            allocated_budget=Decimal("0.00"),
+        )
+        category.full_clean(
+            exclude=[*_CLEAN_EXCLUDE, "budget"],
+            validate_unique=False,
+            validate_constraints=False,
+        )
+        created.append(category)
+
+    for item in changed:
+        category = by_key.get(item.key)
+        if category is None:
+            continue
+        clash = by_name.get(item.name)
+        if clash is not None and clash.pk != category.pk:
+            logger.warning(
+                f"Categoria '{item.name}' já existe no orçamento uuid={budget.uuid}; "
+                "renomeação do template ignorada."
+            )
+        else:
+            category.name = item.name
+        category.description = item.description
+        category.updated_at = now
+        updated.append(category)
+
+    BudgetCategory.objects.bulk_create(created)
+    BudgetCategory.objects.bulk_update(
+        updated, ["template_key", "name", "description", "updated_at"]
+    )
+
+    if removed:
+        stale = categories.filter(template_key__in=removed)
+        in_use = Exists(Expense.objects.filter(category=OuterRef("pk")))
+        stale.filter(in_use).update(template_key="", updated_at=now)
+        stale.exclude(in_use).delete()
@@ -6,6 +6,7 @@ from apps.core.shortcuts import resolve_tenant_resource
 from apps.core.tenant import validate_tenant_ownership
 from apps.scheduler.models import Task
 from apps.scheduler.schemas import TaskIn, TaskPatchIn
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 from apps.weddings.models import Wedding
 
@@ -119,7 +120,7 @@ class TaskService:
             f"company_id={company.id}"
         )
 
-        instance.delete()
+        TombstoneService.delete(company, instance)
         logger.warning(
             f"Tarefa uuid={instance.uuid} DESTRUÍDO por company_id={company.id}"
         )
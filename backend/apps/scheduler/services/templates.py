@@ -5,12 +5,28 @@ Cada template é uma lista de eventos pré-definidos com offset em dias
 antes da data do casamento. Usado na criação de um Wedding para
 popular automaticamente o calendário.
 
+Além dos templates embutidos abaixo, cada tenant pode definir os seus
+(ScheduleTemplate), versionados e com tarefas e categorias de orçamento. Um
+template do tenant com o mesmo ``key`` substitui o embutido. Os dois tipos são
+compilados em CompiledTemplate: os embutidos uma vez por processo, as versões
+do tenant (imutáveis) no cache, por ID da versão.
+
 Referência: UC08, Sprint 4
 """
 
-from typing import Any
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import cache
+from typing import Any, cast
+
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.text import slugify
 
 from apps.core.exceptions import BusinessRuleViolation
+from apps.scheduler.models import Event, ScheduleTemplateVersion
+from apps.tenants.models import Company
 
 
 # ── Template: Religioso 12 meses ────────────────────────────────────────
@@ -163,6 +179,151 @@ TEMPLATES: dict[str, list[dict[str, Any]]] = {
 
 TEMPLATE_CHOICES: list[str] = list(TEMPLATES.keys())
 
+# Tipos aceitos em templates: eventos de pagamento só nascem de parcelas.
+TEMPLATE_EVENT_TYPES = frozenset(Event.TypeChoices.values) - {Event.TypeChoices.PAYMENT}
+
+
+@dataclass(frozen=True)
+class TemplateEvent:
+    """Evento pré-compilado de um template de cronograma."""
+
+    key: str
+    title: str
+    event_type: str
+    offset: timedelta
+
+
+@dataclass(frozen=True)
+class TemplateTask:
+    """Tarefa pré-compilada; sem ``offset``, a tarefa não tem prazo."""
+
+    key: str
+    title: str
+    description: str
+    offset: timedelta | None
+
+
+@dataclass(frozen=True)
+class TemplateBudgetCategory:
+    """Categoria de orçamento pré-compilada (criada sem verba alocada)."""
+
+    key: str
+    name: str
+    description: str
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Conteúdo de uma versão de template pronto para aplicação."""
+
+    key: str
+    version_id: int | None
+    events: tuple[TemplateEvent, ...]
+    tasks: tuple[TemplateTask, ...] = ()
+    budget_categories: tuple[TemplateBudgetCategory, ...] = ()
+
+
+def _compile_template(name: str, raw: list[dict[str, Any]]) -> CompiledTemplate:
+    """
+    Valida e converte um template embutido em CompiledTemplate.
+
+    Os itens embutidos não têm ``key`` explícito: usa-se o título normalizado,
+    único dentro de cada template.
+
+    Raises:
+        ImproperlyConfigured: Se alguma entrada tiver tipo, título ou offset
+            inválidos (erro de definição do template, não do usuário).
+    """
+    title_max = Event._meta.get_field("title").max_length or 0
+    compiled = []
+    for entry in raw:
+        title = str(entry["title"])
+        event_type = str(entry["event_type"])
+        offset_days = int(entry["offset_days"])
+        if (
+            event_type not in TEMPLATE_EVENT_TYPES
+            or not 0 < len(title) <= title_max
+            or offset_days < 0
+        ):
+            raise ImproperlyConfigured(
+                f"Entrada inválida no template de cronograma '{name}': {entry!r}"
+            )
+        compiled.append(
+            TemplateEvent(
+                key=slugify(title),
+                title=title,
+                event_type=event_type,
+                offset=timedelta(days=offset_days),
+            )
+        )
+    return CompiledTemplate(key=name, version_id=None, events=tuple(compiled))
+
+
+def _compile_version(version: ScheduleTemplateVersion, key: str) -> CompiledTemplate:
+    """Converte o conteúdo JSON (já validado na publicação) de uma versão."""
+    return CompiledTemplate(
+        key=key,
+        version_id=version.pk,
+        events=tuple(
+            TemplateEvent(
+                key=e["key"],
+                title=e["title"],
+                event_type=e["event_type"],
+                offset=timedelta(days=e["offset_days"]),
+            )
+            for e in version.events
+        ),
+        tasks=tuple(
+            TemplateTask(
+                key=t["key"],
+                title=t["title"],
+                description=t.get("description", ""),
+                offset=(
+                    timedelta(days=t["offset_days"])
+                    if t.get("offset_days") is not None
+                    else None
+                ),
+            )
+            for t in version.tasks
+        ),
+        budget_categories=tuple(
+            TemplateBudgetCategory(
+                key=c["key"], name=c["name"], description=c.get("description", "")
+            )
+            for c in version.budget_categories
+        ),
+    )
+
+
+def _template_not_found(template_name: str) -> BusinessRuleViolation:
+    return BusinessRuleViolation(
+        detail=(
+            f"Template '{template_name}' não encontrado. "
+            f"Opções disponíveis: {', '.join(TEMPLATE_CHOICES)}"
+        ),
+        code="template_not_found",
+    )
+
+
+@cache
+def get_template(template_name: str) -> CompiledTemplate:
+    """
+    Retorna o template embutido compilado (cacheado por processo).
+
+    Args:
+        template_name: O nome identificador do template de cronograma.
+
+    Returns:
+        CompiledTemplate imutável, com os eventos na ordem do template.
+
+    Raises:
+        BusinessRuleViolation: Se o template solicitado não for encontrado.
+    """
+    template = TEMPLATES.get(template_name)
+    if template is None:
+        raise _template_not_found(template_name)
+    return _compile_template(template_name, template)
+
 
 def get_template_events(template_name: str) -> list[dict[str, Any]]:
     """
@@ -178,13 +339,68 @@ def get_template_events(template_name: str) -> list[dict[str, Any]]:
     Raises:
         BusinessRuleViolation: Se o template solicitado não for encontrado.
     """
-    template = TEMPLATES.get(template_name)
-    if template is None:
-        raise BusinessRuleViolation(
-            detail=(
-                f"Template '{template_name}' não encontrado. "
-                f"Opções disponíveis: {', '.join(TEMPLATE_CHOICES)}"
-            ),
-            code="template_not_found",
+    return [
+        {
+            "title": event.title,
+            "event_type": event.event_type,
+            "offset_days": event.offset.days,
+        }
+        for event in get_template(template_name).events
+    ]
+
+
+def _version_cache_key(version_id: int) -> str:
+    return f"schedule_template_version:{version_id}"
+
+
+def resolve_template(company: Company, template_name: str) -> CompiledTemplate:
+    """
+    Retorna a versão mais recente do template do tenant ou o embutido.
+
+    A versão mais recente é consultada a cada chamada (uma query indexada);
+    só a compilação dela fica no cache, sob o ID da versão. Como versões
+    publicadas são imutáveis, a entrada nunca fica obsoleta, mesmo num cache
+    por processo (LocMem) que não vê publicações feitas em outras instâncias.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        template_name: O ``key`` do template.
+
+    Returns:
+        CompiledTemplate pronto para aplicação.
+
+    Raises:
+        BusinessRuleViolation: Se não houver template do tenant nem embutido
+            com esse nome.
+    """
+    versions = ScheduleTemplateVersion.objects.for_tenant(company).filter(
+        template__key=template_name
+    )
+    version_id = versions.order_by("-number").values_list("pk", flat=True).first()
+    if version_id is None:
+        return get_template(template_name)
+
+    cache_key = _version_cache_key(version_id)
+    compiled = shared_cache.get(cache_key)
+    if compiled is None:
+        compiled = _compile_version(versions.get(pk=version_id), template_name)
+        shared_cache.set(
+            cache_key, compiled, timeout=settings.SCHEDULE_TEMPLATE_CACHE_SECONDS
         )
-    return [dict(e) for e in template]
+    return cast(CompiledTemplate, compiled)
+
+
+def compile_template_version(
+    company: Company, version: ScheduleTemplateVersion
+) -> CompiledTemplate:
+    """
+    Compila uma versão específica (ex.: a já aplicada a um casamento).
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        version: A versão a compilar, com ``template`` carregado.
+
+    Returns:
+        CompiledTemplate da versão.
+    """
+    return _compile_version(version, version.template.key)
@@ -0,0 +1,20 @@
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task, lock_task
+
+
+@db_periodic_task(crontab(minute="*"))  # type: ignore[untyped-decorator]
+@lock_task("scheduler-dispatch-event-reminders")  # type: ignore[untyped-decorator]
+def dispatch_event_reminders() -> int:
+    """Envia, a cada minuto, os lembretes de eventos vencidos.
+
+    O lock evita duas execuções sobrepostas quando um ciclo demora mais que o
+    intervalo; a exclusividade por evento vem do ``SKIP LOCKED`` no serviço.
+    Em produção (sem consumidor Huey) o mesmo serviço é disparado pelo Cloud
+    Scheduler via ``/internal/cron/event-reminders/``.
+
+    Returns:
+        Quantidade de ocorrências lembradas.
+    """
+    from apps.scheduler.services.reminders import EventReminderService
+
+    return EventReminderService.dispatch_due()
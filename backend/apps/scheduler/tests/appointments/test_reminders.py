@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+import pytest
+from django.utils import timezone
+
+from apps.notifications.models import Notification, NotificationType
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.schemas import EventPatchIn
+from apps.scheduler.services.events import EventService
+from apps.scheduler.services.reminders import EventReminderService
+from apps.scheduler.tasks import dispatch_event_reminders
+from apps.scheduler.tests.factories import EventFactory as _EventFactory
+from apps.users.models import User
+from apps.users.tests.factories import UserFactory as _UserFactory
+from apps.weddings.models import Wedding
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
+
+
+def EventFactory(*args: Any, **kwargs: Any) -> Event:
+    return cast(Event, _EventFactory(*args, **kwargs))
+
+
+def UserFactory(*args: Any, **kwargs: Any) -> User:
+    return cast(User, _UserFactory(*args, **kwargs))
+
+
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
+def _event(user: User, start: datetime, **kwargs: Any) -> Event:
+    wedding = WeddingFactory(user_context=user)
+    kwargs.setdefault("reminder_enabled", True)
+    kwargs.setdefault("reminder_minutes_before", 60)
+    return EventFactory(wedding=wedding, start_time=start, **kwargs)
+
+
+@pytest.mark.django_db
+class TestEventReminderSchedule:
+    """O horário do próximo lembrete acompanha o evento a cada save."""
+
+    def test_single_event_schedules_reminder(self, user: User) -> None:
+        start = timezone.now() + timedelta(days=2)
+        event = _event(user, start, reminder_minutes_before=30)
+
+        assert event.reminder_at == start - timedelta(minutes=30)
+
+    def test_disabled_or_past_event_has_no_reminder(self, user: User) -> None:
+        disabled = _event(
+            user, timezone.now() + timedelta(days=1), reminder_enabled=False
+        )
+        past = _event(user, timezone.now() - timedelta(days=1))
+
+        assert disabled.reminder_at is None
+        assert past.reminder_at is None
+
+    def test_recurring_event_schedules_next_occurrence(self, user: User) -> None:
+        first = timezone.now() - timedelta(days=7, hours=-1)
+        event = _event(user, first, recurrence_rule=Event.RecurrenceChoices.WEEKLY)
+
+        assert event.reminder_at == first + timedelta(days=7, minutes=-60)
+
+    def test_update_reschedules_reminder(self, user: User) -> None:
+        event = _event(user, timezone.now() + timedelta(days=2))
+        new_start = timezone.now() + timedelta(days=5)
+
+        EventService.update(
+            user.company,
+            event,
+            EventPatchIn.model_construct(
+                start_time=new_start, reminder_minutes_before=15
+            ),
+        )
+
+        event.refresh_from_db()
+        assert event.reminder_at == new_start - timedelta(minutes=15)
+
+    def test_moving_reminded_event_earlier_reminds_again(self, user: User) -> None:
+        event = _event(user, timezone.now() + timedelta(minutes=50))
+        assert EventReminderService.dispatch_due() == 1
+        event.refresh_from_db()
+        new_start = timezone.now() + timedelta(minutes=20)
+
+        EventService.update(
+            user.company, event, EventPatchIn.model_construct(start_time=new_start)
+        )
+
+        event.refresh_from_db()
+        assert event.reminder_sent_for is None
+        assert event.reminder_at == new_start - timedelta(minutes=60)
+        assert EventReminderService.dispatch_due() == 1
+
+    def test_unrelated_update_keeps_sent_reminder(self, user: User) -> None:
+        event = _event(user, timezone.now() + timedelta(minutes=50))
+        EventReminderService.dispatch_due()
+        event.refresh_from_db()
+
+        EventService.update(
+            user.company, event, EventPatchIn.model_construct(title="Novo título")
+        )
+
+        event.refresh_from_db()
+        assert event.reminder_sent_for == event.start_time
+        assert event.reminder_at is None
+        assert EventReminderService.dispatch_due() == 0
+
+
+@pytest.mark.django_db
+class TestEventReminderDispatch:
+    """Testes do despacho dos lembretes vencidos."""
+
+    def test_dispatch_notifies_active_users_once(self, user: User) -> None:
+        UserFactory(company=user.company, is_active=False)
+        teammate = UserFactory(company=user.company)
+        event = _event(user, timezone.now() + timedelta(minutes=30))
+
+        assert EventReminderService.dispatch_due() == 1
+        assert EventReminderService.dispatch_due() == 0
+
+        notifications = Notification.objects.filter(
+            type=NotificationType.EVENT_REMINDER
+        )
+        assert {n.user_id for n in notifications} == {user.id, teammate.id}
+        assert all(n.target_id == event.uuid for n in notifications)
+        event.refresh_from_db()
+        assert event.reminder_at is None
+        assert event.reminder_sent_for == event.start_time
+
+    def test_dispatch_ignores_reminders_not_yet_due(self, user: User) -> None:
+        _event(user, timezone.now() + timedelta(days=1))
+
+        assert EventReminderService.dispatch_due() == 0
+        assert not Notification.objects.exists()
+
+    def test_dispatch_advances_recurring_series(self, user: User) -> None:
+        start = timezone.now() + timedelta(minutes=30)
+        event = _event(user, start, recurrence_rule=Event.RecurrenceChoices.WEEKLY)
+
+        EventReminderService.dispatch_due()
+
+        event.refresh_from_db()
+        assert event.reminder_sent_for == start
+        assert event.reminder_at == start + timedelta(days=7, minutes=-60)
+
+        # Salvar o evento de novo não reenvia o lembrete já enviado.
+        event.save()
+        assert event.reminder_at == start + timedelta(days=7, minutes=-60)
+
+    def test_dispatch_skips_cancelled_occurrence(self, user: User) -> None:
+        start = timezone.now() + timedelta(minutes=30)
+        event = _event(user, start, recurrence_rule=Event.RecurrenceChoices.WEEKLY)
+        EventException.objects.create(
+            company=user.company,
+            wedding=event.wedding,
+            event=event,
+            original_start=start,
+            is_cancelled=True,
+        )
+
+        assert EventReminderService.dispatch_due() == 0
+
+        event.refresh_from_db()
+        assert event.reminder_sent_for == start
+        assert not Notification.objects.exists()
+
+    def test_dispatch_skips_occurrence_already_started(self, user: User) -> None:
+        event = _event(user, timezone.now() + timedelta(minutes=30))
+
+        later = timezone.now() + timedelta(hours=1)
+        assert EventReminderService.dispatch_due(now=later) == 0
+
+        event.refresh_from_db()
+        assert event.reminder_at is None
+        assert not Notification.objects.exists()
+
+    def test_dispatch_respects_company_scope(self, user: User) -> None:
+        other = UserFactory()
+        _event(other, timezone.now() + timedelta(minutes=30))
+
+        assert EventReminderService.dispatch_due(company=user.company) == 0
+        assert EventReminderService.dispatch_due(company=other.company) == 1
+
+    def test_periodic_task_runs_dispatch(self, user: User) -> None:
+        _event(user, timezone.now() + timedelta(minutes=30))
+
+        assert dispatch_event_reminders.call_local() == 1
@@ -0,0 +1,274 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.finances.models import BudgetCategory
+from apps.finances.tests.factories import ExpenseFactory
+from apps.scheduler.models import (
+    Event,
+    ScheduleTemplate,
+    ScheduleTemplateVersion,
+    Task,
+    TemplateApplication,
+)
+from apps.scheduler.schemas import ScheduleTemplateIn, ScheduleTemplateVersionIn
+from apps.scheduler.services import ScheduleTemplateService
+from apps.scheduler.services.templates import resolve_template
+from apps.users.models import User
+from apps.weddings.models import Wedding
+from apps.weddings.schemas import WeddingIn
+from apps.weddings.services import WeddingService
+
+
+def _version(**content: Any) -> ScheduleTemplateVersionIn:
+    content.setdefault(
+        "events",
+        [
+            {
+                "key": "venue",
+                "title": "Visitar local",
+                "event_type": "visita",
+                "offset_days": 120,
+            },
+            {
+                "key": "tasting",
+                "title": "Degustação",
+                "event_type": "degustacao",
+                "offset_days": 60,
+            },
+        ],
+    )
+    content.setdefault(
+        "tasks",
+        [{"key": "invites", "title": "Enviar convites", "offset_days": 45}],
+    )
+    content.setdefault(
+        "budget_categories", [{"key": "venue", "name": "Local e Buffet"}]
+    )
+    return ScheduleTemplateVersionIn(**content)
+
+
+def _template(user: User, key: str = "custom", **content: Any) -> ScheduleTemplate:
+    return ScheduleTemplateService.create(
+        user.company,
+        ScheduleTemplateIn(key=key, name="Meu template", version=_version(**content)),
+    )
+
+
+def _wedding(user: User, template: str) -> Wedding:
+    return WeddingService.create(
+        user.company,
+        WeddingIn(
+            groom_name="João",
+            bride_name="Maria",
+            date=timezone.localdate() + timedelta(days=200),
+            location="Rio de Janeiro",
+            template=template,
+        ),
+    )
+
+
+@pytest.mark.django_db
+class TestScheduleTemplateApply:
+    """Aplicação de templates do tenant na criação do casamento."""
+
+    def test_wedding_receives_events_tasks_and_categories(self, user: User) -> None:
+        template = _template(user)
+
+        wedding = _wedding(user, "custom")
+
+        events = Event.objects.filter(wedding=wedding).order_by("start_time")
+        assert [e.template_key for e in events] == ["venue", "tasting"]
+        assert events[0].start_time.date() == wedding.date - timedelta(days=120)
+        task = Task.objects.get(wedding=wedding)
+        assert task.due_date == wedding.date - timedelta(days=45)
+        assert BudgetCategory.objects.filter(
+            wedding=wedding, template_key="venue", name="Local e Buffet"
+        ).exists()
+        application = TemplateApplication.objects.get(wedding=wedding)
+        assert application.version == template.versions.get()
+
+    def test_tenant_template_overrides_builtin_key(self, user: User) -> None:
+        _template(user, key="beach_6m")
+
+        wedding = _wedding(user, "beach_6m")
+
+        assert Event.objects.filter(wedding=wedding).count() == 2
+
+    def test_builtin_template_is_recorded(self, user: User) -> None:
+        wedding = _wedding(user, "civil_buffet_3m")
+
+        application = TemplateApplication.objects.get(wedding=wedding)
+        assert application.template_key == "civil_buffet_3m"
+        assert application.version is None
+        assert (
+            Event.objects.filter(wedding=wedding).exclude(template_key="").count() == 7
+        )
+
+    def test_compiled_template_is_cached(self, user: User) -> None:
+        _template(user)
+        resolve_template(user.company, "custom")
+
+        with CaptureQueriesContext(connection) as ctx:
+            compiled = resolve_template(user.company, "custom")
+
+        # Só a consulta da versão mais recente; a compilação vem do cache.
+        assert len(ctx.captured_queries) == 1
+        assert [e.key for e in compiled.events] == ["venue", "tasting"]
+
+    def test_publish_invalidates_cache(self, user: User) -> None:
+        template = _template(user)
+        resolve_template(user.company, "custom")
+
+        ScheduleTemplateService.publish_version(
+            user.company, template, _version(events=[], tasks=[])
+        )
+
+        assert resolve_template(user.company, "custom").events == ()
+
+    def test_version_published_elsewhere_is_not_stale(self, user: User) -> None:
+        """Uma versão nova vale mesmo sem invalidar o cache local (LocMem)."""
+        template = _template(user)
+        resolve_template(user.company, "custom")
+
+        ScheduleTemplateVersion.objects.create(
+            company=user.company, template=template, number=2, events=[], tasks=[]
+        )
+
+        assert resolve_template(user.company, "custom").events == ()
+
+
+@pytest.mark.django_db
+class TestScheduleTemplateValidation:
+    """Validações da publicação de templates."""
+
+    def test_payment_events_are_rejected(self, user: User) -> None:
+        events = [
+            {
+                "key": "fee",
+                "title": "Sinal",
+                "event_type": "pagamento",
+                "offset_days": 1,
+            }
+        ]
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            _template(user, events=events)
+
+        assert exc_info.value.code == "schedule_template_event_type_invalid"
+
+    def test_duplicate_key_in_tenant_is_rejected(self, user: User) -> None:
+        _template(user)
+
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            _template(user)
+
+        assert exc_info.value.code == "schedule_template_key_taken"
+
+    def test_duplicate_item_keys_are_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            _version(tasks=[{"key": "a", "title": "A"}, {"key": "a", "title": "B"}])
+
+
+@pytest.mark.django_db
+class TestScheduleTemplateSync:
+    """Reaplicação incremental de uma versão nova aos casamentos existentes."""
+
+    def test_sync_applies_only_the_diff(self, user: User) -> None:
+        template = _template(user)
+        wedding = _wedding(user, "custom")
+        venue = Event.objects.get(wedding=wedding, template_key="venue")
+        tasting = Event.objects.get(wedding=wedding, template_key="tasting")
+        # Edição do Planner num item que não muda na versão nova.
+        venue.location = "Sítio"
+        venue.save()
+
+        ScheduleTemplateService.publish_version(
+            user.company,
+            template,
+            _version(
+                events=[
+                    {
+                        "key": "venue",
+                        "title": "Visitar local",
+                        "event_type": "visita",
+                        "offset_days": 120,
+                    },
+                    {
+                        "key": "tasting",
+                        "title": "Degustação final",
+                        "event_type": "degustacao",
+                        "offset_days": 30,
+                    },
+                    {
+                        "key": "rehearsal",
+                        "title": "Ensaio",
+                        "event_type": "visita",
+                        "offset_days": 7,
+                    },
+                ],
+                tasks=[],
+            ),
+        )
+        assert ScheduleTemplateService.sync_weddings(user.company, template) == 1
+
+        venue.refresh_from_db()
+        assert venue.location == "Sítio"
+        tasting.refresh_from_db()
+        assert tasting.title == "Degustação final"
+        assert tasting.start_time.date() == wedding.date - timedelta(days=30)
+        assert Event.objects.filter(wedding=wedding, template_key="rehearsal").exists()
+        assert not Task.objects.filter(wedding=wedding).exists()
+        application = TemplateApplication.objects.get(wedding=wedding)
+        assert application.version is not None
+        assert application.version.number == 2
+        assert ScheduleTemplateService.sync_weddings(user.company, template) == 0
+
+    def test_sync_upgrades_weddings_from_builtin(self, user: User) -> None:
+        wedding = _wedding(user, "civil_buffet_3m")
+        kept = Event.objects.get(wedding=wedding, title="Reunião final")
+        template = _template(
+            user,
+            key="civil_buffet_3m",
+            events=[
+                {
+                    "key": "reuniao-final",
+                    "title": "Reunião final",
+                    "event_type": "reuniao",
+                    "offset_days": 3,
+                },
+            ],
+        )
+
+        assert ScheduleTemplateService.sync_weddings(user.company, template) == 1
+
+        assert list(Event.objects.filter(wedding=wedding)) == [kept]
+
+    def test_removed_category_with_expenses_is_kept(self, user: User) -> None:
+        template = _template(user)
+        wedding = _wedding(user, "custom")
+        category = BudgetCategory.objects.get(wedding=wedding, template_key="venue")
+        ExpenseFactory(wedding=wedding, category=category)
+
+        ScheduleTemplateService.publish_version(
+            user.company, template, _version(budget_categories=[])
+        )
+        ScheduleTemplateService.sync_weddings(user.company, template)
+
+        category.refresh_from_db()
+        assert category.template_key == ""
+
+    def test_delete_keeps_wedding_schedule(self, user: User) -> None:
+        template = _template(user)
+        wedding = _wedding(user, "custom")
+
+        ScheduleTemplateService.delete(user.company, template)
+
+        assert Event.objects.filter(wedding=wedding).count() == 2
+        assert not TemplateApplication.objects.filter(wedding=wedding).exists()
+        with pytest.raises(BusinessRuleViolation):
+            resolve_template(user.company, "custom")
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, cast, no_type_check
 from uuid import uuid4
 
@@ -6,8 +6,8 @@ import pytest
 from django.utils import timezone
 
 from apps.core.exceptions import BusinessRuleViolation, ObjectNotFoundError
-from apps.scheduler.models import Event
-from apps.scheduler.schemas import EventIn, EventPatchIn
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.schemas import EventExceptionIn, EventIn, EventPatchIn
 from apps.scheduler.services.events import EventService
 from apps.scheduler.tests.factories import EventFactory as _EventFactory
 from apps.users.models import User
@@ -393,3 +393,103 @@ class TestEventServiceDelete:
 
         with pytest.raises(ObjectNotFoundError):
             EventService.delete(user.company, instance=other_event)
+
+
+@pytest.mark.django_db
+class TestEventServiceOccurrenceExceptions:
+    """Testes de exceções por ocorrência de eventos recorrentes."""
+
+    def _series(self, user: Any) -> Event:
+        wedding = WeddingFactory(user_context=user)
+        return EventFactory(
+            wedding=wedding,
+            recurrence_rule=Event.RecurrenceChoices.WEEKLY,
+            start_time=timezone.make_aware(datetime(2026, 3, 2, 10, 0)),
+        )
+
+    def test_set_exception_upserts_by_original_start(self, user: Any) -> None:
+        series = self._series(user)
+        original = timezone.make_aware(datetime(2026, 3, 9, 10, 0))
+
+        EventService.set_occurrence_exception(
+            user.company,
+            series,
+            EventExceptionIn(original_start=original, is_cancelled=True),
+        )
+        exception = EventService.set_occurrence_exception(
+            user.company,
+            series,
+            EventExceptionIn(original_start=original, title="Só nesta semana"),
+        )
+
+        assert EventException.objects.count() == 1
+        assert exception.company == user.company
+        assert exception.is_cancelled is False
+        assert exception.title == "Só nesta semana"
+
+    def test_set_exception_rejects_date_outside_series(self, user: Any) -> None:
+        series = self._series(user)
+
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            EventService.set_occurrence_exception(
+                user.company,
+                series,
+                EventExceptionIn(
+                    original_start=timezone.make_aware(datetime(2026, 3, 10, 10, 0))
+                ),
+            )
+
+        assert exc_info.value.code == "event_occurrence_not_found"
+
+    def test_set_exception_rejects_single_event(self, user: Any) -> None:
+        wedding = WeddingFactory(user_context=user)
+        event = EventFactory(wedding=wedding)
+
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            EventService.set_occurrence_exception(
+                user.company,
+                event,
+                EventExceptionIn(original_start=event.start_time, is_cancelled=True),
+            )
+
+        assert exc_info.value.code == "event_not_recurring"
+
+    def test_set_exception_cross_tenant(self, user: Any) -> None:
+        series = self._series(UserFactory())
+
+        with pytest.raises(ObjectNotFoundError):
+            EventService.set_occurrence_exception(
+                user.company,
+                series,
+                EventExceptionIn(original_start=series.start_time, is_cancelled=True),
+            )
+
+    def test_rescheduling_series_drops_exceptions(self, user: Any) -> None:
+        series = self._series(user)
+        EventService.set_occurrence_exception(
+            user.company,
+            series,
+            EventExceptionIn(original_start=series.start_time, is_cancelled=True),
+        )
+
+        EventService.update(
+            user.company,
+            series,
+            EventPatchIn.model_construct(
+                start_time=series.start_time + timedelta(hours=2)
+            ),
+        )
+
+        assert not EventException.objects.exists()
+
+    def test_clear_exception_restores_occurrence(self, user: Any) -> None:
+        series = self._series(user)
+        EventService.set_occurrence_exception(
+            user.company,
+            series,
+            EventExceptionIn(original_start=series.start_time, is_cancelled=True),
+        )
+
+        EventService.clear_occurrence_exception(user.company, series, series.start_time)
+
+        assert not EventException.objects.exists()
@@ -1,9 +1,14 @@
+from datetime import timedelta
+
 import pytest
+from django.core.exceptions import ImproperlyConfigured
 
 from apps.core.exceptions import BusinessRuleViolation
 from apps.scheduler.services.templates import (
     TEMPLATE_CHOICES,
     TEMPLATES,
+    _compile_template,
+    get_template,
     get_template_events,
 )
 
@@ -67,3 +72,17 @@ class TestGetTemplateEvents:
         """Nome vazio ou nulo levanta erro apropriado."""
         with pytest.raises(BusinessRuleViolation):
             get_template_events("")
+
+    def test_compiled_template_is_cached(self) -> None:
+        """O template é compilado uma vez e reutilizado entre chamadas."""
+        template = get_template("beach_6m")
+
+        assert get_template("beach_6m") is template
+        assert template.events[0].offset == timedelta(days=180)
+
+    def test_compile_rejects_payment_entries(self) -> None:
+        """Eventos de pagamento não podem vir de templates."""
+        raw = [{"title": "Sinal", "event_type": "pagamento", "offset_days": 30}]
+
+        with pytest.raises(ImproperlyConfigured):
+            _compile_template("custom", raw)
@@ -4,6 +4,10 @@ Configuração Local de Testes: App Scheduler.
 Regista as factories do calendário para uso como fixtures pytest.
 """
 
+from collections.abc import Iterator
+
+import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 
 from .factories import EventFactory, MeetingFactory, TaskFactory
@@ -12,3 +16,15 @@ from .factories import EventFactory, MeetingFactory, TaskFactory
 register(EventFactory)
 register(MeetingFactory)
 register(TaskFactory)
+
+
+@pytest.fixture(autouse=True)
+def clear_template_cache() -> Iterator[None]:
+    """
+    Descarta os templates de cronograma cacheados ao fim de cada teste.
+
+    O rollback do banco pode reaproveitar o ID de uma versão em outro teste,
+    que leria um template cacheado que não existe mais.
+    """
+    yield
+    cache.clear()
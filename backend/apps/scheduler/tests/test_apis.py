@@ -1,12 +1,15 @@
 from datetime import timedelta
 from typing import Any, cast
+from urllib.parse import quote
 
 import pytest
 from django.utils import timezone
 
-from apps.scheduler.models import Event, Task
+from apps.scheduler.models import Event, ScheduleTemplate, Task
 from apps.scheduler.tests.factories import EventFactory as _EventFactory
 from apps.scheduler.tests.factories import TaskFactory as _TaskFactory
+from apps.tenants.models import Company
+from apps.tenants.tests.factories import CompanyFactory
 from apps.weddings.models import Wedding
 from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
 
@@ -254,6 +257,62 @@ class TestSchedulerEventsAPI:
         response = auth_client.delete(f"/api/v1/scheduler/events/{other_event.uuid}/")
         assert response.status_code == 404
 
+    def test_list_occurrences_expands_recurring_events(
+        self, auth_client: Any, user: Any
+    ) -> None:
+        wedding = WeddingFactory(company=user.company)
+        series = EventFactory(
+            wedding=wedding,
+            recurrence_rule=Event.RecurrenceChoices.WEEKLY,
+            start_time=timezone.now() - timedelta(days=70),
+        )
+
+        response = auth_client.get(
+            "/api/v1/scheduler/events/occurrences/",
+            {
+                "start_date": timezone.localdate().isoformat(),
+                "end_date": (timezone.localdate() + timedelta(days=27)).isoformat(),
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 4
+        assert {item["event"] for item in data} == {str(series.uuid)}
+        assert data[0]["recurrence_rule"] == "semanal"
+
+    def test_list_occurrences_invalid_window_returns_422(
+        self, auth_client: Any
+    ) -> None:
+        response = auth_client.get(
+            "/api/v1/scheduler/events/occurrences/",
+            {"start_date": "2026-03-31", "end_date": "2026-03-01"},
+        )
+
+        assert response.status_code == 422
+
+    def test_cancel_occurrence(self, auth_client: Any, user: Any) -> None:
+        wedding = WeddingFactory(company=user.company)
+        series = EventFactory(
+            wedding=wedding, recurrence_rule=Event.RecurrenceChoices.MONTHLY
+        )
+
+        response = auth_client.put(
+            f"/api/v1/scheduler/events/{series.uuid}/occurrences/",
+            {"original_start": series.start_time.isoformat(), "is_cancelled": True},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["is_cancelled"] is True
+
+        response = auth_client.delete(
+            f"/api/v1/scheduler/events/{series.uuid}/occurrences/"
+            f"?original_start={quote(series.start_time.isoformat())}"
+        )
+        assert response.status_code == 204
+        assert not series.exceptions.exists()
+
 
 @pytest.mark.django_db
 class TestSchedulerTasksAPI:
@@ -336,3 +395,172 @@ class TestSchedulerTasksAPI:
 
         response = auth_client.delete(f"/api/v1/scheduler/tasks/{other_task.uuid}/")
         assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestCalendarFeedAPI:
+    """Testes das assinaturas iCalendar (.ics)."""
+
+    def _create_feed(self, auth_client: Any, **payload: Any) -> dict[str, Any]:
+        response = auth_client.post(
+            "/api/v1/scheduler/feeds/", payload, content_type="application/json"
+        )
+        assert response.status_code == 201
+        return cast(dict[str, Any], response.json())
+
+    def _path(self, feed: dict[str, Any]) -> str:
+        return str(feed["url"]).removeprefix("http://testserver")
+
+    def test_feed_streams_tenant_events(
+        self, auth_client: Any, client: Any, user: Any
+    ) -> None:
+        wedding = WeddingFactory(company=user.company)
+        event = EventFactory(wedding=wedding, event_type=Event.TypeChoices.PAYMENT)
+        other = EventFactory()
+        feed = self._create_feed(auth_client, name="Agenda")
+
+        response = client.get(self._path(feed))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/calendar; charset=utf-8"
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        content = b"".join(response.streaming_content).decode()
+        assert str(event.uuid) in content
+        assert str(other.uuid) not in content
+        assert "X-WR-CALNAME:Agenda" in content
+
+    def test_wedding_feed_is_scoped(
+        self, auth_client: Any, client: Any, user: Any
+    ) -> None:
+        wedding = WeddingFactory(company=user.company)
+        other_wedding = WeddingFactory(company=user.company)
+        event = EventFactory(wedding=wedding)
+        hidden = EventFactory(wedding=other_wedding)
+        feed = self._create_feed(auth_client, wedding=str(wedding.uuid))
+
+        response = client.get(self._path(feed))
+
+        assert feed["wedding"] == str(wedding.uuid)
+        content = b"".join(response.streaming_content).decode()
+        assert str(event.uuid) in content
+        assert str(hidden.uuid) not in content
+
+    def test_conditional_get_until_events_change(
+        self, auth_client: Any, client: Any, user: Any
+    ) -> None:
+        wedding = WeddingFactory(company=user.company)
+        event = EventFactory(wedding=wedding)
+        feed = self._create_feed(auth_client, wedding=str(wedding.uuid))
+        etag = client.get(self._path(feed))["ETag"]
+
+        response = client.get(self._path(feed), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+        event.title = "Novo título"
+        event.save()
+        response = client.get(self._path(feed), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+        etag = response["ETag"]
+        Event.objects.filter(pk=event.pk).delete()
+        response = client.get(self._path(feed), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_unknown_or_revoked_token_returns_404(
+        self, auth_client: Any, client: Any
+    ) -> None:
+        feed = self._create_feed(auth_client)
+        assert client.get("/api/v1/scheduler/feeds/invalido.ics").status_code == 404
+
+        response = auth_client.delete(f"/api/v1/scheduler/feeds/{feed['uuid']}/")
+
+        assert response.status_code == 204
+        assert client.get(self._path(feed)).status_code == 404
+
+    def test_create_feed_for_other_tenant_wedding(self, auth_client: Any) -> None:
+        wedding = WeddingFactory()
+
+        response = auth_client.post(
+            "/api/v1/scheduler/feeds/",
+            {"wedding": str(wedding.uuid)},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestScheduleTemplateAPI:
+    """Testes dos endpoints de templates de cronograma do tenant."""
+
+    payload: dict[str, Any] = {
+        "key": "custom",
+        "name": "Meu template",
+        "version": {
+            "events": [
+                {
+                    "key": "venue",
+                    "title": "Visitar local",
+                    "event_type": "visita",
+                    "offset_days": 90,
+                }
+            ],
+            "tasks": [{"key": "invites", "title": "Enviar convites"}],
+        },
+    }
+
+    def test_create_publish_and_sync(self, auth_client: Any, user: Any) -> None:
+        response = auth_client.post(
+            "/api/v1/scheduler/templates/",
+            self.payload,
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        template = response.json()
+        assert template["latest_version"]["number"] == 1
+
+        wedding_response = auth_client.post(
+            "/api/v1/weddings/",
+            {
+                "groom_name": "João",
+                "bride_name": "Maria",
+                "date": (timezone.localdate() + timedelta(days=200)).isoformat(),
+                "location": "Niterói",
+                "template": "custom",
+            },
+            content_type="application/json",
+        )
+        assert wedding_response.status_code == 201
+
+        response = auth_client.post(
+            f"/api/v1/scheduler/templates/{template['uuid']}/versions/",
+            {"events": [], "tasks": []},
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        assert response.json()["number"] == 2
+
+        response = auth_client.post(
+            f"/api/v1/scheduler/templates/{template['uuid']}/sync/"
+        )
+        assert response.status_code == 200
+        assert response.json() == {"weddings": 1}
+        wedding = Wedding.objects.get(uuid=wedding_response.json()["uuid"])
+        assert not Event.objects.filter(wedding=wedding).exists()
+
+        response = auth_client.get("/api/v1/scheduler/templates/")
+        assert [t["latest_version"]["number"] for t in response.json()] == [2]
+
+    def test_template_isolation(self, auth_client: Any) -> None:
+        other = ScheduleTemplate.objects.create(
+            company=cast(Company, CompanyFactory()), key="other", name="Outro"
+        )
+
+        response = auth_client.get(f"/api/v1/scheduler/templates/{other.uuid}/")
+        assert response.status_code == 404
+
+        response = auth_client.delete(f"/api/v1/scheduler/templates/{other.uuid}/")
+        assert response.status_code == 404
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, cast
+
+import pytest
+from django.utils import timezone
+
+from apps.scheduler.ical import render_calendar
+from apps.scheduler.models import Event, EventException
+from apps.scheduler.tests.factories import EventFactory as _EventFactory
+from apps.users.models import User
+from apps.weddings.models import Wedding
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
+
+
+def EventFactory(*args: Any, **kwargs: Any) -> Event:
+    return cast(Event, _EventFactory(*args, **kwargs))
+
+
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
+def _local(year: int, month: int, day: int, hour: int = 10) -> datetime:
+    return timezone.make_aware(datetime(year, month, day, hour))
+
+
+def _render(
+    events: list[Event], exceptions: dict[int, list[EventException]] | None = None
+) -> str:
+    return "".join(render_calendar("Agenda", events, exceptions or {}))
+
+
+def _unfold(content: str) -> list[str]:
+    return content.replace("\r\n ", "").split("\r\n")
+
+
+@pytest.mark.django_db
+class TestRenderCalendar:
+    """Serialização dos eventos em iCalendar."""
+
+    def test_single_event(self, user: User) -> None:
+        wedding = WeddingFactory(user_context=user)
+        event = EventFactory(
+            wedding=wedding,
+            title="Prova; vestido, noiva",
+            location="Ateliê",
+            start_time=_local(2030, 5, 10),
+            end_time=_local(2030, 5, 10, 12),
+            reminder_enabled=True,
+            reminder_minutes_before=30,
+        )
+
+        lines = _unfold(_render([event]))
+
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert lines[-2:] == ["END:VCALENDAR", ""]
+        assert f"UID:{event.uuid}@wedding-management" in lines
+        assert "DTSTART;TZID=America/Sao_Paulo:20300510T100000" in lines
+        assert "DTEND;TZID=America/Sao_Paulo:20300510T120000" in lines
+        assert r"SUMMARY:Prova\; vestido\, noiva" in lines
+        assert "TRIGGER:-PT30M" in lines
+        assert not any(line.startswith("RRULE") for line in lines)
+
+    def test_recurring_event_with_exceptions(self, user: User) -> None:
+        wedding = WeddingFactory(user_context=user)
+        event = EventFactory(
+            wedding=wedding,
+            title="Reunião",
+            start_time=_local(2030, 1, 31),
+            end_time=_local(2030, 1, 31, 11),
+            recurrence_rule=Event.RecurrenceChoices.MONTHLY,
+        )
+        cancelled = EventException(
+            event=event, original_start=_local(2030, 3, 31), is_cancelled=True
+        )
+        moved = EventException(
+            event=event,
+            original_start=_local(2030, 4, 30),
+            start_time=_local(2030, 5, 2, 15),
+            title="Reunião remarcada",
+        )
+        for exception in (cancelled, moved):
+            exception.updated_at = event.updated_at
+
+        lines = _unfold(_render([event], {event.pk: [cancelled, moved]}))
+
+        assert "RRULE:FREQ=MONTHLY;BYMONTHDAY=28,29,30,31;BYSETPOS=-1" in lines
+        assert "EXDATE;TZID=America/Sao_Paulo:20300331T100000" in lines
+        assert "RECURRENCE-ID;TZID=America/Sao_Paulo:20300430T100000" in lines
+        assert "DTSTART;TZID=America/Sao_Paulo:20300502T150000" in lines
+        assert "DTEND;TZID=America/Sao_Paulo:20300502T160000" in lines
+        assert "SUMMARY:Reunião remarcada" in lines
+        assert lines.count("BEGIN:VEVENT") == 2
+
+    def test_biweekly_rule(self, user: User) -> None:
+        wedding = WeddingFactory(user_context=user)
+        event = EventFactory(
+            wedding=wedding,
+            start_time=_local(2030, 1, 7),
+            recurrence_rule=Event.RecurrenceChoices.BIWEEKLY,
+        )
+
+        assert "RRULE:FREQ=WEEKLY;INTERVAL=2" in _unfold(_render([event]))
+
+    def test_long_lines_are_folded_at_75_octets(self, user: User) -> None:
+        wedding = WeddingFactory(user_context=user)
+        description = "Cerimônia e recepção " * 20
+        event = EventFactory(
+            wedding=wedding,
+            start_time=_local(2030, 5, 10),
+            description=description,
+        )
+
+        content = _render([event])
+
+        assert all(len(line.encode()) <= 75 for line in content.split("\r\n"))
+        assert f"DESCRIPTION:{description}" in _unfold(content)
@@ -2,19 +2,20 @@
 Testes unitários e de integração para Selectors e QuerySets do Scheduler.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, cast
 from uuid import uuid4
 
 import pytest
 from django.utils import timezone
 
-from apps.core.exceptions import ObjectNotFoundError
+from apps.core.exceptions import BusinessRuleViolation, ObjectNotFoundError
 from apps.scheduler.managers import TaskQuerySet
-from apps.scheduler.models import Event, Task
+from apps.scheduler.models import Event, EventException, Task
 from apps.scheduler.selectors import (
     event_get_selector,
     event_list_selector,
+    event_occurrences_selector,
     task_get_selector,
     task_list_selector,
     task_urgent_list_selector,
@@ -331,3 +332,164 @@ class TestEventSelectors:
 
         with pytest.raises(ObjectNotFoundError):
             event_get_selector(company=user_a.company, uuid=event_b.uuid)
+
+
+def _local(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return timezone.make_aware(datetime(year, month, day, hour, minute))
+
+
+@pytest.mark.django_db
+class TestEventOccurrencesSelector:
+    """Expansão de eventos recorrentes na janela consultada."""
+
+    def _series(self, user: Any, rule: str, start: datetime, **kwargs: Any) -> Event:
+        wedding = WeddingFactory(user_context=user)
+        return EventFactory(
+            wedding=wedding,
+            recurrence_rule=rule,
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            **kwargs,
+        )
+
+    def test_weekly_series_expands_only_inside_window(self, user: Any) -> None:
+        series = self._series(
+            user, Event.RecurrenceChoices.WEEKLY, _local(2020, 1, 6, 10, 0)
+        )
+
+        occurrences = list(
+            event_occurrences_selector(
+                company=user.company,
+                start_date=date(2026, 3, 1),
+                end_date=date(2026, 3, 31),
+            )
+        )
+
+        assert [o.start_time for o in occurrences] == [
+            _local(2026, 3, day, 10, 0) for day in (2, 9, 16, 23, 30)
+        ]
+        assert all(o.event == series for o in occurrences)
+        assert occurrences[0].end_time == _local(2026, 3, 2, 11, 0)
+
+    def test_monthly_series_clamps_to_month_end(self, user: Any) -> None:
+        self._series(user, Event.RecurrenceChoices.MONTHLY, _local(2026, 1, 31, 9, 0))
+
+        occurrences = event_occurrences_selector(
+            company=user.company,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 4, 30),
+        )
+
+        assert [o.start_time for o in occurrences] == [
+            _local(2026, 2, 28, 9, 0),
+            _local(2026, 3, 31, 9, 0),
+            _local(2026, 4, 30, 9, 0),
+        ]
+
+    def test_merges_series_and_single_events_in_order(self, user: Any) -> None:
+        series = self._series(
+            user, Event.RecurrenceChoices.BIWEEKLY, _local(2026, 3, 2, 10, 0)
+        )
+        single = EventFactory(
+            wedding=series.wedding, start_time=_local(2026, 3, 10, 8, 0)
+        )
+        EventFactory(wedding=series.wedding, start_time=_local(2026, 5, 1, 8, 0))
+
+        occurrences = list(
+            event_occurrences_selector(
+                company=user.company,
+                start_date=date(2026, 3, 1),
+                end_date=date(2026, 3, 31),
+            )
+        )
+
+        assert [(o.event, o.start_time) for o in occurrences] == [
+            (series, _local(2026, 3, 2, 10, 0)),
+            (single, _local(2026, 3, 10, 8, 0)),
+            (series, _local(2026, 3, 16, 10, 0)),
+            (series, _local(2026, 3, 30, 10, 0)),
+        ]
+
+    def test_exceptions_cancel_and_move_occurrences(self, user: Any) -> None:
+        series = self._series(
+            user, Event.RecurrenceChoices.WEEKLY, _local(2026, 3, 2, 10, 0)
+        )
+        EventException.objects.create(
+            company=user.company,
+            wedding=series.wedding,
+            event=series,
+            original_start=_local(2026, 3, 9, 10, 0),
+            is_cancelled=True,
+        )
+        EventException.objects.create(
+            company=user.company,
+            wedding=series.wedding,
+            event=series,
+            original_start=_local(2026, 3, 16, 10, 0),
+            start_time=_local(2026, 3, 24, 15, 0),
+            title="Remarcada",
+        )
+
+        occurrences = list(
+            event_occurrences_selector(
+                company=user.company,
+                start_date=date(2026, 3, 1),
+                end_date=date(2026, 3, 31),
+            )
+        )
+
+        assert [(o.start_time, o.is_exception) for o in occurrences] == [
+            (_local(2026, 3, 2, 10, 0), False),
+            (_local(2026, 3, 23, 10, 0), False),
+            (_local(2026, 3, 24, 15, 0), True),
+            (_local(2026, 3, 30, 10, 0), False),
+        ]
+        moved = occurrences[2]
+        assert moved.title == "Remarcada"
+        assert moved.original_start == _local(2026, 3, 16, 10, 0)
+        assert moved.end_time == _local(2026, 3, 24, 16, 0)
+
+    def test_isolates_tenants(self, user: Any) -> None:
+        self._series(UserFactory(), Event.RecurrenceChoices.WEEKLY, _local(2026, 3, 2))
+
+        occurrences = event_occurrences_selector(
+            company=user.company,
+            start_date=date(2026, 3, 1),
+            end_date=date(2026, 3, 31),
+        )
+
+        assert list(occurrences) == []
+
+    def test_query_count_does_not_grow_with_series_age(
+        self, user: Any, django_assert_num_queries: Any
+    ) -> None:
+        self._series(user, Event.RecurrenceChoices.WEEKLY, _local(2000, 1, 3, 10, 0))
+
+        # Avulsos + séries + exceções.
+        with django_assert_num_queries(3):
+            occurrences = list(
+                event_occurrences_selector(
+                    company=user.company,
+                    start_date=date(2026, 3, 1),
+                    end_date=date(2026, 3, 7),
+                )
+            )
+
+        assert len(occurrences) == 1
+
+    @pytest.mark.parametrize(
+        ("start_date", "end_date", "code"),
+        [
+            (date(2026, 3, 31), date(2026, 3, 1), "occurrence_window_invalid"),
+            (date(2026, 1, 1), date(2027, 1, 2), "occurrence_window_too_large"),
+        ],
+    )
+    def test_rejects_invalid_windows(
+        self, user: Any, start_date: date, end_date: date, code: str
+    ) -> None:
+        with pytest.raises(BusinessRuleViolation) as exc:
+            event_occurrences_selector(
+                company=user.company, start_date=start_date, end_date=end_date
+            )
+
+        assert exc.value.code == code
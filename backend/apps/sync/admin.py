@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = ["resource", "record_uuid", "company", "created_at"]
+    list_filter = ["resource"]
+    search_fields = ["record_uuid"]
+    readonly_fields = ["uuid", "created_at", "updated_at"]
@@ -0,0 +1,32 @@
+from ninja_extra import Router
+
+from apps.core.schemas import ErrorResponse
+from apps.sync.schemas import ChangeFeedOut
+from apps.sync.selectors import ChangeFeedPage, change_feed_selector
+from apps.users.types import AuthRequest
+
+
+sync_router = Router(tags=["Sync"])
+
+
+@sync_router.get(
+    "/changes/",
+    response={200: ChangeFeedOut, 422: ErrorResponse},
+    operation_id="sync_changes_list",
+)
+def list_changes(
+    request: AuthRequest, cursor: str | None = None, limit: int | None = None
+) -> ChangeFeedPage:
+    """
+    Feed de alterações do tenant para sincronização incremental.
+
+    Devolve os registros criados/alterados (``upsert``, com os dados) e os
+    excluídos (``delete``) depois do ``cursor``. Sem cursor, devolve o estado
+    atual completo. Repita com ``next_cursor`` enquanto ``has_more`` for
+    verdadeiro. Um cursor que fica sem uso por mais tempo que a retenção dos
+    tombstones expira (422 ``sync_cursor_expired``) e exige uma sincronização
+    completa.
+    """
+    return change_feed_selector(
+        company=request.user.company, cursor=cursor, limit=limit
+    )
@@ -0,0 +1,12 @@
+from apps.core.cron import cron_registry
+from apps.sync.services import TombstoneService
+
+
+@cron_registry.register(
+    "purge_expired_tombstones",
+    description="Exclui os tombstones do feed de alterações fora da retenção.",
+)
+def run_purge_expired_tombstones() -> str:
+    """Remove os registros de exclusão mais antigos que a retenção do feed."""
+    purged = TombstoneService.purge_expired()
+    return f"{purged} tombstone(s) removido(s)."
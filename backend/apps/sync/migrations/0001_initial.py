@@ -0,0 +1,35 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:17
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('resource', models.CharField(choices=[('weddings', 'Casamentos'), ('contracts', 'Contratos'), ('expenses', 'Despesas'), ('installments', 'Parcelas'), ('events', 'Eventos'), ('tasks', 'Tarefas'), ('suppliers', 'Fornecedores')], max_length=20, verbose_name='Recurso')),
+                ('record_uuid', models.UUIDField(verbose_name='UUID do registro')),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_records', to='tenants.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Exclusão',
+                'verbose_name_plural': 'Exclusões',
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['company', 'created_at'], name='sync_tombst_company_4040d4_idx')],
+            },
+        ),
+    ]
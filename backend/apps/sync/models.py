@@ -0,0 +1,45 @@
+"""
+Modelos do feed de alterações (sincronização incremental).
+Responsabilidade: Registrar as exclusões (tombstones) dos recursos expostos no
+feed, já que uma linha apagada não aparece mais na consulta por ``updated_at``.
+"""
+
+from django.db import models
+
+from apps.tenants.models import TenantModel
+
+
+class Tombstone(TenantModel):
+    """
+    Marca a exclusão de um registro de um recurso sincronizável.
+
+    Criado pelo ``TombstoneService.delete`` para a raiz e para cada registro
+    removido em cascata. O ``created_at`` é o instante da exclusão e ordena o
+    feed junto com o ``updated_at`` dos registros vivos.
+    """
+
+    class ResourceChoices(models.TextChoices):
+        WEDDINGS = "weddings", "Casamentos"
+        CONTRACTS = "contracts", "Contratos"
+        EXPENSES = "expenses", "Despesas"
+        INSTALLMENTS = "installments", "Parcelas"
+        EVENTS = "events", "Eventos"
+        TASKS = "tasks", "Tarefas"
+        SUPPLIERS = "suppliers", "Fornecedores"
+
+    resource = models.CharField(
+        max_length=20, choices=ResourceChoices.choices, verbose_name="Recurso"
+    )
+    record_uuid = models.UUIDField(verbose_name="UUID do registro")
+
+    class Meta:
+        app_label = "sync"
+        verbose_name = "Exclusão"
+        verbose_name_plural = "Exclusões"
+        ordering = ["created_at", "id"]
+        indexes = [
+            models.Index(fields=["company", "created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.resource}:{self.record_uuid}"
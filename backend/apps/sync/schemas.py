@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from ninja import Schema
+from pydantic import UUID4
+
+
+class ChangeOut(Schema):
+    resource: str
+    uuid: UUID4
+    action: Literal["upsert", "delete"]
+    changed_at: datetime
+    data: dict[str, Any] | None = None
+
+
+class ChangeFeedOut(Schema):
+    changes: list[ChangeOut]
+    next_cursor: str | None = None
+    has_more: bool
@@ -0,0 +1,266 @@
+"""
+Selectors do feed de alterações (sincronização incremental).
+
+O feed intercala os registros alterados de cada recurso (por ``updated_at``)
+com os tombstones (por ``created_at``) numa única sequência ordenada por
+``(instante, fluxo, id)``. O cursor é a posição do último item entregue, então
+lotes de registros com o mesmo ``updated_at`` (``bulk_update``) nunca são
+cortados nem repetidos entre páginas.
+
+O cursor carrega também o horizonte: o instante a partir do qual o cliente
+ainda precisa dos tombstones (antes dele já está em dia). A expiração compara
+o horizonte com a retenção dos tombstones, não a data da última alteração, de
+modo que um tenant sem alterações recentes não perde o cursor.
+
+``updated_at`` é gravado antes do commit: uma transação longa pode tornar
+visível um registro com instante anterior ao de um cursor já entregue. Por
+isso o feed só entrega itens mais antigos que ``SYNC_FEED_SAFETY_LAG_SECONDS``;
+transações abertas por mais tempo que essa folga podem ter alterações perdidas.
+"""
+
+import binascii
+import heapq
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Literal
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.reporting.schemas import ExportResourceEnum
+from apps.reporting.selectors import EXPORT_SPECS
+from apps.sync.models import Tombstone
+from apps.tenants.models import Company
+
+
+# Fluxo 0 são os tombstones; os recursos seguem a ordem das choices. Novos
+# recursos entram no fim para não invalidar cursores já emitidos.
+_TOMBSTONE_STREAM = 0
+_RESOURCE_STREAMS: dict[str, int] = {
+    resource: index for index, resource in enumerate(Tombstone.ResourceChoices, 1)
+}
+
+
+@dataclass(frozen=True)
+class FeedPosition:
+    """Posição no feed: instante da alteração, fluxo e id do registro."""
+
+    changed_at: datetime
+    stream: int
+    pk: int
+
+
+@dataclass(frozen=True)
+class Change:
+    """Um item do feed: upsert (com os dados) ou exclusão (sem dados)."""
+
+    resource: str
+    uuid: UUID
+    action: Literal["upsert", "delete"]
+    changed_at: datetime
+    data: dict[str, Any] | None
+    position: FeedPosition
+
+
+@dataclass(frozen=True)
+class ChangeFeedPage:
+    """Página do feed e o cursor para a próxima chamada."""
+
+    changes: list[Change]
+    next_cursor: str | None
+    has_more: bool
+
+
+def _encode_cursor(position: FeedPosition, horizon: datetime) -> str:
+    """Serializa a posição e o horizonte como cursor opaco (base64 URL-safe)."""
+    raw = (
+        f"{position.changed_at.isoformat()}|{position.stream}|{position.pk}"
+        f"|{horizon.isoformat()}"
+    )
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[FeedPosition, datetime]:
+    """
+    Lê um cursor emitido pelo feed.
+
+    Returns:
+        A posição do último item entregue e o horizonte dos tombstones.
+
+    Raises:
+        BusinessRuleViolation: Se o cursor estiver malformado.
+    """
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        changed_at, stream, pk, horizon_raw = raw.split("|")
+        position = FeedPosition(
+            datetime.fromisoformat(changed_at), int(stream), int(pk)
+        )
+        horizon = datetime.fromisoformat(horizon_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise BusinessRuleViolation(
+            detail="Cursor de sincronização inválido.",
+            code="sync_invalid_cursor",
+        ) from e
+    if timezone.is_naive(position.changed_at) or timezone.is_naive(horizon):
+        raise BusinessRuleViolation(
+            detail="Cursor de sincronização inválido.",
+            code="sync_invalid_cursor",
+        )
+    return position, horizon
+
+
+def change_feed_selector(
+    *, company: Company, cursor: str | None = None, limit: int | None = None
+) -> ChangeFeedPage:
+    """
+    Lista o que mudou no tenant depois do cursor.
+
+    Sem cursor, devolve o estado atual completo (sem tombstones), paginado.
+    Cada página traz até ``limit`` itens; o cliente repete a chamada com
+    ``next_cursor`` enquanto ``has_more`` for verdadeiro e o guarda para a
+    próxima sincronização.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        cursor: ``next_cursor`` da chamada anterior.
+        limit: Tamanho da página (limitado a ``SYNC_FEED_MAX_PAGE_SIZE``).
+
+    Returns:
+        ChangeFeedPage com as alterações em ordem.
+
+    Raises:
+        BusinessRuleViolation: Se o cursor for inválido ou anterior à
+            retenção dos tombstones (o cliente precisa ressincronizar do zero).
+    """
+    limit = min(
+        max(limit or settings.SYNC_FEED_PAGE_SIZE, 1), settings.SYNC_FEED_MAX_PAGE_SIZE
+    )
+    now = timezone.now()
+    until = now - timedelta(seconds=settings.SYNC_FEED_SAFETY_LAG_SECONDS)
+    if cursor:
+        position, horizon = _decode_cursor(cursor)
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if horizon < now - retention:
+            raise BusinessRuleViolation(
+                detail=(
+                    "Cursor anterior à retenção do histórico de exclusões. "
+                    "Faça uma sincronização completa."
+                ),
+                code="sync_cursor_expired",
+            )
+    else:
+        # Sincronização completa: exclusões anteriores a ela não interessam.
+        position, horizon = None, now
+
+    streams = [
+        _resource_changes(company, resource, position, until, limit + 1)
+        for resource in Tombstone.ResourceChoices
+    ]
+    if position is not None:
+        streams.append(_tombstone_changes(company, position, until, limit + 1))
+    merged = heapq.merge(*streams, key=lambda change: _sort_key(change.position))
+    page = list(islice(merged, limit + 1))
+
+    has_more = len(page) > limit
+    changes = page[:limit]
+    if changes:
+        position = changes[-1].position
+    # Tudo até a posição (ou, na última página, até ``until``) foi entregue.
+    if has_more:
+        horizon = max(horizon, changes[-1].position.changed_at)
+    else:
+        horizon = max(horizon, until)
+    next_cursor = _encode_cursor(position, horizon) if position else None
+    return ChangeFeedPage(changes=changes, next_cursor=next_cursor, has_more=has_more)
+
+
+def _sort_key(position: FeedPosition) -> tuple[datetime, int, int]:
+    return position.changed_at, position.stream, position.pk
+
+
+def _after(
+    qs: QuerySet[Any],
+    field: str,
+    stream: int,
+    position: FeedPosition | None,
+    until: datetime,
+) -> QuerySet[Any]:
+    """
+    Filtra o que vem depois da posição na ordem ``(instante, fluxo, id)``.
+
+    Itens alterados depois de ``until`` (folga de segurança) ficam para a
+    próxima chamada.
+    """
+    qs = qs.filter(**{f"{field}__lte": until})
+    if position is None:
+        return qs
+    if stream > position.stream:
+        return qs.filter(**{f"{field}__gte": position.changed_at})
+    if stream < position.stream:
+        return qs.filter(**{f"{field}__gt": position.changed_at})
+    return qs.filter(
+        Q(**{f"{field}__gt": position.changed_at})
+        | Q(**{field: position.changed_at, "pk__gt": position.pk})
+    )
+
+
+def _resource_changes(
+    company: Company,
+    resource: str,
+    position: FeedPosition | None,
+    until: datetime,
+    size: int,
+) -> Iterator[Change]:
+    spec = EXPORT_SPECS[ExportResourceEnum(resource)]
+    stream = _RESOURCE_STREAMS[resource]
+    qs = _after(
+        spec.model._default_manager.filter(company=company),
+        "updated_at",
+        stream,
+        position,
+        until,
+    )
+    header = spec.header
+    lookups = [lookup for _, lookup in spec.columns]
+    rows = qs.order_by("updated_at", "pk").values_list("pk", "updated_at", *lookups)
+    for pk, updated_at, *values in rows[:size]:
+        data = dict(zip(header, values, strict=True))
+        yield Change(
+            resource=resource,
+            uuid=data["uuid"],
+            action="upsert",
+            changed_at=updated_at,
+            data=data,
+            position=FeedPosition(updated_at, stream, pk),
+        )
+
+
+def _tombstone_changes(
+    company: Company, position: FeedPosition, until: datetime, size: int
+) -> Iterator[Change]:
+    qs = _after(
+        Tombstone.objects.filter(company=company),
+        "created_at",
+        _TOMBSTONE_STREAM,
+        position,
+        until,
+    )
+    rows = qs.order_by("created_at", "pk").values_list(
+        "pk", "created_at", "resource", "record_uuid"
+    )
+    for pk, created_at, resource, record_uuid in rows[:size]:
+        yield Change(
+            resource=resource,
+            uuid=record_uuid,
+            action="delete",
+            changed_at=created_at,
+            data=None,
+            position=FeedPosition(created_at, _TOMBSTONE_STREAM, pk),
+        )
@@ -0,0 +1,135 @@
+"""
+Serviço de tombstones do feed de alterações.
+
+Exclusões de recursos sincronizáveis passam pelo ``TombstoneService.delete``
+(em vez do ``delete()`` direto) para que o feed consiga avisar os clientes do
+que sumiu, inclusive do que foi removido em cascata.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Model, QuerySet
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+from apps.sync.models import Tombstone
+from apps.tenants.models import Company
+
+
+logger = logging.getLogger(__name__)
+
+# Models sincronizáveis (label do Django -> recurso do feed).
+TRACKED_RESOURCES: dict[str, str] = {
+    "weddings.Wedding": Tombstone.ResourceChoices.WEDDINGS,
+    "logistics.Contract": Tombstone.ResourceChoices.CONTRACTS,
+    "finances.Expense": Tombstone.ResourceChoices.EXPENSES,
+    "finances.Installment": Tombstone.ResourceChoices.INSTALLMENTS,
+    "scheduler.Event": Tombstone.ResourceChoices.EVENTS,
+    "scheduler.Task": Tombstone.ResourceChoices.TASKS,
+    "logistics.Supplier": Tombstone.ResourceChoices.SUPPLIERS,
+}
+
+
+class TombstoneService:
+    """
+    Camada de serviço para as exclusões visíveis no feed de alterações.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def delete(
+        company: Company, target: Model | QuerySet[Any]
+    ) -> tuple[int, dict[str, int]]:
+        """
+        Exclui ``target`` registrando tombstones para o feed de alterações.
+
+        Usa o mesmo ``Collector`` do ORM para descobrir o que a exclusão vai
+        remover em cascata: cada registro sincronizável removido ganha um
+        tombstone, e os que apenas perdem uma FK (``SET_NULL``) têm o
+        ``updated_at`` renovado para reaparecerem no feed. A exclusão em si
+        continua sendo o ``delete()`` do alvo, preservando os QuerySets
+        customizados (ex.: versão de eventos do casamento).
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            target: Instância ou QuerySet (já filtrado pelo tenant) a excluir.
+
+        Returns:
+            O retorno padrão de ``delete()``.
+
+        Raises:
+            ProtectedError: Se uma relação ``PROTECT`` impedir a exclusão.
+        """
+        if isinstance(target, QuerySet):
+            collector = Collector(using=router.db_for_write(target.model))
+            collector.collect(target)
+        else:
+            collector = Collector(using=router.db_for_write(type(target)))
+            collector.collect([target])
+
+        Tombstone.objects.bulk_create(
+            Tombstone(company=company, resource=resource, record_uuid=record_uuid)
+            for resource, record_uuid in _deleted_records(collector)
+        )
+        _touch_nullified(collector, timezone.now())
+        return target.delete()
+
+    @staticmethod
+    def purge_expired(
+        company: Company | None = None, *, now: datetime | None = None
+    ) -> int:
+        """Exclui os tombstones mais antigos que a retenção do feed.
+
+        Cursores anteriores a ``SYNC_TOMBSTONE_RETENTION_DAYS`` deixam de ser
+        aceitos pelo feed, então esses tombstones não serão mais lidos.
+
+        Args:
+            company: Tenant opcional para restringir a operação.
+            now: Instante de referência (padrão: agora).
+
+        Returns:
+            int: Quantidade de tombstones excluídos.
+        """
+        now = now or timezone.now()
+        cutoff = now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        qs = Tombstone.objects.filter(created_at__lt=cutoff)
+        if company is not None:
+            qs = qs.filter(company=company)
+        deleted, _ = qs.delete()
+        if deleted:
+            logger.info("%d tombstone(s) expirado(s) removido(s).", deleted)
+        return deleted
+
+
+def _deleted_records(collector: Collector) -> Iterator[tuple[str, UUID]]:
+    for model, instances in collector.data.items():
+        resource = TRACKED_RESOURCES.get(model._meta.label)
+        if resource is not None:
+            for obj in instances:
+                yield resource, obj.uuid  # type: ignore[attr-defined]
+    for qs in collector.fast_deletes:
+        resource = TRACKED_RESOURCES.get(qs.model._meta.label)
+        if resource is not None:
+            for record_uuid in qs.values_list("uuid", flat=True):
+                yield resource, record_uuid
+
+
+def _touch_nullified(collector: Collector, now: datetime) -> None:
+    for (field, _), batches in collector.field_updates.items():
+        model = field.model
+        if model._meta.label not in TRACKED_RESOURCES:
+            continue
+        for batch in batches:
+            qs: QuerySet[Any]
+            if isinstance(batch, QuerySet):
+                qs = batch
+            else:
+                pks = [obj.pk for obj in cast(Iterable[Model], batch)]
+                qs = model._default_manager.filter(pk__in=pks)
+            qs.update(updated_at=now)
@@ -0,0 +1,47 @@
+from typing import Any, cast
+
+import pytest
+
+from apps.scheduler.models import Task
+from apps.scheduler.tests.factories import TaskFactory as _TaskFactory
+from apps.users.models import User
+
+
+def TaskFactory(*args: Any, **kwargs: Any) -> Task:
+    return cast(Task, _TaskFactory(*args, **kwargs))
+
+
+@pytest.mark.django_db
+class TestSyncAPI:
+    """Testes de integração do feed de alterações (/api/v1/sync/changes/)."""
+
+    def test_changes_unauthorized(self, client: Any) -> None:
+        response = client.get("/api/v1/sync/changes/")
+        assert response.status_code == 401
+
+    def test_changes_success(self, auth_client: Any, user: User) -> None:
+        task = TaskFactory(wedding__company=user.company)
+
+        response = auth_client.get("/api/v1/sync/changes/", {"limit": 1})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_more"] is True
+        assert data["changes"][0]["resource"] == "weddings"
+
+        response = auth_client.get(
+            "/api/v1/sync/changes/", {"cursor": data["next_cursor"]}
+        )
+        data = response.json()
+        assert data["has_more"] is False
+        [change] = data["changes"]
+        assert change["resource"] == "tasks"
+        assert change["uuid"] == str(task.uuid)
+        assert change["action"] == "upsert"
+        assert change["data"]["title"] == task.title
+
+    def test_changes_invalid_cursor(self, auth_client: Any) -> None:
+        response = auth_client.get("/api/v1/sync/changes/", {"cursor": "x"})
+
+        assert response.status_code == 422
+        assert response.json()["code"] == "sync_invalid_cursor"
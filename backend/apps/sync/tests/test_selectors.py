@@ -0,0 +1,148 @@
+from datetime import timedelta
+from typing import Any, cast
+
+import pytest
+from django.utils import timezone
+
+from apps.core.exceptions import BusinessRuleViolation
+from apps.logistics.models import Supplier
+from apps.logistics.tests.factories import SupplierFactory as _SupplierFactory
+from apps.scheduler.models import Task
+from apps.scheduler.services.tasks import TaskService
+from apps.scheduler.tests.factories import TaskFactory as _TaskFactory
+from apps.sync.selectors import change_feed_selector
+from apps.users.models import User
+from apps.weddings.models import Wedding
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
+
+
+def SupplierFactory(*args: Any, **kwargs: Any) -> Supplier:
+    return cast(Supplier, _SupplierFactory(*args, **kwargs))
+
+
+def TaskFactory(*args: Any, **kwargs: Any) -> Task:
+    return cast(Task, _TaskFactory(*args, **kwargs))
+
+
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
+def _drain(user: User, cursor: str | None, limit: int) -> tuple[list[Any], str | None]:
+    changes: list[Any] = []
+    while True:
+        page = change_feed_selector(company=user.company, cursor=cursor, limit=limit)
+        changes.extend(page.changes)
+        cursor = page.next_cursor
+        if not page.has_more:
+            return changes, cursor
+
+
+@pytest.mark.django_db
+class TestChangeFeedSelector:
+    """Feed de alterações: upserts, tombstones e paginação por cursor."""
+
+    def test_initial_sync_returns_current_state(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        task = TaskFactory(wedding=wedding)
+        supplier = SupplierFactory(company=user.company)
+        TaskFactory()  # outro tenant
+
+        page = change_feed_selector(company=user.company)
+
+        assert not page.has_more
+        assert page.next_cursor is not None
+        assert {(c.resource, c.uuid) for c in page.changes} == {
+            ("weddings", wedding.uuid),
+            ("tasks", task.uuid),
+            ("suppliers", supplier.uuid),
+        }
+        change = next(c for c in page.changes if c.resource == "tasks")
+        assert change.action == "upsert"
+        assert change.data is not None
+        assert change.data["wedding"] == wedding.uuid
+        assert change.data["title"] == task.title
+
+    def test_incremental_sync_returns_updates_and_deletes(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        kept = TaskFactory(wedding=wedding)
+        removed = TaskFactory(wedding=wedding)
+        cursor = change_feed_selector(company=user.company).next_cursor
+
+        kept.title = "Confirmar buffet"
+        kept.save()
+        TaskService.delete(user.company, removed)
+        page = change_feed_selector(company=user.company, cursor=cursor)
+
+        assert [(c.resource, c.uuid, c.action) for c in page.changes] == [
+            ("tasks", kept.uuid, "upsert"),
+            ("tasks", removed.uuid, "delete"),
+        ]
+        assert page.changes[1].data is None
+
+        empty = change_feed_selector(company=user.company, cursor=page.next_cursor)
+        assert empty.changes == []
+        assert empty.next_cursor is not None
+        again = change_feed_selector(company=user.company, cursor=empty.next_cursor)
+        assert again.changes == []
+
+    def test_pages_split_rows_with_the_same_timestamp(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        tasks = [TaskFactory(wedding=wedding) for _ in range(5)]
+        cursor = change_feed_selector(company=user.company).next_cursor
+        Task.objects.filter(wedding=wedding).update(updated_at=timezone.now())
+
+        changes, _ = _drain(user, cursor, limit=2)
+
+        assert [c.uuid for c in changes] == [task.uuid for task in tasks]
+
+    def test_invalid_cursor(self, user: User) -> None:
+        with pytest.raises(BusinessRuleViolation) as exc:
+            change_feed_selector(company=user.company, cursor="não-é-cursor")
+        assert exc.value.code == "sync_invalid_cursor"
+
+    def test_cursor_older_than_retention_expires(
+        self, user: User, settings: Any
+    ) -> None:
+        TaskFactory(wedding__company=user.company)
+        cursor = change_feed_selector(company=user.company).next_cursor
+        settings.SYNC_TOMBSTONE_RETENTION_DAYS = 0
+
+        with pytest.raises(BusinessRuleViolation) as exc:
+            change_feed_selector(company=user.company, cursor=cursor)
+        assert exc.value.code == "sync_cursor_expired"
+
+    def test_quiet_tenant_keeps_a_valid_cursor(self, user: User) -> None:
+        """Dados de 40 dias atrás não expiram o cursor (retenção de 30 dias)."""
+        wedding = WeddingFactory(company=user.company)
+        TaskFactory(wedding=wedding)
+        TaskFactory(wedding=wedding)
+        old = timezone.now() - timedelta(days=40)
+        Wedding.objects.filter(pk=wedding.pk).update(updated_at=old)
+        Task.objects.filter(wedding=wedding).update(updated_at=old)
+
+        first = change_feed_selector(company=user.company, limit=1)
+        assert first.has_more
+        changes, cursor = _drain(user, first.next_cursor, limit=1)
+        assert len(first.changes) + len(changes) == 3
+
+        page = change_feed_selector(company=user.company, cursor=cursor)
+        assert page.changes == []
+        assert (
+            change_feed_selector(company=user.company, cursor=page.next_cursor).changes
+            == []
+        )
+
+    def test_recent_changes_wait_for_the_safety_lag(
+        self, user: User, settings: Any
+    ) -> None:
+        settings.SYNC_FEED_SAFETY_LAG_SECONDS = 60
+        task = TaskFactory(wedding__company=user.company)
+
+        assert change_feed_selector(company=user.company).changes == []
+
+        Task.objects.filter(pk=task.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=61)
+        )
+        page = change_feed_selector(company=user.company)
+        assert [c.uuid for c in page.changes] == [task.uuid]
@@ -0,0 +1,167 @@
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, cast
+
+import pytest
+from django.utils import timezone
+
+from apps.core.exceptions import DomainIntegrityError
+from apps.finances.models import BudgetCategory, Expense, Installment
+from apps.finances.services.expense_service import ExpenseService
+from apps.finances.tests.factories import (
+    BudgetCategoryFactory as _BudgetCategoryFactory,
+)
+from apps.finances.tests.factories import ExpenseFactory as _ExpenseFactory
+from apps.finances.tests.factories import InstallmentFactory as _InstallmentFactory
+from apps.logistics.models import Contract, Supplier
+from apps.logistics.tests.factories import ContractFactory as _ContractFactory
+from apps.logistics.tests.factories import SupplierFactory as _SupplierFactory
+from apps.scheduler.models import Event, Task
+from apps.scheduler.services.tasks import TaskService
+from apps.scheduler.tests.factories import EventFactory as _EventFactory
+from apps.scheduler.tests.factories import TaskFactory as _TaskFactory
+from apps.sync.models import Tombstone
+from apps.sync.services import TombstoneService
+from apps.users.models import User
+from apps.weddings.models import Wedding
+from apps.weddings.services import WeddingService
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
+
+
+def BudgetCategoryFactory(*args: Any, **kwargs: Any) -> BudgetCategory:
+    return cast(BudgetCategory, _BudgetCategoryFactory(*args, **kwargs))
+
+
+def ContractFactory(*args: Any, **kwargs: Any) -> Contract:
+    return cast(Contract, _ContractFactory(*args, **kwargs))
+
+
+def EventFactory(*args: Any, **kwargs: Any) -> Event:
+    return cast(Event, _EventFactory(*args, **kwargs))
+
+
+def ExpenseFactory(*args: Any, **kwargs: Any) -> Expense:
+    return cast(Expense, _ExpenseFactory(*args, **kwargs))
+
+
+def InstallmentFactory(*args: Any, **kwargs: Any) -> Installment:
+    return cast(Installment, _InstallmentFactory(*args, **kwargs))
+
+
+def SupplierFactory(*args: Any, **kwargs: Any) -> Supplier:
+    return cast(Supplier, _SupplierFactory(*args, **kwargs))
+
+
+def TaskFactory(*args: Any, **kwargs: Any) -> Task:
+    return cast(Task, _TaskFactory(*args, **kwargs))
+
+
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
+def _expense(wedding: Wedding, **kwargs: Any) -> Expense:
+    category = BudgetCategoryFactory(wedding=wedding, budget__wedding=wedding)
+    return ExpenseFactory(wedding=wedding, category=category, **kwargs)
+
+
+def _tombstones() -> set[tuple[str, Any]]:
+    return set(Tombstone.objects.values_list("resource", "record_uuid"))
+
+
+@pytest.mark.django_db
+class TestTombstoneService:
+    """Exclusões registradas para o feed de alterações."""
+
+    def test_service_delete_records_tombstone(self, user: User) -> None:
+        task = TaskFactory(wedding__company=user.company)
+
+        TaskService.delete(user.company, task)
+
+        assert not Task.objects.filter(pk=task.pk).exists()
+        tombstone = Tombstone.objects.get()
+        assert tombstone.company == user.company
+        assert (tombstone.resource, tombstone.record_uuid) == ("tasks", task.uuid)
+
+    def test_cascade_records_every_tracked_child(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        task = TaskFactory(wedding=wedding)
+        event = EventFactory(wedding=wedding)
+
+        WeddingService.delete(user.company, wedding)
+
+        assert _tombstones() == {
+            ("weddings", wedding.uuid),
+            ("tasks", task.uuid),
+            ("events", event.uuid),
+        }
+
+    def test_expense_delete_records_installments(self, user: User) -> None:
+        expense = _expense(WeddingFactory(company=user.company))
+        installment = InstallmentFactory(expense=expense)
+
+        ExpenseService.delete(user.company, expense)
+
+        assert _tombstones() == {
+            ("expenses", expense.uuid),
+            ("installments", installment.uuid),
+        }
+
+    def test_queryset_delete_records_each_row(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        tasks = [TaskFactory(wedding=wedding) for _ in range(3)]
+
+        deleted, _ = TombstoneService.delete(
+            user.company, Task.objects.filter(wedding=wedding)
+        )
+
+        assert deleted == 3
+        assert _tombstones() == {("tasks", task.uuid) for task in tasks}
+
+    def test_set_null_relation_touches_updated_at(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        supplier = SupplierFactory(company=user.company)
+        contract = ContractFactory(
+            wedding=wedding, supplier=supplier, total_amount=Decimal("1000.00")
+        )
+        expense = _expense(
+            wedding, contract=contract, actual_amount=contract.total_amount
+        )
+        stale = timezone.now() - timedelta(days=1)
+        Expense.objects.filter(pk=expense.pk).update(updated_at=stale)
+
+        TombstoneService.delete(user.company, supplier)
+
+        expense.refresh_from_db()
+        assert expense.contract is None
+        assert expense.updated_at > stale
+        assert _tombstones() == {
+            ("suppliers", supplier.uuid),
+            ("contracts", contract.uuid),
+        }
+
+    def test_protected_delete_leaves_no_tombstones(self, user: User) -> None:
+        wedding = WeddingFactory(company=user.company)
+        ContractFactory(wedding=wedding)
+
+        with pytest.raises(DomainIntegrityError):
+            WeddingService.delete(user.company, wedding)
+
+        assert not Tombstone.objects.exists()
+
+    def test_purge_expired(self, user: User, settings: Any) -> None:
+        settings.SYNC_TOMBSTONE_RETENTION_DAYS = 30
+        TombstoneService.delete(
+            user.company, TaskFactory(wedding__company=user.company)
+        )
+        TombstoneService.delete(
+            user.company, TaskFactory(wedding__company=user.company)
+        )
+        old = Tombstone.objects.first()
+        assert old is not None
+        Tombstone.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+
+        assert TombstoneService.purge_expired() == 1
+        assert Tombstone.objects.count() == 1
@@ -4,8 +4,12 @@ Seletores de leitura para o domínio de Tenants (Empresas).
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Iterable
 from uuid import UUID
 
+from django.db.models import Count, Max, Model
+
 from apps.core.exceptions import ObjectNotFoundError
 from apps.tenants.models import Company
 
@@ -26,3 +30,31 @@ def company_get_selector(*, uuid: UUID | str) -> Company:
     if not company:
         raise ObjectNotFoundError(detail="Empresa não encontrada.")
     return company
+
+
+def tenant_data_version_selector(
+    *, company: Company, models: Iterable[type[Model]], extra: str = ""
+) -> str:
+    """Calcula um fingerprint barato dos dados do tenant nas tabelas informadas.
+
+    Para cada model, agrega quantidade e ``max(updated_at)`` do tenant (pelo
+    índice ``(company, updated_at)``): criações e edições mudam o máximo e
+    exclusões mudam a contagem. Serve de ETag para GETs condicionais.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+        models: Models de que a resposta depende (precisam de ``company``).
+        extra: Dado adicional que também invalida a versão (ex.: a data de
+            hoje em respostas que dependem dela).
+
+    Returns:
+        str: Hash hexadecimal da versão.
+    """
+    parts = [str(company.pk), extra]
+    for model in models:
+        state = model._default_manager.filter(company=company).aggregate(
+            count=Count("pk"), changed_at=Max("updated_at")
+        )
+        changed_at = state["changed_at"].isoformat() if state["changed_at"] else ""
+        parts.append(f"{model._meta.label}:{state['count']}:{changed_at}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
@@ -2,21 +2,32 @@
 Testes para os seletores do domínio de Tenants.
 """
 
+from datetime import timedelta
 from typing import Any, cast
 from uuid import uuid4
 
 import pytest
+from django.utils import timezone
 
 from apps.core.exceptions import ObjectNotFoundError
 from apps.tenants.models import Company
-from apps.tenants.selectors import company_get_selector
+from apps.tenants.selectors import (
+    company_get_selector,
+    tenant_data_version_selector,
+)
 from apps.tenants.tests.factories import CompanyFactory as _CompanyFactory
+from apps.weddings.models import Wedding
+from apps.weddings.tests.factories import WeddingFactory as _WeddingFactory
 
 
 def CompanyFactory(*args: Any, **kwargs: Any) -> Company:
     return cast(Company, _CompanyFactory(*args, **kwargs))
 
 
+def WeddingFactory(*args: Any, **kwargs: Any) -> Wedding:
+    return cast(Wedding, _WeddingFactory(*args, **kwargs))
+
+
 @pytest.mark.django_db
 class TestCompanyGetSelector:
     """Testes para o seletor company_get_selector."""
@@ -36,3 +47,43 @@ class TestCompanyGetSelector:
     def test_get_by_uuid_not_found_raises_object_not_found(self) -> None:
         with pytest.raises(ObjectNotFoundError):
             company_get_selector(uuid=uuid4())
+
+
+@pytest.mark.django_db
+class TestTenantDataVersionSelector:
+    """Testes para o seletor tenant_data_version_selector."""
+
+    def version(self, company: Company, extra: str = "") -> str:
+        return tenant_data_version_selector(
+            company=company, models=[Wedding], extra=extra
+        )
+
+    def test_stable_while_data_is_unchanged(self) -> None:
+        company = CompanyFactory()
+        WeddingFactory(company=company)
+        assert self.version(company) == self.version(company)
+
+    def test_changes_on_create_update_and_delete(self) -> None:
+        company = CompanyFactory()
+        wedding = WeddingFactory(company=company)
+        versions = [self.version(company)]
+
+        Wedding.objects.filter(pk=wedding.pk).update(
+            updated_at=timezone.now() + timedelta(seconds=1)
+        )
+        versions.append(self.version(company))
+        WeddingFactory(company=company)
+        versions.append(self.version(company))
+        Wedding.objects.filter(pk=wedding.pk).delete()
+        versions.append(self.version(company))
+
+        assert len(set(versions)) == 4
+
+    def test_ignores_other_tenants_and_uses_extra(self) -> None:
+        company = CompanyFactory()
+        before = self.version(company)
+        WeddingFactory()
+
+        assert self.version(company) == before
+        assert self.version(company, extra="2026-01-01") != before
+        assert self.version(CompanyFactory()) != before
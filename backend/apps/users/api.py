@@ -2,7 +2,6 @@ from typing import Any
 
 from django.http import HttpRequest
 from ninja_extra import Router
-from ninja_extra.throttling import AnonRateThrottle
 from ninja_jwt.schema import (
     TokenRefreshInputSchema,
     TokenRefreshOutputSchema,
@@ -11,6 +10,7 @@ from ninja_jwt.schema import (
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES
 from apps.core.schemas import ErrorResponse
+from apps.core.throttling import SlidingWindowAnonThrottle
 
 from .schemas import (
     GoogleAuthIn,
@@ -33,39 +33,39 @@ from .services.registration_service import RegistrationService
 from .services.token_service import TokenService
 
 
-class RegisterAnonThrottle(AnonRateThrottle):
+class RegisterAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_register"
 
 
-class LoginAnonThrottle(AnonRateThrottle):
+class LoginAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_login"
 
 
-class RefreshAnonThrottle(AnonRateThrottle):
+class RefreshAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_refresh"
 
 
-class VerifyAnonThrottle(AnonRateThrottle):
+class VerifyAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_verify"
 
 
-class GoogleAuthAnonThrottle(AnonRateThrottle):
+class GoogleAuthAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_google"
 
 
-class PasswordResetRequestAnonThrottle(AnonRateThrottle):
+class PasswordResetRequestAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_password_reset_request"
 
 
-class PasswordResetConfirmAnonThrottle(AnonRateThrottle):
+class PasswordResetConfirmAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_password_reset_confirm"
 
 
-class VerifyEmailAnonThrottle(AnonRateThrottle):
+class VerifyEmailAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_verify_email_token"
 
 
-class ResendVerificationAnonThrottle(AnonRateThrottle):
+class ResendVerificationAnonThrottle(SlidingWindowAnonThrottle):
     scope = "auth_resend_verification"
 
 
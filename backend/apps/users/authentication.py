@@ -0,0 +1,70 @@
+"""
+Autenticação JWT com verificação de estado no cache e usuário preguiçoso.
+
+Para tokens com as claims ``company_id`` e ``ver`` (emitidos por
+``apps.users.tokens``), a autenticação não consulta o banco quando o estado
+do usuário está no cache compartilhado, e ``request.user`` só é carregado
+(com a company, numa única query) quando o endpoint o acessa de fato.
+"""
+
+from typing import Any
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.utils.functional import SimpleLazyObject
+from ninja_extra.security import AsyncHttpBearer
+from ninja_jwt.authentication import AsyncJWTBaseAuthentication, JWTAuth
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import Token
+
+from apps.users.tokens import COMPANY_CLAIM, STATE_CLAIM, check_token_state
+
+
+class TenantJWTAuth(JWTAuth):
+    """
+    JWTAuth que valida tokens sem ida ao banco.
+
+    Tokens legados (sem a claim ``ver``) seguem o fluxo original do ninja_jwt,
+    com leitura do usuário no banco.
+    """
+
+    lazy_user = True
+
+    def get_user(self, validated_token: Token) -> AbstractBaseUser:
+        try:
+            check_token_state(validated_token)
+        except TokenError as e:
+            raise InvalidToken(str(e)) from e
+
+        if STATE_CLAIM not in validated_token.payload:
+            return super().get_user(validated_token)
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        company_id = validated_token[COMPANY_CLAIM]
+        if not self.lazy_user:
+            return self._load_user(user_id, company_id)
+        return SimpleLazyObject(  # type: ignore[return-value]
+            lambda: self._load_user(user_id, company_id)
+        )
+
+    def _load_user(self, user_id: Any, company_id: Any) -> AbstractBaseUser:
+        try:
+            return self.user_model.objects.select_related("company").get(
+                **{api_settings.USER_ID_FIELD: user_id}, company_id=company_id
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed("Usuário não encontrado.") from e
+
+
+class AsyncTenantJWTAuth(AsyncJWTBaseAuthentication, TenantJWTAuth, AsyncHttpBearer):
+    """
+    Versão assíncrona de TenantJWTAuth.
+
+    O usuário é carregado já na autenticação: um SimpleLazyObject avaliado
+    depois, dentro do event loop, faria uma query síncrona proibida.
+    """
+
+    lazy_user = False
+
+    async def authenticate(self, request: Any, token: str) -> Any:
+        return await self.async_jwt_authenticate(request, token)
@@ -0,0 +1,18 @@
+import logging
+
+from apps.core.cron import cron_registry
+from apps.users.tokens import prune_expired_tokens
+
+
+logger = logging.getLogger(__name__)
+
+
+@cron_registry.register(
+    "prune_expired_tokens",
+    description="Remove tokens JWT expirados das tabelas de blacklist.",
+)
+def run_prune_expired_tokens() -> str:
+    """Poda OutstandingToken/BlacklistedToken já expirados."""
+    deleted = prune_expired_tokens()
+    logger.info("%d token(s) expirado(s) removido(s).", deleted)
+    return f"{deleted} token(s) expirado(s) removido(s)."
@@ -197,6 +197,21 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = "Usuários"
         ordering = ["-date_joined"]
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Salva e descarta o estado do usuário usado na verificação de tokens."""
+        from apps.users.tokens import invalidate_user_token_state
+
+        super().save(*args, **kwargs)
+        invalidate_user_token_state(self.pk)
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        from apps.users.tokens import invalidate_user_token_state
+
+        user_id = self.pk
+        result = super().delete(*args, **kwargs)
+        invalidate_user_token_state(user_id)
+        return result
+
     def __str__(self) -> str:
         return f"{self.get_full_name()} ({self.email})"
 
@@ -4,13 +4,12 @@ from typing import cast
 
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
 from apps.core.exceptions import ApplicationError
+from apps.core.mail import queue_email, render_email
 from apps.users.models import User
 
 
@@ -21,7 +20,10 @@ class EmailVerificationService:
     def send_verification_email(
         cls, user: User, frontend_url: str | None = None
     ) -> None:
-        """Gera o token e envia o e-mail de verificação para o usuário.
+        """Gera o token e enfileira o e-mail de verificação para o usuário.
+
+        A mensagem é renderizada aqui e enviada pela fila de e-mails
+        (``apps.core.mail``) após o commit da transação.
 
         Args:
             user (User): Usuário que receberá o e-mail.
@@ -40,18 +42,15 @@ class EmailVerificationService:
             "verify_url": verify_url,
         }
 
-        subject = "Confirme seu e-mail"
-        text_content = render_to_string("emails/email_verification.txt", context)
-        html_content = render_to_string("emails/email_verification.html", context)
-
-        email_message = EmailMultiAlternatives(
-            subject,
-            text_content,
-            getattr(settings, "DEFAULT_FROM_EMAIL", "webmaster@localhost"),
-            [user.email],
+        queue_email(
+            render_email(
+                subject="Confirme seu e-mail",
+                to=[user.email],
+                text_template="emails/email_verification.txt",
+                html_template="emails/email_verification.html",
+                context=context,
+            )
         )
-        email_message.attach_alternative(html_content, "text/html")
-        email_message.send()
 
     @classmethod
     def verify_email(cls, uid: str, token: str) -> User:
@@ -2,7 +2,6 @@ import logging
 
 from django.db import transaction
 from django.utils import timezone
-from ninja_jwt.tokens import RefreshToken
 
 from apps.core.exceptions import AuthenticationFailedError
 from apps.core.services.social_auth import (
@@ -13,6 +12,7 @@ from apps.core.services.social_auth import (
 from apps.tenants.services.tenant_service import TenantService
 from apps.users.models import User
 from apps.users.schemas import TokenOut, UserDataOut
+from apps.users.tokens import TenantRefreshToken
 
 
 logger = logging.getLogger(__name__)
@@ -63,8 +63,7 @@ class GoogleAuthService:
 
         user = cls._get_or_create_user(user_info)
 
-        # ninja_jwt v5.4.5 alterou a assinatura de for_user
-        refresh = RefreshToken.for_user(user)  # type: ignore[misc]
+        refresh = TenantRefreshToken.for_user(user)
         token_out = TokenOut(
             access=str(refresh.access_token),
             refresh=str(refresh),
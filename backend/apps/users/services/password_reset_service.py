@@ -5,12 +5,11 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
 from apps.core.exceptions import ApplicationError
+from apps.core.mail import queue_email, render_email
 
 
 User = get_user_model()
@@ -23,7 +22,7 @@ class PasswordResetService:
         """
         Inicia o fluxo de redefinição de senha para o e-mail fornecido.
 
-        Gera token seguro via PasswordResetTokenGenerator e envia o e-mail
+        Gera token seguro via PasswordResetTokenGenerator e enfileira o e-mail
         transacional contendo o link de recuperação. Retorna silenciosamente
         caso o usuário não exista para evitar enumeração de e-mails.
 
@@ -56,18 +55,15 @@ class PasswordResetService:
             "reset_url": reset_url,
         }
 
-        subject = "Redefinição de Senha - Sim, Aceito!"
-        text_content = render_to_string("emails/password_reset.txt", context)
-        html_content = render_to_string("emails/password_reset.html", context)
-
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email],
+        queue_email(
+            render_email(
+                subject="Redefinição de Senha - Sim, Aceito!",
+                to=[user.email],
+                text_template="emails/password_reset.txt",
+                html_template="emails/password_reset.html",
+                context=context,
+            )
         )
-        msg.attach_alternative(html_content, "text/html")
-        msg.send()
 
     @staticmethod
     def confirm_password_reset(uid: str, token: str, new_password: str) -> None:
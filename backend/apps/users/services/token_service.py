@@ -1,17 +1,15 @@
 import hashlib
 import logging
-from typing import cast
 
 from django.contrib.auth import authenticate
-from ninja_jwt.schema import (
-    TokenRefreshInputSchema,
-    TokenRefreshOutputSchema,
-    TokenVerifyInputSchema,
-)
-from ninja_jwt.tokens import RefreshToken
+from ninja_jwt.exceptions import InvalidToken, TokenError
+from ninja_jwt.schema import TokenRefreshOutputSchema
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import UntypedToken
 
 from apps.core.exceptions import AuthenticationFailedError
 from apps.users.schemas import TokenOut, UserDataOut, VerifyTokenOut
+from apps.users.tokens import TenantRefreshToken, check_token_state
 
 
 logger = logging.getLogger(__name__)
@@ -64,8 +62,7 @@ class TokenService:
                 code="invalid_credentials",
             )
 
-        # ninja_jwt v5.4.5 alterou a assinatura de for_user
-        refresh = RefreshToken.for_user(user)  # type: ignore[misc]
+        refresh = TenantRefreshToken.for_user(user)
         token_out = TokenOut(
             access=str(refresh.access_token),
             refresh=str(refresh),
@@ -86,8 +83,9 @@ class TokenService:
         """
         Gera um novo par de tokens a partir de um token de atualização (refresh token).
 
-        Se a rotação de tokens estiver ativa (padrão do ninja_jwt), o token antigo
-        será invalidado e adicionado à blacklist, emitindo-se um novo refresh.
+        O token antigo é revogado na blacklist do banco de forma atômica (um
+        mesmo refresh usado por requisições concorrentes rotaciona uma única
+        vez) e um novo refresh é emitido com o estado atual do usuário.
 
         Args:
             refresh_token: O refresh token atual recebido na requisição.
@@ -102,15 +100,33 @@ class TokenService:
         """
         token_fp = hashlib.sha256(refresh_token.encode()).hexdigest()[:12]
         logger.info(f"Tentativa de refresh de token (fp={token_fp})")
-        schema = TokenRefreshInputSchema(refresh=refresh_token)
-        result = schema.to_response_schema()  # type: ignore[no-untyped-call]
+        from apps.users.models import User
+
+        try:
+            token = TenantRefreshToken(refresh_token)
+        except TokenError as e:
+            raise InvalidToken(str(e)) from e
+
+        user = User.objects.filter(
+            pk=token[api_settings.USER_ID_CLAIM], is_active=True
+        ).first()
+        if user is None:
+            raise InvalidToken("Usuário não encontrado ou inativo.")
+
+        new_refresh = token.rotate(user)
         logger.info(f"Token refresh bem-sucedido (fp={token_fp})")
-        return cast(TokenRefreshOutputSchema, result)
+        # model_construct: o validador do schema gravaria na blacklist do banco.
+        return TokenRefreshOutputSchema.model_construct(
+            refresh=str(new_refresh), access=str(new_refresh.access_token)
+        )
 
     @staticmethod
     def verify(token: str) -> VerifyTokenOut:
         """
-        Verifica a integridade e a validade temporal de um token JWT.
+        Verifica a integridade, a validade temporal e a revogação de um token JWT.
+
+        O estado do usuário vem do cache compartilhado (lido do banco na
+        ausência dele).
 
         Args:
             token: O token JWT (geralmente o access token) a ser validado.
@@ -123,8 +139,9 @@ class TokenService:
         """
         token_fp = hashlib.sha256(token.encode()).hexdigest()[:12]
         logger.info(f"Tentativa de verificação de token (fp={token_fp})")
-        schema = TokenVerifyInputSchema(token=token)
-        # O método levanta HttpError(401) caso o token seja inválido.
-        schema.to_response_schema()  # type: ignore[no-untyped-call]
+        try:
+            check_token_state(UntypedToken(token))
+        except TokenError as e:
+            raise InvalidToken(str(e)) from e
         logger.info(f"Token verificado com sucesso (fp={token_fp})")
         return VerifyTokenOut()
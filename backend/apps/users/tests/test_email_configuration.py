@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from django.core import mail
@@ -18,9 +18,12 @@ class TestEmailConfiguration:
     """
 
     @override_settings(DEFAULT_FROM_EMAIL="contato@simaceito.site")
-    def test_email_verification_uses_custom_default_from_email(self) -> None:
+    def test_email_verification_uses_custom_default_from_email(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
         user = cast(User, UserFactory(is_active=False, is_email_verified=False))
-        EmailVerificationService.send_verification_email(user)
+        with django_capture_on_commit_callbacks(execute=True):
+            EmailVerificationService.send_verification_email(user)
 
         assert len(mail.outbox) == 1
         sent_email = mail.outbox[0]
@@ -28,9 +31,12 @@ class TestEmailConfiguration:
         assert user.email in sent_email.to
 
     @override_settings(DEFAULT_FROM_EMAIL="contato@simaceito.site")
-    def test_password_reset_uses_custom_default_from_email(self) -> None:
+    def test_password_reset_uses_custom_default_from_email(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
         user = cast(User, UserFactory(email="recuperar@simaceito.site"))
-        PasswordResetService.request_password_reset(email=user.email)
+        with django_capture_on_commit_callbacks(execute=True):
+            PasswordResetService.request_password_reset(email=user.email)
 
         assert len(mail.outbox) == 1
         sent_email = mail.outbox[0]
@@ -12,9 +12,12 @@ from apps.users.services.email_verification_service import EmailVerificationServ
 
 @pytest.mark.django_db
 class TestEmailVerificationService:
-    def test_send_verification_email(self, user_factory: Any) -> None:
+    def test_send_verification_email(
+        self, user_factory: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
         user = user_factory.create(is_active=False, is_email_verified=False)
-        EmailVerificationService.send_verification_email(user)
+        with django_capture_on_commit_callbacks(execute=True):
+            EmailVerificationService.send_verification_email(user)
 
         assert len(mail.outbox) == 1
         assert mail.outbox[0].subject == "Confirme seu e-mail"
@@ -40,9 +43,12 @@ class TestEmailVerificationService:
 
         assert exc_info.value.code == "invalid_token"
 
-    def test_resend_verification_email_success(self, user_factory: Any) -> None:
+    def test_resend_verification_email_success(
+        self, user_factory: Any, django_capture_on_commit_callbacks: Any
+    ) -> None:
         user = user_factory.create(is_active=False, is_email_verified=False)
-        EmailVerificationService.resend_verification_email(user.email)
+        with django_capture_on_commit_callbacks(execute=True):
+            EmailVerificationService.resend_verification_email(user.email)
 
         assert len(mail.outbox) == 1
         assert mail.outbox[0].subject == "Confirme seu e-mail"
@@ -22,14 +22,17 @@ def unauth_client() -> Client:
 
 @pytest.mark.django_db
 class TestPasswordResetAPI:
-    def test_request_password_reset(self, unauth_client: Client) -> None:
+    def test_request_password_reset(
+        self, unauth_client: Client, django_capture_on_commit_callbacks: Any
+    ) -> None:
         UserFactory(email="test_api@example.com")
 
-        response = unauth_client.post(
-            "/api/v1/auth/password-reset/request/",
-            {"email": "test_api@example.com"},
-            content_type="application/json",
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            response = unauth_client.post(
+                "/api/v1/auth/password-reset/request/",
+                {"email": "test_api@example.com"},
+                content_type="application/json",
+            )
 
         assert response.status_code == 200
         assert (
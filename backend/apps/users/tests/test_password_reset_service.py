@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from django.contrib.auth.tokens import default_token_generator
@@ -14,9 +14,12 @@ from apps.users.tests.factories import UserFactory
 
 @pytest.mark.django_db
 class TestPasswordResetService:
-    def test_request_password_reset_success(self) -> None:
+    def test_request_password_reset_success(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
         user = cast(User, UserFactory(email="test@example.com"))
-        PasswordResetService.request_password_reset(email="test@example.com")
+        with django_capture_on_commit_callbacks(execute=True):
+            PasswordResetService.request_password_reset(email="test@example.com")
 
         assert len(mail.outbox) == 1
         assert mail.outbox[0].subject == "Redefinição de Senha - Sim, Aceito!"
@@ -5,19 +5,36 @@ Cobre os métodos:
 - TokenService.obtain() — via conftest já existente
 - TokenService.refresh() — refresh de token
 - TokenService.verify() — verificação de token
+- Tokens de tenant (apps.users.tokens) e TenantJWTAuth
 
 Regra: toda função pública em services.py deve ter ≥1 teste de sucesso
 e ≥1 teste de falha.
 """
 
+from datetime import timedelta
+
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from ninja.errors import HttpError
+from ninja_jwt.exceptions import TokenError
 from ninja_jwt.schema import TokenRefreshOutputSchema
-from ninja_jwt.tokens import RefreshToken
+from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from ninja_jwt.tokens import AccessToken, RefreshToken
 
 from apps.core.exceptions import AuthenticationFailedError
+from apps.users.authentication import TenantJWTAuth
 from apps.users.schemas import TokenOut, UserDataOut, VerifyTokenOut
 from apps.users.services.token_service import TokenService
+from apps.users.tokens import (
+    COMPANY_CLAIM,
+    STATE_CLAIM,
+    TenantRefreshToken,
+    prune_expired_tokens,
+)
 
 
 pytestmark = pytest.mark.django_db
@@ -120,3 +137,119 @@ class TestTokenServiceVerify:
             TokenService.verify("invalid.token.here")
 
         assert exc_info.value.status_code == 401
+
+
+class TestTenantTokens:
+    """Tokens com claims de tenant, estado no cache e revogação no banco."""
+
+    def test_obtain_embeds_tenant_claims(self, user_factory):
+        user = user_factory.create(email="claims@example.com", is_active=True)
+        user.set_password("password123")
+        user.save()
+
+        result = TokenService.obtain("claims@example.com", "password123")
+
+        access = AccessToken(result.access)
+        assert access[COMPANY_CLAIM] == user.company_id
+        assert access[STATE_CLAIM]
+
+    def test_verify_does_not_hit_the_database(self, user_factory):
+        user = user_factory.create(is_active=True)
+        access = str(TenantRefreshToken.for_user(user).access_token)
+        TokenService.verify(access)  # aquece o estado do usuário no cache
+
+        with CaptureQueriesContext(connection) as queries:
+            TokenService.verify(access)
+
+        assert len(queries) == 0
+
+    def test_password_change_revokes_issued_tokens(self, user_factory):
+        user = user_factory.create(is_active=True)
+        access = str(TenantRefreshToken.for_user(user).access_token)
+        TokenService.verify(access)
+
+        user.set_password("outra-senha-123")
+        user.save()
+
+        with pytest.raises(HttpError) as exc_info:
+            TokenService.verify(access)
+        assert exc_info.value.status_code == 401
+
+    def test_deactivation_blocks_refresh(self, user_factory):
+        user = user_factory.create(is_active=True)
+        refresh = str(TenantRefreshToken.for_user(user))
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(HttpError) as exc_info:
+            TokenService.refresh(refresh)
+        assert exc_info.value.status_code == 401
+
+    def test_refresh_rotation_is_recorded_in_the_database(self, user_factory):
+        user = user_factory.create(is_active=True)
+        refresh = str(TenantRefreshToken.for_user(user))
+
+        TokenService.refresh(refresh)
+        cache.clear()  # o cache não é a fonte de verdade da revogação
+
+        blacklisted = BlacklistedToken.objects.select_related("token").get()
+        assert blacklisted.token.user_id == user.id
+        with pytest.raises(HttpError) as exc_info:
+            TokenService.refresh(refresh)
+        assert exc_info.value.status_code == 401
+
+    def test_concurrent_rotation_of_the_same_refresh_fails(self, user_factory):
+        user = user_factory.create(is_active=True)
+        raw = str(TenantRefreshToken.for_user(user))
+        # Duas requisições que passaram pela checagem antes de qualquer rotação.
+        first, second = TenantRefreshToken(raw), TenantRefreshToken(raw)
+
+        first.rotate(user)
+
+        with pytest.raises(TokenError):
+            second.rotate(user)
+        assert BlacklistedToken.objects.count() == 1
+
+    @override_settings(AUTH_TOKEN_STATE_CACHE_SECONDS=0)
+    def test_state_is_read_from_database_without_shared_cache(self, user_factory):
+        user = user_factory.create(is_active=True)
+        access = str(TenantRefreshToken.for_user(user).access_token)
+        TokenService.verify(access)
+
+        # Alteração feita por outro processo: nenhuma invalidação local.
+        type(user).objects.filter(pk=user.pk).update(is_active=False)
+
+        with pytest.raises(HttpError) as exc_info:
+            TokenService.verify(access)
+        assert exc_info.value.status_code == 401
+        assert cache.get(f"auth:user_state:{user.pk}") is None
+
+    def test_authentication_loads_user_lazily(self, user_factory, rf):
+        user = user_factory.create(is_active=True)
+        access = str(TenantRefreshToken.for_user(user).access_token)
+        TokenService.verify(access)
+        request = rf.get("/")
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticated = TenantJWTAuth().authenticate(request, access)
+        assert len(queries) == 0
+
+        with CaptureQueriesContext(connection) as queries:
+            assert authenticated.company.name == user.company.name
+        assert len(queries) == 1
+
+    def test_prune_expired_tokens(self, user_factory):
+        user = user_factory.create(is_active=True)
+        now = timezone.now()
+        expired = OutstandingToken.objects.create(
+            user=user, jti="old", token="x", expires_at=now - timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(token=expired)
+        OutstandingToken.objects.create(
+            user=user, jti="new", token="y", expires_at=now + timedelta(days=1)
+        )
+
+        assert prune_expired_tokens() == 1
+        assert list(OutstandingToken.objects.values_list("jti", flat=True)) == ["new"]
+        assert not BlacklistedToken.objects.exists()
@@ -0,0 +1,191 @@
+"""
+Tokens JWT com claims de tenant e verificação de estado sem banco.
+
+Os tokens emitidos carregam ``company_id`` e ``ver`` (impressão digital do
+estado do usuário: hash da senha e flag ``is_active``). A verificação confere
+assinatura e expiração localmente e o estado atual do usuário vem do cache
+compartilhado (Redis), lido do banco quando ausente. Trocar a senha ou
+desativar a conta muda o estado e invalida todos os tokens emitidos antes.
+
+O cache é só uma camada de leitura: com ``AUTH_TOKEN_STATE_CACHE_SECONDS = 0``
+(produção sem Redis, onde cada processo teria o seu LocMemCache) o estado é
+lido do banco a cada verificação.
+
+A revogação do refresh continua no banco (``ninja_jwt.token_blacklist``), a
+fonte de verdade: a linha só é gravada na rotação, e a unicidade do
+BlacklistedToken garante que um mesmo refresh rotacione uma única vez. As
+tabelas são podadas pelo cron ``prune_expired_tokens``.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+from ninja_jwt.exceptions import TokenError
+from ninja_jwt.settings import api_settings
+from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from ninja_jwt.tokens import AccessToken, RefreshToken, Token
+from ninja_jwt.utils import datetime_from_epoch
+
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+
+COMPANY_CLAIM = "company_id"
+STATE_CLAIM = "ver"
+
+# Estado gravado no cache para usuários inexistentes ou inativos.
+_NO_USER = "-"
+
+
+def _state_key(user_id: Any) -> str:
+    return f"auth:user_state:{user_id}"
+
+
+def user_token_state(user: "User") -> str:
+    """
+    Impressão digital do estado do usuário relevante para autenticação.
+
+    Usuários inativos não têm estado válido: nenhum token passa.
+
+    Args:
+        user: Usuário dono do token.
+
+    Returns:
+        Hash curto que muda quando a senha ou o ``is_active`` mudam.
+    """
+    if not user.is_active:
+        return _NO_USER
+    value = f"{user.password}|{user.is_active}"
+    return salted_hmac("apps.users.tokens.state", value).hexdigest()[:16]
+
+
+def invalidate_user_token_state(user_id: Any) -> None:
+    """
+    Descarta o estado do usuário no cache (chamado a cada save/delete do User).
+
+    A chave é apagada já e de novo após o commit: assim, uma leitura feita por
+    outro processo antes do commit não deixa o estado antigo no cache.
+
+    Args:
+        user_id: ID do usuário alterado.
+    """
+    key = _state_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def _load_user_token_state(user_id: Any) -> str:
+    """Lê o estado do banco e o publica no cache, se habilitado."""
+    from apps.users.models import User
+
+    user = User.objects.filter(pk=user_id).only("password", "is_active").first()
+    state = user_token_state(user) if user is not None else _NO_USER
+    timeout = settings.AUTH_TOKEN_STATE_CACHE_SECONDS
+    if timeout > 0:
+        cache.set(_state_key(user_id), state, timeout=timeout)
+    return state
+
+
+def check_token_state(token: Token) -> None:
+    """
+    Confere o estado do usuário gravado no token contra o estado atual.
+
+    Tokens emitidos antes da claim ``ver`` (sem ela) não são verificados
+    aqui; o chamador decide como validá-los.
+
+    Args:
+        token: Token já decodificado e com assinatura/expiração verificadas.
+
+    Raises:
+        TokenError: Se a senha ou o ``is_active`` do usuário mudaram.
+    """
+    expected = token.payload.get(STATE_CLAIM)
+    if expected is None:
+        return
+    user_id = token.payload.get(api_settings.USER_ID_CLAIM)
+    state = None
+    if settings.AUTH_TOKEN_STATE_CACHE_SECONDS > 0:
+        state = cache.get(_state_key(user_id))
+    if state is None:
+        state = _load_user_token_state(user_id)
+    if state == _NO_USER or state != expected:
+        raise TokenError("Token revogado.")
+
+
+def _add_user_claims(token: Token, user: "User") -> None:
+    token[api_settings.USER_ID_CLAIM] = getattr(user, api_settings.USER_ID_FIELD)
+    token[COMPANY_CLAIM] = user.company_id
+    token[STATE_CLAIM] = user_token_state(user)
+
+
+class TenantAccessToken(AccessToken):
+    """Access token com as claims ``company_id`` e ``ver``."""
+
+
+class TenantRefreshToken(RefreshToken):
+    """
+    Refresh token com claims de tenant.
+
+    A emissão não grava OutstandingToken; a linha (e o BlacklistedToken) só
+    é criada quando o token é revogado na rotação.
+    """
+
+    access_token_class = TenantAccessToken
+
+    @classmethod
+    def for_user(cls, user: "User") -> "TenantRefreshToken":  # type: ignore[override]
+        token = cls()
+        _add_user_claims(token, user)
+        return token
+
+    def check_blacklist(self) -> None:
+        check_token_state(self)
+        super().check_blacklist()
+
+    @transaction.atomic
+    def blacklist(self) -> BlacklistedToken:
+        """
+        Revoga o token no banco; só a primeira revogação de um ``jti`` vence.
+
+        Raises:
+            TokenError: Se o token já tinha sido revogado (inclusive por uma
+                requisição concorrente com o mesmo refresh).
+        """
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults={
+                "user_id": self.payload.get(api_settings.USER_ID_CLAIM),
+                "token": str(self),
+                "expires_at": datetime_from_epoch(self.payload["exp"]),
+            },
+        )
+        # O OneToOne do BlacklistedToken serializa rotações concorrentes: a
+        # segunda inserção colide e cai no ramo "já existia".
+        blacklisted, created = BlacklistedToken.objects.get_or_create(token=outstanding)
+        if not created:
+            raise TokenError("Token revogado.")
+        return blacklisted
+
+    def rotate(self, user: "User") -> "TenantRefreshToken":
+        """Revoga este token e emite o próximo da rotação para o usuário."""
+        self.blacklist()
+        return type(self).for_user(user)
+
+
+def prune_expired_tokens() -> int:
+    """
+    Remove tokens expirados das tabelas do ``ninja_jwt.token_blacklist``.
+
+    BlacklistedToken é apagado em cascata com o OutstandingToken.
+
+    Returns:
+        Quantidade de OutstandingToken removidos.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+    _, deleted = expired.delete()
+    return deleted.get(OutstandingToken._meta.label, 0)
@@ -6,10 +6,12 @@ from ninja_extra import Router
 from pydantic import UUID4
 
 from apps.core.constants import MUTATION_ERROR_RESPONSES, READ_ERROR_RESPONSES
+from apps.core.decorators import conditional_get
 from apps.users.types import AuthRequest
 from apps.weddings.models import Wedding
 from apps.weddings.schemas import (
     WeddingByMonthOut,
+    WeddingCloneIn,
     WeddingIn,
     WeddingLookupOut,
     WeddingOut,
@@ -17,6 +19,7 @@ from apps.weddings.schemas import (
 )
 from apps.weddings.selectors import (
     wedding_count_by_month_selector,
+    wedding_data_version_selector,
     wedding_get_selector,
     wedding_list_selector,
     wedding_lookup_selector,
@@ -27,7 +30,13 @@ from apps.weddings.services import WeddingService
 router = Router(tags=["Weddings"])
 
 
+def _data_version(request: AuthRequest, **_: object) -> str:
+    """Versão dos dados de casamentos do tenant (ETag das leituras)."""
+    return wedding_data_version_selector(company=request.user.company)
+
+
 @router.get("/lookup/", response=list[WeddingLookupOut], operation_id="weddings_lookup")
+@conditional_get(_data_version)
 def list_weddings_lookup(request: AuthRequest) -> QuerySet[Wedding]:
     """Retorna lista simplificada de casamentos para comboboxes."""
     user = request.user
@@ -35,6 +44,7 @@ def list_weddings_lookup(request: AuthRequest) -> QuerySet[Wedding]:
 
 
 @router.get("/", response=list[WeddingOut], operation_id="weddings_list")
+@conditional_get(_data_version)
 @paginate
 def list_weddings(
     request: AuthRequest,
@@ -50,6 +60,7 @@ def list_weddings(
     response=list[WeddingByMonthOut],
     operation_id="weddings_by_month",
 )
+@conditional_get(_data_version)
 def list_weddings_by_month(
     request: AuthRequest,
     year: int,
@@ -64,6 +75,7 @@ def list_weddings_by_month(
     response={200: WeddingOut, **READ_ERROR_RESPONSES},
     operation_id="weddings_read",
 )
+@conditional_get(_data_version)
 def retrieve_wedding(request: AuthRequest, uuid: UUID4) -> Wedding:
     user = request.user
     return wedding_get_selector(company=user.company, uuid=uuid)
@@ -80,6 +92,23 @@ def create_wedding(request: AuthRequest, payload: WeddingIn) -> tuple[int, Weddi
     return 201, wedding
 
 
+@router.post(
+    "/{uuid:uuid}/clone/",
+    response={201: WeddingOut, **MUTATION_ERROR_RESPONSES},
+    operation_id="weddings_clone",
+)
+def clone_wedding(
+    request: AuthRequest, uuid: UUID4, payload: WeddingCloneIn
+) -> tuple[int, Wedding]:
+    """Cria um casamento copiando o planejamento de um existente."""
+    user = request.user
+    instance = wedding_get_selector(company=user.company, uuid=uuid)
+    wedding = WeddingService.clone(
+        company=user.company, instance=instance, payload=payload
+    )
+    return 201, wedding
+
+
 @router.patch(
     "/{uuid:uuid}/",
     response={200: WeddingOut, **MUTATION_ERROR_RESPONSES},
@@ -7,8 +7,9 @@ from __future__ import annotations
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
-from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models import Count, F, OuterRef, Q, Subquery
 from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from apps.core.exceptions import BusinessRuleViolation
 from apps.tenants.managers import TenantQuerySet
@@ -200,3 +201,17 @@ class WeddingQuerySet(TenantQuerySet["Wedding"]):
             WeddingQuerySet otimizado para componentes de seleção/lookup.
         """
         return self.only("uuid", "bride_name", "groom_name").order_by("bride_name")
+
+    def bump_events_version(self) -> int:
+        """
+        Incrementa o contador de versão dos eventos do calendário.
+
+        Chamado a cada mudança em eventos (ou exceções de ocorrência) dos
+        casamentos filtrados; alimenta o ETag/Last-Modified do feed iCalendar.
+
+        Returns:
+            Quantidade de casamentos atualizados.
+        """
+        return self.update(
+            events_version=F("events_version") + 1, events_changed_at=timezone.now()
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weddings', '0002_wedding_template'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wedding',
+            name='events_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Última Mudança nos Eventos'),
+        ),
+        migrations.AddField(
+            model_name='wedding',
+            name='events_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Incrementada a cada mudança nos eventos do calendário', verbose_name='Versão dos Eventos'),
+        ),
+    ]
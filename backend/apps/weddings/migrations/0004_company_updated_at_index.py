@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+        ('weddings', '0003_wedding_events_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wedding',
+            index=models.Index(fields=['company', 'updated_at'], name='weddings_we_company_ca305a_idx'),
+        ),
+    ]
@@ -43,6 +43,18 @@ class Wedding(TenantModel):
         verbose_name="Modelo de Cronograma",
         help_text="Template aplicado na criação do casamento",
     )
+    events_version = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Versão dos Eventos",
+        help_text="Incrementada a cada mudança nos eventos do calendário",
+    )
+    events_changed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Última Mudança nos Eventos",
+    )
 
     class Meta:
         verbose_name = "Casamento"
@@ -50,6 +62,7 @@ class Wedding(TenantModel):
         ordering = ["-date"]
         indexes = [
             models.Index(fields=["company", "status"]),
+            models.Index(fields=["company", "updated_at"]),
             models.Index(fields=["date"]),
             models.Index(fields=["status"]),
         ]
@@ -57,6 +70,11 @@ class Wedding(TenantModel):
     def __str__(self) -> str:
         return f"{self.groom_name} & {self.bride_name}"
 
+    @property
+    def display_name(self) -> str:
+        """Nome de exibição usado em notificações (ex: "Casamento de A e B")."""
+        return f"Casamento de {self.bride_name} e {self.groom_name}"
+
     def clean(self) -> None:
         """Validações de negócio."""
         super().clean()
@@ -34,6 +34,17 @@ class WeddingPatchIn(Schema):
     status: WeddingStatusEnum | None = None
 
 
+class WeddingCloneIn(Schema):
+    model_config = {"extra": "ignore"}
+
+    groom_name: str
+    bride_name: str
+    date: datetime.date
+    location: str | None = None
+    expected_guests: int | None = None
+    include_logistics: bool = False
+
+
 class WeddingOut(Schema):
     uuid: UUID4
     groom_name: str
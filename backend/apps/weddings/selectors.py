@@ -13,6 +13,7 @@ from uuid import UUID
 from django.db.models import Count
 
 from apps.core.shortcuts import get_object_or_404_for_tenant
+from apps.tenants.selectors import tenant_data_version_selector
 from apps.weddings.models import Wedding
 
 
@@ -139,3 +140,23 @@ def critical_weddings_selector(
         .with_critical_metrics(today=today)
         .order_by("date")[:limit]
     )
+
+
+def wedding_data_version_selector(*, company: Company) -> str:
+    """
+    Versão (ETag) dos dados exibidos nas rotas de casamentos.
+
+    Inclui as tabelas das métricas anotadas por ``with_metrics``.
+
+    Args:
+        company: O tenant atual para isolamento de dados.
+
+    Returns:
+        str: Fingerprint dos dados do tenant.
+    """
+    from apps.finances.models import Budget, Installment
+    from apps.scheduler.models import Task
+
+    return tenant_data_version_selector(
+        company=company, models=(Wedding, Budget, Installment, Task)
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, time, timedelta
+from datetime import timedelta
 
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
@@ -12,11 +12,13 @@ from apps.core.exceptions import (
     DomainIntegrityError,
 )
 from apps.core.tenant import validate_tenant_ownership
-from apps.scheduler.schemas import EventIn
+from apps.notifications.services import NotificationService
+from apps.sync.services import TombstoneService
 from apps.tenants.models import Company
 
 from .models import Wedding
 from .schemas import (
+    WeddingCloneIn,
     WeddingIn,
     WeddingPatchIn,
 )
@@ -24,6 +26,9 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Linhas por INSERT nas cópias em lote do clone (limita o tamanho do statement).
+CLONE_BATCH_SIZE = 500
+
 
 class WeddingService:
     """
@@ -138,9 +143,88 @@ class WeddingService:
                 code="wedding_validation_error",
             ) from e
 
+        # Notificações guardam o nome do casamento; propaga renomeações.
+        if {"bride_name", "groom_name"} & data.keys():
+            NotificationService.sync_wedding_name(company, instance)
+
         logger.info(f"Casamento uuid={instance.uuid} atualizado.")
         return instance
 
+    @staticmethod
+    @transaction.atomic
+    def clone(company: Company, instance: Wedding, payload: WeddingCloneIn) -> Wedding:
+        """
+        Cria um novo casamento a partir de um existente.
+
+        Copia orçamento, categorias, tarefas e eventos (com as datas deslocadas
+        pela diferença entre as datas dos casamentos) e, opcionalmente,
+        contratos e itens. Cada tabela é lida uma vez e inserida em lotes com
+        as chaves estrangeiras remapeadas, então o número de queries não
+        depende do tamanho do casamento de origem.
+
+        Dados financeiros realizados (despesas, parcelas e os eventos de
+        pagamento gerados por elas) não são copiados; contratos voltam a
+        rascunho e itens a pendente.
+
+        Args:
+            company: O tenant atual para isolamento de dados.
+            instance: Casamento de origem.
+            payload: Dados do novo casamento e opções da cópia.
+
+        Returns:
+            O novo casamento criado.
+
+        Raises:
+            BusinessRuleViolation: Se os dados do novo casamento forem inválidos.
+        """
+        validate_tenant_ownership(
+            company,
+            instance,
+            detail="Casamento não encontrado ou acesso negado.",
+            code="wedding_not_found_or_denied",
+        )
+        logger.info(
+            f"Clonando casamento uuid={instance.uuid} pela company_id={company.id}"
+        )
+
+        wedding = Wedding(
+            company=company,
+            groom_name=payload.groom_name,
+            bride_name=payload.bride_name,
+            date=payload.date,
+            location=(
+                payload.location if payload.location is not None else instance.location
+            ),
+            expected_guests=(
+                payload.expected_guests
+                if payload.expected_guests is not None
+                else instance.expected_guests
+            ),
+            template=instance.template,
+        )
+        try:
+            wedding.save()
+        except DjangoValidationError as e:
+            logger.warning(
+                f"Falha de validação ao clonar casamento uuid={instance.uuid} "
+                f"pela company_id={company.id}: {e}"
+            )
+            detail = "; ".join(e.messages) if e.messages else str(e)
+            raise BusinessRuleViolation(
+                detail=detail,
+                code="wedding_validation_error",
+            ) from e
+
+        shift = timedelta(days=(wedding.date - instance.date).days)
+        _clone_budget(instance, wedding)
+        _clone_tasks(instance, wedding, shift)
+        _clone_events(instance, wedding, shift)
+        if payload.include_logistics:
+            _clone_logistics(instance, wedding, shift)
+
+        logger.info(f"Casamento uuid={instance.uuid} clonado como uuid={wedding.uuid}")
+        return wedding
+
     @staticmethod
     @transaction.atomic
     def delete(company: Company, instance: Wedding) -> None:
@@ -170,7 +254,7 @@ class WeddingService:
         )
 
         try:
-            instance.delete()
+            TombstoneService.delete(company, instance)
             logger.warning(
                 f"Casamento uuid={instance.uuid} e dependências removidos pela "
                 f"company_id={company.id}"
@@ -188,6 +272,202 @@ class WeddingService:
             ) from e
 
 
+@transaction.atomic
+def _clone_budget(source: Wedding, target: Wedding) -> None:
+    """Copia o orçamento e as categorias (sem despesas) para o novo casamento."""
+    from apps.finances.models import Budget, BudgetCategory
+
+    budget = Budget.objects.filter(wedding=source).first()
+    if budget is None:
+        return
+    new_budget = Budget.objects.create(
+        company=target.company,
+        wedding=target,
+        total_estimated=budget.total_estimated,
+        notes=budget.notes,
+    )
+    BudgetCategory.objects.bulk_create(
+        [
+            BudgetCategory(
+                company=target.company,
+                wedding=target,
+                budget=new_budget,
+                name=category.name,
+                description=category.description,
+                allocated_budget=category.allocated_budget,
+                template_key=category.template_key,
+            )
+            for category in BudgetCategory.objects.filter(budget=budget).iterator(
+                chunk_size=CLONE_BATCH_SIZE
+            )
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+    )
+
+
+def _clone_tasks(source: Wedding, target: Wedding, shift: timedelta) -> None:
+    """Copia as tarefas como pendentes, com o prazo deslocado."""
+    from apps.scheduler.models import Task
+
+    Task.objects.bulk_create(
+        [
+            Task(
+                company=target.company,
+                wedding=target,
+                title=task.title,
+                description=task.description,
+                due_date=task.due_date + shift if task.due_date else None,
+                template_key=task.template_key,
+            )
+            for task in Task.objects.filter(wedding=source).iterator(
+                chunk_size=CLONE_BATCH_SIZE
+            )
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+    )
+
+
+@transaction.atomic
+def _clone_events(source: Wedding, target: Wedding, shift: timedelta) -> None:
+    """
+    Copia eventos e exceções de ocorrência com os horários deslocados.
+
+    Eventos de pagamento pertencem às parcelas do casamento de origem e não
+    são copiados. A aplicação de template acompanha a cópia para que o novo
+    casamento continue sincronizável com novas versões do template.
+    """
+    from apps.scheduler.models import Event, EventException, TemplateApplication
+    from apps.scheduler.models.event import touch_wedding_events
+
+    originals = list(
+        Event.objects.filter(wedding=source).exclude(
+            event_type=Event.TypeChoices.PAYMENT
+        )
+    )
+    clones = []
+    for original in originals:
+        event = Event(
+            company=target.company,
+            wedding=target,
+            title=original.title,
+            location=original.location,
+            description=original.description,
+            event_type=original.event_type,
+            start_time=original.start_time + shift,
+            end_time=original.end_time + shift if original.end_time else None,
+            recurrence_rule=original.recurrence_rule,
+            reminder_enabled=original.reminder_enabled,
+            reminder_minutes_before=original.reminder_minutes_before,
+            template_key=original.template_key,
+        )
+        # bulk_create não passa pelo Event.save: agenda o lembrete aqui.
+        event.reminder_at = event.next_reminder_at()
+        clones.append(event)
+    Event.objects.bulk_create(clones, batch_size=CLONE_BATCH_SIZE)
+
+    # O zip depende de bulk_create preservar a ordem e preencher as PKs.
+    event_map = {
+        original.pk: clone for original, clone in zip(originals, clones, strict=True)
+    }
+    EventException.objects.bulk_create(
+        [
+            EventException(
+                company=target.company,
+                wedding=target,
+                event=event_map[exception.event_id],
+                original_start=exception.original_start + shift,
+                is_cancelled=exception.is_cancelled,
+                title=exception.title,
+                location=exception.location,
+                start_time=exception.start_time + shift
+                if exception.start_time
+                else None,
+                end_time=exception.end_time + shift if exception.end_time else None,
+            )
+            for exception in EventException.objects.filter(
+                event_id__in=event_map
+            ).iterator(chunk_size=CLONE_BATCH_SIZE)
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+    )
+
+    application = TemplateApplication.objects.filter(wedding=source).first()
+    if application is not None:
+        TemplateApplication.objects.create(
+            company=target.company,
+            wedding=target,
+            template_key=application.template_key,
+            version_id=application.version_id,
+        )
+
+    if clones:
+        touch_wedding_events(target.pk)
+
+
+@transaction.atomic
+def _clone_logistics(source: Wedding, target: Wedding, shift: timedelta) -> None:
+    """
+    Copia contratos (como rascunho, sem PDF nem assinatura) e itens.
+
+    Contratos cancelados ficam de fora; itens que apontavam para eles são
+    copiados sem contrato. A hierarquia de aditivos é remapeada num
+    ``bulk_update`` depois que todos os contratos têm PK.
+    """
+    from apps.logistics.models import Contract, Item
+
+    originals = list(
+        Contract.objects.filter(wedding=source).exclude(
+            status=Contract.StatusChoices.CANCELED
+        )
+    )
+    clones = [
+        Contract(
+            company=target.company,
+            wedding=target,
+            supplier_id=original.supplier_id,
+            total_amount=original.total_amount,
+            name=original.name,
+            description=original.description,
+            expiration_date=(
+                original.expiration_date + shift if original.expiration_date else None
+            ),
+            alert_days_before=original.alert_days_before,
+        )
+        for original in originals
+    ]
+    Contract.objects.bulk_create(clones, batch_size=CLONE_BATCH_SIZE)
+
+    contract_map = {
+        original.pk: clone for original, clone in zip(originals, clones, strict=True)
+    }
+    addendums = []
+    for original, clone in zip(originals, clones, strict=True):
+        parent = contract_map.get(original.parent_id) if original.parent_id else None
+        if parent is not None:
+            clone.parent = parent
+            addendums.append(clone)
+    Contract.objects.bulk_update(addendums, ["parent"], batch_size=CLONE_BATCH_SIZE)
+
+    Item.objects.bulk_create(
+        [
+            Item(
+                company=target.company,
+                wedding=target,
+                contract=contract_map.get(item.contract_id)
+                if item.contract_id
+                else None,
+                name=item.name,
+                description=item.description,
+                quantity=item.quantity,
+            )
+            for item in Item.objects.filter(wedding=source).iterator(
+                chunk_size=CLONE_BATCH_SIZE
+            )
+        ],
+        batch_size=CLONE_BATCH_SIZE,
+    )
+
+
 @transaction.atomic
 def _apply_template_events(
     company: Company, wedding: Wedding, template_name: str
@@ -195,38 +475,15 @@ def _apply_template_events(
     """
     Aplica um template de cronograma criando eventos para o casamento.
 
-    Calcula a data de início de cada evento usando a quantidade de dias
-    especificada como offset relativo à data do casamento.
+    Usa o template do tenant com esse nome, se houver, ou o embutido. Calcula
+    a data de início de cada evento usando a quantidade de dias especificada
+    como offset relativo à data do casamento.
 
     Args:
         company: O tenant atual para isolamento de dados.
         wedding: O casamento a receber os eventos do template.
         template_name: O identificador/nome do template a ser aplicado.
     """
-    from django.utils import timezone
-
-    from apps.scheduler.services import EventService
-    from apps.scheduler.services.templates import get_template_events
-
-    template_events = get_template_events(template_name)
+    from apps.scheduler.services import ScheduleTemplateService
 
-    for event_data in template_events:
-        offset_days = int(event_data["offset_days"])
-        naive_start = datetime.combine(
-            wedding.date - timedelta(days=offset_days),
-            time(hour=9, minute=0),
-        )
-        event_start = timezone.make_aware(naive_start)
-
-        EventService.create(
-            company,
-            EventIn(
-                wedding=wedding.uuid,
-                title=event_data["title"],
-                event_type=event_data["event_type"],
-                start_time=event_start,
-                location="",
-                description="",
-            ),
-            _allow_historical_start=True,
-        )
+    ScheduleTemplateService.apply(company, wedding, template_name)
@@ -171,6 +171,25 @@ class TestWeddingNinjaAPI:
 
         assert response.status_code == 422
 
+    def test_clone_wedding_success(self, auth_client, user):
+        source = WeddingFactory(company=user.company)
+        payload = {
+            "groom_name": "João",
+            "bride_name": "Maria",
+            "date": str(source.date),
+        }
+
+        response = auth_client.post(
+            f"/api/v1/weddings/{source.uuid}/clone/",
+            data=payload,
+            content_type="application/json",
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["uuid"] != str(source.uuid)
+        assert data["location"] == source.location
+
     def test_delete_wedding_success(self, auth_client, user):
         """DELETE deve remover um casamento."""
         wedding = WeddingFactory(company=user.company)
@@ -233,3 +252,62 @@ class TestWeddingNinjaAPI:
         data = response.json()
         assert len(data) == 1
         assert data[0]["bride_name"] == "Minha Noiva"
+
+
+@pytest.mark.django_db
+class TestWeddingConditionalGet:
+    """ETag/304 nas leituras de casamentos."""
+
+    def test_list_returns_etag_and_304_when_unchanged(self, auth_client, user):
+        WeddingFactory(company=user.company)
+
+        first = auth_client.get("/api/v1/weddings/")
+        etag = first["ETag"]
+        second = auth_client.get("/api/v1/weddings/", HTTP_IF_NONE_MATCH=etag)
+
+        assert first.status_code == 200
+        assert len(first.json()["items"]) == 1
+        assert first["Cache-Control"] == "private, no-cache"
+        assert second.status_code == 304
+        assert second["ETag"] == etag
+        assert second.content == b""
+
+    def test_change_invalidates_etag(self, auth_client, user):
+        wedding = WeddingFactory(company=user.company, bride_name="Ana")
+        etag = auth_client.get(f"/api/v1/weddings/{wedding.uuid}/")["ETag"]
+
+        auth_client.patch(
+            f"/api/v1/weddings/{wedding.uuid}/",
+            data={"bride_name": "Beatriz"},
+            content_type="application/json",
+        )
+        response = auth_client.get(
+            f"/api/v1/weddings/{wedding.uuid}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response.json()["bride_name"] == "Beatriz"
+        assert response["ETag"] != etag
+
+    def test_etag_is_scoped_to_tenant(self, auth_client, user):
+        etag = auth_client.get("/api/v1/weddings/")["ETag"]
+
+        WeddingFactory()
+        unchanged = auth_client.get("/api/v1/weddings/", HTTP_IF_NONE_MATCH=etag)
+        WeddingFactory(company=user.company)
+        changed = auth_client.get("/api/v1/weddings/", HTTP_IF_NONE_MATCH=etag)
+
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+
+    def test_not_modified_skips_the_view_queries(
+        self, auth_client, user, django_assert_max_num_queries
+    ):
+        WeddingFactory.create_batch(3, company=user.company)
+        etag = auth_client.get("/api/v1/weddings/")["ETag"]
+
+        # Autenticação + uma agregação por tabela da versão.
+        with django_assert_max_num_queries(6):
+            response = auth_client.get("/api/v1/weddings/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
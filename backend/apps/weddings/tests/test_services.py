@@ -3,6 +3,8 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from apps.core.exceptions import (
@@ -12,13 +14,17 @@ from apps.core.exceptions import (
 )
 from apps.finances.models import Budget, BudgetCategory
 from apps.finances.tests.factories import (
+    BudgetCategoryFactory,
     BudgetFactory,
 )
-from apps.logistics.tests.factories import ContractFactory
-from apps.scheduler.models import Event
+from apps.logistics.models import Contract, Item
+from apps.logistics.tests.factories import ContractFactory, ItemFactory
+from apps.notifications.services import NotificationService
+from apps.scheduler.models import Event, EventException, Task
+from apps.scheduler.tests.factories import EventFactory, TaskFactory
 from apps.users.tests.factories import UserFactory
 from apps.weddings.models import Wedding
-from apps.weddings.schemas import WeddingIn, WeddingPatchIn
+from apps.weddings.schemas import WeddingCloneIn, WeddingIn, WeddingPatchIn
 from apps.weddings.services import WeddingService
 from apps.weddings.tests.factories import WeddingFactory
 
@@ -91,6 +97,24 @@ class TestWeddingService:
         budget = Budget.objects.get(wedding=updated_wedding)
         assert budget.total_estimated == initial_value
 
+    def test_update_wedding_rename_propagates_to_notifications(self, user):
+        """Renomear os noivos atualiza o nome gravado nas notificações."""
+        wedding = WeddingFactory(company=user.company, bride_name="Antiga")
+        notification = NotificationService.create_notification(
+            user.company, user, "Título", "Mensagem", wedding_id=wedding.uuid
+        )
+
+        WeddingService.update(
+            company=user.company,
+            instance=wedding,
+            payload=WeddingPatchIn(bride_name="Nova Maria"),
+        )
+
+        notification.refresh_from_db()
+        assert notification.wedding_name == (
+            f"Casamento de Nova Maria e {wedding.groom_name}"
+        )
+
     def test_update_wedding_cross_tenant(self, user):
         """Casamento de outro tenant não pode ser atualizado."""
         other_user = UserFactory()
@@ -338,3 +362,155 @@ class TestWeddingTemplateApplication:
 
         assert events1 == 8
         assert events2 == 8
+
+    def test_template_events_are_inserted_in_bulk(self, user, wedding_payload):
+        """O template gera um único INSERT e agenda lembretes/versão do calendário."""
+        wedding_payload["template"] = "religious_12m"
+
+        with CaptureQueriesContext(connection) as ctx:
+            wedding = WeddingService.create(
+                company=user.company, payload=WeddingIn(**wedding_payload)
+            )
+
+        inserts = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "scheduler_event"')
+        ]
+        assert len(inserts) == 1
+        assert Event.objects.filter(wedding=wedding).count() == 10
+        wedding.refresh_from_db()
+        assert wedding.events_version == 1
+
+
+@pytest.mark.django_db
+class TestWeddingClone:
+    """Testes da cópia de casamentos (WeddingService.clone)."""
+
+    def _source(self, user, *, size=1):
+        wedding = WeddingFactory(
+            company=user.company, date=timezone.now().date() + timedelta(days=100)
+        )
+        budget = BudgetFactory(wedding=wedding, total_estimated=Decimal("80000.00"))
+        for i in range(size):
+            BudgetCategoryFactory(budget=budget, wedding=wedding, name=f"Cat {i}")
+            TaskFactory(
+                wedding=wedding,
+                due_date=wedding.date - timedelta(days=30),
+                is_completed=True,
+            )
+            EventFactory(
+                wedding=wedding,
+                start_time=timezone.now() + timedelta(days=10 + i),
+                recurrence_rule=Event.RecurrenceChoices.WEEKLY,
+            )
+            contract = ContractFactory(wedding=wedding)
+            ContractFactory(
+                wedding=wedding, supplier=contract.supplier, parent=contract
+            )
+            ItemFactory(wedding=wedding, contract=contract)
+        return wedding
+
+    def _payload(self, days=130, **kwargs):
+        return WeddingCloneIn(
+            groom_name="João",
+            bride_name="Maria",
+            date=timezone.now().date() + timedelta(days=days),
+            **kwargs,
+        )
+
+    def test_clone_copies_planning_with_shifted_dates(self, user):
+        source = self._source(user)
+        event = Event.objects.get(wedding=source)
+        EventException.objects.create(
+            company=user.company,
+            wedding=source,
+            event=event,
+            original_start=event.start_time + timedelta(days=7),
+            is_cancelled=True,
+        )
+
+        clone = WeddingService.clone(user.company, source, self._payload())
+
+        assert clone.pk != source.pk
+        assert clone.location == source.location
+        assert clone.budget.total_estimated == Decimal("80000.00")
+        assert list(clone.budget.categories.values_list("name", flat=True)) == ["Cat 0"]
+
+        task = Task.objects.get(wedding=clone)
+        assert task.due_date == clone.date - timedelta(days=30)
+        assert task.is_completed is False
+
+        copied = Event.objects.get(wedding=clone)
+        assert copied.start_time == event.start_time + timedelta(days=30)
+        assert copied.recurrence_rule == Event.RecurrenceChoices.WEEKLY
+        exception = EventException.objects.get(wedding=clone)
+        assert exception.event == copied
+        assert exception.original_start == copied.start_time + timedelta(days=7)
+        clone.refresh_from_db()
+        assert clone.events_version == 1
+
+        # Logística só é copiada quando solicitada.
+        assert not Contract.objects.filter(wedding=clone).exists()
+        assert not Item.objects.filter(wedding=clone).exists()
+
+    def test_clone_skips_payment_events(self, user):
+        source = WeddingFactory(company=user.company)
+        EventFactory(wedding=source, event_type=Event.TypeChoices.PAYMENT)
+
+        clone = WeddingService.clone(user.company, source, self._payload())
+
+        assert not Event.objects.filter(wedding=clone).exists()
+
+    def test_clone_with_logistics_resets_contracts_and_remaps_addendums(self, user):
+        source = self._source(user)
+        Contract.objects.filter(wedding=source).update(
+            expiration_date=source.date - timedelta(days=10)
+        )
+
+        clone = WeddingService.clone(
+            user.company, source, self._payload(include_logistics=True)
+        )
+
+        contracts = Contract.objects.filter(wedding=clone)
+        assert contracts.count() == 2
+        assert set(contracts.values_list("status", flat=True)) == {
+            Contract.StatusChoices.DRAFT
+        }
+        addendum = contracts.get(parent__isnull=False)
+        assert addendum.parent.wedding == clone
+        assert addendum.expiration_date == clone.date - timedelta(days=10)
+
+        item = Item.objects.get(wedding=clone)
+        assert item.contract == addendum.parent
+        assert item.acquisition_status == Item.AcquisitionStatus.PENDING
+
+    def test_clone_query_count_does_not_grow_with_size(self, user):
+        small = self._source(user, size=1)
+        large = self._source(user, size=6)
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            WeddingService.clone(
+                user.company, small, self._payload(include_logistics=True)
+            )
+        with CaptureQueriesContext(connection) as large_ctx:
+            WeddingService.clone(
+                user.company, large, self._payload(include_logistics=True)
+            )
+
+        assert len(large_ctx.captured_queries) == len(small_ctx.captured_queries)
+        assert Event.objects.filter(wedding__bride_name="Maria").count() == 7
+
+    def test_clone_invalid_date_raises(self, user):
+        source = WeddingFactory(company=user.company)
+
+        with pytest.raises(BusinessRuleViolation):
+            WeddingService.clone(user.company, source, self._payload(days=-1))
+
+        assert Wedding.objects.filter(company=user.company).count() == 1
+
+    def test_clone_cross_tenant(self, user):
+        source = WeddingFactory()
+
+        with pytest.raises(ObjectNotFoundError):
+            WeddingService.clone(user.company, source, self._payload())
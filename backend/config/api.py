@@ -10,7 +10,6 @@ from django.http import Http404, HttpRequest, HttpResponse
 from ninja.errors import HttpError
 from ninja.errors import ValidationError as NinjaValidationError
 from ninja_extra import NinjaExtraAPI
-from ninja_jwt.authentication import JWTAuth
 from pydantic import ValidationError as PydanticValidationError
 
 from apps.core.cron_api import cron_router
@@ -18,6 +17,7 @@ from apps.core.exceptions import ApplicationError
 from apps.finances.api import (
     budget_categories_router,
     budgets_router,
+    expense_imports_router,
     expenses_router,
     installments_router,
 )
@@ -25,20 +25,24 @@ from apps.logistics.api import contracts_router, items_router, suppliers_router
 from apps.notifications.api import notifications_router
 from apps.reporting.api import dashboard_router, reports_router
 from apps.scheduler.api import events_router as scheduler_events_router
+from apps.scheduler.api import feeds_router as scheduler_feeds_router
 from apps.scheduler.api import tasks_router as scheduler_tasks_router
+from apps.scheduler.api import templates_router as scheduler_templates_router
+from apps.sync.api import sync_router
 from apps.users.api import router as auth_router
+from apps.users.authentication import TenantJWTAuth
 from apps.weddings.api import router as weddings_router
 
 
 logger = logging.getLogger(__name__)
 
 # Instância principal do Django Ninja
-# auth=JWTAuth() garante que todos os endpoints exigem Bearer JWT por padrão
+# auth=TenantJWTAuth() garante que todos os endpoints exigem Bearer JWT por padrão
 api = NinjaExtraAPI(
     title="Wedding Management API (Ninja)",
     version="1.0.0",
     docs_url="/docs/",
-    auth=JWTAuth(),
+    auth=TenantJWTAuth(),
 )
 
 
@@ -169,8 +173,12 @@ api.add_router("/finances/budgets/", budgets_router)
 api.add_router("/finances/categories/", budget_categories_router)
 api.add_router("/finances/expenses/", expenses_router)
 api.add_router("/finances/installments/", installments_router)
+api.add_router("/finances/imports/", expense_imports_router)
 
 api.add_router("/scheduler/events/", scheduler_events_router)
 api.add_router("/scheduler/tasks/", scheduler_tasks_router)
+api.add_router("/scheduler/feeds/", scheduler_feeds_router)
+api.add_router("/scheduler/templates/", scheduler_templates_router)
 api.add_router("/notifications/", notifications_router)
+api.add_router("/sync/", sync_router)
 api.add_router("/internal/cron/", cron_router, auth=None)
@@ -3,6 +3,11 @@ ASGI config for wedding_management project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The notifications SSE stream (/api/v1/notifications/stream/) is only served
+through this entry point (e.g. ``uvicorn config.asgi:application``); WSGI
+deployments fall back to the conditional long-poll at
+/api/v1/notifications/poll/.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
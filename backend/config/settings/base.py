@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     "apps.scheduler",
     "apps.notifications",
     "apps.reporting",
+    "apps.sync",
 ]
 
 MIDDLEWARE = [
@@ -55,6 +56,7 @@ MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "apps.core.middleware.RequestIDMiddleware",
+    "apps.core.middleware.QueryProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -135,6 +137,11 @@ NINJA_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Tempo que o estado do usuário (hash de senha/is_active) fica no cache para a
+# verificação de tokens sem banco; save/delete do User invalidam a chave. Exige
+# cache compartilhado entre os workers; 0 lê o estado do banco a cada request.
+AUTH_TOKEN_STATE_CACHE_SECONDS = env.int("AUTH_TOKEN_STATE_CACHE_SECONDS", default=3600)
+
 LANGUAGE_CODE = "pt-br"
 TIME_ZONE = "America/Sao_Paulo"
 USE_I18N = True
@@ -165,6 +172,10 @@ NINJA_EXTRA = {
     }
 }
 
+# Valkey/Redis compartilhado pelos contadores de rate limiting
+# (apps.core.throttling). Vazio mantém os contadores em memória por processo.
+THROTTLE_REDIS_URL = env("THROTTLE_REDIS_URL", default="")
+
 # --- Tasks Framework (Django 6.0 + Huey Integration) ---
 TASKS = {
     "default": {
@@ -173,6 +184,21 @@ TASKS = {
 }
 
 
+# --- Perfil SQL por requisição (QueryProfilingMiddleware) ---
+SQL_PROFILING_ENABLED = env.bool("SQL_PROFILING_ENABLED", default=True)
+SQL_PROFILING_SLOW_REQUEST_MS = env.int("SQL_PROFILING_SLOW_REQUEST_MS", default=500)
+# Fração das requisições lentas registradas com as SQLs mais caras.
+SQL_PROFILING_SLOW_SAMPLE_RATE = env.float(
+    "SQL_PROFILING_SLOW_SAMPLE_RATE", default=0.1
+)
+SQL_PROFILING_TOP_QUERIES = env.int("SQL_PROFILING_TOP_QUERIES", default=5)
+# Detector de N+1 amostrado (o django-zeal cobre o desenvolvimento).
+N_PLUS_ONE_SAMPLE_RATE = env.float("N_PLUS_ONE_SAMPLE_RATE", default=0.01)
+N_PLUS_ONE_THRESHOLD = env.int("N_PLUS_ONE_THRESHOLD", default=5)
+# Padrões fnmatch de rotas onde repetições são esperadas (ex: "/api/v1/cron/*").
+N_PLUS_ONE_ALLOWLIST = env.list("N_PLUS_ONE_ALLOWLIST", default=[])
+
+
 REDIS_URL = env("REDIS_URL", default="redis://valkey:6379")
 
 HUEY = {
@@ -187,3 +213,89 @@ HUEY = {
         "worker_type": "thread",
     },
 }
+
+# --- Lembretes de eventos (tarefa periódica "dispatch_event_reminders") ---
+EVENT_REMINDER_BATCH_SIZE = env.int("EVENT_REMINDER_BATCH_SIZE", default=200)
+
+# Versões (imutáveis) de templates de cronograma do tenant compiladas no cache,
+# por ID da versão; a versão mais recente é sempre consultada no banco.
+SCHEDULE_TEMPLATE_CACHE_SECONDS = env.int(
+    "SCHEDULE_TEMPLATE_CACHE_SECONDS", default=3600
+)
+
+# --- Importação de despesas por planilha (apps.finances.imports / django.tasks) ---
+# Linhas validadas e gravadas por lote (uma transação por lote).
+EXPENSE_IMPORT_BATCH_SIZE = env.int("EXPENSE_IMPORT_BATCH_SIZE", default=500)
+# Erros guardados no relatório do job; os demais só entram na contagem.
+EXPENSE_IMPORT_MAX_REPORTED_ERRORS = env.int(
+    "EXPENSE_IMPORT_MAX_REPORTED_ERRORS", default=200
+)
+# Job em execução sem progresso há mais que isso é considerado parado
+# (processo encerrado) e pode ser validado de novo.
+EXPENSE_IMPORT_STALE_SECONDS = env.int("EXPENSE_IMPORT_STALE_SECONDS", default=900)
+
+# --- Exportação em massa (apps.reporting.exports) ---
+# Linhas buscadas por ida ao cursor do servidor (PostgreSQL) ao exportar.
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=2000)
+
+# --- Feed de alterações (apps.sync, cron "purge_expired_tombstones") ---
+SYNC_FEED_PAGE_SIZE = env.int("SYNC_FEED_PAGE_SIZE", default=500)
+SYNC_FEED_MAX_PAGE_SIZE = env.int("SYNC_FEED_MAX_PAGE_SIZE", default=2000)
+# Cursores cujo horizonte é mais antigo que isso exigem sincronização completa.
+SYNC_TOMBSTONE_RETENTION_DAYS = env.int("SYNC_TOMBSTONE_RETENTION_DAYS", default=30)
+# Alterações mais recentes que isso ficam para a próxima página: cobre
+# transações ainda não commitadas com ``updated_at`` anterior ao cursor.
+SYNC_FEED_SAFETY_LAG_SECONDS = env.int("SYNC_FEED_SAFETY_LAG_SECONDS", default=30)
+
+# --- Fila de e-mails transacionais (apps.core.mail / django.tasks) ---
+EMAIL_QUEUE_BATCH_SIZE = env.int("EMAIL_QUEUE_BATCH_SIZE", default=50)
+EMAIL_QUEUE_MAX_ATTEMPTS = env.int("EMAIL_QUEUE_MAX_ATTEMPTS", default=5)
+# Espera antes da 2ª tentativa quando o backend de tarefas agenda execuções;
+# dobra a cada nova falha (30s, 60s, 120s...). No backend imediato as
+# tentativas são repetidas na hora.
+EMAIL_QUEUE_RETRY_BASE_SECONDS = env.int("EMAIL_QUEUE_RETRY_BASE_SECONDS", default=30)
+
+# --- Notificações em tempo real (Redis Pub/Sub → SSE / long-polling) ---
+# Vazio desativa a publicação; o /notifications/poll/ passa a responder sempre
+# na hora (200 ou 304 pelo ETag).
+NOTIFICATIONS_PUBSUB_URL = env("NOTIFICATIONS_PUBSUB_URL", default="")
+NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS = env.int(
+    "NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS", default=15
+)
+NOTIFICATIONS_STREAM_MAX_SECONDS = env.int(
+    "NOTIFICATIONS_STREAM_MAX_SECONDS", default=300
+)
+# Espera máxima do /notifications/poll/. Em produção (gunicorn gthread, 4
+# threads por worker) cada espera prende uma thread, então o padrão 0 responde
+# na hora (200 ou 304 pelo ETag) e o cliente repete o GET condicional. Só
+# aumente com Pub/Sub ativo e threads dimensionadas para as abas abertas;
+# deve ficar abaixo do --timeout do gunicorn (60s).
+NOTIFICATIONS_LONG_POLL_TIMEOUT_SECONDS = env.int(
+    "NOTIFICATIONS_LONG_POLL_TIMEOUT_SECONDS", default=0
+)
+
+# --- Retenção de notificações (cron "apply_notification_retention") ---
+# Dias de vida por NotificationType; "default" vale para os tipos não listados.
+NOTIFICATIONS_RETENTION_DAYS = {
+    "default": 180,
+    "GENERAL": 90,
+    "UPCOMING_INSTALLMENT": 60,
+    "TASK_DEADLINE": 90,
+}
+# Lidas há mais tempo que isso saem da tabela principal para o arquivo.
+NOTIFICATIONS_ARCHIVE_READ_AFTER_DAYS = env.int(
+    "NOTIFICATIONS_ARCHIVE_READ_AFTER_DAYS", default=30
+)
+NOTIFICATIONS_RETENTION_BATCH_SIZE = env.int(
+    "NOTIFICATIONS_RETENTION_BATCH_SIZE", default=2000
+)
+
+# --- Agrupamento de notificações (resumo por usuário, tipo, casamento e dia) ---
+NOTIFICATIONS_DIGEST_TYPES = [
+    "OVERDUE_INSTALLMENT",
+    "UPCOMING_INSTALLMENT",
+    "EXPIRING_CONTRACT",
+    "TASK_DEADLINE",
+    "CHECKLIST_ITEM_OVERDUE",
+]
+NOTIFICATIONS_DIGEST_MAX_ITEMS = env.int("NOTIFICATIONS_DIGEST_MAX_ITEMS", default=50)
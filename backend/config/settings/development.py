@@ -116,6 +116,8 @@ if _is_redis_available(REDIS_URL):
             "worker_type": "thread",
         },
     }
+    NOTIFICATIONS_PUBSUB_URL = env("NOTIFICATIONS_PUBSUB_URL", default=f"{REDIS_URL}/2")
+    THROTTLE_REDIS_URL = env("THROTTLE_REDIS_URL", default=f"{REDIS_URL}/3")
 else:
     CACHES = {
         "default": {
@@ -151,6 +151,14 @@ if env("REDIS_HOST", default=""):
             ),
         }
     }
+    NOTIFICATIONS_PUBSUB_URL = env(
+        "NOTIFICATIONS_PUBSUB_URL",
+        default=f"redis://{env('REDIS_HOST')}:{env.int('REDIS_PORT', default=6379)}/2",
+    )
+    THROTTLE_REDIS_URL = env(
+        "THROTTLE_REDIS_URL",
+        default=f"redis://{env('REDIS_HOST')}:{env.int('REDIS_PORT', default=6379)}/3",
+    )
 else:
     CACHES = {
         "default": {
@@ -158,3 +166,6 @@ else:
             "LOCATION": "wedding-prod-cache",
         }
     }
+    # Cache por processo não vê a invalidação feita em outro worker (troca de
+    # senha, desativação): o estado dos tokens passa a ser lido do banco.
+    AUTH_TOKEN_STATE_CACHE_SECONDS = 0
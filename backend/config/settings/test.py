@@ -2,6 +2,9 @@
 Test settings: in-memory SQLite, fast password hashers, disabled zeal.
 """
 
+import tempfile
+from pathlib import Path
+
 from .base import *
 
 
@@ -11,6 +14,7 @@ ALLOWED_HOSTS = ["testserver"]
 
 
 ENABLE_ZEAL = False
+N_PLUS_ONE_SAMPLE_RATE = 0.0
 
 DATABASES = {
     "default": {
@@ -23,6 +27,9 @@ PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 
+# Uploads gerados pelos testes (ex.: PDFs de contrato) fora da árvore do repo.
+MEDIA_ROOT = Path(tempfile.mkdtemp(prefix="wedding-test-media-"))
+
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 DEFAULT_FROM_EMAIL = "test@wedding.com"
 
@@ -46,3 +53,12 @@ HUEY = {
     "name": "test_tasks",
     "immediate": True,
 }
+
+# --- Realtime desativado: os testes mockam o cliente Redis quando necessário ---
+NOTIFICATIONS_PUBSUB_URL = ""
+
+# --- Feed de alterações sem folga: os testes leem o que acabaram de gravar ---
+SYNC_FEED_SAFETY_LAG_SECONDS = 0
+
+# --- Rate limiting com contadores em memória (zerados entre testes no conftest) ---
+THROTTLE_REDIS_URL = ""
@@ -6,11 +6,14 @@ from typing import Any, cast
 
 import factory
 import pytest
+from django.apps import apps
+from django.db import connection
 from django.http import HttpResponseBase
 from django.test import Client
 from ninja_jwt.tokens import RefreshToken
 from pytest_factoryboy import register
 
+from apps.core.throttling import reset_local_store
 from apps.users.models import User
 from apps.users.tests.factories import AdminFactory, UserFactory
 
@@ -23,6 +26,54 @@ register(AdminFactory)
 factory.Faker._DEFAULT_LOCALE = "pt_BR"  # type: ignore[attr-defined]
 
 
+# 3. Benchmark de endpoints (desativado por padrão; ver apps/core/tests/benchmarks.py)
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("api-benchmark", "Benchmark de endpoints da API")
+    group.addoption(
+        "--api-benchmark",
+        action="store_true",
+        help="Executa o benchmark de queries/latência de todos os endpoints GET.",
+    )
+    group.addoption(
+        "--api-benchmark-sizes",
+        default="10,100,1000",
+        help="Tamanhos de tenant (casamentos) separados por vírgula.",
+    )
+    group.addoption(
+        "--api-benchmark-repeats",
+        type=int,
+        default=20,
+        help="Requisições cronometradas por endpoint.",
+    )
+    group.addoption(
+        "--api-benchmark-output",
+        default="benchmark-results.json",
+        help="Arquivo JSON de saída com os resultados.",
+    )
+    group.addoption(
+        "--api-benchmark-baseline",
+        default=None,
+        help="JSON de uma execução anterior; pioras falham a execução.",
+    )
+    group.addoption(
+        "--api-benchmark-tolerance",
+        type=float,
+        default=0.2,
+        help="Piora relativa aceita em latência e memória (0.2 = 20%%).",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--api-benchmark"):
+        return
+    skip = pytest.mark.skip(reason="use --api-benchmark para executar")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 class JWTClient(Client):
     """Django test client that injects a Bearer JWT on every request."""
 
@@ -50,6 +101,30 @@ class JWTClient(Client):
         )
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup: None, django_db_blocker: Any) -> None:
+    """
+    Cria as tabelas dos modelos stub declarados nos testes (``app_label="core"``).
+
+    O app core tem migrations, então modelos definidos só nos módulos de teste
+    não ganham tabela pelo migrate.
+    """
+    stubs = [
+        model
+        for model in apps.get_app_config("core").get_models()
+        if model.__module__ != "apps.core.models"
+    ]
+    with django_db_blocker.unblock(), connection.schema_editor() as editor:
+        for model in stubs:
+            editor.create_model(model)
+
+
+@pytest.fixture(autouse=True)
+def reset_throttle_counters() -> None:
+    """Zera os contadores de rate limiting em memória antes de cada teste."""
+    reset_local_store()
+
+
 @pytest.fixture
 def user(user_factory: Any) -> User:
     """Cria e retorna um usuário ativo (Planner) para uso nos testes."""
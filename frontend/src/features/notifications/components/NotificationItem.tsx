@@ -22,6 +22,7 @@ export const getNotificationIcon = (type: string) => {
       return AlertTriangle;
     case "UPCOMING_INSTALLMENT":
     case "TASK_DEADLINE":
+    case "EVENT_REMINDER":
       return Clock;
     case "EXPIRING_CONTRACT":
       return FileText;
@@ -91,3 +91,23 @@ resource "google_cloud_scheduler_job" "daily_batch_cron" {
   }
 
 }
+
+# Cloud Scheduler Job para os lembretes de eventos (resolução de minutos)
+resource "google_cloud_scheduler_job" "event_reminders_cron" {
+  name        = "wedding-event-reminders-cron-${local.environment}"
+  description = "Envia os lembretes de eventos vencidos (RF12, ADR-005)"
+  schedule    = "* * * * *" # A cada minuto
+  time_zone   = "America/Sao_Paulo"
+  region      = local.gcp_region
+
+  http_target {
+    http_method = "POST"
+    uri         = "${module.backend_service.service_uri}/api/v1/internal/cron/event-reminders/"
+
+    oidc_token {
+      service_account_email = data.terraform_remote_state.shared.outputs.runtime_sa_email
+      audience              = module.backend_service.service_uri
+    }
+  }
+
+}